@@ -17,11 +17,16 @@ To test changes to the C decoders you want the last number: this script drives
 ``parse_chunk_soa`` (or ``evutils_read_csv``) directly in a loop over a reused
 buffer, so it measures the decode inner loop with no streaming/allocation noise.
 
+EVT2 and EVT4 decode runs of CD words with a runtime-dispatched SIMD kernel;
+they are reported once per kernel level the CPU supports (scalar / avx2 /
+avx512) so the speedup is visible side by side. ``--simd`` narrows that.
+
 Usage
 -----
     python benchmarks/decode_micro.py                       # synthetic, defaults
     python benchmarks/decode_micro.py --events 20_000_000 --formats evt2,dat,csv
     python benchmarks/decode_micro.py --file rec.raw        # one real file
+    python benchmarks/decode_micro.py --formats evt2 --simd scalar,avx2
 """
 from __future__ import annotations
 
@@ -36,7 +41,9 @@ from typing import Any
 import numpy as np
 
 from evutils.io import EventWriter
-from evutils.io._native_core import EventSoABuffers, TriggerSoABuffers, lib
+from evutils.io._native_core import (
+    EventSoABuffers, TriggerSoABuffers, SIMD_LEVELS, lib, set_simd_level, simd_level,
+)
 from evutils.io._source import make_source
 from evutils.random import random_events
 
@@ -52,6 +59,8 @@ _BINARY = {
     "evt4": (Evt4Input, Evt4Parser, np.uint32, ".raw"),
     "dat": (DatInput, DatParser, np.uint32, ".dat"),
 }
+# Formats whose parsers use the SIMD CD kernel (benchmarked per level).
+_SIMD_FORMATS = ("evt2", "evt4")
 # evt3's vector groups need look-ahead tail padding on the final chunk, which the
 # simple reused-loop here doesn't emulate; benchmark it via throughput.py.
 
@@ -82,7 +91,8 @@ def _time(fn: Any, repeats: int, warmup: int) -> tuple[float, float, int]:
     return min(ts), sum(ts) / len(ts), n
 
 
-def bench_binary(words: np.ndarray, fmt: str, chunk: int, repeats: int, warmup: int) -> int:
+def bench_binary(words: np.ndarray, fmt: str, chunk: int, repeats: int, warmup: int,
+                 label: str | None = None) -> int:
     InputCls, ParserCls, _dtype, _ext = _BINARY[fmt]
     parser = ParserCls()
     ev = EventSoABuffers(chunk + 8192)   # one reused, warm output buffer
@@ -105,10 +115,26 @@ def bench_binary(words: np.ndarray, fmt: str, chunk: int, repeats: int, warmup:
         return total
 
     mn, mean, n = _time(decode, repeats, warmup)
-    _report(fmt, n, mn, mean)
+    _report(label or fmt, n, mn, mean)
     return n
 
 
+def bench_binary_levels(words: np.ndarray, fmt: str, chunk: int, repeats: int, warmup: int,
+                        levels: list[str]) -> None:
+    """``bench_binary`` once per SIMD kernel level (SIMD formats only)."""
+    if fmt not in _SIMD_FORMATS:
+        bench_binary(words, fmt, chunk, repeats, warmup)
+        return
+    try:
+        for level in levels:
+            if set_simd_level(level) != level:
+                print(f"  {fmt + '/' + level:13s} skipped (CPU lacks {level})")
+                continue
+            bench_binary(words, fmt, chunk, repeats, warmup, label=f"{fmt}/{level}")
+    finally:
+        set_simd_level(None)
+
+
 def bench_csv(payload: bytes, chunk: int, repeats: int, warmup: int) -> int:
     # Reused output columns (t,x,y,p); decode the buffer in chunk-event slices.
     t = np.empty(chunk, np.int64)
@@ -147,7 +173,7 @@ def bench_csv(payload: bytes, chunk: int, repeats: int, warmup: int) -> int:
 def _report(fmt: str, n: int, mn: float, mean: float) -> None:
     peak = n / mn / 1e6 if mn else float("nan")
     avg = n / mean / 1e6 if mean else float("nan")
-    print(f"  {fmt:6s} decode  peak {peak:8.1f}  mean {avg:8.1f} Mev/s   ({n:,} events)")
+    print(f"  {fmt:13s} decode  peak {peak:8.1f}  mean {avg:8.1f} Mev/s   ({n:,} events)")
 
 
 def _csv_payload(path: Path) -> bytes:
@@ -168,7 +194,10 @@ def main() -> None:
     ap.add_argument("--tmpfs", type=str, default="/dev/shm")
     ap.add_argument("--file", type=str, default=None,
                     help="decode ONE real file (its format only)")
+    ap.add_argument("--simd", type=str, default=",".join(SIMD_LEVELS),
+                    help="kernel levels to compare for evt2/evt4")
     args = ap.parse_args()
+    levels = [s.strip() for s in args.simd.split(",") if s.strip()]
 
     tmpdir = Path(args.tmpfs)
 
@@ -176,18 +205,20 @@ def main() -> None:
         from evutils.io._evt import EventDecoder_EVT  # noqa: F401 (import cost warm-up)
         path = Path(args.file)
         fmt = _detect(path)
-        print(f"decode (reused warm buffer) -- real file {path.name} [{fmt}]")
+        print(f"decode (reused warm buffer) -- real file {path.name} [{fmt}], "
+              f"native SIMD: {simd_level()}")
         if fmt == "csv":
             bench_csv(_csv_payload(path), args.chunk, args.repeats, args.warmup)
         elif fmt in _BINARY:
             words = _payload_words(path, _BINARY[fmt][2], fmt == "dat")
-            bench_binary(words, fmt, args.chunk, args.repeats, args.warmup)
+            bench_binary_levels(words, fmt, args.chunk, args.repeats, args.warmup, levels)
         else:
             raise SystemExit(f"decode_micro does not cover {fmt}")
         return
 
     formats = [f.strip() for f in args.formats.split(",") if f.strip()]
-    print(f"decode (reused warm buffer) -- {args.events/1e6:.0f} M synthetic events")
+    print(f"decode (reused warm buffer) -- {args.events/1e6:.0f} M synthetic events, "
+          f"native SIMD: {simd_level()}")
     data = random_events(args.events)
     for fmt in formats:
         if fmt == "csv":
@@ -203,9 +234,9 @@ def main() -> None:
                 w.write(data)
             words = _payload_words(path, _BINARY[fmt][2], fmt == "dat")
             path.unlink(missing_ok=True)
-            bench_binary(words, fmt, args.chunk, args.repeats, args.warmup)
+            bench_binary_levels(words, fmt, args.chunk, args.repeats, args.warmup, levels)
         else:
-            print(f"  {fmt:6s} skipped (not covered; use throughput.py for evt3)")
+            print(f"  {fmt:13s} skipped (not covered; use throughput.py for evt3)")
         gc.collect()
 
 
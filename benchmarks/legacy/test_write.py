@@ -5,8 +5,9 @@ Run with::
     pytest benchmarks/test_write.py
 
 The payload is the shared ``reference_events`` array, so all three formats
-encode the same events. ``warmup_rounds=1`` absorbs the numba JIT compile of
-each encoder so it isn't counted in the timed rounds.
+encode the same events. ``warmup_rounds=1`` absorbs loading the native library
+and sizing each encoder's reused output buffer so neither is counted in the
+timed rounds.
 """
 import pytest
 
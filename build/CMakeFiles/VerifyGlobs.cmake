@@ -0,0 +1,26 @@
+# CMAKE generated file: DO NOT EDIT!
+# Generated by CMake Version 3.25
+cmake_policy(SET CMP0009 NEW)
+
+# EVUTILS_SOURCES at CMakeLists.txt:21 (file)
+file(GLOB NEW_GLOB LIST_DIRECTORIES true "/root/package/csrc/*.c")
+set(OLD_GLOB
+  "/root/package/csrc/aedat4.c"
+  "/root/package/csrc/aer.c"
+  "/root/package/csrc/csv.c"
+  "/root/package/csrc/dat.c"
+  "/root/package/csrc/evt2.c"
+  "/root/package/csrc/evt21.c"
+  "/root/package/csrc/evt2_encoder.c"
+  "/root/package/csrc/evt3.c"
+  "/root/package/csrc/evt3_encoder.c"
+  "/root/package/csrc/evt4.c"
+  "/root/package/csrc/evu.c"
+  "/root/package/csrc/evutils.c"
+  "/root/package/csrc/histogram.c"
+  "/root/package/csrc/simd.c"
+  )
+if(NOT "${NEW_GLOB}" STREQUAL "${OLD_GLOB}")
+  message("-- GLOB mismatch!")
+  file(TOUCH_NOCREATE "/root/package/build/CMakeFiles/cmake.verify_globs")
+endif()
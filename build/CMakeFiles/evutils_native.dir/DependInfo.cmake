@@ -0,0 +1,32 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/csrc/aedat4.c" "CMakeFiles/evutils_native.dir/csrc/aedat4.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/aedat4.c.o.d"
+  "/root/package/csrc/aer.c" "CMakeFiles/evutils_native.dir/csrc/aer.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/aer.c.o.d"
+  "/root/package/csrc/csv.c" "CMakeFiles/evutils_native.dir/csrc/csv.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/csv.c.o.d"
+  "/root/package/csrc/dat.c" "CMakeFiles/evutils_native.dir/csrc/dat.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/dat.c.o.d"
+  "/root/package/csrc/evt2.c" "CMakeFiles/evutils_native.dir/csrc/evt2.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evt2.c.o.d"
+  "/root/package/csrc/evt21.c" "CMakeFiles/evutils_native.dir/csrc/evt21.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evt21.c.o.d"
+  "/root/package/csrc/evt2_encoder.c" "CMakeFiles/evutils_native.dir/csrc/evt2_encoder.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evt2_encoder.c.o.d"
+  "/root/package/csrc/evt3.c" "CMakeFiles/evutils_native.dir/csrc/evt3.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evt3.c.o.d"
+  "/root/package/csrc/evt3_encoder.c" "CMakeFiles/evutils_native.dir/csrc/evt3_encoder.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evt3_encoder.c.o.d"
+  "/root/package/csrc/evt4.c" "CMakeFiles/evutils_native.dir/csrc/evt4.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evt4.c.o.d"
+  "/root/package/csrc/evu.c" "CMakeFiles/evutils_native.dir/csrc/evu.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evu.c.o.d"
+  "/root/package/csrc/evutils.c" "CMakeFiles/evutils_native.dir/csrc/evutils.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/evutils.c.o.d"
+  "/root/package/csrc/histogram.c" "CMakeFiles/evutils_native.dir/csrc/histogram.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/histogram.c.o.d"
+  "/root/package/csrc/simd.c" "CMakeFiles/evutils_native.dir/csrc/simd.c.o" "gcc" "CMakeFiles/evutils_native.dir/csrc/simd.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
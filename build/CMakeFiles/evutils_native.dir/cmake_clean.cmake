@@ -0,0 +1,37 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/evutils_native.dir/csrc/aedat4.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/aedat4.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/aer.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/aer.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/csv.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/csv.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/dat.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/dat.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evt2.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evt2.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evt21.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evt21.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evt2_encoder.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evt2_encoder.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evt3.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evt3.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evt3_encoder.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evt3_encoder.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evt4.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evt4.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evu.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evu.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/evutils.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/evutils.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/histogram.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/histogram.c.o.d"
+  "CMakeFiles/evutils_native.dir/csrc/simd.c.o"
+  "CMakeFiles/evutils_native.dir/csrc/simd.c.o.d"
+  "libevutils_native.pdb"
+  "libevutils_native.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/evutils_native.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
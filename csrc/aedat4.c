@@ -0,0 +1,133 @@
+#include "evutils/aedat4.h"
+#include "evutils/filter.h"
+
+#include <string.h>
+
+typedef struct aedat4_state_s {
+    uint32_t next;   /* index of the next vector element of the current body */
+} aedat4_state_t;
+
+#define AEDAT4_ELEMENT_SIZE 16
+
+
+size_t AEDAT4_state_size(void) {
+    return sizeof(aedat4_state_t);
+}
+
+
+/* Little-endian loads at arbitrary offsets (FlatBuffers only guarantee
+ * alignment relative to the buffer start). */
+static inline uint32_t load_u32(const uint8_t *p) { uint32_t v; memcpy(&v, p, 4); return v; }
+static inline int32_t load_i32(const uint8_t *p) { int32_t v; memcpy(&v, p, 4); return v; }
+static inline uint16_t load_u16(const uint8_t *p) { uint16_t v; memcpy(&v, p, 2); return v; }
+static inline int64_t load_i64(const uint8_t *p) { int64_t v; memcpy(&v, p, 8); return v; }
+
+
+/* Locate the struct vector of the root table's field 0. Returns 0 and sets
+ * `count` = 0 when the field is absent; -1 when the body is malformed. */
+static int aedat4_vector(const uint8_t *body, size_t len, const uint8_t **elements, uint32_t *count) {
+    *elements = NULL;
+    *count = 0;
+    const size_t root = 4 + (size_t)load_u32(body + 4);
+    if (root + 4 > len) {
+        return -1;
+    }
+    const int64_t vtable = (int64_t)root - load_i32(body + root);
+    if (vtable < 0 || (size_t)vtable + 4 > len) {
+        return -1;
+    }
+    const size_t vtable_size = load_u16(body + vtable);
+    const size_t slot = (size_t)vtable + 4;
+    if (slot + 2 > (size_t)vtable + vtable_size || slot + 2 > len) {
+        return 0;
+    }
+    const size_t voffset = load_u16(body + slot);
+    if (voffset == 0) {
+        return 0;
+    }
+    const size_t pos = root + voffset;
+    if (pos + 4 > len) {
+        return -1;
+    }
+    const size_t vector = pos + (size_t)load_u32(body + pos);
+    if (vector + 4 > len) {
+        return -1;
+    }
+    const uint32_t n = load_u32(body + vector);
+    if ((uint64_t)n * AEDAT4_ELEMENT_SIZE > len - (vector + 4)) {
+        return -1;
+    }
+    *elements = body + vector + 4;
+    *count = n;
+    return 0;
+}
+
+
+EVUTILS_TARGET_CLONES
+parser_result_t AEDAT4_parse_packet_soa(
+    aedat4_state_t *state,
+    const aedat4_input_buffer_t *input_buffer,
+    event_buffer_soa_t *event_buffer,
+    trigger_buffer_soa_t *trigger_buffer) {
+
+    const uint8_t *body = input_buffer->begin;
+    const size_t len = (size_t)(input_buffer->end - input_buffer->begin);
+    parser_result_t done = { .current = (const void *)input_buffer->end, .status = EVUTILS_PARSE_OK };
+
+    if (len < 12) {
+        state->next = 0;
+        return done;
+    }
+    const int is_events = memcmp(body + 8, "EVTS", 4) == 0;
+    const int is_triggers = !is_events && memcmp(body + 8, "TRIG", 4) == 0;
+    if (!is_events && !is_triggers) {
+        state->next = 0;
+        return done;
+    }
+
+    const uint8_t *elements;
+    uint32_t count;
+    if (aedat4_vector(body, len, &elements, &count) < 0) {
+        state->next = 0;
+        return (parser_result_t){ .current = (const void *)body, .status = EVUTILS_PARSE_ERROR };
+    }
+
+    uint32_t i = state->next;
+    if (is_events) {
+        size_t n = event_buffer->size;
+        const size_t capacity = event_buffer->capacity;
+        timestamp_t *restrict out_ts = event_buffer->t;
+        uint16_t *restrict out_x = event_buffer->x;
+        uint16_t *restrict out_y = event_buffer->y;
+        uint8_t *restrict out_p = event_buffer->p;
+        const event_filter_t *filter = event_buffer->filter;
+
+        for (; i < count && n < capacity; ++i) {
+            const uint8_t *e = elements + (size_t)i * AEDAT4_ELEMENT_SIZE;
+            out_ts[n] = (timestamp_t)load_i64(e);
+            out_x[n] = load_u16(e + 8);
+            out_y[n] = load_u16(e + 10);
+            out_p[n] = e[12];
+            n += EVUTILS_KEEP(filter, out_x[n], out_y[n], out_p[n]);
+        }
+        event_buffer->size = n;
+    } else {
+        size_t n = trigger_buffer->size;
+        const size_t capacity = trigger_buffer->capacity;
+        for (; i < count && n < capacity; ++i) {
+            const uint8_t *e = elements + (size_t)i * AEDAT4_ELEMENT_SIZE;
+            trigger_buffer->t[n] = (timestamp_t)load_i64(e);
+            trigger_buffer->id[n] = 0;
+            trigger_buffer->p[n] = e[8] & 1u;
+            n++;
+        }
+        trigger_buffer->size = n;
+    }
+
+    if (i < count) {
+        state->next = i;
+        return (parser_result_t){ .current = (const void *)body, .status = EVUTILS_PARSE_OUTPUT_FULL };
+    }
+    state->next = 0;
+    return done;
+}
@@ -1,4 +1,5 @@
 #include "evutils/aer.h"
+#include "evutils/filter.h"
 
 typedef struct aer_state_s {
     uint64_t t_next;   /* timestamp of the next decoded event (sequential) */
@@ -33,6 +34,7 @@ parser_result_t AER_parse_chunk_soa(
     uint16_t*    restrict out_x = event_buffer->x;
     uint16_t*    restrict out_y = event_buffer->y;
     uint8_t*     restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
 
     size_t n = event_buffer->size;
     const size_t capacity = event_buffer->capacity;
@@ -47,7 +49,7 @@ parser_result_t AER_parse_chunk_soa(
             out_x[n] = (uint16_t)((w >> 9) & 0x1FF);
             out_y[n] = (uint16_t)(w & 0x1FF);
             out_p[n] = (uint8_t)((w >> 18) & 0x1);
-            n++;
+            n += EVUTILS_KEEP(filter, out_x[n], out_y[n], out_p[n]);
         }
         state->t_next = t;
     } else {
@@ -57,7 +59,7 @@ parser_result_t AER_parse_chunk_soa(
             out_x[n] = (uint16_t)((w >> 9) & 0x1FF);
             out_y[n] = (uint16_t)(w & 0x1FF);
             out_p[n] = (uint8_t)((w >> 18) & 0x1);
-            n++;
+            n += EVUTILS_KEEP(filter, out_x[n], out_y[n], out_p[n]);
         }
     }
 
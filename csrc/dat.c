@@ -1,4 +1,5 @@
 #include "evutils/dat.h"
+#include "evutils/filter.h"
 
 typedef struct dat_state_s {
     uint64_t ts_offset;   /* accumulated 2^32 timestamp wraps */
@@ -26,6 +27,7 @@ parser_result_t DAT_parse_chunk_soa(
     uint16_t*    restrict out_x = event_buffer->x;
     uint16_t*    restrict out_y = event_buffer->y;
     uint8_t*     restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
 
     size_t n = event_buffer->size;
     const size_t capacity = event_buffer->capacity;
@@ -52,7 +54,7 @@ parser_result_t DAT_parse_chunk_soa(
         out_x[n] = (uint16_t)(data & 0x3FFF);
         out_y[n] = (uint16_t)((data >> 14) & 0x3FFF);
         out_p[n] = (uint8_t)((data >> 28) & 0x1);
-        n++;
+        n += EVUTILS_KEEP(filter, out_x[n], out_y[n], out_p[n]);
     }
 
     event_buffer->size = n;
@@ -1,5 +1,7 @@
 
 #include "evutils/evt2.h"
+#include "evutils/filter.h"
+#include "evutils/simd.h"
 
 typedef struct evt2_state_s {
     uint64_t last_ts_high;   /* current TIME_HIGH << 6 (bits 6..33)          */
@@ -15,6 +17,11 @@ size_t EVT2_state_size(void) {
     return sizeof(evt2_state_t);
 }
 
+void EVT2_state_time_base(const evt2_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high) {
+    *ts_high_high = state->ts_high_high;
+    *ts_high = state->last_ts_high;
+}
+
 
 enum EVT2_PacketType {
     EVT2_CD_OFF         = 0x0,
@@ -45,6 +52,7 @@ parser_result_t EVT2_parse_chunk_soa(
     uint16_t* restrict out_x = event_buffer->x;
     uint16_t* restrict out_y = event_buffer->y;
     uint8_t* restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
 
     // Trigger output buffers
     timestamp_t* restrict trigger_ts = trigger_buffer->t;
@@ -60,12 +68,25 @@ parser_result_t EVT2_parse_chunk_soa(
 
     parse_status_t status = EVUTILS_PARSE_OK;
 
+    // Unfiltered decodes hand runs of CD words to the SIMD kernel (if any).
+    const evutils_cd32_kernel_t cd32 = filter == NULL ? evutils_cd32_kernel() : NULL;
+    const uint32_t *simd_resume = current;
+
     while(
         current < end &&
         n_events_read < events_capacity &&
         n_triggers_read < triggers_capacity
     ) {
 
+        if (cd32 != NULL && current >= simd_resume) {
+            event_buffer->size = n_events_read;
+            current += cd32(current, (size_t)(end - current), EVT2_CD_OFF, EVT2_EVT_TIME_HIGH,
+                            &last_ts_high, &ts_high_high, event_buffer);
+            n_events_read = event_buffer->size;
+            simd_resume = current + EVUTILS_CD32_BACKOFF;
+            continue;
+        }
+
         uint32_t packet_type = (*current & 0xF0000000) >> 28;
         uint32_t packet_data = *current & 0x0FFFFFFF;
         uint8_t value = 0, channel = 0;
@@ -83,7 +104,7 @@ parser_result_t EVT2_parse_chunk_soa(
                 out_y[n_events_read] = packet_data & 0x7FF;
 
                 out_p[n_events_read] = !!packet_type;
-                n_events_read++;
+                n_events_read += EVUTILS_KEEP(filter, out_x[n_events_read], out_y[n_events_read], out_p[n_events_read]);
                 break;
             case EVT2_EVT_TIME_HIGH:
                 {
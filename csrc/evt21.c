@@ -1,4 +1,5 @@
 #include "evutils/evt21.h"
+#include "evutils/filter.h"
 
 
 enum EVT21_PacketType{
@@ -21,6 +22,11 @@ size_t EVT21_state_size(void) {
     return sizeof(evt21_state_t);
 }
 
+void EVT21_state_time_base(const evt21_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high) {
+    *ts_high_high = state->ts_high_high;
+    *ts_high = state->last_ts_high;
+}
+
 /* The TIME_HIGH field is 28 bits carrying time base bits 6..33, so it wraps at
  * 2^34. Bump the overflow accumulator by 2^34 on each wrap. */
 #define EVT21_TS_WRAP (1ULL << 34)
@@ -53,6 +59,7 @@ parser_result_t EVT21_parse_chunk_soa(
     uint16_t* restrict out_x = event_buffer->x;
     uint16_t* restrict out_y = event_buffer->y;
     uint8_t* restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
 
     // Trigger output buffers
     timestamp_t* restrict trigger_ts = trigger_buffer->t;
@@ -101,7 +108,7 @@ parser_result_t EVT21_parse_chunk_soa(
                 out_x[n_events_read] = (uint16_t)(x + lz);
                 out_y[n_events_read] = (uint16_t)y;
                 out_p[n_events_read] = (uint8_t)p;
-                n_events_read++;
+                n_events_read += EVUTILS_KEEP(filter, (uint32_t)(x + lz), (uint32_t)y, p);
             }
             continue;
         }
@@ -0,0 +1,101 @@
+#include "evutils/encoder.h"
+#include "evutils/compat.h"
+
+#include <stdint.h>
+
+/* EVT2, EVT2.1 and EVT4 share one CD / TIME_HIGH bit layout and differ only in
+ * type codes and word width:
+ *
+ *   TIME_HIGH  type[28:31] | ts[6:33]                           (28 bits)
+ *   CD         type[28:31] | ts[0:5] << 22 | x << 11 | y
+ *
+ * EVT2.1 widens the CD word to 64 bits with the validity mask for
+ * x..x+31 in the high half; one event per word sets only bit 0. */
+#define EVT2_TYPE_CD_OFF      0x0u
+#define EVT2_TYPE_TIME_HIGH   0x8u
+#define EVT4_TYPE_CD_OFF      0xAu
+#define EVT4_TYPE_TIME_HIGH   0xEu
+
+
+static inline uint32_t evt2_cd_word(uint32_t type_off, timestamp64_t ts, uint16_t x, uint16_t y, uint8_t p) {
+    return ((type_off | (p & 1u)) << 28)
+         | ((uint32_t)(ts & 0x3F) << 22)
+         | ((uint32_t)(x & 0x7FF) << 11)
+         | (uint32_t)(y & 0x7FF);
+}
+
+/* Emit TIME_HIGH when the 28-bit high part changes. Returns the words written. */
+static inline size_t evt2_time_high(int64_t *last, uint32_t type, timestamp64_t ts, uint32_t *out) {
+    const int64_t high = (int64_t)((ts >> 6) & 0x0FFFFFFF);
+    if (high == *last) {
+        return 0;
+    }
+    *last = high;
+    *out = (type << 28) | (uint32_t)high;
+    return 1;
+}
+
+static inline size_t evt2_encode_words(
+    evt_encoder_state_t *state,
+    const event_buffer_soa_t *events,
+    uint32_t type_cd_off,
+    uint32_t type_time_high,
+    uint32_t *out) {
+
+    const size_t n = events->size;
+    const timestamp64_t *restrict in_t = events->t;
+    const uint16_t *restrict in_x = events->x;
+    const uint16_t *restrict in_y = events->y;
+    const uint8_t *restrict in_p = events->p;
+
+    int64_t ts_high = state->ts_high;
+    size_t w = 0;
+    for (size_t i = 0; i < n; ++i) {
+        w += evt2_time_high(&ts_high, type_time_high, in_t[i], out + w);
+        out[w++] = evt2_cd_word(type_cd_off, in_t[i], in_x[i], in_y[i], in_p[i]);
+    }
+    state->ts_high = ts_high;
+    return w;
+}
+
+
+EVUTILS_TARGET_CLONES
+size_t EVT2_encode_soa(
+    evt_encoder_state_t *state,
+    const event_buffer_soa_t *events,
+    uint32_t *out) {
+    return evt2_encode_words(state, events, EVT2_TYPE_CD_OFF, EVT2_TYPE_TIME_HIGH, out);
+}
+
+EVUTILS_TARGET_CLONES
+size_t EVT4_encode_soa(
+    evt_encoder_state_t *state,
+    const event_buffer_soa_t *events,
+    uint32_t *out) {
+    return evt2_encode_words(state, events, EVT4_TYPE_CD_OFF, EVT4_TYPE_TIME_HIGH, out);
+}
+
+EVUTILS_TARGET_CLONES
+size_t EVT21_encode_soa(
+    evt_encoder_state_t *state,
+    const event_buffer_soa_t *events,
+    uint64_t *out) {
+
+    const size_t n = events->size;
+    const timestamp64_t *restrict in_t = events->t;
+    const uint16_t *restrict in_x = events->x;
+    const uint16_t *restrict in_y = events->y;
+    const uint8_t *restrict in_p = events->p;
+
+    int64_t ts_high = state->ts_high;
+    size_t w = 0;
+    for (size_t i = 0; i < n; ++i) {
+        uint32_t high_word;
+        if (evt2_time_high(&ts_high, EVT2_TYPE_TIME_HIGH, in_t[i], &high_word)) {
+            out[w++] = high_word;
+        }
+        out[w++] = (1ULL << 32) | evt2_cd_word(EVT2_TYPE_CD_OFF, in_t[i], in_x[i], in_y[i], in_p[i]);
+    }
+    state->ts_high = ts_high;
+    return w;
+}
@@ -2,6 +2,7 @@
 #include "evutils/evt3.h"
 #include "evutils/types.h"
 #include "evutils/parser.h"
+#include "evutils/filter.h"
 
 #include <stdio.h>
 #include <stdint.h>
@@ -41,6 +42,11 @@ size_t EVT3_state_size(void) {
     return sizeof(evt3_state_t);
 }
 
+void EVT3_state_time_base(const evt3_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high) {
+    *ts_high_high = state->ts_high_high;
+    *ts_high = state->ts_high;
+}
+
 
 #define EMIT_SOA() do { \
     unsigned has = (vec_valid != 0u); \
@@ -49,7 +55,7 @@ size_t EVT3_state_size(void) {
     out_x[n] = (uint16_t)(bx + lz); \
     out_y[n] = y; \
     out_p[n] = p; \
-    n += has; \
+    n += has & EVUTILS_KEEP(filter, out_x[n], y, p); \
     vec_valid &= vec_valid - 1u; \
 } while (0)
 
@@ -62,7 +68,7 @@ static inline const unaligned_uint16_t * EVT3_parse_vector_12_12_8_soa(
     evt3_state_t * __restrict__ state,
     timestamp_t* __restrict__ out_ts, uint16_t* __restrict__ out_x,
     uint16_t* __restrict__ out_y,  uint8_t* __restrict__ out_p,
-    size_t * n_events) {
+    size_t * n_events, const event_filter_t *filter) {
 
     uint32_t vec_valid = EVT3_get_packet_data(*current);
     current++;
@@ -123,6 +129,7 @@ parser_result_t EVT3_parse_chunk_soa(
     uint16_t* restrict out_x = event_buffer->x;
     uint16_t* restrict out_y = event_buffer->y;
     uint8_t* restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
     
     // Trigger output buffers
     const size_t triggers_capacity = trigger_buffer->capacity;
@@ -153,7 +160,7 @@ parser_result_t EVT3_parse_chunk_soa(
             out_y[n_events_read] = local_state.y;
             out_x[n_events_read] = (packet_data & 0x7FF);
             out_p[n_events_read] = (packet_data & 0x800) >> 11;
-            n_events_read++;
+            n_events_read += EVUTILS_KEEP(filter, out_x[n_events_read], local_state.y, out_p[n_events_read]);
             current++;
             continue;
         }
@@ -166,7 +173,7 @@ parser_result_t EVT3_parse_chunk_soa(
 
             // Parse vector messages
             while (EVT3_get_packet_type(*current) == EVT3_VECT_12 && current < end_offset && n_events_read < events_capacity_offset) {
-                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read);
+                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read, filter);
             }
 
             continue;
@@ -205,7 +212,7 @@ parser_result_t EVT3_parse_chunk_soa(
                 n_triggers_read++;
                 break;
             case EVT3_VECT_12:
-                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read);
+                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read, filter);
                 continue;
                 break;
             case EVT3_VECT_8:
@@ -277,6 +284,7 @@ parser_result_t EVT3_parse_delta_t_soa(
     uint16_t* restrict out_x = event_buffer->x;
     uint16_t* restrict out_y = event_buffer->y;
     uint8_t* restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
 
     const size_t triggers_capacity = trigger_buffer->capacity;
     size_t n_triggers_read = trigger_buffer->size;
@@ -307,7 +315,7 @@ parser_result_t EVT3_parse_delta_t_soa(
             out_y[n_events_read] = local_state.y;
             out_x[n_events_read] = (packet_data & 0x7FF);
             out_p[n_events_read] = (packet_data & 0x800) >> 11;
-            n_events_read++;
+            n_events_read += EVUTILS_KEEP(filter, out_x[n_events_read], local_state.y, out_p[n_events_read]);
             current++;
             continue;
         }
@@ -316,7 +324,7 @@ parser_result_t EVT3_parse_delta_t_soa(
             local_state.vecbase_p = (packet_data & 0x800) >> 11;
             current++;
             while (EVT3_get_packet_type(*current) == EVT3_VECT_12 && current < end_offset && n_events_read < events_capacity_offset) {
-                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read);
+                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read, filter);
             }
             continue;
         }
@@ -351,7 +359,7 @@ parser_result_t EVT3_parse_delta_t_soa(
                 n_triggers_read++;
                 break;
             case EVT3_VECT_12:
-                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read);
+                current = EVT3_parse_vector_12_12_8_soa(current, &local_state, out_ts, out_x, out_y, out_p, &n_events_read, filter);
                 continue;
                 break;
             case EVT3_VECT_8:
@@ -0,0 +1,93 @@
+#include "evutils/encoder.h"
+#include "evutils/compat.h"
+
+#include <stdint.h>
+
+#define EVT3_WORD_ADDR_Y      0x0000u
+#define EVT3_WORD_ADDR_X      0x2000u
+#define EVT3_WORD_VECT_BASE_X 0x3000u
+#define EVT3_WORD_VECT_12     0x4000u
+#define EVT3_WORD_VECT_8      0x5000u
+#define EVT3_WORD_TIME_LOW    0x6000u
+#define EVT3_WORD_TIME_HIGH   0x8000u
+
+/* Longest vector group: VECT_BASE_X + VECT_12 + VECT_12 + VECT_8. */
+#define EVT3_VECT_SPAN 32
+
+EVUTILS_TARGET_CLONES
+size_t EVT3_encode_soa(
+    evt_encoder_state_t *state,
+    const event_buffer_soa_t *events,
+    uint16_t *out) {
+
+    const size_t n = events->size;
+    const timestamp64_t *restrict in_t = events->t;
+    const uint16_t *restrict in_x = events->x;
+    const uint16_t *restrict in_y = events->y;
+    const uint8_t *restrict in_p = events->p;
+
+    int64_t ts_high = state->ts_high;
+    int64_t ts_low = state->ts_low;
+    int32_t last_y = state->y;
+    size_t w = 0;
+    size_t i = 0;
+
+    while (i < n) {
+        const timestamp64_t ts = in_t[i];
+        const int64_t high = (int64_t)((ts >> 12) & 0xFFF);
+        const int64_t low = (int64_t)(ts & 0xFFF);
+        if (high != ts_high) {
+            out[w++] = (uint16_t)(EVT3_WORD_TIME_HIGH | (uint32_t)high);
+            ts_high = high;
+        }
+        if (low != ts_low) {
+            out[w++] = (uint16_t)(EVT3_WORD_TIME_LOW | (uint32_t)low);
+            ts_low = low;
+        }
+        const uint16_t y = in_y[i] & 0x7FF;
+        if ((int32_t)y != last_y) {
+            out[w++] = (uint16_t)(EVT3_WORD_ADDR_Y | y);  /* master camera */
+            last_y = y;
+        }
+
+        /* Gather the vector run starting here. Strictly increasing x keeps the
+         * decoded order (ascending bit order) identical to the input order. */
+        const uint16_t x0 = in_x[i] & 0x7FF;
+        const uint32_t p = in_p[i] & 1u;
+        uint32_t mask = 1u;
+        uint16_t last_x = x0;
+        size_t j = i + 1;
+        while (j < n && in_t[j] == ts && (in_y[j] & 0x7FF) == y && (uint32_t)(in_p[j] & 1u) == p) {
+            const uint16_t x = in_x[j] & 0x7FF;
+            if (x <= last_x || x - x0 >= EVT3_VECT_SPAN) {
+                break;
+            }
+            mask |= 1u << (x - x0);
+            last_x = x;
+            j++;
+        }
+
+        /* A group costs VECT_BASE_X plus one word per 12/12/8 bits in use. */
+        const unsigned span = (unsigned)(last_x - x0);
+        const size_t words = span < 12 ? 1 : (span < 24 ? 2 : 3);
+        if (j - i >= words + 2) {
+            out[w++] = (uint16_t)(EVT3_WORD_VECT_BASE_X | (p << 11) | x0);
+            out[w++] = (uint16_t)(EVT3_WORD_VECT_12 | (mask & 0xFFF));
+            if (words > 1) {
+                out[w++] = (uint16_t)(EVT3_WORD_VECT_12 | ((mask >> 12) & 0xFFF));
+            }
+            if (words > 2) {
+                out[w++] = (uint16_t)(EVT3_WORD_VECT_8 | ((mask >> 24) & 0xFF));
+            }
+            i = j;
+        } else {
+            out[w++] = (uint16_t)(EVT3_WORD_ADDR_X | (p << 11) | x0);
+            i++;
+        }
+    }
+
+    state->ts_high = ts_high;
+    state->ts_low = ts_low;
+    state->y = last_y;
+    return w;
+}
@@ -1,4 +1,6 @@
 #include "evutils/evt4.h"
+#include "evutils/filter.h"
+#include "evutils/simd.h"
 
 /* EVT4 timestamp reconstruction is identical to EVT2: the 28-bit TIME_HIGH
  * field carries time-base bits 6..33 (so it is shifted left by 6), and the CD /
@@ -16,6 +18,11 @@ size_t EVT4_state_size(void) {
     return sizeof(evt4_state_t);
 }
 
+void EVT4_state_time_base(const evt4_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high) {
+    *ts_high_high = state->ts_high_high;
+    *ts_high = state->last_ts_high;
+}
+
 
 /* 4-bit type field in bits 28..31 of each 32-bit word. */
 enum EVT4_PacketType {
@@ -53,6 +60,7 @@ parser_result_t EVT4_parse_chunk_soa(
     uint16_t* restrict out_x = event_buffer->x;
     uint16_t* restrict out_y = event_buffer->y;
     uint8_t* restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
 
     // Trigger output buffers
     timestamp_t* restrict trigger_ts = trigger_buffer->t;
@@ -68,12 +76,25 @@ parser_result_t EVT4_parse_chunk_soa(
 
     parse_status_t status = EVUTILS_PARSE_OK;
 
+    // Unfiltered decodes hand runs of CD words to the SIMD kernel (if any).
+    const evutils_cd32_kernel_t cd32 = filter == NULL ? evutils_cd32_kernel() : NULL;
+    const uint32_t *simd_resume = current;
+
     while(
         current < end &&
         n_events_read < events_capacity_offset &&
         n_triggers_read < triggers_capacity
     ) {
 
+        if (cd32 != NULL && current >= simd_resume) {
+            event_buffer->size = n_events_read;
+            current += cd32(current, (size_t)(end - current), EVT4_CD_OFF, EVT4_EVT_TIME_HIGH,
+                            &last_ts_high, &ts_high_high, event_buffer);
+            n_events_read = event_buffer->size;
+            simd_resume = current + EVUTILS_CD32_BACKOFF;
+            continue;
+        }
+
         uint32_t packet_type = (*current & 0xF0000000) >> 28;
         uint32_t packet_data = *current & 0x0FFFFFFF;
 
@@ -85,7 +106,7 @@ parser_result_t EVT4_parse_chunk_soa(
                 out_x[n_events_read] = (packet_data >> 11) & 0x7FF;
                 out_y[n_events_read] = packet_data & 0x7FF;
                 out_p[n_events_read] = packet_type & 1;   // CD_ON (0xB) -> 1
-                n_events_read++;
+                n_events_read += EVUTILS_KEEP(filter, out_x[n_events_read], out_y[n_events_read], out_p[n_events_read]);
                 break;
             case EVT4_CD_VEC_OFF:
             case EVT4_CD_VEC_ON: {
@@ -110,7 +131,7 @@ parser_result_t EVT4_parse_chunk_soa(
                     out_x[n_events_read] = (uint16_t)(base_x + off);
                     out_y[n_events_read] = y;
                     out_p[n_events_read] = p;
-                    n_events_read++;
+                    n_events_read += EVUTILS_KEEP(filter, base_x + off, y, p);
                     mask &= mask - 1u;
                 }
                 current++;   // consume the mask word (base word consumed below)
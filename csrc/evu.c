@@ -0,0 +1,157 @@
+#include "evutils/evu.h"
+#include "evutils/filter.h"
+
+#include <string.h>
+
+static inline uint64_t load_u64(const uint8_t *p) { uint64_t v; memcpy(&v, p, 8); return v; }
+static inline void store_u64(uint8_t *p, uint64_t v) { memcpy(p, &v, 8); }
+static inline uint32_t load_u32(const uint8_t *p) { uint32_t v; memcpy(&v, p, 4); return v; }
+static inline void store_u32(uint8_t *p, uint32_t v) { memcpy(p, &v, 4); }
+static inline uint16_t load_u16(const uint8_t *p) { uint16_t v; memcpy(&v, p, 2); return v; }
+static inline void store_u16(uint8_t *p, uint16_t v) { memcpy(p, &v, 2); }
+
+static inline unsigned bit_length(uint32_t v) {
+    unsigned n = 0;
+    while (v) {
+        n++;
+        v >>= 1;
+    }
+    return n;
+}
+
+
+size_t EVU_encode_block_soa(const event_buffer_soa_t *events, uint8_t *out) {
+    const size_t n = events->size;
+    const timestamp64_t *t = events->t;
+    const uint16_t *xs = events->x;
+    const uint16_t *ys = events->y;
+    const uint8_t *ps = events->p;
+
+    uint16_t x_min = 0xFFFF, x_max = 0, y_min = 0xFFFF, y_max = 0;
+    uint8_t p_max = 0;
+    for (size_t i = 0; i < n; ++i) {
+        if (xs[i] < x_min) x_min = xs[i];
+        if (xs[i] > x_max) x_max = xs[i];
+        if (ys[i] < y_min) y_min = ys[i];
+        if (ys[i] > y_max) y_max = ys[i];
+        if (ps[i] > p_max) p_max = ps[i];
+    }
+    if (n == 0) {
+        x_min = y_min = 0;
+        x_max = y_max = 0;
+    }
+    const unsigned x_bits = bit_length((uint32_t)(x_max - x_min));
+    const unsigned y_bits = bit_length((uint32_t)(y_max - y_min));
+    const unsigned p_bits = bit_length(p_max);
+    const unsigned w = x_bits + y_bits + p_bits;
+
+    store_u32(out, (uint32_t)n);
+    out[4] = (uint8_t)x_bits;
+    out[5] = (uint8_t)y_bits;
+    out[6] = (uint8_t)p_bits;
+    out[7] = 0;
+    store_u16(out + 8, x_min);
+    store_u16(out + 10, y_min);
+    store_u64(out + 12, n ? (uint64_t)t[0] : 0);
+
+    /* Zigzag deltas as LEB128 varints: a sorted stream costs one byte per
+     * event for gaps under 64 us, and a backwards step stays representable. */
+    uint8_t *d = out + EVU_BLOCK_HEADER;
+    for (size_t i = 1; i < n; ++i) {
+        const int64_t delta = (int64_t)(t[i] - t[i - 1]);
+        uint64_t z = ((uint64_t)delta << 1) ^ (uint64_t)(delta >> 63);
+        while (z >= 0x80) {
+            *d++ = (uint8_t)(z | 0x80);
+            z >>= 7;
+        }
+        *d++ = (uint8_t)z;
+    }
+    store_u32(out + 20, (uint32_t)(d - (out + EVU_BLOCK_HEADER)));
+
+    const size_t packed = ((size_t)n * w + 7) / 8;
+    memset(d, 0, packed + EVU_PAD);
+    if (w > 0) {
+        for (size_t i = 0; i < n; ++i) {
+            const uint64_t v = (uint64_t)(xs[i] - x_min)
+                             | ((uint64_t)(ys[i] - y_min) << x_bits)
+                             | ((uint64_t)ps[i] << (x_bits + y_bits));
+            const size_t bit = i * w;
+            uint8_t *at = d + (bit >> 3);
+            store_u64(at, load_u64(at) | (v << (bit & 7)));
+        }
+    }
+    return (size_t)(d + packed + EVU_PAD - out);
+}
+
+
+EVUTILS_TARGET_CLONES
+parser_result_t EVU_decode_block_soa(const evu_input_buffer_t *input_buffer, event_buffer_soa_t *event_buffer) {
+    const uint8_t *body = input_buffer->begin;
+    const size_t len = (size_t)(input_buffer->end - input_buffer->begin);
+    const parser_result_t error = { .current = (const void *)body, .status = EVUTILS_PARSE_ERROR };
+
+    if (len < EVU_BLOCK_HEADER + EVU_PAD) {
+        return error;
+    }
+    const size_t n = load_u32(body);
+    const unsigned x_bits = body[4], y_bits = body[5], p_bits = body[6];
+    const unsigned w = x_bits + y_bits + p_bits;
+    if (x_bits > 16 || y_bits > 16 || p_bits > 8) {
+        return error;
+    }
+    const uint16_t x_min = load_u16(body + 8);
+    const uint16_t y_min = load_u16(body + 10);
+    const size_t t_bytes = load_u32(body + 20);
+    const size_t packed = (n * w + 7) / 8;
+    if (t_bytes > len || EVU_BLOCK_HEADER + t_bytes + packed + EVU_PAD > len) {
+        return error;
+    }
+    if (event_buffer->capacity - event_buffer->size < n) {
+        return (parser_result_t){ .current = (const void *)body, .status = EVUTILS_PARSE_OUTPUT_FULL };
+    }
+
+    size_t k = event_buffer->size;
+    timestamp64_t *restrict out_t = event_buffer->t;
+    uint16_t *restrict out_x = event_buffer->x;
+    uint16_t *restrict out_y = event_buffer->y;
+    uint8_t *restrict out_p = event_buffer->p;
+    const event_filter_t *filter = event_buffer->filter;
+
+    const uint8_t *d = body + EVU_BLOCK_HEADER;
+    const uint8_t *d_end = d + t_bytes;
+    const uint8_t *bits = d_end;
+    const uint64_t x_mask = (1ull << x_bits) - 1;
+    const uint64_t y_mask = (1ull << y_bits) - 1;
+    const uint64_t p_mask = (1ull << p_bits) - 1;
+    const uint64_t w_mask = (1ull << w) - 1;
+
+    uint64_t ts = load_u64(body + 12);
+    for (size_t i = 0; i < n; ++i) {
+        if (i > 0) {
+            uint64_t z = 0;
+            unsigned shift = 0;
+            uint8_t byte;
+            do {
+                if (unlikely(d >= d_end || shift > 63)) {
+                    return error;
+                }
+                byte = *d++;
+                z |= (uint64_t)(byte & 0x7F) << shift;
+                shift += 7;
+            } while (byte & 0x80);
+            ts += (z >> 1) ^ (uint64_t)(-(int64_t)(z & 1));
+        }
+        const size_t bit = i * w;
+        const uint64_t v = (load_u64(bits + (bit >> 3)) >> (bit & 7)) & w_mask;
+        out_t[k] = ts;
+        out_x[k] = (uint16_t)(x_min + (v & x_mask));
+        out_y[k] = (uint16_t)(y_min + ((v >> x_bits) & y_mask));
+        out_p[k] = (uint8_t)((v >> (x_bits + y_bits)) & p_mask);
+        k += EVUTILS_KEEP(filter, out_x[k], out_y[k], out_p[k]);
+    }
+    if (d != d_end) {
+        return error;
+    }
+    event_buffer->size = k;
+    return (parser_result_t){ .current = (const void *)input_buffer->end, .status = EVUTILS_PARSE_OK };
+}
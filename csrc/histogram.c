@@ -0,0 +1,48 @@
+#include "evutils/histogram.h"
+#include "evutils/compat.h"
+
+EVUTILS_TARGET_CLONES
+size_t evutils_histogram_accumulate_soa(
+    const event_buffer_soa_t *events,
+    size_t start,
+    uint32_t *counts,
+    uint32_t n_bins,
+    uint32_t height,
+    uint32_t width,
+    timestamp_t t0,
+    uint64_t delta_t) {
+
+    const timestamp_t *restrict in_t = events->t;
+    const uint16_t *restrict in_x = events->x;
+    const uint16_t *restrict in_y = events->y;
+    const uint8_t *restrict in_p = events->p;
+    const size_t n = events->size;
+
+    const timestamp_t t_end = t0 + delta_t;
+    const size_t row = (size_t)width * 2;
+    const size_t plane = (size_t)height * row;
+
+    size_t i = start;
+    if (n_bins <= 1) {
+        /* Single frame: no per-event bin arithmetic. */
+        for (; i < n; i++) {
+            if (in_t[i] >= t_end) break;
+            const uint32_t x = in_x[i], y = in_y[i];
+            if (x >= width || y >= height) continue;
+            counts[y * row + x * 2 + (in_p[i] & 1u)]++;
+        }
+        return i;
+    }
+
+    for (; i < n; i++) {
+        const timestamp_t t = in_t[i];
+        if (t >= t_end) break;
+        const uint32_t x = in_x[i], y = in_y[i];
+        if (x >= width || y >= height) continue;
+        /* Events stamped before t0 (never produced by an ordered stream) fall
+         * into the first bin. */
+        const uint64_t bin = t > t0 ? (t - t0) * n_bins / delta_t : 0;
+        counts[bin * plane + y * row + x * 2 + (in_p[i] & 1u)]++;
+    }
+    return i;
+}
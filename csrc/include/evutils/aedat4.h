@@ -0,0 +1,48 @@
+/* evutils — AEDAT 4.0 (DV) packet parser.
+ *
+ * An AEDAT4 packet body (after decompression) is a size-prefixed FlatBuffer:
+ *   bytes 0-3: size prefix, bytes 4-7: root table offset, bytes 8-11: file
+ *   identifier ("EVTS" event packet, "TRIG" trigger packet, others ignored).
+ * The root table's single field is a vector of 16-byte structs:
+ *   EVTS: int64 t, int16 x, int16 y, uint8 p, 3 pad bytes
+ *   TRIG: int64 t, int8 type, 7 pad bytes   (p = type & 1, rising edges odd)
+ * The container (packet headers, compression) is walked by the caller; this
+ * parser decodes one body at a time and can resume a body mid-vector when the
+ * output buffer fills.
+ */
+#ifndef EVUTILS_AEDAT4_H
+#define EVUTILS_AEDAT4_H
+
+#include "evutils/types.h"
+#include "evutils/parser.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct aedat4_state_s aedat4_state_t;
+
+/* One decompressed packet body. */
+typedef struct aedat4_input_buffer_s {
+    const uint8_t *begin;
+    const uint8_t *end;
+} aedat4_input_buffer_t;
+
+size_t AEDAT4_state_size(void);
+
+/* Decode the body's elements into the event / trigger buffers. Returns
+ * EVUTILS_PARSE_OK with `current == end` once the body is fully decoded (the
+ * state is then ready for the next body), EVUTILS_PARSE_OUTPUT_FULL with
+ * `current == begin` when an output filled first (call again with the same
+ * body to continue), or EVUTILS_PARSE_ERROR for a malformed / truncated body. */
+parser_result_t AEDAT4_parse_packet_soa(
+    aedat4_state_t              *state,
+    const aedat4_input_buffer_t *input_buffer,
+    event_buffer_soa_t          *event_buffer,
+    trigger_buffer_soa_t        *trigger_buffer);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* EVUTILS_AEDAT4_H */
@@ -0,0 +1,64 @@
+/* evutils — native EVT encoders.
+ *
+ * The writers' counterpart of the parsers: encode straight from the SoA event
+ * columns into a caller-owned word buffer (reused across calls), carrying the
+ * running timestamp / row state between calls so a stream can be written in
+ * any number of batches.
+ */
+#ifndef EVUTILS_ENCODER_H
+#define EVUTILS_ENCODER_H
+
+#include "evutils/types.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Running encoder state. Zero-initialise, then set every field to -1 ("nothing
+ * emitted yet") so the first event always writes its time base and row. */
+typedef struct evt_encoder_state_s {
+    int64_t ts_high;  /* last TIME_HIGH payload emitted (all formats)      */
+    int64_t ts_low;   /* EVT3: last TIME_LOW payload emitted               */
+    int32_t y;        /* EVT3: last ADDR_Y emitted                         */
+} evt_encoder_state_t;
+
+/* Worst case output words for n events: TIME_HIGH + TIME_LOW + ADDR_Y + ADDR_X. */
+#define EVT3_ENCODE_MAX_WORDS(n) (4 * (size_t)(n))
+
+/* Encode events[0:size) as EVT3 16-bit words into `out`, which must hold
+ * EVT3_ENCODE_MAX_WORDS(size) words. Runs of events sharing timestamp, row and
+ * polarity with strictly increasing x inside a 32-pixel span are written as
+ * VECT_BASE_X + VECT_12 [+ VECT_12 [+ VECT_8]] groups whenever that is shorter
+ * than one ADDR_X per event. Returns the number of words written. */
+size_t EVT3_encode_soa(
+    evt_encoder_state_t      *state,
+    const event_buffer_soa_t *events,
+    uint16_t                 *out);
+
+/* Worst case output words for n events in EVT2 / EVT2.1 / EVT4: TIME_HIGH + CD. */
+#define EVT2_ENCODE_MAX_WORDS(n) (2 * (size_t)(n))
+
+/* Encode events[0:size) one CD word per event, emitting TIME_HIGH whenever
+ * bits 6..33 of the timestamp change. `out` must hold
+ * EVT2_ENCODE_MAX_WORDS(size) words of the format's width (32-bit for EVT2 /
+ * EVT4, 64-bit for EVT2.1). Return the number of words written. */
+size_t EVT2_encode_soa(
+    evt_encoder_state_t      *state,
+    const event_buffer_soa_t *events,
+    uint32_t                 *out);
+
+size_t EVT21_encode_soa(
+    evt_encoder_state_t      *state,
+    const event_buffer_soa_t *events,
+    uint64_t                 *out);
+
+size_t EVT4_encode_soa(
+    evt_encoder_state_t      *state,
+    const event_buffer_soa_t *events,
+    uint32_t                 *out);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* EVUTILS_ENCODER_H */
@@ -20,6 +20,10 @@ typedef struct evt2_input_buffer_s {
 
 
 
+/* Time base of a parser state: the accumulated TIME_HIGH wrap offset and the
+ * last TIME_HIGH value, both already shifted into timestamp bits (see evt3.h). */
+void EVT2_state_time_base(const evt2_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high);
+
 parser_result_t EVT2_parse_chunk_soa(
     evt2_state_t *state,
     const evt2_input_buffer_t *input_buffer,
@@ -21,6 +21,10 @@ typedef struct evt21_input_buffer_s {
 
 
 
+/* Time base of a parser state: the accumulated TIME_HIGH wrap offset and the
+ * last TIME_HIGH value, both already shifted into timestamp bits (see evt3.h). */
+void EVT21_state_time_base(const evt21_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high);
+
 parser_result_t EVT21_parse_chunk_soa(
     evt21_state_t *state,
     const evt21_input_buffer_t *input_buffer,
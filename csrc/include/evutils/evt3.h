@@ -47,6 +47,12 @@ typedef struct evt3_input_buffer_s {
 
 size_t EVT3_state_size(void);
 
+/* Time base of a parser state: the accumulated TIME_HIGH wrap offset and the
+ * last TIME_HIGH value, both already shifted into timestamp bits. Lets the
+ * segment-parallel read_all() chain the wrap accumulation across segments
+ * decoded from a fresh state. */
+void EVT3_state_time_base(const evt3_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high);
+
 parser_result_t EVT3_parse_chunk_soa(
     evt3_state_t            *state,
     const evt3_input_buffer_t *input_buffer,
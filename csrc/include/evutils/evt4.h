@@ -25,6 +25,10 @@ typedef struct evt4_input_buffer_s {
 
 size_t EVT4_state_size(void);
 
+/* Time base of a parser state: the accumulated TIME_HIGH wrap offset and the
+ * last TIME_HIGH value, both already shifted into timestamp bits (see evt3.h). */
+void EVT4_state_time_base(const evt4_state_t *state, uint64_t *ts_high_high, uint64_t *ts_high);
+
 parser_result_t EVT4_parse_chunk_soa(
     evt4_state_t            *state,
     const evt4_input_buffer_t *input_buffer,
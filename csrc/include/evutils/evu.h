@@ -0,0 +1,61 @@
+/* evutils — EVU block codec (evutils' own chunked columnar container).
+ *
+ * An .evu file is a sequence of independently (optionally zstd-) compressed
+ * blocks plus a footer indexing them by time and event count; the container
+ * is walked by the caller (src/evutils/io/_evu.py). This codec encodes and
+ * decodes one uncompressed block body:
+ *
+ *   u32 n_events
+ *   u8  x_bits, y_bits, p_bits, reserved
+ *   u16 x_min, y_min
+ *   i64 t0                      first timestamp
+ *   u32 t_bytes                 length of the delta stream
+ *   t_bytes of LEB128 varints   zigzag(t[i] - t[i-1]) for i = 1..n-1
+ *   ceil(n * w / 8) bytes       x - x_min | (y - y_min) << x_bits |
+ *                               p << (x_bits + y_bits), w = x_bits + y_bits +
+ *                               p_bits bits per event, little-endian bit order
+ *   EVU_PAD zero bytes          so the packed fields load as unaligned 64-bit
+ *
+ * All integers are little-endian.
+ */
+#ifndef EVUTILS_EVU_H
+#define EVUTILS_EVU_H
+
+#include "evutils/types.h"
+#include "evutils/parser.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define EVU_BLOCK_HEADER 24
+#define EVU_PAD 8
+
+/* Worst-case body size for n events: 10-byte varints, 16+16+8 bit fields. */
+#define EVU_ENCODE_MAX_BYTES(n) (EVU_BLOCK_HEADER + 10 * (size_t)(n) + 5 * (size_t)(n) + EVU_PAD)
+
+typedef struct evu_input_buffer_s {
+    const uint8_t *begin;
+    const uint8_t *end;
+} evu_input_buffer_t;
+
+/* Encode events[0:size) as one block body into `out`, which must hold
+ * EVU_ENCODE_MAX_BYTES(size) bytes. Returns the body size. */
+size_t EVU_encode_block_soa(
+    const event_buffer_soa_t *events,
+    uint8_t                  *out);
+
+/* Decode a whole block body, appending its events after `events->size`.
+ * Returns EVUTILS_PARSE_OK with `current == end`, EVUTILS_PARSE_OUTPUT_FULL
+ * (nothing written) when fewer than n_events slots are free, or
+ * EVUTILS_PARSE_ERROR for a malformed / truncated body. The optional event
+ * filter drops events as in the other parsers. */
+parser_result_t EVU_decode_block_soa(
+    const evu_input_buffer_t *input_buffer,
+    event_buffer_soa_t       *event_buffer);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* EVUTILS_EVU_H */
@@ -0,0 +1,42 @@
+/* evutils — fused ROI / stride / polarity event filter.
+ *
+ * The parsers always write a decoded event into the next output slot and then
+ * advance the output count by EVUTILS_KEEP(): a rejected event is simply
+ * overwritten by the next one. The output therefore holds only kept events,
+ * and window accounting (n_events, delta_t) and the capacity checks operate on
+ * the filtered stream. A dropped event still costs its slot write; what the
+ * filter saves is the masking pass and the compacting copy afterwards.
+ *
+ * A NULL filter keeps everything. EVUTILS_KEEP tests for it per event; the
+ * test is loop-invariant, so the branch predicts perfectly and the unfiltered
+ * path pays one compare per event.
+ */
+#ifndef EVUTILS_FILTER_H
+#define EVUTILS_FILTER_H
+
+#include "evutils/compat.h"
+#include "evutils/types.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+static inline unsigned evutils_filter_keep(const event_filter_t *f, uint32_t x, uint32_t y, uint32_t p) {
+    if (!((f->polarity >> (p & 1u)) & 1u)) return 0;
+    if (f->x_stride > 1 && x % f->x_stride) return 0;
+    if (f->y_stride > 1 && y % f->y_stride) return 0;
+    if (f->n_rois == 0) return 1;
+    for (uint32_t i = 0; i < f->n_rois; i++) {
+        const uint16_t *r = f->roi[i];
+        if (x >= r[0] && y >= r[1] && x < r[2] && y < r[3]) return 1;
+    }
+    return 0;
+}
+
+#define EVUTILS_KEEP(f, x, y, p) ((f) == NULL || evutils_filter_keep((f), (x), (y), (p)))
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* EVUTILS_FILTER_H */
@@ -0,0 +1,36 @@
+/* evutils — native event-count accumulation.
+ *
+ * Scatter-increments decoded events straight into a caller-owned counter
+ * array, so frame generation (EventReader.iter_frames) never materialises a
+ * window of events: the parsers decode into a small, cache-resident SoA block
+ * that is accumulated and immediately reused.
+ */
+#ifndef EVUTILS_HISTOGRAM_H
+#define EVUTILS_HISTOGRAM_H
+
+#include "evutils/types.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Accumulate events[start:size) into `counts`, a C-contiguous
+ * (n_bins, height, width, 2) uint32 array indexed [bin][y][x][p]. An event at
+ * time t lands in bin (t - t0) * n_bins / delta_t; events outside the frame
+ * are skipped. Stops at the first event with t >= t0 + delta_t and returns its
+ * index (events->size when every event was accumulated). */
+size_t evutils_histogram_accumulate_soa(
+    const event_buffer_soa_t *events,
+    size_t start,
+    uint32_t *counts,
+    uint32_t n_bins,
+    uint32_t height,
+    uint32_t width,
+    timestamp_t t0,
+    uint64_t delta_t);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* EVUTILS_HISTOGRAM_H */
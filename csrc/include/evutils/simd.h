@@ -0,0 +1,58 @@
+/* evutils — runtime-dispatched SIMD kernels.
+ *
+ * EVT2 and EVT4 share a fixed-width 32-bit CD word (type[28:31], ts[22:27],
+ * x[11:21], y[0:10]), so long runs of CD words decode many lanes at a time.
+ * The kernel for the widest instruction set the CPU supports is picked once at
+ * first use (AVX-512F, AVX2, or none); the parsers call it on unfiltered
+ * decodes and fall back to their scalar loop wherever it stops.
+ */
+#ifndef EVUTILS_SIMD_H
+#define EVUTILS_SIMD_H
+
+#include "evutils/types.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+enum {
+    EVUTILS_SIMD_AUTO   = -1,
+    EVUTILS_SIMD_SCALAR = 0,
+    EVUTILS_SIMD_AVX2   = 1,
+    EVUTILS_SIMD_AVX512 = 2
+};
+
+/* Active kernel level (resolving EVUTILS_SIMD_AUTO on first call). */
+int evutils_simd_level(void);
+
+/* Force a level (clamped to what the CPU supports; EVUTILS_SIMD_AUTO picks the
+ * widest). Returns the level now in effect. Intended for benchmarks/tests. */
+int evutils_set_simd_level(int level);
+
+/* Decode whole blocks of CD words from `words[0:n_words)` into `events`,
+ * stopping at the first block holding anything but CD words and at most one
+ * TIME_HIGH, or when fewer than a block of words / output slots remain. CD
+ * types are `cd_type` (polarity 0) and `cd_type | 1`; TIME_HIGH is
+ * `time_high_type`. The time base is read and updated through `last_ts_high`
+ * / `ts_high_high` exactly as the scalar loop does. Returns words consumed. */
+typedef size_t (*evutils_cd32_kernel_t)(
+    const uint32_t     *words,
+    size_t              n_words,
+    uint32_t            cd_type,
+    uint32_t            time_high_type,
+    uint64_t           *last_ts_high,
+    uint64_t           *ts_high_high,
+    event_buffer_soa_t *events);
+
+/* Words the scalar loop decodes after a kernel stop before the kernel is tried
+ * again, so a block the kernel rejects is not re-probed word by word. */
+#define EVUTILS_CD32_BACKOFF 16
+
+/* The kernel for the active level, or NULL for scalar. */
+evutils_cd32_kernel_t evutils_cd32_kernel(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* EVUTILS_SIMD_H */
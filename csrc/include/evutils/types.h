@@ -20,8 +20,22 @@ typedef uint64_t timestamp64_t;
 typedef uint32_t timestamp32_t;
 typedef timestamp64_t timestamp_t;
 
+/* Fused event filter (ROI rectangles, x/y stride, polarity selection); see
+ * evutils/filter.h for the predicate the parsers apply. */
+#define EVUTILS_MAX_ROIS 8
+
+typedef struct event_filter_s {
+    uint32_t n_rois;                     /* 0: no spatial restriction        */
+    uint16_t roi[EVUTILS_MAX_ROIS][4];   /* x0, y0, x1, y1 (half-open)        */
+    uint16_t x_stride;                   /* keep x % x_stride == 0 (0/1: all) */
+    uint16_t y_stride;                   /* keep y % y_stride == 0 (0/1: all) */
+    uint8_t  polarity;                   /* bit p set: keep polarity p        */
+} event_filter_t;
+
 /* Struct-of-arrays event buffer (preferred for the numpy path: one dtype per
- * column, no struct padding to reconcile). */
+ * column, no struct padding to reconcile). `filter` is optional: when set, the
+ * parsers only count the events it keeps, so dropped events never occupy
+ * output slots. */
 typedef struct event_buffer_soa_s {
     timestamp64_t *t;
     uint16_t *x;
@@ -29,6 +43,7 @@ typedef struct event_buffer_soa_s {
     uint8_t  *p;
     size_t capacity;
     size_t size;
+    const event_filter_t *filter;
 } event_buffer_soa_t;
 
 typedef struct trigger_buffer_soa_s {
@@ -0,0 +1,223 @@
+#include "evutils/simd.h"
+#include "evutils/compat.h"
+
+#include <string.h>
+
+/* Same wrap as the scalar EVT2 / EVT4 loops: the 28-bit TIME_HIGH field holds
+ * time base bits 6..33. */
+#define CD32_TS_WRAP (1ULL << 34)
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define EVUTILS_HAVE_X86_SIMD 1
+#include <immintrin.h>
+#endif
+
+
+#ifdef EVUTILS_HAVE_X86_SIMD
+
+/* Apply a block's (single) TIME_HIGH word: advance the time base exactly as the
+ * scalar loop would. */
+static inline void cd32_time_high(uint32_t word, uint64_t *high, uint64_t *hh) {
+    const uint64_t new_high = (uint64_t)(word & 0x0FFFFFFF) << 6;
+    if (new_high < *high) {
+        *hh += CD32_TS_WRAP;
+    }
+    *high = new_high;
+}
+
+/* 8 words per step. A block may hold one TIME_HIGH at lane k: CD lanes before
+ * it take the old time base, lanes after it the new one, and the lanes are
+ * compacted over it with a permute (j -> j + (j >= k)). */
+__attribute__((target("avx2")))
+static size_t cd32_kernel_avx2(
+    const uint32_t *words, size_t n_words, uint32_t cd_type, uint32_t time_high_type,
+    uint64_t *last_ts_high, uint64_t *ts_high_high, event_buffer_soa_t *events) {
+
+    size_t n = events->size;
+    const size_t capacity = events->capacity;
+    timestamp_t *out_t = events->t;
+    uint16_t *out_x = events->x;
+    uint16_t *out_y = events->y;
+    uint8_t *out_p = events->p;
+    uint64_t high = *last_ts_high;
+    uint64_t hh = *ts_high_high;
+
+    const __m256i v_cd = _mm256_set1_epi32((int)(cd_type >> 1));
+    const __m256i v_th = _mm256_set1_epi32((int)time_high_type);
+    const __m256i lane = _mm256_setr_epi32(0, 1, 2, 3, 4, 5, 6, 7);
+    const __m256i lane64_lo = _mm256_setr_epi64x(0, 1, 2, 3);
+    const __m256i lane64_hi = _mm256_setr_epi64x(4, 5, 6, 7);
+    const __m256i m11 = _mm256_set1_epi32(0x7FF);
+    const __m256i m6 = _mm256_set1_epi32(0x3F);
+    const __m256i one = _mm256_set1_epi32(1);
+
+    size_t i = 0;
+    while (i + 8 <= n_words && capacity - n >= 8) {
+        __m256i w = _mm256_loadu_si256((const __m256i *)(words + i));
+        const __m256i type = _mm256_srli_epi32(w, 28);
+        const unsigned cd = (unsigned)_mm256_movemask_ps(_mm256_castsi256_ps(
+            _mm256_cmpeq_epi32(_mm256_srli_epi32(type, 1), v_cd)));
+        const unsigned th = (unsigned)_mm256_movemask_ps(_mm256_castsi256_ps(
+            _mm256_cmpeq_epi32(type, v_th)));
+        if ((cd | th) != 0xFFu || (th & (th - 1u))) {
+            break;
+        }
+
+        const uint64_t base_before = hh | high;
+        int k = 8;
+        if (th) {
+            k = __builtin_ctz(th);
+            cd32_time_high(words[i + (size_t)k], &high, &hh);
+            w = _mm256_permutevar8x32_epi32(w, _mm256_sub_epi32(lane,
+                _mm256_cmpgt_epi32(lane, _mm256_set1_epi32(k - 1))));
+        }
+        const uint64_t base_after = hh | high;
+
+        const __m256i x = _mm256_and_si256(_mm256_srli_epi32(w, 11), m11);
+        const __m256i y = _mm256_and_si256(w, m11);
+        const __m256i lo = _mm256_and_si256(_mm256_srli_epi32(w, 22), m6);
+        const __m256i p = _mm256_and_si256(_mm256_srli_epi32(w, 28), one);
+
+        const __m256i vk = _mm256_set1_epi64x(k);
+        const __m256i before = _mm256_set1_epi64x((long long)base_before);
+        const __m256i after = _mm256_set1_epi64x((long long)base_after);
+        const __m256i t0 = _mm256_or_si256(_mm256_cvtepu32_epi64(_mm256_castsi256_si128(lo)),
+            _mm256_blendv_epi8(after, before, _mm256_cmpgt_epi64(vk, lane64_lo)));
+        const __m256i t1 = _mm256_or_si256(_mm256_cvtepu32_epi64(_mm256_extracti128_si256(lo, 1)),
+            _mm256_blendv_epi8(after, before, _mm256_cmpgt_epi64(vk, lane64_hi)));
+        _mm256_storeu_si256((__m256i *)(out_t + n), t0);
+        _mm256_storeu_si256((__m256i *)(out_t + n + 4), t1);
+
+        /* packus interleaves per 128-bit half; 0xD8 restores lane order. */
+        const __m256i xy = _mm256_permute4x64_epi64(_mm256_packus_epi32(x, y), 0xD8);
+        _mm_storeu_si128((__m128i *)(out_x + n), _mm256_castsi256_si128(xy));
+        _mm_storeu_si128((__m128i *)(out_y + n), _mm256_extracti128_si256(xy, 1));
+        const __m256i p16 = _mm256_packus_epi32(p, p);
+        const __m256i p8 = _mm256_packus_epi16(p16, p16);
+        const uint32_t p_lo = (uint32_t)_mm256_extract_epi32(p8, 0);
+        const uint32_t p_hi = (uint32_t)_mm256_extract_epi32(p8, 4);
+        memcpy(out_p + n, &p_lo, 4);
+        memcpy(out_p + n + 4, &p_hi, 4);
+
+        n += th ? 7 : 8;
+        i += 8;
+    }
+
+    events->size = n;
+    *last_ts_high = high;
+    *ts_high_high = hh;
+    return i;
+}
+
+/* 16 words per step; the TIME_HIGH lane is dropped with a compress. */
+__attribute__((target("avx512f")))
+static size_t cd32_kernel_avx512(
+    const uint32_t *words, size_t n_words, uint32_t cd_type, uint32_t time_high_type,
+    uint64_t *last_ts_high, uint64_t *ts_high_high, event_buffer_soa_t *events) {
+
+    size_t n = events->size;
+    const size_t capacity = events->capacity;
+    timestamp_t *out_t = events->t;
+    uint16_t *out_x = events->x;
+    uint16_t *out_y = events->y;
+    uint8_t *out_p = events->p;
+    uint64_t high = *last_ts_high;
+    uint64_t hh = *ts_high_high;
+
+    const __m512i v_cd = _mm512_set1_epi32((int)(cd_type >> 1));
+    const __m512i v_th = _mm512_set1_epi32((int)time_high_type);
+    const __m512i m11 = _mm512_set1_epi32(0x7FF);
+    const __m512i m6 = _mm512_set1_epi32(0x3F);
+    const __m512i one = _mm512_set1_epi32(1);
+
+    size_t i = 0;
+    while (i + 16 <= n_words && capacity - n >= 16) {
+        __m512i w = _mm512_loadu_si512((const void *)(words + i));
+        const __m512i type = _mm512_srli_epi32(w, 28);
+        const __mmask16 cd = _mm512_cmpeq_epi32_mask(_mm512_srli_epi32(type, 1), v_cd);
+        const __mmask16 th = _mm512_cmpeq_epi32_mask(type, v_th);
+        if ((uint16_t)(cd | th) != 0xFFFFu || (th & (th - 1u))) {
+            break;
+        }
+
+        const uint64_t base_before = hh | high;
+        unsigned k = 16;
+        if (th) {
+            k = (unsigned)__builtin_ctz(th);
+            cd32_time_high(words[i + k], &high, &hh);
+            w = _mm512_maskz_compress_epi32(cd, w);
+        }
+        const uint64_t base_after = hh | high;
+
+        const __m512i x = _mm512_and_si512(_mm512_srli_epi32(w, 11), m11);
+        const __m512i y = _mm512_and_si512(w, m11);
+        const __m512i lo = _mm512_and_si512(_mm512_srli_epi32(w, 22), m6);
+        const __m512i p = _mm512_and_si512(_mm512_srli_epi32(w, 28), one);
+
+        /* Output lanes below k precede the TIME_HIGH. */
+        const __mmask8 before_lo = (__mmask8)(k >= 8 ? 0xFFu : (1u << k) - 1u);
+        const __mmask8 before_hi = (__mmask8)(k <= 8 ? 0u : (k >= 16 ? 0xFFu : (1u << (k - 8)) - 1u));
+        const __m512i before = _mm512_set1_epi64((long long)base_before);
+        const __m512i after = _mm512_set1_epi64((long long)base_after);
+        _mm512_storeu_si512((void *)(out_t + n), _mm512_or_si512(
+            _mm512_cvtepu32_epi64(_mm512_castsi512_si256(lo)), _mm512_mask_blend_epi64(before_lo, after, before)));
+        _mm512_storeu_si512((void *)(out_t + n + 8), _mm512_or_si512(
+            _mm512_cvtepu32_epi64(_mm512_extracti64x4_epi64(lo, 1)), _mm512_mask_blend_epi64(before_hi, after, before)));
+        _mm256_storeu_si256((__m256i *)(out_x + n), _mm512_cvtepi32_epi16(x));
+        _mm256_storeu_si256((__m256i *)(out_y + n), _mm512_cvtepi32_epi16(y));
+        _mm_storeu_si128((__m128i *)(out_p + n), _mm512_cvtepi32_epi8(p));
+
+        n += th ? 15 : 16;
+        i += 16;
+    }
+
+    events->size = n;
+    *last_ts_high = high;
+    *ts_high_high = hh;
+    return i;
+}
+
+static int simd_max_level(void) {
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx512f")) {
+        return EVUTILS_SIMD_AVX512;
+    }
+    if (__builtin_cpu_supports("avx2")) {
+        return EVUTILS_SIMD_AVX2;
+    }
+    return EVUTILS_SIMD_SCALAR;
+}
+
+#else
+
+static int simd_max_level(void) {
+    return EVUTILS_SIMD_SCALAR;
+}
+
+#endif /* EVUTILS_HAVE_X86_SIMD */
+
+
+static int simd_level = EVUTILS_SIMD_AUTO;
+
+int evutils_set_simd_level(int level) {
+    const int max_level = simd_max_level();
+    simd_level = (level < 0 || level > max_level) ? max_level : level;
+    return simd_level;
+}
+
+int evutils_simd_level(void) {
+    if (simd_level == EVUTILS_SIMD_AUTO) {
+        evutils_set_simd_level(EVUTILS_SIMD_AUTO);
+    }
+    return simd_level;
+}
+
+evutils_cd32_kernel_t evutils_cd32_kernel(void) {
+    switch (evutils_simd_level()) {
+#ifdef EVUTILS_HAVE_X86_SIMD
+        case EVUTILS_SIMD_AVX512: return cd32_kernel_avx512;
+        case EVUTILS_SIMD_AVX2:   return cd32_kernel_avx2;
+#endif
+        default:                  return NULL;
+    }
+}
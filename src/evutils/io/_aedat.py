@@ -21,7 +21,12 @@ reading (writing is not implemented yet):
   ``EventPacket`` FlatBuffers (identifier ``EVTS``), optionally LZ4- or
   Zstd-compressed, holding 16-byte event structs (``int64`` t, ``int16`` x,
   ``int16`` y, ``uint8`` p). Compressed files need the optional ``lz4`` /
-  ``zstandard`` package (``pip install evutils[aedat]``).
+  ``zstandard`` package (``pip install evutils[aedat]``). Packet bodies are
+  decompressed on a small thread pool ahead of the native packet parser
+  (``csrc/aedat4.c``), which decodes them straight into reused SoA buffers.
+  Packets of streams the reader does not return (frames, IMU, and triggers
+  unless ``ext_trigger=True``) are skipped by their stream id without being
+  decompressed.
 
 The byte order and record layouts for 1.0/2.0/3.1 follow the official
 iniVation file-format documentation (jAER writes big-endian); the 4.0 layout
@@ -39,12 +44,24 @@ from __future__ import annotations
 
 import re
 import struct
+from collections import deque
+from concurrent.futures import Future
 from typing import Callable
 
 import numpy as np
 
 from ..types import EventArray, TriggerArray
-from .common import EventDecoder, EventEncoder
+from .common import EventDecoder, EventEncoder, SeekResult
+from ._native_core import (
+    EventSoABuffers,
+    TriggerSoABuffers,
+    events_view,
+    triggers_view,
+    EVUTILS_PARSE_ERROR,
+    EVUTILS_PARSE_OUTPUT_FULL,
+)
+from ._native_aedat import Aedat4Input, Aedat4Parser
+from ._index import StaticSeekIndex
 from ._source import ByteSource
 
 _EMPTY_EVENTS = EventArray.empty()
@@ -70,6 +87,14 @@ _V4_EVENT_DTYPE = np.dtype({
 
 _V3_POLARITY_EVENT = 1  # cAER event type id for polarity events
 
+#: AEDAT 1.0/2.0 seek checkpoints: one per this many records, holding the
+#: timestamp-unwrap state a mid-file jump cannot recover on its own.
+_V12_CHECKPOINT = 1 << 16
+
+#: Compressed AEDAT4 packets queued for decompression per pool worker, ahead of
+#: the packet the parser is on.
+_V4_AHEAD_PER_WORKER = 4
+
 # AEDAT 2.0 address layouts: name -> (extractor, aps_mask_bit31).
 _V2_LAYOUTS = {
     # DAVIS (jAER): bit 31 = readout type (1 = APS/IMU, skip), p = bit 11,
@@ -80,9 +105,10 @@ _V2_LAYOUTS = {
 }
 
 # ---------------------------------------------------------------------------#
-# Minimal FlatBuffer field access (AEDAT 4.0). The two schemas involved are
-# tiny and fixed, so the offsets are walked by hand instead of depending on a
-# flatbuffers runtime (cf. the evlib reference reader).
+# Minimal FlatBuffer field access (AEDAT 4.0 IOHeader). The schema is tiny and
+# fixed, so the offsets are walked by hand instead of depending on a
+# flatbuffers runtime (cf. the evlib reference reader). Packet bodies are
+# walked by the native parser (csrc/aedat4.c).
 # ---------------------------------------------------------------------------#
 def _u16(b: bytes, o: int) -> int:
     return int(struct.unpack_from("<H", b, o)[0])
@@ -131,37 +157,71 @@ def _parse_io_header(buf: bytes) -> tuple[int, int, str]:
         info_node = bytes(buf[str_pos + 4:str_pos + 4 + str_len]).decode("utf-8", "replace")
     return compression, data_table_position, info_node
 
-def _parse_event_packet(body: bytes) -> np.ndarray | None:
-    """Extract the event structs from a size-prefixed ``EventPacket`` FlatBuffer.
+def _parse_data_table(buf) -> list[tuple[int, int, int, int, int]] | None:
+    """Parse a (decompressed) AEDAT4 ``FileDataTable`` FlatBuffer.
+
+    The table (identifier ``FTAB``, optionally size-prefixed) is a vector of
+    ``FileDataDefinition`` tables: 0 = ByteOffset (i64), 1 = PacketInfo
+    (struct: StreamID i32, Size i32), 2 = NumElements (i64),
+    3 = TimestampStart (i64), 4 = TimestampEnd (i64).
 
-    Returns a ``_V4_EVENT_DTYPE`` view, or ``None`` when the body is not an
-    ``EVTS`` packet (frame/IMU/trigger streams).
+    Returns ``(byte_offset, stream_id, size, n_elements, timestamp_start)``
+    per packet, or None if ``buf`` is not a well-formed data table.
     """
-    if len(body) < 12 or body[8:12] != b"EVTS":
+    if len(buf) >= 12 and bytes(buf[8:12]) == b"FTAB":
+        base = 4                        # size-prefixed
+    elif len(buf) >= 8 and bytes(buf[4:8]) == b"FTAB":
+        base = 0
+    else:
+        return None
+    try:
+        table = base + _u32(buf, base)
+        pos = _fb_field_pos(buf, table, 0)
+        if pos is None:
+            return []
+        vec = pos + _u32(buf, pos)
+        out = []
+        for i in range(_u32(buf, vec)):
+            slot = vec + 4 + 4 * i
+            entry = slot + _u32(buf, slot)
+            fields = [_fb_field_pos(buf, entry, k) for k in range(4)]
+            if fields[0] is None or fields[1] is None:
+                return None
+            byte_offset = _i64(buf, fields[0])
+            stream_id, size = _i32(buf, fields[1]), _i32(buf, fields[1] + 4)
+            n_elements = _i64(buf, fields[2]) if fields[2] is not None else 0
+            ts_start = _i64(buf, fields[3]) if fields[3] is not None else 0
+            out.append((byte_offset, stream_id, size, n_elements, ts_start))
+    except (struct.error, IndexError):
         return None
-    root = 4 + _u32(body, 4)
-    pos = _fb_field_pos(body, root, 0)  # single field: `elements` vector
-    if pos is None:
-        return _np_empty_v4()
-    vector = pos + _u32(body, pos)
-    count = _u32(body, vector)
-    start = vector + 4
-    if start + count * _V4_EVENT_DTYPE.itemsize > len(body):
-        raise ValueError("truncated AEDAT4 EventPacket")
-    return np.frombuffer(body, dtype=_V4_EVENT_DTYPE, count=count, offset=start)
-
-def _np_empty_v4() -> np.ndarray:
-    return np.empty(0, dtype=_V4_EVENT_DTYPE)
-
-def _parse_streams_xml(xml: str) -> tuple[set[int], int | None, int | None]:
-    """Extract event-stream ids and the sensor geometry from the ``IOHeader``
+    return out
+
+def _fb_event_ts(body) -> np.ndarray:
+    """Timestamps of a decompressed ``EVTS`` packet body: a strided view of
+    the event vector's ``int64`` t fields (empty for any other packet)."""
+    if len(body) < 12 or bytes(body[8:12]) != b"EVTS":
+        return np.empty(0, dtype=np.int64)
+    try:
+        table = 4 + _u32(body, 4)
+        pos = _fb_field_pos(body, table, 0)
+        if pos is None:
+            return np.empty(0, dtype=np.int64)
+        vec = pos + _u32(body, pos)
+        return np.ndarray((_u32(body, vec),), dtype="<i8", buffer=body,
+                          offset=vec + 4, strides=(16,))
+    except (struct.error, IndexError, TypeError):
+        raise ValueError("truncated AEDAT4 packet") from None
+
+def _parse_streams_xml(xml: str) -> tuple[dict[int, str], int | None, int | None]:
+    """Extract the stream table and the sensor geometry from the ``IOHeader``
     infoNode XML (a DV config tree).
 
-    Returns ``(event_stream_ids, width, height)``. Parsing is best-effort:
-    on any failure the id set is empty and the caller falls back to
-    identifying event packets by their FlatBuffer identifier.
+    Returns ``(streams, width, height)`` where ``streams`` maps each stream
+    id to its type identifier (``"EVTS"``, ``"TRIG"``, ``"FRME"``, ...).
+    Parsing is best-effort: on any failure the table is empty and the caller
+    falls back to identifying packets by their FlatBuffer identifier.
     """
-    ids: set[int] = set()
+    streams: dict[int, str] = {}
     width: int | None = None
     height: int | None = None
     try:
@@ -181,13 +241,47 @@ def _parse_streams_xml(xml: str) -> tuple[set[int], int | None, int | None]:
                     size_x = int((attr.text or "0").strip())
                 elif key == "sizeY":
                     size_y = int((attr.text or "0").strip())
-            if type_id == "EVTS":
-                ids.add(int(name))
-                if width is None and size_x:
-                    width, height = size_x, size_y
+            if type_id:
+                streams[int(name)] = type_id
+            if type_id == "EVTS" and width is None and size_x:
+                width, height = size_x, size_y
     except Exception:
-        return set(), None, None
-    return ids, width, height
+        return {}, None, None
+    return streams, width, height
+
+def _unwrap32(ts_raw: np.ndarray, wraps: int, last_raw: int) -> tuple[np.ndarray, int, int]:
+    """Extend raw 32-bit µs timestamps to int64 given the unwrap state
+    ``(wraps, last_raw)`` before them (``last_raw`` < 0: no previous record);
+    returns the timestamps and the state after them. A drop of more than
+    2^31 between consecutive timestamps counts as a wrap; smaller decreases
+    are genuine jitter and pass through."""
+    t = ts_raw.astype(np.int64)
+    if len(t) == 0:
+        return t, wraps, last_raw
+    prev = np.empty_like(t)
+    prev[0] = last_raw if last_raw >= 0 else int(t[0])
+    prev[1:] = t[:-1]
+    acc = wraps + np.cumsum((prev - t) > (1 << 31))
+    return t + (acc << np.int64(32)), int(acc[-1]), int(t[-1])
+
+def _v2_event_mask(a: np.ndarray) -> np.ndarray:
+    """Polarity-event records of an AEDAT 2.0 address column: DVS words
+    (bit 31 clear) whose bit 10 is clear (bits 11-10 ``00`` OFF / ``10`` ON;
+    ``x1`` are external events)."""
+    return ((a >> np.uint32(31)) == 0) & (((a >> np.uint32(10)) & np.uint32(1)) == 0)
+
+def _v3_polarity_events(buf, body_start: int, number: int, ts_overflow: int) -> EventArray:
+    """Decode the valid events of an AEDAT 3.1 polarity packet body."""
+    rec = np.frombuffer(buf, dtype=_V3_EVENT_DTYPE, count=number, offset=body_start)
+    d = rec["d"]
+    valid = (d & np.uint32(0x1)) != 0
+    if not valid.all():
+        rec, d = rec[valid], d[valid]
+    t = rec["t"].astype(np.int64) + (np.int64(ts_overflow) << np.int64(31))
+    x = ((d >> np.uint32(17)) & np.uint32(0x7FFF)).astype(np.uint16)
+    y = ((d >> np.uint32(2)) & np.uint32(0x7FFF)).astype(np.uint16)
+    p = ((d >> np.uint32(1)) & np.uint32(0x1)).astype(np.uint8)
+    return EventArray(t, x, y, p)
 
 def _decompress_lz4(body: bytes) -> bytes:
     try:
@@ -225,9 +319,19 @@ _DECOMPRESSORS: dict[int, Callable[[bytes], bytes]] = {
 
 class EventDecoder_Aedat(EventDecoder):
     SUPPORTS_EXT_TRIGGERS = True
+    SUPPORTS_SEEK = True
 
     #: init() slurps the whole payload into memory (or mmaps it).
     _buffers_in_memory = True
+
+    @property
+    def _native_filter(self) -> bool:
+        """AEDAT 4.0 packets are decoded by the native parser, which applies the
+        reader's ROI / stride / polarity filter; the older versions are decoded
+        with numpy and filtered by the reader."""
+        if self._is_initialized:
+            return self._version == 4
+        return self._source.peek(12).startswith(b"#!AER-DAT4.0")
     """Decode AEDAT 1.0 / 2.0 / 3.1 / 4.0 files into ``EventArray`` chunks.
 
     The version is detected from the ``#!AER-DATx.y`` header line (a file
@@ -240,8 +344,8 @@ class EventDecoder_Aedat(EventDecoder):
         Byte source to read from.
     chunk_size
         Maximum number of events produced per :meth:`read_chunk` call
-        (AEDAT 3.1/4.0 packets are never split, so a chunk can exceed this
-        by at most one packet's worth).
+        (AEDAT 3.1 packets are never split, so a chunk can exceed this by at
+        most one packet's worth; AEDAT 4.0 chunks are at most this long).
     layout : {"davis", "dvs128"}, default "davis"
         AEDAT 2.0 address layout (the 2.0 container does not name the
         camera). Ignored for the other versions.
@@ -267,7 +371,30 @@ class EventDecoder_Aedat(EventDecoder):
         # v4 packet-region metadata.
         self._v4_compression: int = 0
         self._v4_region_end: int = 0
-        self._v4_stream_ids: set[int] = set()
+        self._v4_data_table_pos: int = -1
+        self._v4_streams: dict[int, str] = {}   # stream id -> type identifier
+
+        # v4 native decode: the packet-header scan runs ahead of the parser;
+        # bodies wait in stream order in _v4_queue (compressed ones as futures
+        # of the decompression pool). _v4_body is the body being parsed, kept
+        # across read_chunk() calls when a chunk fills mid-packet.
+        self._v4_scan: int = 0
+        self._v4_queue: deque = deque()   # (packet end offset, body or Future)
+        self._v4_body: Aedat4Input | None = None
+        self._v4_pool = None
+        self._v4_parser: Aedat4Parser | None = None
+        self._events: EventSoABuffers | None = None
+        self._triggers: TriggerSoABuffers | None = None
+        # v4 seek index: one bookmark per non-empty event packet (its first
+        # timestamp, header byte offset and the events before it), read from
+        # the FileDataTable or built by one scan on the first seek().
+        self._v4_index: StaticSeekIndex | None = None
+        # v1/v2 seek index: one bookmark per _V12_CHECKPOINT records (record
+        # index, first timestamp, events before it) plus the unwrap state
+        # (wraps, last raw ts) before each; v3: one bookmark per non-empty
+        # polarity packet (header offset). Built by one pass on first seek().
+        self._v12_index: tuple[StaticSeekIndex, np.ndarray, np.ndarray] | None = None
+        self._v3_index: StaticSeekIndex | None = None
 
     # ------------------------------------------------------------------ #
     # Header
@@ -331,11 +458,12 @@ class EventDecoder_Aedat(EventDecoder):
         # FileDataTable (when its position is known).
         if 0 <= data_table_pos <= len(buf):
             self._v4_region_end = int(data_table_pos)
+            self._v4_data_table_pos = int(data_table_pos)
         else:
             self._v4_region_end = len(buf)
 
-        ids, width, height = _parse_streams_xml(info_node)
-        self._v4_stream_ids = ids
+        streams, width, height = _parse_streams_xml(info_node)
+        self._v4_streams = streams
         if width:
             self._width = width
         if height:
@@ -356,26 +484,22 @@ class EventDecoder_Aedat(EventDecoder):
 
         self._parse_header()
         self._cursor = self._payload_off
+        if self._version == 4:
+            self._v4_parser = Aedat4Parser()
+            self._v4_parser.set_filter(self._native_event_filter())
+            self._events = EventSoABuffers(int(self._chunk_size))
+            self._triggers = TriggerSoABuffers(1 << 12)
+            self._v4_scan = self._payload_off
         self._is_initialized = True
 
     # ------------------------------------------------------------------ #
     # Per-version batch decoding
     # ------------------------------------------------------------------ #
     def _unwrap_ts(self, ts_raw: np.ndarray) -> np.ndarray:
-        """Extend raw 32-bit µs timestamps to int64, accumulating wraps
-        (a drop of more than 2^31 between consecutive timestamps counts as a
-        wrap; smaller decreases are genuine jitter and pass through).
-        """
-        t = ts_raw.astype(np.int64)
-        if len(t) == 0:
-            return t
-        prev = np.empty_like(t)
-        prev[0] = self._last_raw_ts if self._last_raw_ts >= 0 else int(t[0])
-        prev[1:] = t[:-1]
-        wraps = self._ts_wraps + np.cumsum((prev - t) > (1 << 31))
-        self._ts_wraps = int(wraps[-1])
-        self._last_raw_ts = int(t[-1])
-        return t + (wraps << np.int64(32))
+        """Extend raw 32-bit µs timestamps to int64, accumulating wraps across
+        calls (see :func:`_unwrap32`)."""
+        t, self._ts_wraps, self._last_raw_ts = _unwrap32(ts_raw, self._ts_wraps, self._last_raw_ts)
+        return t
 
     def _batch_v1_v2(self) -> tuple[EventArray, TriggerArray] | None:
         """Decode the next ``chunk_size`` fixed-size records (AEDAT 1.0/2.0)."""
@@ -438,18 +562,10 @@ class EventDecoder_Aedat(EventDecoder):
             if ev_type == _V3_POLARITY_EVENT:
                 if ev_size != _V3_EVENT_DTYPE.itemsize or ts_offset != 4:
                     raise ValueError(f"unsupported AEDAT3 polarity event layout (eventSize={ev_size})")
-                rec = np.frombuffer(buf, dtype=_V3_EVENT_DTYPE, count=number, offset=body_start)
-                d = rec["d"]
-                valid = (d & np.uint32(0x1)) != 0
-                if not valid.all():
-                    rec, d = rec[valid], d[valid]
-                    if len(rec) == 0:
-                        continue
-                t = rec["t"].astype(np.int64) + (np.int64(ts_overflow) << np.int64(31))
-                x = ((d >> np.uint32(17)) & np.uint32(0x7FFF)).astype(np.uint16)
-                y = ((d >> np.uint32(2)) & np.uint32(0x7FFF)).astype(np.uint16)
-                p = ((d >> np.uint32(1)) & np.uint32(0x1)).astype(np.uint8)
-                return EventArray(t, x, y, p), TriggerArray.empty()
+                events = _v3_polarity_events(buf, body_start, number, ts_overflow)
+                if len(events) == 0:
+                    continue
+                return events, TriggerArray.empty()
 
             elif ev_type == 0:  # SPECIAL_EVENT
                 rec = np.frombuffer(buf, dtype=_V3_EVENT_DTYPE, count=number, offset=body_start)
@@ -467,54 +583,235 @@ class EventDecoder_Aedat(EventDecoder):
         self._cursor = n
         return None
 
-    def _batch_v4(self) -> tuple[EventArray, TriggerArray] | None:
-        """Decode the next AEDAT4 packet carrying events or triggers."""
-        from ..types import TriggerArray
+    def _v4_skipped_streams(self) -> set[int]:
+        """Stream ids whose packets are dropped by their header alone: every
+        stream the IOHeader declares that is neither events nor (when they
+        are requested) triggers. Empty when the stream table is unknown."""
+        wanted = {"EVTS", "TRIG"} if self.read_external_triggers else {"EVTS"}
+        return {sid for sid, kind in self._v4_streams.items() if kind not in wanted}
+
+    def _v4_fill_queue(self) -> None:
+        """Scan packet headers ahead of the parser and queue their bodies;
+        compressed bodies are submitted to the decompression pool. Packets of
+        unrequested streams (frames, IMU, unread triggers) are skipped without
+        being decompressed."""
         buf = self._buf
         end = self._v4_region_end
-        decompress = _DECOMPRESSORS[self._v4_compression]
-        while self._cursor + 8 <= end:
-            stream_id = _i32(buf, self._cursor)
-            size = _i32(buf, self._cursor + 4)
-            body_start = self._cursor + 8
+        compressed = self._v4_compression != 0
+        depth = _V4_AHEAD_PER_WORKER * max(1, int(self._decode_workers)) if compressed else 1
+        skipped = self._v4_skipped_streams()
+        while len(self._v4_queue) < depth and self._v4_scan + 8 <= end:
+            stream_id = _i32(buf, self._v4_scan)
+            size = _i32(buf, self._v4_scan + 4)
+            body_start = self._v4_scan + 8
             body_end = body_start + size
             if size < 0 or body_end > end:
-                self._cursor = end
+                self._v4_scan = end
+                return
+            self._v4_scan = body_end
+            if stream_id in skipped:
+                continue
+            body = memoryview(buf)[body_start:body_end]
+            if compressed:
+                body = self._v4_executor().submit(_DECOMPRESSORS[self._v4_compression], body)
+            self._v4_queue.append((body_end, body))
+
+    def _v4_executor(self):
+        """The decompression pool (created on first use)."""
+        if self._v4_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._v4_pool = ThreadPoolExecutor(max_workers=max(1, int(self._decode_workers)),
+                                               thread_name_prefix="evutils-aedat")
+        return self._v4_pool
+
+    def _v4_next_body(self) -> Aedat4Input | None:
+        """The next packet body in stream order (decompressed), or None at the
+        end of the packet region."""
+        self._v4_fill_queue()
+        if not self._v4_queue:
+            self._cursor = self._v4_scan
+            return None
+        body_end, body = self._v4_queue.popleft()
+        if isinstance(body, Future):
+            body = body.result()
+        self._cursor = body_end
+        self._v4_fill_queue()
+        return Aedat4Input(np.frombuffer(body, dtype=np.uint8))
+
+    def _batch_v4(self) -> tuple[EventArray, TriggerArray] | None:
+        """Decode AEDAT4 packets into the reused SoA buffers until ``chunk_size``
+        events are out (a packet that does not fit resumes on the next call)."""
+        ev, tr = self._events, self._triggers
+        assert ev is not None and tr is not None and self._v4_parser is not None
+        ev.reset()
+        tr.reset()
+        while True:
+            if self._v4_body is None:
+                self._v4_body = self._v4_next_body()
+                if self._v4_body is None:
+                    break
+            res = self._v4_parser.parse_packet_soa(self._v4_body, ev, tr)
+            if res.status == EVUTILS_PARSE_ERROR:
+                self._v4_body = None
+                raise ValueError("truncated AEDAT4 packet")
+            if res.status != EVUTILS_PARSE_OUTPUT_FULL:
+                self._v4_body = None
+            elif ev.size < ev.capacity and not self.read_external_triggers:
+                tr.reset()  # trigger buffer full of triggers nobody asked for
+            else:
+                break
+        if ev.size == 0 and tr.size == 0:
+            return None
+        return events_view(ev), triggers_view(tr)
+
+    # ------------------------------------------------------------------ #
+    # Seek indexes
+    # ------------------------------------------------------------------ #
+    def _v12_seek_index(self) -> tuple[StaticSeekIndex, np.ndarray, np.ndarray]:
+        """AEDAT 1.0/2.0 checkpoints: ``(index, wraps, last_raw)`` where
+        bookmark ``b`` is record ``b * _V12_CHECKPOINT`` and ``wraps[b]`` /
+        ``last_raw[b]`` the timestamp-unwrap state before it."""
+        if self._v12_index is None:
+            dtype = _V1_DTYPE if self._version == 1 else _V2_DTYPE
+            n_rec = max(0, (len(self._buf) - self._payload_off) // dtype.itemsize)
+            rec = np.frombuffer(self._buf, dtype=dtype, count=n_rec, offset=self._payload_off)
+            n_blocks = -(-n_rec // _V12_CHECKPOINT)
+            ts, cum = np.zeros(n_blocks, np.int64), np.zeros(n_blocks, np.int64)
+            wraps, last_raw = np.zeros(n_blocks, np.int64), np.zeros(n_blocks, np.int64)
+            w, last, count = 0, -1, 0
+            for b in range(n_blocks):
+                block = rec[b * _V12_CHECKPOINT:(b + 1) * _V12_CHECKPOINT]
+                wraps[b], last_raw[b], cum[b] = w, last, count
+                t, w, last = _unwrap32(block["t"], w, last)
+                ts[b] = t[0]
+                count += len(block) if self._version == 1 else int(np.count_nonzero(_v2_event_mask(block["a"])))
+            records = np.arange(n_blocks, dtype=np.int64) * _V12_CHECKPOINT
+            self._v12_index = (StaticSeekIndex(ts=ts, word_offset=records, cum_count=cum, n_events=count),
+                               wraps, last_raw)
+        return self._v12_index
+
+    def _v3_seek_index(self) -> StaticSeekIndex:
+        """AEDAT 3.1 packet index: one bookmark per polarity packet holding
+        valid events (header offset, first timestamp, events before it)."""
+        if self._v3_index is None:
+            buf = self._buf
+            n = len(buf)
+            headers, firsts, counts = [], [], []
+            pos = self._payload_off
+            while pos + _V3_HEADER.size <= n:
+                (ev_type, _source, ev_size, ts_offset, ts_overflow,
+                 capacity, number, _valid) = _V3_HEADER.unpack_from(buf, pos)
+                body_end = pos + _V3_HEADER.size + capacity * ev_size
+                if ev_size <= 0 or body_end > n:
+                    break
+                if (ev_type == _V3_POLARITY_EVENT and number > 0
+                        and ev_size == _V3_EVENT_DTYPE.itemsize and ts_offset == 4):
+                    events = _v3_polarity_events(buf, pos + _V3_HEADER.size, number, ts_overflow)
+                    if len(events):
+                        headers.append(pos)
+                        firsts.append(int(events.t[0]))
+                        counts.append(len(events))
+                pos = body_end
+            c = np.asarray(counts, dtype=np.int64)
+            cum = np.zeros(len(c), dtype=np.int64)
+            np.cumsum(c[:-1], out=cum[1:])
+            self._v3_index = StaticSeekIndex(ts=np.asarray(firsts, dtype=np.int64),
+                                             word_offset=np.asarray(headers, dtype=np.int64),
+                                             cum_count=cum, n_events=int(c.sum()))
+        return self._v3_index
+
+    def _v4_header_at(self, off: int, stream_id: int, size: int) -> bool:
+        """Whether a packet header ``(stream_id, size)`` sits at byte ``off``."""
+        return (self._payload_off <= off and off + 8 + size <= self._v4_region_end
+                and _i32(self._buf, off) == stream_id and _i32(self._buf, off + 4) == size)
+
+    def _v4_packet_body(self, header: int):
+        """The decompressed body of the packet whose header is at ``header``."""
+        size = _i32(self._buf, header + 4)
+        return _DECOMPRESSORS[self._v4_compression](memoryview(self._buf)[header + 8:header + 8 + size])
+
+    def _v4_table_packets(self) -> list[tuple[int, int, int]] | None:
+        """``(header offset, n_events, first ts)`` of the event packets listed
+        in the trailing FileDataTable, or None when the file has no usable
+        table (absent, unreadable, or not matching the packet headers)."""
+        event_ids = {sid for sid, kind in self._v4_streams.items() if kind == "EVTS"}
+        if self._v4_data_table_pos < 0 or not event_ids:
+            return None
+        raw = memoryview(self._buf)[self._v4_data_table_pos:]
+        entries = None
+        if self._v4_compression != 0:
+            try:
+                entries = _parse_data_table(_DECOMPRESSORS[self._v4_compression](raw))
+            except Exception:
+                entries = None
+        if entries is None:
+            entries = _parse_data_table(raw)
+        if entries is None:
+            return None
+        out = []
+        for byte_offset, stream_id, size, n_elements, ts_start in entries:
+            if stream_id not in event_ids:
+                continue
+            # ByteOffset names the packet header or (dv-processing) its body.
+            if self._v4_header_at(byte_offset, stream_id, size):
+                out.append((byte_offset, n_elements, ts_start))
+            elif self._v4_header_at(byte_offset - 8, stream_id, size):
+                out.append((byte_offset - 8, n_elements, ts_start))
+            else:
                 return None
-            self._cursor = body_end
+        return out
 
-            # Unconditionally decompress if we're reading triggers (don't skip non-EVTS streams just yet)
-            body = decompress(bytes(buf[body_start:body_end]))
-            
-            if len(body) >= 12 and body[8:12] == b"EVTS":
-                rec = _parse_event_packet(body)
-                if rec is not None and len(rec) > 0:
-                    return EventArray(
-                        rec["t"],
-                        rec["x"].astype(np.uint16),
-                        rec["y"].astype(np.uint16),
-                        rec["p"].astype(np.uint8),
-                    ), TriggerArray.empty()
-            elif len(body) >= 12 and body[8:12] == b"TRIG":
-                # Trigger packet parsing:
-                # Trigger struct: int64 t, int8 type, 7 pad bytes = 16 bytes.
-                # Types: 0=TIMESTAMP_RESET, 1=EXTERNAL_INPUT_RISING_EDGE, 2=EXTERNAL_INPUT_FALLING_EDGE, 3=EXTERNAL_INPUT_PULSE, etc.
-                root = 4 + _u32(body, 4)
-                pos = _fb_field_pos(body, root, 0)
-                if pos is not None:
-                    vector = pos + _u32(body, pos)
-                    count = _u32(body, vector)
-                    start = vector + 4
-                    if start + count * 16 <= len(body):
-                        tr_rec = np.frombuffer(body, dtype=np.dtype([("t", "<i8"), ("type", "i1"), ("pad", "V7")]), count=count, offset=start)
-                        t = tr_rec["t"]
-                        type_id = tr_rec["type"]
-                        # Rising edge is typically 1 (odd), falling edge is 2 (even).
-                        # Let's map it simply:
-                        tr_p = (type_id % 2 != 0).astype(np.uint8)
-                        return _EMPTY_EVENTS, TriggerArray(t, tr_p, np.zeros_like(tr_p))
-        self._cursor = end
-        return None
+    def _v4_scan_packets(self) -> list[tuple[int, int, int]]:
+        """``(header offset, n_events, first ts)`` of every event packet, by
+        walking the packet headers and decompressing the event packets on the
+        pool (a batch at a time, so memory stays bounded)."""
+        buf = self._buf
+        event_ids = {sid for sid, kind in self._v4_streams.items() if kind == "EVTS"}
+        headers = []
+        pos, end = self._payload_off, self._v4_region_end
+        while pos + 8 <= end:
+            stream_id, size = _i32(buf, pos), _i32(buf, pos + 4)
+            if size < 0 or pos + 8 + size > end:
+                break
+            # Without a stream table any packet may hold events (by identifier).
+            if not event_ids or stream_id in event_ids:
+                headers.append(pos)
+            pos += 8 + size
+        out = []
+        batch = _V4_AHEAD_PER_WORKER * max(1, int(self._decode_workers))
+        for i in range(0, len(headers), batch):
+            group = headers[i:i + batch]
+            if self._v4_compression != 0:
+                bodies = list(self._v4_executor().map(self._v4_packet_body, group))
+            else:
+                bodies = [self._v4_packet_body(h) for h in group]
+            for header, body in zip(group, bodies):
+                ts = _fb_event_ts(body)
+                if len(ts):
+                    out.append((header, len(ts), int(ts[0])))
+        return out
+
+    def _v4_seek_index(self) -> StaticSeekIndex:
+        """The packet-level seek index (built once, then cached)."""
+        if self._v4_index is None:
+            packets = self._v4_table_packets()
+            if packets is None:
+                packets = self._v4_scan_packets()
+            arr = np.array([p for p in packets if p[1] > 0], dtype=np.int64).reshape(-1, 3)
+            counts = arr[:, 1]
+            cum = np.zeros(len(arr), dtype=np.int64)
+            np.cumsum(counts[:-1], out=cum[1:])
+            self._v4_index = StaticSeekIndex(ts=arr[:, 2].copy(), word_offset=arr[:, 0].copy(),
+                                             cum_count=cum, n_events=int(counts.sum()))
+        return self._v4_index
+
+    def _v4_reset(self) -> None:
+        """Drop the decode-ahead queue and any partially parsed body."""
+        self._v4_queue.clear()
+        self._v4_body = None
+        self._v4_scan = self._payload_off
+        if self._v4_parser is not None:
+            self._v4_parser.reset()
 
     # ------------------------------------------------------------------ #
     # EventDecoder interface
@@ -543,12 +840,131 @@ class EventDecoder_Aedat(EventDecoder):
             return events, triggers
         return events
 
+    def seek(self, t: int | None = None, n: int | None = None) -> tuple["SeekResult", "EventArray", "TriggerArray | None"]:
+        """Seek to an absolute timestamp (µs) or event index. See base class.
+
+        * **1.0 / 2.0** -- fixed-size records: a sparse checkpoint table (one
+          per ``_V12_CHECKPOINT`` records, with the 32-bit timestamp-unwrap
+          state) is bisected, then one block of records is unwrapped to land
+          on the exact record.
+        * **3.1** -- a packet index (first timestamp / events before each
+          polarity packet) picks the packet; its remainder is returned.
+        * **4.0** -- a packet-level index (the file's FileDataTable, or one
+          built by a single scan of the packet headers) picks the target
+          packet, only that packet is decompressed to find the exact element,
+          and the native parser resumes mid-packet at it.
+
+        Each index is built once, on the first seek. Triggers resume at the
+        landing position.
+        """
+        if not self._is_initialized:
+            self.init()
+        axis, val = self._seek_axis(t, n)
+        self.reset()
+        if self._version in (1, 2):
+            return self._seek_v1_v2(axis, val)
+        if self._version == 3:
+            return self._seek_v3(axis, val)
+        return self._seek_v4(axis, val)
+
+    def _seek_eof(self, axis: str, val: int, n_events: int) -> tuple[SeekResult, EventArray, None]:
+        """Park the cursor at the end of the payload (target past the last event)."""
+        self._cursor = self._v4_scan = self._v4_region_end if self._version == 4 else len(self._buf)
+        self._eof = True
+        idx = val if axis == "n" else n_events
+        return SeekResult(ts=val, index=idx, eof=True), _EMPTY_EVENTS, None
+
+    def _seek_v1_v2(self, axis: str, val: int) -> tuple[SeekResult, EventArray, None]:
+        index, wraps, last_raw = self._v12_seek_index()
+        dtype = _V1_DTYPE if self._version == 1 else _V2_DTYPE
+        n_rec = (len(self._buf) - self._payload_off) // dtype.itemsize
+        rec = np.frombuffer(self._buf, dtype=dtype, count=n_rec, offset=self._payload_off)
+        if axis == "t":
+            # Last checkpoint starting before val: timestamps tie across
+            # checkpoints, so one starting at val may follow events at val.
+            b0 = max(int(np.searchsorted(index.ts, val, side="left")) - 1, 0)
+            cum = int(index.cum_count[b0]) if len(index) else 0
+        else:
+            first, cum, _ = index.bookmark_for_event(val)
+            b0 = first // _V12_CHECKPOINT
+        for b in range(b0, len(index)):
+            block = rec[b * _V12_CHECKPOINT:(b + 1) * _V12_CHECKPOINT]
+            t, _, _ = _unwrap32(block["t"], int(wraps[b]), int(last_raw[b]))
+            events = (np.arange(len(block)) if self._version == 1
+                      else np.flatnonzero(_v2_event_mask(block["a"])))
+            k = (int(np.searchsorted(t[events], val, side="left")) if axis == "t"
+                 else val - cum)
+            if k < len(events):
+                r = int(events[k])
+                _, self._ts_wraps, self._last_raw_ts = _unwrap32(block["t"][:r], int(wraps[b]), int(last_raw[b]))
+                self._cursor = self._payload_off + (b * _V12_CHECKPOINT + r) * dtype.itemsize
+                return SeekResult(ts=int(t[r]), index=cum + k, eof=False), _EMPTY_EVENTS, None
+            cum += len(events)
+        return self._seek_eof(axis, val, index.n_events)
+
+    def _seek_v3(self, axis: str, val: int) -> tuple[SeekResult, EventArray, None]:
+        index = self._v3_seek_index()
+        if axis == "n" and val >= index.n_events:
+            return self._seek_eof(axis, val, index.n_events)
+        i = (int(np.searchsorted(index.cum_count, val, side="right")) if axis == "n"
+             else int(np.searchsorted(index.ts, val, side="left"))) - 1
+        for i in range(max(i, 0), len(index)):
+            header = int(index.word_offset[i])
+            (_type, _source, ev_size, _ts_offset, ts_overflow,
+             capacity, number, _valid) = _V3_HEADER.unpack_from(self._buf, header)
+            events = _v3_polarity_events(self._buf, header + _V3_HEADER.size, number, ts_overflow)
+            k = (int(np.searchsorted(events.t, val, side="left")) if axis == "t"
+                 else val - int(index.cum_count[i]))
+            if k < len(events):
+                self._cursor = header + _V3_HEADER.size + capacity * ev_size
+                res = SeekResult(ts=int(events.t[k]), index=int(index.cum_count[i]) + k, eof=False)
+                return res, events[k:], None
+        return self._seek_eof(axis, val, index.n_events)
+
+    def _seek_v4(self, axis: str, val: int) -> tuple[SeekResult, EventArray, None]:
+        assert self._v4_parser is not None
+        index = self._v4_seek_index()
+        hit: tuple[int, int, int, object, np.ndarray] | None = None
+        if axis == "n":
+            if val < index.n_events:
+                header, cum, _ = index.bookmark_for_event(val)
+                body = self._v4_packet_body(header)
+                ts = _fb_event_ts(body)
+                if val - cum >= len(ts):
+                    raise ValueError("AEDAT4 data table does not match the packets")
+                hit = (header, cum, val - cum, body, ts)
+        elif len(index):
+            # Last packet starting before val: a packet starting at val may be
+            # preceded by events at val in the one before it.
+            i = max(int(np.searchsorted(index.ts, val, side="left")) - 1, 0)
+            for i in range(i, len(index)):
+                header = int(index.word_offset[i])
+                body = self._v4_packet_body(header)
+                ts = _fb_event_ts(body)
+                k = int(np.searchsorted(ts, val, side="left"))
+                if k < len(ts):
+                    hit = (header, int(index.cum_count[i]), k, body, ts)
+                    break
+
+        if hit is None:
+            return self._seek_eof(axis, val, index.n_events)
+
+        header, cum, k, body, ts = hit
+        # Queue the already decompressed body; the parser starts at element k.
+        body_end = header + 8 + _i32(self._buf, header + 4)
+        self._v4_scan = body_end
+        self._v4_queue.append((body_end, body))
+        self._v4_parser.reset(k)
+        self._cursor = header
+        return SeekResult(ts=int(ts[k]), index=cum + k, eof=False), _EMPTY_EVENTS, None
+
     def reset(self) -> None:
         """Reset the reader to the first event."""
         self._cursor = self._payload_off
         self._ts_wraps = 0
         self._last_raw_ts = -1
         self._eof = False
+        self._v4_reset()
 
     def tell(self) -> int:
         """Get the current byte offset.
@@ -563,6 +979,11 @@ class EventDecoder_Aedat(EventDecoder):
 
     def close(self) -> None:
         """Release the buffer view so the source can be closed."""
+        if self._v4_pool is not None:
+            self._v4_pool.shutdown(wait=True, cancel_futures=True)
+            self._v4_pool = None
+        self._v4_queue.clear()
+        self._v4_body = None
         self._buf = None
 
 def _fb_io_header(compression: int, data_table_pos: int, info_node: bytes) -> bytes:
@@ -22,7 +22,7 @@ from datetime import datetime
 import numpy as np
 
 from ..types import EventArray, TriggerArray
-from .common import EventDecoder, EventEncoder
+from .common import EventDecoder, EventEncoder, SeekResult
 from ._native_core import (
     EventSoABuffers,
     TriggerSoABuffers,
@@ -74,6 +74,15 @@ class EventDecoder_AER(EventDecoder):
     #: init() slurps the whole payload into memory (or mmaps it).
     _buffers_in_memory = True
 
+    SUPPORTS_SEEK = True
+
+    @property
+    def _native_filter(self) -> bool:
+        """The C parser applies the reader's ROI / stride / polarity filter,
+        except with user-provided timestamps: those are matched to events by
+        decode position, which a filtered decode no longer preserves."""
+        return self._custom_ts is None
+
     def __init__(self, source: ByteSource, chunk_size: int = 1_000_000,
                  timestamps: 'str | np.ndarray' = "zero",
                  t_start: int = 0, t_step: int = 1):
@@ -133,6 +142,8 @@ class EventDecoder_AER(EventDecoder):
 
         self._offset = 0
         self._parser = AerParser(self._ts_mode, self._t_start, self._t_step)
+        if self._native_filter:
+            self._parser.set_filter(self._native_event_filter())
         self._input_cls = AerInput
         self._word_dtype = np.uint32
         cap = int(self._chunk_size)
@@ -208,6 +219,45 @@ class EventDecoder_AER(EventDecoder):
         self._eof = True
         return out
 
+    def _ts_at(self, idx: int) -> int:
+        """Timestamp the decoder generates for the event at stream index ``idx``."""
+        if self._custom_ts is not None:
+            return int(self._custom_ts[idx])
+        if self._ts_mode == AER_TS_SEQUENTIAL:
+            return self._t_start + idx * self._t_step
+        return 0
+
+    def seek(self, t: int | None = None, n: int | None = None) -> tuple[SeekResult, EventArray, TriggerArray | None]:
+        """Seek to an absolute timestamp (µs) or event index. See base class.
+
+        One event per 4-byte record, so index seek is record arithmetic. The
+        timestamps are generated, not stored: time seek inverts the generator
+        (``"sequential"``: ``t_start + i * t_step``; ``"zero"``: all 0) or
+        bisects the user-provided array (assumed non-decreasing).
+        """
+        if not self._is_initialized:
+            self.init()
+        axis, val = self._seek_axis(t, n)
+        n_events = 0 if self._words is None else len(self._words)
+
+        if axis == "n":
+            idx = val
+        elif self._custom_ts is not None:
+            idx = int(np.searchsorted(self._custom_ts[:n_events], val, side="left"))
+        elif self._ts_mode == AER_TS_SEQUENTIAL and self._t_step > 0:
+            idx = -((self._t_start - val) // self._t_step)  # ceil((val - t_start) / t_step)
+        else:
+            idx = 0 if val <= self._ts_at(0) else n_events
+        idx = max(0, min(idx, n_events))
+
+        self._offset = idx
+        self._n_decoded = idx
+        self._eof = idx >= n_events
+        if self._parser is not None:
+            self._parser.reset(self._t_start + idx * self._t_step)
+        landed_ts = self._ts_at(idx) if idx < n_events else val
+        return SeekResult(ts=landed_ts, index=idx, eof=self._eof), _EMPTY_EVENTS, None
+
     def reset(self) -> None:
         """Reset the AER reader to the beginning.
 
@@ -1,85 +1,182 @@
-"""Binary (.bin) file decoder and encoder.
-
-.. note::
-    Not implemented yet: both classes raise :class:`NotImplementedError` on
-    construction. The classes exist so the ``.bin`` extension is reserved in
-    the reader/writer registries and the error message is explicit.
+"""Binary (.bin) file decoder and encoder: a memory-mappable columnar dump.
+
+The cheapest scratch format: no compression, no encoding, nothing to
+decode. Layout (all integers little-endian)::
+
+    header   64 bytes   magic "\\x8bEVB", u16 version, u16 reserved,
+                        u16 width, u16 height, u32 reserved,
+                        u64 block_size, zero padding
+    blocks              raw contiguous columns, block after block:
+                        t[k] (<i8) | x[k] (<u2) | y[k] (<u2) | p[k] (u1)
+                        with k = block_size, except for a shorter last block
+
+Every block but the last holds exactly ``block_size`` events, so the event
+count and each block's column offsets follow from the header and the file
+size alone. That lets the writer append blocks to any stream (no temp files,
+no seeking back to patch a count), and makes ``seek(n=)`` pure pointer math.
+A time seek picks the block from its first/last ``t`` and runs a
+``searchsorted`` over the memory-mapped ``t`` column.
+
+Plain files are opened with :class:`numpy.memmap`: windows are read-only
+views of the file that stay valid after the reader is closed.
 """
+from __future__ import annotations
 
-import numpy as np
-from ..types import EventArray, TriggerArray
-from .common import EventDecoder, EventEncoder
-
-_NOT_IMPLEMENTED = (
-    "The .bin event format is not implemented yet. "
-    "Convert the file to a supported format (RAW/EVT, DAT, AER, HDF5, NPZ, CSV) "
-    "or pass an explicit file_decoder/file_encoder."
-)
+import io
+import struct
+from datetime import datetime
 
-class EventDecoder_Bin(EventDecoder):
-    """A decoder for reading events from binary files.
+import numpy as np
 
-    .. note::
-        Not implemented yet -- constructing this class raises
-        :class:`NotImplementedError`.
+from ..types import EventArray
+from ._columnar import DEFAULT_GROUP_SIZE, _ColumnarDecoder, _ColumnarEncoder
+from ._compression import is_compressed_path
+from ._source import BufferSource, ByteSource
+
+MAGIC = b"\x8bEVB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHHHIQ")
+HEADER_SIZE = 64
+
+#: Column dtypes, in on-disk order.
+_COLUMN_DTYPES = (("t", np.dtype("<i8")), ("x", np.dtype("<u2")), ("y", np.dtype("<u2")), ("p", np.dtype("u1")))
+#: Bytes per event over all columns.
+EVENT_BYTES = sum(dt.itemsize for _, dt in _COLUMN_DTYPES)
+
+def _column_offsets(n: int) -> dict[str, int]:
+    """Offset of each column from the start of an ``n``-event block."""
+    offsets, off = {}, 0
+    for name, dt in _COLUMN_DTYPES:
+        offsets[name] = off
+        off += n * dt.itemsize
+    return offsets
+
+class EventDecoder_Bin(_ColumnarDecoder):
+    """Decode events from a ``.bin`` columnar dump.
+
+    Nothing is decoded: chunks are read-only views of the memory-mapped
+    columns (only an ``n_events`` window straddling a block boundary is
+    copied). Seekable sources that cannot be mapped are read block by
+    block; streams are read into memory at init.
 
     Parameters
     ----------
-    source : ByteSource
-        Byte source to read events from.
-    **kwargs
-        Additional decoder arguments.
-
-    Raises
-    ------
-    NotImplementedError
-        Always, until the format is implemented.
+    source
+        Byte source to read from.
+    chunk_size
+        Number of events returned per :meth:`read_chunk` call.
 
     """
 
-    def __init__(self, source: "io.BufferedIOBase | str | bytes", **kwargs):
-        raise NotImplementedError(_NOT_IMPLEMENTED)
+    _buffers_in_memory = True
 
-    def init(self) -> None:
-        """Initialize the file for reading."""
-        raise NotImplementedError(_NOT_IMPLEMENTED)
+    def __init__(self, source: ByteSource, chunk_size: int = 1_000_000):
+        super().__init__(source, chunk_size)
+        self._buf: np.ndarray | None = None  # the whole file, when addressable
+        self._block_size = 0
 
-    def read_chunk(self, delta_t_hint: int | None = None, n_events_hint: int | None = None) -> "np.ndarray | EventArray | None":
-        """Read a chunk of events."""
-        raise NotImplementedError(_NOT_IMPLEMENTED)
+    def _read_at(self, offset: int, size: int) -> np.ndarray:
+        if self._buf is not None:
+            return self._buf[offset:offset + size]
+        self._source.seek(offset)
+        data = self._source.read(size)
+        if len(data) != size:
+            raise ValueError(f"BIN file truncated: wanted {size} bytes at offset {offset}, got {len(data)}")
+        return np.frombuffer(data, dtype=np.uint8)
 
-    def reset(self) -> None:
-        """Reset the file pointer to the beginning of the file."""
-        raise NotImplementedError(_NOT_IMPLEMENTED)
-
-class EventEncoder_Bin(EventEncoder):
-    """An encoder for writing events to binary files.
-
-    .. note::
-        Not implemented yet -- constructing this class raises
-        :class:`NotImplementedError`.
+    def init(self) -> None:
+        """Map the file and derive the block layout from its size."""
+        if self._is_initialized:
+            return
+        path = self._raw_path
+        if path is not None and not is_compressed_path(path):
+            # numpy's own map: views outlive the reader and never pin the source.
+            self._buf = np.memmap(path, dtype=np.uint8, mode="r")
+        elif isinstance(self._source, BufferSource):
+            self._buf = np.frombuffer(self._source.buffer(), dtype=np.uint8)
+        elif not self._source.seekable():
+            self._buf = np.frombuffer(self._source.read(-1), dtype=np.uint8)
+        size = len(self._buf) if self._buf is not None else self._source.seek(0, io.SEEK_END)
+        if size < HEADER_SIZE:
+            raise ValueError("BIN file too short for its header")
+
+        magic, version, _, width, height, _, block_size = _HEADER.unpack(
+            self._read_at(0, _HEADER.size).tobytes())
+        if magic != MAGIC:
+            raise ValueError(f"not an evutils BIN file (magic {magic!r})")
+        if version != _VERSION:
+            raise ValueError(f"unsupported BIN version {version}")
+        if block_size <= 0:
+            raise ValueError("BIN header has no block size")
+        self._width, self._height = width, height
+        self._block_size = block_size
+
+        full, rest = divmod(size - HEADER_SIZE, block_size * EVENT_BYTES)
+        if rest % EVENT_BYTES:
+            raise ValueError("BIN file truncated inside a block")
+        rows = [block_size] * full + ([rest // EVENT_BYTES] if rest else [])
+        t_min = [self._t_at(i, 0) for i in range(len(rows))]
+        t_max = [self._t_at(i, r - 1) for i, r in enumerate(rows)]
+        self._set_groups(rows, t_min, t_max)
+        self._pos = 0
+        self._is_initialized = True
+
+    def _block_offset(self, i: int) -> int:
+        return HEADER_SIZE + i * self._block_size * EVENT_BYTES
+
+    def _t_at(self, i: int, k: int) -> int:
+        return int(self._read_at(self._block_offset(i) + 8 * k, 8).view("<i8")[0])
+
+    def _load_group(self, i: int, columns: tuple[str, ...] = ("t", "x", "y", "p")) -> dict[str, np.ndarray]:
+        n = int(self._starts[i + 1] - self._starts[i])
+        base = self._block_offset(i)
+        offsets = _column_offsets(n)
+        dtypes = dict(_COLUMN_DTYPES)
+        return {name: self._read_at(base + offsets[name], n * dtypes[name].itemsize).view(dtypes[name])
+                for name in columns}
+
+    def close(self) -> None:
+        super().close()
+        self._buf = None
+
+class EventEncoder_Bin(_ColumnarEncoder):
+    """Encode events into a ``.bin`` columnar dump.
+
+    Events are gathered into ``block_size``-event blocks, and each full block
+    is appended as its four raw columns. The writer never seeks, so any
+    writable stream works.
 
     Parameters
     ----------
-    writable : io.BufferedIOBase
-        Destination for writing events.
-    **kwargs
-        Additional encoder arguments (``width``, ``height``, ``dt``, ...).
-
-    Raises
-    ------
-    NotImplementedError
-        Always, until the format is implemented.
+    writable
+        Destination stream to write to.
+    width, height : int
+        Frame geometry stored in the header.
+    dt : datetime, optional
+        Unused; BIN stores no recording timestamp.
+    block_size : int
+        Events per block; a multiple of 8 so every ``t`` column stays
+        8-byte aligned in the file.
 
     """
 
-    def __init__(self, writable: "io.BufferedIOBase", **kwargs):
-        raise NotImplementedError(_NOT_IMPLEMENTED)
+    def __init__(self, writable: io.BufferedIOBase, width: int = 1280, height: int = 720,
+                 dt: datetime | None = None, block_size: int = DEFAULT_GROUP_SIZE):
+        if block_size % 8:
+            raise ValueError("block_size must be a multiple of 8")
+        super().__init__(writable, width, height, dt, group_size=block_size)
 
     def init(self) -> None:
-        """Initialize the file for writing."""
-        raise NotImplementedError(_NOT_IMPLEMENTED)
-
-    def write(self, events: 'np.ndarray | EventArray', triggers: 'np.ndarray | TriggerArray | None' = None) -> int:
-        """Write a chunk of events."""
-        raise NotImplementedError(_NOT_IMPLEMENTED)
+        """Write the file header."""
+        if self._is_initialized:
+            return
+        header = _HEADER.pack(MAGIC, _VERSION, 0, self._width, self._height, 0, self._group_size)
+        self._fd.write(header.ljust(HEADER_SIZE, b"\0"))
+        self._is_initialized = True
+
+    def _emit(self, events: EventArray) -> None:
+        for name, dt in _COLUMN_DTYPES:
+            self._fd.write(np.ascontiguousarray(getattr(events, name), dtype=dt).data)
+
+    def _finish(self) -> None:
+        """Nothing to finish: the layout is implied by the file size."""
@@ -0,0 +1,299 @@
+"""Shared machinery for formats stored as time-sorted groups of events.
+
+Parquet row groups, Arrow IPC record batches and EVU blocks all split a
+recording into groups of a fixed number of events whose time range is known
+without decoding them. :class:`_ColumnarDecoder` turns that into streaming
+reads, range reads and seeks that decode only the groups they touch;
+:class:`_ColumnarEncoder` cuts arbitrary writes into fixed-size groups.
+"""
+from __future__ import annotations
+
+import io
+from abc import abstractmethod
+from datetime import datetime
+
+import numpy as np
+
+from ..types import EventArray, TriggerArray
+from .common import EventDecoder, EventEncoder, SeekResult
+from ._source import ByteSource
+
+_EMPTY_EVENTS = EventArray.empty()
+
+#: Column name -> canonical dtype (matches EventArray's column dtypes).
+_COLUMNS = (("t", np.dtype(np.int64)), ("x", np.dtype(np.uint16)),
+            ("y", np.dtype(np.uint16)), ("p", np.dtype(np.uint8)))
+
+#: Events per group written by the encoders.
+DEFAULT_GROUP_SIZE = 1 << 20
+
+def _concat(parts: "list[EventArray]") -> EventArray:
+    if len(parts) == 1:
+        return parts[0]
+    return EventArray(*(np.concatenate([getattr(a, f) for a in parts]) for f in "txyp"))
+
+
+class _ColumnarDecoder(EventDecoder):
+    """Shared reading logic over a file split into time-sorted row groups.
+
+    Subclasses open the file in :meth:`init` and set ``_starts`` (first global
+    row of each group plus the total), ``_t_min`` / ``_t_max`` (per-group time
+    range) and implement :meth:`_load_group`; a subclass without per-group
+    statistics overrides :meth:`_group_for_time` instead of filling ``_t_min`` /
+    ``_t_max``. The group under the cursor is
+    cached, so consecutive chunks slice it without decoding it again.
+    """
+
+    _independent_windows = True
+    SUPPORTS_SEEK = True
+
+    #: Whether :meth:`_load_group` can decode a subset of the columns more
+    #: cheaply than the whole group (column-chunked formats).
+    _projects_columns = True
+
+    def __init__(self, source: ByteSource, chunk_size: int = 1_000_000):
+        super().__init__(source, chunk_size)
+        self._starts = np.zeros(1, dtype=np.int64)
+        self._t_min = np.zeros(0, dtype=np.int64)
+        self._t_max = np.zeros(0, dtype=np.int64)
+        self._n = 0
+        self._pos = 0
+        self._cached: tuple[int, EventArray] | None = None
+
+    @abstractmethod
+    def _load_group(self, i: int, columns: tuple[str, ...] = ("t", "x", "y", "p")) -> dict[str, np.ndarray]:
+        """Decode ``columns`` of group ``i`` as numpy arrays."""
+        raise NotImplementedError
+
+    def _set_groups(self, rows: "list[int]", t_min: "list[int]", t_max: "list[int]") -> None:
+        self._starts = np.concatenate(([0], np.cumsum(rows, dtype=np.int64)))
+        self._t_min = np.asarray(t_min, dtype=np.int64)
+        self._t_max = np.asarray(t_max, dtype=np.int64)
+        self._n = int(self._starts[-1])
+
+    def _group(self, i: int) -> EventArray:
+        if self._cached is None or self._cached[0] != i:
+            cols = self._load_group(i)
+            group = EventArray(cols["t"], cols["x"], cols["y"], cols["p"])
+            # Chunks are views of the cached group: keep callers from editing it.
+            for f in "txyp":
+                getattr(group, f).flags.writeable = False
+            self._cached = (i, group)
+        return self._cached[1]
+
+    def _slice(self, start: int, end: int) -> EventArray:
+        """Events ``[start, end)``, stitched across group boundaries if needed."""
+        parts = []
+        while start < end:
+            i = int(np.searchsorted(self._starts, start, side="right")) - 1
+            g0 = int(self._starts[i])
+            stop = min(end, int(self._starts[i + 1]))
+            parts.append(self._group(i)[start - g0:stop - g0])
+            start = stop
+        if not parts:
+            return _EMPTY_EVENTS
+        return _concat(parts)
+
+    def read_chunk(self, delta_t_hint: int | None = None,
+                   n_events_hint: int | None = None) -> EventArray:
+        if not self._is_initialized:
+            self.init()
+
+        if self._pos >= self._n:
+            self._eof = True
+            return _EMPTY_EVENTS
+
+        if n_events_hint:
+            # An n_events window must be full unless the file ends; only one
+            # straddling a group boundary is stitched (copied).
+            end = min(self._pos + n_events_hint, self._n)
+        else:
+            # Otherwise stop at the group boundary: the chunk stays a view.
+            i = int(np.searchsorted(self._starts, self._pos, side="right")) - 1
+            end = min(self._pos + self._chunk_size, int(self._starts[i + 1]))
+        chunk = self._slice(self._pos, end)
+        self._pos = end
+        if self._pos >= self._n:
+            self._eof = True
+        return chunk
+
+    def count_events(self) -> int:
+        """The row count of the file's group index."""
+        if not self._is_initialized:
+            self.init()
+        return self._n
+
+    def read_all(self) -> EventArray:
+        """Return every remaining event at once."""
+        if not self._is_initialized:
+            self.init()
+        out = self._slice(self._pos, self._n)
+        self._pos = self._n
+        self._eof = True
+        self._cached = None
+        return out
+
+    def _group_for_time(self, t: int) -> int:
+        """First group whose last timestamp is ``>= t`` (the group count if none)."""
+        return int(np.searchsorted(self._t_max, t, side="left"))
+
+    def _index_of_time(self, t: int) -> int:
+        """Global index of the first event with timestamp ``>= t``.
+
+        Only the one group whose range can hold ``t`` is decoded -- just its
+        ``t`` column when the format :attr:`_projects_columns`.
+        """
+        i = self._group_for_time(t)
+        if i >= len(self._starts) - 1:
+            return self._n
+        if not self._projects_columns or (self._cached is not None and self._cached[0] == i):
+            ts = self._group(i).t
+        else:
+            ts = self._load_group(i, ("t",))["t"]
+        return int(self._starts[i]) + int(np.searchsorted(ts, t, side="left"))
+
+    def read(self, start_ms: int = 0, end_ms: int = -1) -> EventArray:
+        """Random-access read of a millisecond time range.
+
+        Only the groups whose time statistics overlap the range are decoded.
+
+        Parameters
+        ----------
+        start_ms : int, optional
+            Start time in milliseconds, by default 0.
+        end_ms : int, optional
+            End time in milliseconds (exclusive), by default -1 (until the end).
+
+        Returns
+        -------
+        EventArray
+            Events with ``start_ms * 1000 <= t < end_ms * 1000``.
+
+        """
+        if not self._is_initialized:
+            self.init()
+        if start_ms < 0:
+            raise ValueError("start_ms must be greater or equal to 0")
+        if 0 <= end_ms < start_ms:
+            raise ValueError("start_ms must be smaller than end_ms")
+        start = self._index_of_time(start_ms * 1000)
+        end = self._index_of_time(end_ms * 1000) if end_ms >= 0 else self._n
+        return self._slice(start, end)
+
+    def seek(self, t: int | None = None, n: int | None = None) -> tuple[SeekResult, EventArray, "TriggerArray | None"]:
+        """Seek to an absolute timestamp (µs) or event index. See base class.
+
+        A time seek picks the group from the per-group time statistics and
+        searches only its ``t`` column.
+        """
+        if not self._is_initialized:
+            self.init()
+        axis, val = self._seek_axis(t, n)
+        idx = self._index_of_time(val) if axis == "t" else val
+        idx = max(0, min(idx, self._n))
+        self._pos = idx
+        self._eof = idx >= self._n
+        landed_ts = int(self._slice(idx, idx + 1).t[0]) if idx < self._n else val
+        return SeekResult(ts=landed_ts, index=idx, eof=self._eof), _EMPTY_EVENTS, None
+
+    def reset(self) -> None:
+        """Reset the reader to the beginning of the file."""
+        self._pos = 0
+        self._eof = False
+
+    def tell(self) -> int:
+        """Current position, in events (columnar files have no meaningful byte offset)."""
+        return self._pos
+
+    def close(self) -> None:
+        self._cached = None
+
+    def _read_geometry(self, metadata: "dict[bytes, bytes] | None") -> None:
+        metadata = metadata or {}
+        if b"width" in metadata:
+            self._width = int(metadata[b"width"])
+        if b"height" in metadata:
+            self._height = int(metadata[b"height"])
+
+
+class _ColumnarEncoder(EventEncoder):
+    """Buffer written events into ``group_size``-row groups.
+
+    Whole groups are handed to :meth:`_emit` as they fill; the remainder
+    is flushed on :meth:`close`. Fixed-size groups keep the per-group time
+    ranges tight however the caller slices its writes.
+    """
+
+    def __init__(self, writable: io.BufferedIOBase, width: int = 1280, height: int = 720,
+                 dt: datetime | None = None, group_size: int = DEFAULT_GROUP_SIZE):
+        super().__init__(writable, width, height, dt)
+        if group_size <= 0:
+            raise ValueError("group_size must be positive")
+        self._group_size = group_size
+        self._pending: list[EventArray] = []
+        self._n_pending = 0
+        self._closed = False
+
+    @abstractmethod
+    def _emit(self, events: EventArray) -> None:
+        """Write one group."""
+        raise NotImplementedError
+
+    def write(self, events: 'np.ndarray | EventArray', triggers: 'np.ndarray | TriggerArray | None' = None) -> int:
+        """Append a chunk of events.
+
+        Parameters
+        ----------
+        events : np.ndarray or EventArray
+            Array of events to write (timestamps must not go backwards
+            between chunks).
+
+        Returns
+        -------
+        int
+            Number of events written.
+
+        """
+        if not self._is_initialized:
+            self.init()
+        n = len(events)
+        if n == 0:
+            return 0
+        if isinstance(events, EventArray):
+            events = events.expand()
+        else:
+            events = EventArray(events["t"], events["x"], events["y"], events["p"])
+        self._pending.append(events)
+        self._n_pending += n
+        if self._n_pending >= self._group_size:
+            pending = _concat(self._pending)
+            full = len(pending) - len(pending) % self._group_size
+            for start in range(0, full, self._group_size):
+                self._emit(pending[start:start + self._group_size])
+            rest = pending[full:]
+            self._pending = [rest] if len(rest) else []
+            self._n_pending = len(rest)
+        self._n_written_events += n
+        return n
+
+    def flush(self) -> None:
+        """No-op: only whole groups are written before :meth:`close`."""
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """Write whatever follows the last group (footer, index)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Write the last partial group and the file footer."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._is_initialized:
+            self.init()  # produce a valid (empty) file even with no writes
+        if self._n_pending:
+            self._emit(_concat(self._pending))
+            self._pending = []
+            self._n_pending = 0
+        self._finish()
+        self._fd.flush()
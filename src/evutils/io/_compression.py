@@ -18,12 +18,22 @@ Supported suffixes:
 * ``.bz2`` -- bzip2    (stdlib :mod:`bz2`)
 * ``.zst`` -- zstandard: stdlib ``compression.zstd`` (Python 3.14+), falling
   back to the third-party ``zstandard`` or ``pyzstd`` packages if installed.
+
+A ``.zst`` file may also be written in the zstd *seekable format*
+(``open_compressed(path, "wb", frame_size=...)``): independent frames of
+``frame_size`` uncompressed bytes followed by a seek table in a skippable frame.
+Plain zstd readers decompress it as usual (skippable frames are ignored);
+:func:`read_zstd_seek_table` recovers the frame layout so
+:class:`~evutils.io._source.SeekableZstdSource` can decompress only the frames a
+read covers, on several threads for long reads.
 """
 from __future__ import annotations
 
 import io
 from pathlib import Path
 
+import numpy as np
+
 #: Recognised compression suffixes (lower-case, incl. leading dot).
 COMPRESSION_SUFFIXES = {".gz", ".zst", ".xz", ".bz2"}
 
@@ -65,7 +75,136 @@ def _open_zstd(path: "str | Path", mode: str) -> "io.BufferedIOBase":
         "package"
     )
 
-def open_compressed(path: "str | Path", mode: str = "rb") -> "io.BufferedIOBase":
+# --------------------------------------------------------------------------- #
+# zstd seekable format (facebook/zstd contrib/seekable_format)
+# --------------------------------------------------------------------------- #
+
+#: Default uncompressed bytes per frame of a seekable ``.zst``: the most a
+#: random access has to decompress, traded against the ratio lost per frame.
+SEEKABLE_ZSTD_FRAME_SIZE = 1 << 20
+
+_SKIPPABLE_MAGIC = 0x184D2A5E
+_SEEKABLE_MAGIC = 0x8F92EAB1
+_SEEK_FOOTER_SIZE = 9  # Number_Of_Frames u32, descriptor u8, magic u32
+
+def _zstd_frame_codec():
+    """``(compress(data, level), decompress(frame, size))`` one-shot frame
+    functions from the first available zstd backend (see :func:`_open_zstd`)."""
+    try:
+        from compression import zstd  # Python 3.14+ stdlib
+        return (lambda data, level: zstd.compress(data, level),
+                lambda frame, size: zstd.decompress(frame))
+    except ImportError:
+        pass
+    try:
+        import zstandard  # third-party; compressor/decompressor are not thread-safe
+        return (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+                lambda frame, size: zstandard.ZstdDecompressor().decompress(frame, max_output_size=size))
+    except ImportError:
+        pass
+    try:
+        import pyzstd  # third-party
+        return (lambda data, level: pyzstd.compress(data, level),
+                lambda frame, size: pyzstd.decompress(frame))
+    except ImportError:
+        pass
+    raise ImportError(
+        "reading/writing '.zst' files requires zstd support: use Python 3.14+ "
+        "(stdlib 'compression.zstd') or install the 'zstandard' or 'pyzstd' "
+        "package"
+    )
+
+def read_zstd_seek_table(f: "io.BufferedIOBase") -> "tuple[np.ndarray, np.ndarray] | None":
+    """Read the seek table at the end of a seekable ``.zst`` file.
+
+    Returns ``(compressed_sizes, decompressed_sizes)`` (one entry per frame),
+    or ``None`` when the file does not end in a valid seek table -- a plain
+    zstd stream, or one whose frame sizes do not add up to the file size.
+    """
+    end = f.seek(0, io.SEEK_END)
+    if end < 8 + _SEEK_FOOTER_SIZE:
+        return None
+    f.seek(end - _SEEK_FOOTER_SIZE)
+    footer = f.read(_SEEK_FOOTER_SIZE)
+    n_frames = int.from_bytes(footer[0:4], "little")
+    descriptor = footer[4]
+    if int.from_bytes(footer[5:9], "little") != _SEEKABLE_MAGIC or descriptor & 0x7C:
+        return None
+    entry = 12 if descriptor & 0x80 else 8  # optional per-frame checksum
+    table = n_frames * entry + _SEEK_FOOTER_SIZE
+    if 8 + table > end:
+        return None
+    f.seek(end - table - 8)
+    head = f.read(8)
+    if (int.from_bytes(head[0:4], "little") != _SKIPPABLE_MAGIC
+            or int.from_bytes(head[4:8], "little") != table):
+        return None
+    rec = np.frombuffer(f.read(n_frames * entry), dtype="<u4").reshape(n_frames, entry // 4)
+    comp = rec[:, 0].astype(np.int64)
+    decomp = rec[:, 1].astype(np.int64)
+    if int(comp.sum()) != end - table - 8:
+        return None
+    return comp, decomp
+
+class SeekableZstdWriter(io.BufferedIOBase):
+    """Write-only stream producing a seekable ``.zst`` file: every
+    ``frame_size`` uncompressed bytes become an independent zstd frame, and
+    :meth:`close` appends the seek table."""
+
+    def __init__(self, path: "str | Path", frame_size: int = SEEKABLE_ZSTD_FRAME_SIZE, level: int = 3) -> None:
+        if frame_size <= 0 or frame_size >= 1 << 32:
+            raise ValueError("frame_size must be in (0, 2**32)")
+        self._compress = _zstd_frame_codec()[0]
+        self._f = open(path, "wb")
+        self.name = str(path)
+        self._frame_size = int(frame_size)
+        self._level = level
+        self._pending = bytearray()
+        self._frames: list[tuple[int, int]] = []  # (compressed, decompressed)
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        view = memoryview(b).cast("B")
+        n = view.nbytes
+        self._pending += view
+        self._pos += n
+        if len(self._pending) >= self._frame_size:
+            full = len(self._pending) - len(self._pending) % self._frame_size
+            view = memoryview(self._pending)
+            for lo in range(0, full, self._frame_size):
+                self._emit(view[lo:lo + self._frame_size])
+            view.release()
+            del self._pending[:full]
+        return n
+
+    def _emit(self, data: "bytes | memoryview") -> None:
+        frame = self._compress(data, self._level)
+        self._f.write(frame)
+        self._frames.append((len(frame), len(data)))
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._pending:
+                self._emit(bytes(self._pending))
+                self._pending = bytearray()
+            sizes = np.asarray(self._frames, dtype="<u4").reshape(-1, 2)
+            table = sizes.nbytes + _SEEK_FOOTER_SIZE
+            self._f.write(_SKIPPABLE_MAGIC.to_bytes(4, "little") + table.to_bytes(4, "little"))
+            self._f.write(sizes.tobytes())
+            self._f.write(len(sizes).to_bytes(4, "little") + b"\0" + _SEEKABLE_MAGIC.to_bytes(4, "little"))
+        finally:
+            self._f.close()
+            super().close()
+
+def open_compressed(path: "str | Path", mode: str = "rb", frame_size: int | None = None) -> "io.BufferedIOBase":
     """Open a compressed file, dispatching on its suffix.
 
     Parameters
@@ -75,6 +214,11 @@ def open_compressed(path: "str | Path", mode: str = "rb") -> "io.BufferedIOBase"
     mode
         Binary open mode (``'rb'`` / ``'wb'``). Text modes are not supported --
         event codecs operate on bytes.
+    frame_size
+        Write ``.zst`` in the zstd seekable format with independent frames of
+        this many uncompressed bytes (see :class:`SeekableZstdWriter`).
+        Ignored when reading: seekable files are recognised by their seek
+        table (:func:`read_zstd_seek_table`).
 
     Returns
     -------
@@ -84,12 +228,15 @@ def open_compressed(path: "str | Path", mode: str = "rb") -> "io.BufferedIOBase"
     Raises
     ------
     ValueError
-        If the suffix is not a recognised compression suffix.
+        If the suffix is not a recognised compression suffix, or
+        ``frame_size`` is given for a non-``.zst`` path.
     ImportError
         If the backend for the suffix is unavailable (e.g. zstd).
 
     """
     suffix = Path(path).suffix.lower()
+    if frame_size is not None and suffix != ".zst":
+        raise ValueError(f"frame_size (seekable zstd) needs a '.zst' path, not {suffix!r}")
     if suffix == ".gz":
         import gzip
         return gzip.open(path, mode)
@@ -100,6 +247,8 @@ def open_compressed(path: "str | Path", mode: str = "rb") -> "io.BufferedIOBase"
         import bz2
         return bz2.open(path, mode)
     if suffix == ".zst":
+        if frame_size is not None and "w" in mode:
+            return SeekableZstdWriter(path, frame_size)
         return _open_zstd(path, mode)
     raise ValueError(
         f"{suffix!r} is not a supported compression suffix "
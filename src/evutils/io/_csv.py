@@ -8,10 +8,19 @@ from pathlib import Path
 
 import numpy as np
 from ..types import Event_dtype, EventArray, TriggerArray
+from ._index import StaticSeekIndex
 from .common import EventDecoder, EventEncoder
 
 _EMPTY_EVENTS = EventArray.empty()
 
+#: Byte-range size of the parallel mode (``decode_workers > 1``): each range is
+#: snapped to line starts and parsed by one worker into its own arrays.
+_PARALLEL_RANGE_BYTES = 8 << 20
+
+#: Events per block of the sparse seek index: the byte offset and timestamp of
+#: every K-th event line. A seek parses at most one block of K lines.
+_LINE_INDEX_STRIDE = 4096
+
 class EventDecoder_Csv(EventDecoder):
     """A reader for CSV files with events.
 
@@ -38,8 +47,9 @@ class EventDecoder_Csv(EventDecoder):
     #: accumulator). CSV decode is text-parse-bound, so the gain is small.
     _independent_windows = True
 
-    #: Seekable via byte-offset binary search with newline resync (time) or a
-    #: newline count (event index). Requires a seekable source.
+    #: Seekable via a sparse line-offset index (every ``_LINE_INDEX_STRIDE``-th
+    #: event line's byte offset and timestamp), built by one pass on the first
+    #: seek or mapped from a persisted ``.evidx`` sidecar (``index="persist"``).
     SUPPORTS_SEEK = True
 
     def __init__(self, source: io.BufferedReader, order: list[str] | None = None,
@@ -59,6 +69,11 @@ class EventDecoder_Csv(EventDecoder):
         self._order = order
         self._delimiter = delimiter
 
+        self._bytes: np.ndarray | None = None   # uint8 view of a mapped source
+        self._pool = None
+        self._pipeline: "_RangePipeline | None" = None
+        self._index: StaticSeekIndex | None = None  # sparse line index, see seek()
+
     def _check_header(self) -> None:
         have_header = False
 
@@ -123,27 +138,55 @@ class EventDecoder_Csv(EventDecoder):
         # Byte offset of the first event line (past any header), for seeking.
         self._data_start = int(self._fd.tell())
 
+        import ctypes
+        self._c_array_types = (ctypes.c_int * 4)(8, 2, 2, 1)
+        self._c_col_mapping = (ctypes.c_int * len(self._col_mapping))(*self._col_mapping)
+        self._c_delimiter = self._delimiter.encode('utf-8')[0]
+
         self._buffer = bytearray()
         self._is_initialized = True
 
+    def _native_parse(self, addr: int, length: int, out: tuple[np.ndarray, ...], start: int, max_events: int) -> tuple[int, int]:
+        """Parse the complete lines of the ``length`` bytes at address ``addr``
+        into ``out[i][start:]`` (at most ``max_events`` rows).
+
+        Returns ``(events parsed, bytes consumed)``.
+        """
+        import ctypes
+        from . import _native_csv; from ._native_core import lib
+        t_arr, x_arr, y_arr, p_arr = out
+        out_ptrs = (ctypes.c_void_p * 4)(
+            t_arr.ctypes.data + start * 8,
+            x_arr.ctypes.data + start * 2,
+            y_arr.ctypes.data + start * 2,
+            p_arr.ctypes.data + start * 1
+        )
+        events_parsed = ctypes.c_size_t(0)
+        res = lib().evutils_read_csv(
+            ctypes.cast(addr, ctypes.c_char_p), length, self._c_delimiter, out_ptrs, self._c_array_types,
+            self._c_col_mapping, len(self._col_mapping), max_events,
+            ctypes.byref(events_parsed)
+        )
+        consumed = (res.current - addr) if res.current is not None else 0
+        return events_parsed.value, consumed
+
     def read_chunk(self, delta_t_hint:int | None = None, n_events_hint:int | None = None) -> 'EventArray':
         """Read a chunk of events from the CSV file."""
         import ctypes
-        from . import _native_csv; from ._native_core import lib
         
         assert self._is_initialized, "Reader is not initialized"
         chunk_size = self._chunk_size
         if n_events_hint is not None:
             chunk_size = n_events_hint
 
+        if self._parallel:
+            return self._read_chunk_parallel(chunk_size)
+
         t_arr = np.zeros(chunk_size, dtype=np.int64)
         x_arr = np.zeros(chunk_size, dtype=np.uint16)
         y_arr = np.zeros(chunk_size, dtype=np.uint16)
         p_arr = np.zeros(chunk_size, dtype=np.uint8)
-
-        array_types = (ctypes.c_int * 4)(8, 2, 2, 1)
-        col_mapping = (ctypes.c_int * len(self._col_mapping))(*self._col_mapping)
-        delimiter = self._delimiter.encode('utf-8')[0]
+        out = (t_arr, x_arr, y_arr, p_arr)
 
         events_parsed_total = 0
 
@@ -159,29 +202,13 @@ class EventDecoder_Csv(EventDecoder):
             if len(self._buffer) == 0:
                 break
 
-            events_parsed = ctypes.c_size_t(0)
-
-            cur_out_ptrs = (ctypes.c_void_p * 4)(
-                t_arr.ctypes.data + events_parsed_total * 8,
-                x_arr.ctypes.data + events_parsed_total * 2,
-                y_arr.ctypes.data + events_parsed_total * 2,
-                p_arr.ctypes.data + events_parsed_total * 1
-            )
-
             c_buf = (ctypes.c_char * len(self._buffer)).from_buffer(self._buffer)
-
-            res = lib().evutils_read_csv(
-                c_buf, len(self._buffer), delimiter, cur_out_ptrs, array_types,
-                col_mapping, len(self._col_mapping), chunk_size - events_parsed_total,
-                ctypes.byref(events_parsed)
+            parsed, consumed = self._native_parse(
+                ctypes.addressof(c_buf), len(self._buffer), out,
+                events_parsed_total, chunk_size - events_parsed_total,
             )
-            
-            consumed = (res.current - ctypes.addressof(c_buf)) if res.current is not None else 0
-            
             del c_buf # Release memory view so buffer can be resized
 
-            parsed = events_parsed.value
-
             if consumed == 0:
                 if self._eof:
                     break
@@ -210,14 +237,109 @@ class EventDecoder_Csv(EventDecoder):
         )
 
     # ------------------------------------------------------------------ #
-    # Seeking (byte-offset binary search + newline resync)
+    # Parallel mode (decode_workers > 1, memory-mapped source)
     # ------------------------------------------------------------------ #
-    def _file_size(self) -> int:
-        cur = self._fd.tell()
-        end = self._fd.seek(0, io.SEEK_END)
-        self._fd.seek(cur)
-        return end
+    @property
+    def _parallel(self) -> bool:
+        """With ``decode_workers > 1`` on a memory-mapped source, the file is cut
+        into line-aligned byte ranges parsed concurrently (the native parser
+        releases the GIL) and consumed in order: read_all() concatenates them,
+        read_chunk() is served by an ordered decode-ahead queue."""
+        return self._decode_workers > 1 and self._source.mappable()
+
+    def _executor(self):
+        """The parse pool (created on first use)."""
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=int(self._decode_workers),
+                                            thread_name_prefix="evutils-csv")
+        return self._pool
+
+    def _unconsumed_offset(self) -> int:
+        """Byte offset of the first line the serial path has not parsed yet."""
+        return max(self._data_start, int(self._fd.tell()) - len(self._buffer))
+
+    def _range_bounds(self, start: int, size: int) -> list[int]:
+        """``[start, b1, ..., size]``: ``_PARALLEL_RANGE_BYTES`` ranges, each
+        boundary snapped forward to a line start."""
+        bounds = [start]
+        while bounds[-1] < size:
+            nxt = self._line_start_at_or_after(bounds[-1] + _PARALLEL_RANGE_BYTES)
+            bounds.append(min(max(nxt, bounds[-1] + 1), size))
+        return bounds
+
+    def _parse_range(self, lo: int, hi: int) -> EventArray:
+        """Parse the whole lines of bytes ``[lo, hi)`` of the mapped file into
+        fresh arrays (runs on a worker thread). A final line without a newline
+        is parsed from a newline-terminated copy."""
+        import ctypes
+        assert self._bytes is not None
+        data = self._bytes[lo:hi]
+        n_lines = int(np.count_nonzero(data == 10)) + int(data[-1] != 10)
+        out = (np.empty(n_lines, dtype=np.int64), np.empty(n_lines, dtype=np.uint16),
+               np.empty(n_lines, dtype=np.uint16), np.empty(n_lines, dtype=np.uint8))
+        n, consumed = self._native_parse(data.ctypes.data, len(data), out, 0, n_lines)
+        if consumed < len(data):
+            tail = ctypes.create_string_buffer(data[consumed:].tobytes() + b"\n")
+            k, _ = self._native_parse(ctypes.addressof(tail), len(data) - consumed + 1, out, n, n_lines - n)
+            n += k
+        return EventArray(out[0][:n], out[1][:n], out[2][:n], out[3][:n])
+
+    def _ensure_mapped(self) -> None:
+        if self._bytes is None:
+            self._bytes = np.frombuffer(self._source.buffer(), dtype=np.uint8)
+
+    def _read_chunk_parallel(self, chunk_size: int) -> EventArray:
+        """read_chunk served by the ordered decode-ahead queue."""
+        if self._pipeline is None:
+            if self._eof:
+                return _EMPTY_EVENTS
+            self._ensure_mapped()
+            assert self._bytes is not None
+            start = self._unconsumed_offset()
+            self._pipeline = _RangePipeline(self, self._range_bounds(start, len(self._bytes)))
+        out = self._pipeline.take(chunk_size)
+        if len(out) < chunk_size:
+            self._eof = True
+        return out
+
+    def _stop_pipeline(self) -> None:
+        if self._pipeline is not None:
+            self._pipeline.close()
+            self._pipeline = None
+
+    def read_all(self) -> 'EventArray':
+        """Decode every remaining event; in parallel mode the line-aligned
+        ranges are parsed concurrently and concatenated in order."""
+        if not self._is_initialized:
+            self.init()
+        if not self._parallel:
+            return super().read_all()
+        if self._pipeline is None and not self._eof:
+            self._ensure_mapped()
+            assert self._bytes is not None
+            start = self._unconsumed_offset()
+            self._pipeline = _RangePipeline(self, self._range_bounds(start, len(self._bytes)))
+        parts = self._pipeline.drain() if self._pipeline is not None else []
+        self._eof = True
+        if not parts:
+            return _EMPTY_EVENTS
+        if len(parts) == 1:
+            return parts[0]
+        return EventArray(*(np.concatenate([getattr(a, f) for a in parts])
+                            for f in ("t", "x", "y", "p")))
+
+    def close(self) -> None:
+        """Stop the parse pool and drop the mapped view so the source can be closed."""
+        self._stop_pipeline()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._bytes = None
 
+    # ------------------------------------------------------------------ #
+    # Seeking (sparse line-offset index)
+    # ------------------------------------------------------------------ #
     def _line_start_at_or_after(self, pos: int) -> int:
         """Byte offset of the first line whose start is ``>= pos``."""
         if pos <= self._data_start:
@@ -233,95 +355,252 @@ class EventDecoder_Csv(EventDecoder):
                 return pos - 1 + acc + i + 1
             acc += len(chunk)
 
-    def _parse_line_t(self, pos: int) -> int | None:
-        """Parse the ``t`` column of the line starting at ``pos`` (or ``None``)."""
-        assert self._order is not None
-        self._fd.seek(pos)
-        line = b""
-        while True:
-            chunk = self._fd.read(65536)
-            if not chunk:
-                break
-            nl = chunk.find(b"\n")
-            if nl >= 0:
-                line += chunk[:nl]
-                break
-            line += chunk
-        if not line.strip():
-            return None
-        parts = line.split(self._delimiter.encode("utf-8"))
-        ti = self._order.index("t")
-        try:
-            return int(parts[ti].strip())
-        except (ValueError, IndexError):
-            return None
-
-    def _seek_line_index(self, n: int) -> int:
-        """Byte offset of event line ``n`` (0-based), by counting newlines."""
+    def _header_digest(self) -> bytes:
+        """Digest of the header line and column layout, binding a persisted
+        index to how the file is parsed."""
+        import hashlib
+        self._fd.seek(0)
+        head = self._fd.read(self._data_start)
+        layout = f"{self._order}|{self._delimiter}".encode("utf-8")
+        return hashlib.blake2b(head + b"\0" + layout, digest_size=16).digest()
+
+    def _build_line_index(self) -> StaticSeekIndex:
+        """One serial pass over the event lines: the byte offset and timestamp
+        of every ``_LINE_INDEX_STRIDE``-th event, and the total event count.
+
+        Blocks are cut by the native parser itself (``max_events`` = stride),
+        so blank lines and a missing final newline count exactly as in
+        read_chunk().
+        """
+        import ctypes
+        k = _LINE_INDEX_STRIDE
+        out = (np.empty(k, dtype=np.int64), np.empty(k, dtype=np.uint16),
+               np.empty(k, dtype=np.uint16), np.empty(k, dtype=np.uint8))
+        ts: list[int] = []
+        offsets: list[int] = []
+        n_events = 0
+        in_block = 0          # events of the current block parsed so far
+        buf = bytearray()
+        buf_off = self._data_start  # file offset of buf[0]
+        eof = False
         self._fd.seek(self._data_start)
-        pos = self._data_start
-        remaining = n
-        while remaining > 0:
-            chunk = self._fd.read(1 << 20)
-            if not chunk:
+        while True:
+            if not eof and len(buf) < 1024 * 1024:
+                data = self._fd.read(4 * 1024 * 1024)
+                if not data:
+                    eof = True
+                    buf.extend(b"\n")  # guarantee final-line newline
+                else:
+                    buf.extend(data)
+            if not buf:
                 break
-            cnt = chunk.count(b"\n")
-            if cnt < remaining:
-                remaining -= cnt
-                pos += len(chunk)
-            else:
-                idx = -1
-                for _ in range(remaining):
-                    idx = chunk.find(b"\n", idx + 1)
-                pos += idx + 1
-                remaining = 0
-        return pos
+            c_buf = (ctypes.c_char * len(buf)).from_buffer(buf)
+            parsed, consumed = self._native_parse(ctypes.addressof(c_buf), len(buf), out, in_block, k - in_block)
+            del c_buf
+            if parsed and in_block == 0:
+                offsets.append(buf_off)
+                ts.append(int(out[0][0]))
+            in_block = (in_block + parsed) % k
+            n_events += parsed
+            if consumed == 0:
+                if eof:
+                    break
+                data = self._fd.read(4 * 1024 * 1024)  # a line longer than the window
+                if not data:
+                    eof = True
+                    buf.extend(b"\n")
+                else:
+                    buf.extend(data)
+                continue
+            del buf[:consumed]
+            buf_off += consumed
+        return StaticSeekIndex(
+            ts=np.asarray(ts, dtype=np.int64),
+            word_offset=np.asarray(offsets, dtype=np.int64),
+            cum_count=np.arange(len(offsets), dtype=np.int64) * k,
+            n_events=n_events,
+        )
+
+    def _line_index(self) -> StaticSeekIndex:
+        """The sparse line index (built on the first seek, or mapped from a
+        persisted ``.evidx`` sidecar when ``index=`` allows it)."""
+        if self._index is not None:
+            return self._index
+        from ._index import evutils_index_path, read_evutils_index, write_evutils_index
+        sidecar = None
+        if self._raw_path is not None and (self._load_index or self._save_index):
+            sidecar = evutils_index_path(self._raw_path, self._index_dir)
+        idx = None
+        if sidecar is not None and self._load_index:
+            idx = read_evutils_index(sidecar, self._raw_path, self._header_digest(),
+                                     self._data_start, _LINE_INDEX_STRIDE)
+        if idx is None:
+            idx = self._build_line_index()
+            if sidecar is not None and self._save_index:
+                write_evutils_index(sidecar, self._raw_path, self._header_digest(),
+                                    self._data_start, _LINE_INDEX_STRIDE, idx)
+        self._index = idx
+        return idx
+
+    def _read_block(self, index: StaticSeekIndex, i: int) -> tuple[EventArray, int]:
+        """Parse index block ``i``; returns its events and the byte offset
+        just past it."""
+        import ctypes
+        k = _LINE_INDEX_STRIDE
+        lo = int(index.word_offset[i])
+        n = min(k, index.n_events - i * k)
+        self._fd.seek(lo)
+        if i + 1 < len(index.word_offset):
+            hi = int(index.word_offset[i + 1])
+            data = self._fd.read(hi - lo)
+        else:
+            data = self._fd.read()
+            hi = lo + len(data)
+            data += b"\n"  # guarantee final-line newline
+        out = (np.empty(n, dtype=np.int64), np.empty(n, dtype=np.uint16),
+               np.empty(n, dtype=np.uint16), np.empty(n, dtype=np.uint8))
+        raw = ctypes.create_string_buffer(data, len(data))
+        got, _ = self._native_parse(ctypes.addressof(raw), len(data), out, 0, n)
+        return EventArray(out[0][:got], out[1][:got], out[2][:got], out[3][:got]), hi
 
     def seek(self, t: int | None = None, n: int | None = None) -> tuple["SeekResult", "EventArray", "TriggerArray | None"]:
-        """Seek to an absolute timestamp (µs) or event index. See base class."""
+        """Seek to an absolute timestamp (µs) or event index. See base class.
+
+        The block holding the target is located in the sparse line index
+        (bisection on time, division on index) and parsed whole; the events
+        from the target on are returned as the remainder and the file cursor
+        is left at the next block.
+        """
         from .common import SeekResult
         if not self._is_initialized:
             self.init()
         axis, val = self._seek_axis(t, n)
-        size = self._file_size()
+        self._stop_pipeline()
+        index = self._line_index()
 
         if axis == "n":
-            pos = self._seek_line_index(val)
-            idx = val
+            i = val // _LINE_INDEX_STRIDE
         else:
-            lo, hi = self._data_start, size
-            while lo < hi:
-                mid = (lo + hi) // 2
-                ls = self._line_start_at_or_after(mid)
-                tv = self._parse_line_t(ls) if ls < size else None
-                if tv is not None and tv >= val:
-                    hi = mid
-                else:
-                    lo = mid + 1
-            pos = self._line_start_at_or_after(lo)
-            idx = -1
-
-        self._fd.seek(pos)
+            # Last block starting before t: the first event >= t is in it or
+            # opens the next block.
+            i = max(int(np.searchsorted(index.ts, val, side="left")) - 1, 0)
         self._buffer = bytearray()
+        if i >= len(index.word_offset):
+            self._fd.seek(0, io.SEEK_END)
+            self._eof = True
+            return SeekResult(ts=val, index=val if axis == "n" else index.n_events, eof=True), _EMPTY_EVENTS, None
+
+        block, end = self._read_block(index, i)
+        if axis == "n":
+            j = val - i * _LINE_INDEX_STRIDE
+        else:
+            hit = block.t >= val
+            j = int(np.argmax(hit)) if hit.any() else len(block)
+        rem = block[j:]
+        self._fd.seek(end)
         self._eof = False
-        landed_ts = self._parse_line_t(pos) if pos < size else None
-        self._fd.seek(pos)  # _parse_line_t moved the cursor
-        
-        # If pos >= size, we are at EOF.
-        if pos >= size:
+        if len(rem) == 0 and i + 1 >= len(index.word_offset):
             self._eof = True
-            
-        return SeekResult(ts=landed_ts if landed_ts is not None else val, index=idx, eof=self._eof), _EMPTY_EVENTS, None
+            return SeekResult(ts=val, index=val if axis == "n" else index.n_events, eof=True), _EMPTY_EVENTS, None
+        if len(rem) == 0:
+            # Time target past this block's last event: it opens the next one.
+            rem, end = self._read_block(index, i + 1)
+            self._fd.seek(end)
+            j = 0
+            i += 1
+        return SeekResult(ts=int(rem.t[0]), index=i * _LINE_INDEX_STRIDE + j, eof=False), rem, None
+
+    def count_events(self) -> int:
+        """The event count of the sparse line index (built by one pass over
+        the file if it is not loaded yet)."""
+        if not self._is_initialized:
+            self.init()
+        if self._index is None:
+            pos = self._fd.tell()  # building the index reads the whole file
+            self._line_index()
+            self._fd.seek(pos)
+        return self._line_index().n_events
 
     def reset(self) -> None:
         """Reset the CSV reader to the beginning of the file."""
         assert self._fd is not None
+        self._stop_pipeline()
         self._fd.seek(0)
         self._eof = False
         if self._is_initialized:
             self._is_initialized = False
             self.init()
 
+class _RangePipeline:
+    """Ordered decode-ahead for :class:`EventDecoder_Csv` (``decode_workers > 1``).
+
+    Line-aligned byte ranges are parsed on the decoder's pool up to
+    ``2 * workers`` ranges ahead and consumed strictly in file order -- the
+    futures queue is the reorder stage -- so every chunk is identical to the
+    serial decoder's.
+    """
+
+    def __init__(self, dec: EventDecoder_Csv, bounds: list[int]) -> None:
+        from collections import deque
+        self._dec = dec
+        self._bounds = bounds
+        self._next = 0                      # index of the next range to submit
+        self._depth = 2 * int(dec._decode_workers)
+        self._queue: deque = deque()        # (range end, future), in file order
+        self._cur: EventArray = _EMPTY_EVENTS
+        self._pos = 0
+        self._submit()
+
+    def _submit(self) -> None:
+        pool = self._dec._executor()
+        while len(self._queue) < self._depth and self._next + 1 < len(self._bounds):
+            lo, hi = self._bounds[self._next], self._bounds[self._next + 1]
+            self._queue.append((hi, pool.submit(self._dec._parse_range, lo, hi)))
+            self._next += 1
+
+    def _advance(self) -> bool:
+        """Make the next non-empty range current; False at end of file."""
+        while self._pos >= len(self._cur):
+            if not self._queue:
+                return False
+            hi, fut = self._queue.popleft()
+            self._cur, self._pos = fut.result(), 0
+            self._dec._fd.seek(hi)          # tell(): end of the range being served
+            self._submit()
+        return True
+
+    def take(self, n: int) -> EventArray:
+        """The next ``n`` events (fewer only at end of file)."""
+        parts = []
+        while n > 0 and self._advance():
+            k = min(n, len(self._cur) - self._pos)
+            parts.append(self._cur[self._pos:self._pos + k])
+            self._pos += k
+            n -= k
+        if not parts:
+            return _EMPTY_EVENTS
+        if len(parts) == 1:
+            return parts[0]
+        return EventArray(*(np.concatenate([getattr(a, f) for a in parts])
+                            for f in ("t", "x", "y", "p")))
+
+    def drain(self) -> list[EventArray]:
+        """Every remaining event, one array per range."""
+        parts = []
+        while self._advance():
+            parts.append(self._cur[self._pos:])
+            self._pos = len(self._cur)
+        return parts
+
+    def close(self) -> None:
+        for _, fut in self._queue:
+            fut.cancel()
+        for _, fut in self._queue:
+            if not fut.cancelled():
+                fut.result()
+        self._queue.clear()
+
+
 class EventEncoder_Csv(EventEncoder):
     """A writer for CSV files with events.
 
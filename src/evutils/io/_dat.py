@@ -68,6 +68,9 @@ class EventDecoder_Dat(EventDecoder):
     #: even over a non-seekable source (e.g. a compressed stream).
     _buffers_in_memory = True
 
+    #: The C parser applies the reader's ROI / stride / polarity filter.
+    _native_filter = True
+
     def __init__(self, source: ByteSource, chunk_size: int = 1_000_000):
         super().__init__(source, chunk_size)
         self._header: dict[str, str | int | float] = {}
@@ -151,6 +154,7 @@ class EventDecoder_Dat(EventDecoder):
 
         self._offset = 0
         self._parser = DatParser()
+        self._parser.set_filter(self._native_event_filter())
         self._input_cls = DatInput
         self._word_dtype = np.uint32
         cap = int(self._chunk_size)
@@ -5,9 +5,10 @@ from a file or byte stream.
 """
 
 import io
+import itertools
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 import numpy as np
 
@@ -18,6 +19,8 @@ from . import decoders as ev_decoders
 from ._native_core import (EVUTILS_PARSE_OUTPUT_FULL,
                            EVUTILS_PARSE_WINDOW_DONE, EventSoABuffers,
                            TriggerSoABuffers, events_view)
+from ._filter import make_event_filter
+from ._multifile import EventDecoder_MultiFile, FileListSource
 from ._prefetch import PrefetchIterator
 from ._source import ByteSource, make_source
 from .buffer import EventAccumulator
@@ -37,7 +40,9 @@ class EventReader():
         ``foo.raw.zst``) are decompressed transparently; the inner extension
         selects the format. An already-open compressed file object
         (``gzip.GzipFile`` / ``lzma.LZMAFile`` / ``compression.zstd.ZstdFile``)
-        may also be passed directly.
+        may also be passed directly. A list of paths reads the files (e.g. the
+        segments of a rolled recording) in order as one continuous stream:
+        windows span file boundaries and ``seek`` is global.
     delta_t: int or optional
         Time window in microseconds, by default None
     n_events: int or None
@@ -104,18 +109,61 @@ class EventReader():
         sleep. ``None`` disables the skip (strict real time). Ignored when
         ``real_time=False``.
     index: str or bool, default="auto"
-        Seek-index policy for random access (:meth:`seek`). ``"auto"``/``True``/
-        ``False`` all build an exact in-memory index lazily on the first seek
-        (``False`` additionally never touches a sidecar). ``"metavision"`` reads
-        a Metavision ``.tmp_index`` sidecar instead -- fast, but approximate near
-        large event gaps. Only EVT formats use an index; others seek by record
-        math or ``searchsorted``.
+        Seek-index policy for random access (:meth:`seek`). ``"auto"``/``True``
+        memory-map a valid evutils ``<file>.evidx`` sidecar when one exists,
+        else build an exact in-memory index lazily on the first seek.
+        ``"persist"`` additionally writes that sidecar after building the index
+        once (a full decode pass), so later opens -- other processes included --
+        seek in O(1) from the first call; it is validated against the file's
+        size, mtime and header and rebuilt when stale. ``False`` never touches
+        a sidecar. ``"metavision"`` reads a Metavision ``.tmp_index`` sidecar
+        first -- fast, but approximate near large event gaps (EVT only). EVT
+        and CSV (a sparse line-offset index) use an index; others seek by
+        record math or ``searchsorted``.
+    index_dir: str or Path or None, default=None
+        Directory for the evutils index sidecar instead of next to the
+        recording (e.g. a shared cache when the data directory is read-only).
     strict: bool, default=False
         Corrupt-packet policy. When False (default), a malformed packet is
         skipped with a :class:`UserWarning` and decoding resumes -- a robust
         decoder (like Metavision's UNRELIABLE mode). When True, a malformed
         packet raises instead (a SAFE decoder). Warnings can be captured with
         :func:`warnings.catch_warnings`.
+    decode_workers: int, default=1
+        Decode threads for EVT recordings (EVT2/2.1/3/4), which are cut at
+        TIME_HIGH restart points into segments decoded concurrently (the native
+        parsers release the GIL). :meth:`read_all` splits the payload into up to
+        this many segments and stitches them into one array; windowed reads and
+        iteration decode segments ahead on the pool and consume them strictly in
+        order, so every ``delta_t`` / ``n_events`` window is identical to the
+        serial reader's. Combine with ``async_read`` to also overlap the window
+        cutting with the caller. Memory-mapped CSV files are likewise cut into
+        line-aligned byte ranges parsed concurrently and consumed in order, and
+        AEDAT 4.0 packets are decompressed ahead on this many threads, as are
+        the frames of a seekable ``.zst`` recording (see ``EventWriter``). With
+        ``ext_trigger=True`` (EVT), for small payloads and for other formats,
+        decoding stays serial.
+    roi: tuple or list of tuples or None, default=None
+        Keep only events inside the half-open rectangle ``(x0, y0, x1, y1)``, or
+        inside any of a list of up to 8 such rectangles.
+    polarity: int or None, default=None
+        Keep only events of this polarity (``0`` or ``1``).
+    stride: int or tuple of int or None, default=None
+        Keep only every ``stride``-th column and row (``x % sx == 0`` and
+        ``y % sy == 0`` for ``stride=(sx, sy)``), a cheap spatial subsample.
+        ``roi``, ``polarity`` and ``stride`` combine. The EVT, DAT and AER
+        decoders apply them inside the native parser, so dropped events never
+        reach the output; other formats are masked after decoding. Either way
+        ``delta_t`` / ``n_events`` windows, ``len(reader)`` and ``read_all()``
+        see only the kept events, and ``seek(n=...)`` is unavailable (event
+        indices would be ambiguous).
+    ts_dtype: {'i8', 'u4'}, default 'i8'
+        Timestamp layout of the returned events. ``'u4'`` returns each window
+        (and ``read_all()``) compact: ``t`` holds ``uint32`` offsets from
+        ``events.t_base``, the window's earliest timestamp (see
+        :meth:`EventArray.compact`), shrinking an event from 13 to 9 bytes. A
+        window must then span less than ``2**32`` us (~71 minutes). Triggers
+        and :meth:`read_into` keep absolute ``int64`` timestamps.
     file_decoder: ev_decoders.EventDecoder or type[ev_decoders.EventDecoder] or None, default=None
         File decoder to use, by default None - automatic
     **kwargs
@@ -141,7 +189,7 @@ class EventReader():
     READING_MODES = ["delta_t", "n_events", "mixed", "all", "auto"]
     DEFAULT_N_EVENTS = 1_000_000
     DEFAULT_DELTA_T = 10_000
-    def __init__(self, file: Path | str | io.BufferedReader | bytes | ByteSource,
+    def __init__(self, file: "Path | str | io.BufferedReader | bytes | ByteSource | Sequence[Path | str]",
                  delta_t:int|None=None,
                  n_events:int|None=None,
                  mode:str="auto",
@@ -158,8 +206,14 @@ class EventReader():
                  playback_speed: float=1.0,
                  max_gap: float | None=1.0,
                  index: "str | bool" = "auto",
+                 index_dir: "str | Path | None" = None,
                  strict: bool=False,
                  batch_mode: bool=False,
+                 decode_workers: int=1,
+                 roi: "tuple[int, int, int, int] | list[tuple[int, int, int, int]] | None" = None,
+                 polarity: int | None = None,
+                 stride: "int | tuple[int, int] | None" = None,
+                 ts_dtype: "str | np.dtype | type" = "i8",
                  file_decoder: ev_decoders.EventDecoder | type[ev_decoders.EventDecoder] | None = None,
                  **kwargs) -> None:
 
@@ -168,14 +222,26 @@ class EventReader():
         self._read_external_triggers = ext_trigger
         self._batch_mode = batch_mode
 
+        if not isinstance(decode_workers, int) or decode_workers < 1:
+            raise ValueError("decode_workers must be a positive integer")
+
         # 1. Normalise the input into a ByteSource (path | stream | bytes |
-        #    BytesIO | ByteSource -> ByteSource). Regular files are memory-mapped.
-        self._source: ByteSource = make_source(file)
+        #    BytesIO | ByteSource -> ByteSource). Regular files are memory-mapped;
+        #    seekable .zst files decompress their frames on decode_workers threads.
+        #    A list of paths is one recording split over several files.
+        if isinstance(file, (list, tuple)):
+            if isinstance(file_decoder, ev_decoders.EventDecoder):
+                raise TypeError("file_decoder must be a decoder class when reading a list of files")
+            self._source: ByteSource = FileListSource(file)
+        else:
+            self._source = make_source(file, workers=decode_workers)
 
         # 2. Resolve the decoder and launch it:
         #    explicit instance > explicit class > heuristic (extension, then
         #    content sniffing of the source).
-        if isinstance(file_decoder, ev_decoders.EventDecoder):
+        if isinstance(self._source, FileListSource):
+            self._file_decoder = EventDecoder_MultiFile(self._source, file_decoder, **kwargs)
+        elif isinstance(file_decoder, ev_decoders.EventDecoder):
             self._file_decoder = file_decoder
         else:
             decoder_cls = file_decoder or ev_decoders.resolve_decoder_cls(self._source)
@@ -186,6 +252,19 @@ class EventReader():
         # (a malformed packet) instead of skipping it. Default is robust
         # (warn + skip + resume), like Metavision's UNRELIABLE decoder.
         self._file_decoder._strict = strict
+        self._file_decoder._decode_workers = decode_workers
+        # Fused event selection (see io/_filter.py). Native decoders apply it in
+        # the C parser; for the others the reader masks each decoded chunk.
+        self._event_filter = make_event_filter(roi, polarity, stride)
+        self._file_decoder._event_filter = self._event_filter
+        self._post_filter = None if self._file_decoder._native_filter else self._event_filter
+        try:
+            ts = np.dtype(ts_dtype)
+        except TypeError:
+            ts = None
+        if ts not in (np.dtype(np.int64), np.dtype(np.uint32)):
+            raise ValueError(f"ts_dtype must be 'i8' or 'u4' (got {ts_dtype!r})")
+        self._ts_compact = ts == np.uint32
         if self._read_external_triggers and not self._file_decoder.SUPPORTS_EXT_TRIGGERS:
             import warnings
             warnings.warn(f"{self._file_decoder.__class__.__name__} does not support reading external triggers.")
@@ -343,13 +422,21 @@ class EventReader():
         # sought ``_current_ts`` instead of re-anchoring to the stream start.
         self._anchored = False
         self._index_opt = index
-        # ``index`` selects the seek index source for formats that use one (EVT):
-        #   "auto"/True/False -> build an exact index in memory, lazily on the
-        #                        first seek() (never on open);
-        #   "metavision"      -> read a Metavision `.tmp_index` sidecar when
-        #                        present (fast, but approximate near large event
-        #                        gaps), else fall back to the built index.
+        # ``index`` selects the seek index source for formats that use one (EVT, CSV):
+        #   "auto"/True  -> load a valid evutils `.evidx` sidecar, else build an
+        #                   exact index in memory, lazily on the first seek()
+        #                   (never on open);
+        #   "persist"    -> as "auto", and save the built index as the sidecar;
+        #   False        -> always build in memory, no sidecar I/O;
+        #   "metavision" -> read a Metavision `.tmp_index` sidecar when present
+        #                   (fast, but approximate near large event gaps), else
+        #                   fall back as "auto".
+        if index not in ("auto", "persist", "metavision", True, False):
+            raise ValueError(f"index must be 'auto', 'persist', 'metavision' or a bool (got {index!r})")
         self._file_decoder._use_sidecar = (index == "metavision")
+        self._file_decoder._load_index = index is not False
+        self._file_decoder._save_index = (index == "persist")
+        self._file_decoder._index_dir = str(index_dir) if index_dir is not None else None
         if self._file_name is not None:
             self._file_decoder._raw_path = str(self._file_name)
 
@@ -402,15 +489,20 @@ class EventReader():
                 if dec.is_eof():
                     return 0
                 # else: consumed only state/timing words; step again.
-        chunk = dec.read_chunk(delta_t, n_events)
-        if isinstance(chunk, tuple):
-            chunk, triggers = chunk
-        else:
-            triggers = None
-        if len(chunk) == 0 and (triggers is None or len(triggers) == 0):
-            return 0
-        acc.append(chunk, triggers)
-        return int(len(chunk)) if len(chunk) > 0 else 1
+        while True:
+            chunk = dec.read_chunk(delta_t, n_events)
+            if isinstance(chunk, tuple):
+                chunk, triggers = chunk
+            else:
+                triggers = None
+            if len(chunk) == 0 and (triggers is None or len(triggers) == 0):
+                return 0
+            if self._post_filter is not None:
+                chunk = self._post_filter.apply(chunk)
+                if len(chunk) == 0 and (triggers is None or len(triggers) == 0):
+                    continue  # everything dropped: not the end of the stream
+            acc.append(chunk, triggers)
+            return int(len(chunk)) if len(chunk) > 0 else 1
 
     def read(self, delta_t:int|None=None, n_events:int|None=None) -> 'EventArray | tuple[EventArray, TriggerArray]':
         """Read events on the files based on the mode and the parameters.
@@ -449,6 +541,114 @@ class EventReader():
                 return DataBatch(events=out, triggers=TriggerArray.empty())
         return out
 
+    #: Smallest free space in a :meth:`read_into` buffer that the delta_t fast
+    #: paths decode into directly; below it the window is staged and copied.
+    _INTO_MIN_DIRECT = 1 << 12
+
+    def read_into(self, out: "EventArray", offset: int = 0, delta_t: int | None = None,
+                  n_events: int | None = None) -> "int | tuple[int, TriggerArray]":
+        """Read the next window into caller-owned columns instead of a new array.
+
+        Same windows as :meth:`read`, but the events are written to
+        ``out[offset:offset + n]`` -- on the native fast paths the parser decodes
+        straight into ``out``'s ``t`` / ``x`` / ``y`` / ``p`` arrays, saving the
+        per-window allocation and copy. ``out`` may wrap pre-allocated, pinned or
+        shared-memory arrays (``EventArray`` does not copy arrays of the right
+        dtype). The rest of ``out[offset:]`` may be used as scratch space.
+
+        A window larger than the free space ``len(out) - offset`` is cut there,
+        and the next call continues the same window.
+
+        Parameters
+        ----------
+        out : EventArray
+            Destination with writable, C-contiguous ``int64`` / ``uint16`` /
+            ``uint16`` / ``uint8`` columns.
+        offset : int, default 0
+            Index in ``out`` at which to write the window.
+        delta_t
+            Override the delta_t parameter, otherwise the default value is used from the constructor
+        n_events
+            Override the n_events parameter, otherwise the default value is used from the constructor
+
+        Returns
+        -------
+        int
+            The number of events written (0 at the end of the stream); with
+            ``ext_trigger=True`` a ``(n, triggers)`` tuple.
+
+        Raises
+        ------
+        TypeError
+            If ``out`` is not an ``EventArray``.
+        ValueError
+            If the columns have the wrong dtype or layout, or ``offset`` leaves
+            no room in ``out``.
+
+        Examples
+        --------
+        >>> from evutils.types import EventArray, Event_dtype
+        >>> buf = EventArray.from_aos(np.zeros(100_000, dtype=Event_dtype))
+        >>> reader = EventReader(b"% format EVT3;height=720;width=1280\\n% end\\n", n_events=1000)
+        >>> reader.read_into(buf)
+        0
+        """
+        self._check_no_active_prefetch()
+        into = self._wrap_into(out, offset)
+        res = self._read_impl(delta_t, n_events, into=into)
+        self._attach_sensor_size(out)
+        ev = res[0] if isinstance(res, tuple) else res
+        if self._real_time:
+            self._pace(ev)
+        if isinstance(res, tuple):
+            return len(ev), res[1]
+        return len(ev)
+
+    def iter_into(self, out: "EventArray", offset: int = 0) -> "Iterator[int | tuple[int, TriggerArray]]":
+        """Streaming :meth:`read_into`: decode each window into the same buffer.
+
+        Yields the result of :meth:`read_into` per window; the window is
+        ``out[offset:offset + n]`` and is overwritten by the next one. Always
+        synchronous (``async_read`` does not apply), paced with ``real_time``.
+
+        Examples
+        --------
+        >>> from evutils.types import EventArray, Event_dtype
+        >>> buf = EventArray.from_aos(np.zeros(100_000, dtype=Event_dtype))
+        >>> reader = EventReader(b"% format EVT3;height=720;width=1280\\n% end\\n", n_events=1000)
+        >>> for n in reader.iter_into(buf):
+        ...     window = buf[:n]
+        """
+        self._check_no_active_prefetch()
+        self._wrap_into(out, offset)  # validate eagerly
+        return self._iter_into(out, offset)
+
+    def _iter_into(self, out: "EventArray", offset: int) -> "Iterator[int | tuple[int, TriggerArray]]":
+        """Generator body of :meth:`iter_into`."""
+        if not self._is_initialized:
+            self.init()
+        while not self.is_eof():
+            yield self.read_into(out, offset)
+
+    @staticmethod
+    def _wrap_into(out: "EventArray", offset: int) -> EventSoABuffers:
+        """Validate a :meth:`read_into` destination and wrap ``out[offset:]``."""
+        if not isinstance(out, EventArray):
+            raise TypeError(f"out must be an EventArray, got {type(out).__name__}")
+        n = len(out)
+        if not isinstance(offset, (int, np.integer)) or not 0 <= offset < n:
+            raise ValueError(f"offset must be in [0, {n}) for an output of {n} events (got {offset!r})")
+        cols = []
+        for name, dtypes in (("t", (np.int64, np.uint64)), ("x", (np.uint16,)),
+                             ("y", (np.uint16,)), ("p", (np.uint8,))):
+            col = getattr(out, name)
+            if col.dtype not in dtypes or col.ndim != 1 or len(col) != n:
+                raise ValueError(f"out.{name} must be a 1-D {np.dtype(dtypes[0])} array of {n} events")
+            if not col.flags.c_contiguous or not col.flags.writeable:
+                raise ValueError(f"out.{name} must be C-contiguous and writable")
+            cols.append(col[offset:])
+        return EventSoABuffers.wrap(*cols)
+
     def _pace(self, out: "np.ndarray | EventArray") -> None:
         """Sleep until the chunk's last event timestamp aligns with wall-clock
         playback time (anchored at the first delivered chunk).
@@ -460,10 +660,11 @@ class EventReader():
         ev = out[0] if isinstance(out, tuple) else out
         if len(ev) == 0:
             return
-        t_last = int(ev.t[-1])
+        base = ev.t_base if isinstance(ev, EventArray) else 0  # ts_dtype="u4"
+        t_last = base + int(ev.t[-1])
         now = time.perf_counter()
         if self._pace_anchor is None:
-            self._pace_anchor = (now, int(ev.t[0]))
+            self._pace_anchor = (now, base + int(ev.t[0]))
         wall0, ts0 = self._pace_anchor
         target = wall0 + (t_last - ts0) / (1e6 * self._playback_speed)
         delay = target - now
@@ -477,7 +678,7 @@ class EventReader():
         if delay > 0:
             time.sleep(delay)
 
-    def _read_n_events_fast(self, n_events: int) -> "np.ndarray | EventArray":
+    def _read_n_events_fast(self, n_events: int, into: EventSoABuffers | None = None) -> "np.ndarray | EventArray":
         """Decode ~``n_events`` straight into a fresh output buffer and hand it
         out with no staging copy.
 
@@ -488,6 +689,8 @@ class EventReader():
         the data (decode into the reused accumulator, then copy the window out)
         into one, roughly matching :class:`EventStreamer` while still returning
         an independent array (the buffer is fresh per call, never reused).
+        With ``into`` (see :meth:`read_into`) the caller's buffer is filled
+        instead.
         """
         dec = self._file_decoder
         # Fresh per-call output; handed to the caller as zero-copy views, so it
@@ -497,7 +700,7 @@ class EventReader():
         # window with no overshoot and no remainder to carry. (Vector formats
         # would stop a few short and a second parse_step on the full buffer is
         # misread as EOF, so they stay on the accumulator path.)
-        out = EventSoABuffers(n_events)
+        out = EventSoABuffers(n_events) if into is None else into
         out.c.capacity = n_events
         # Throwaway trigger sink (this path is only taken when the caller did not
         # request triggers); reset each step so it never fills and stalls the
@@ -529,7 +732,8 @@ class EventReader():
 
         For decoders whose ``read_chunk`` already returns an *independent* array
         of at most ``n_events`` events (``_independent_windows``): NPZ slices its
-        loaded columns into fresh arrays, CSV parses into fresh arrays. Skipping
+        loaded columns into fresh arrays, CSV parses into fresh arrays, Parquet /
+        Arrow hand out read-only views of the decoded group. Skipping
         the staging accumulator drops the append + slice_copy double copy.
         """
         dec = self._file_decoder
@@ -547,7 +751,11 @@ class EventReader():
             self._current_ts = self._first_ts
         self._n_read_events += len(chunk)
         if self._normalize_ts:
-            chunk.t -= self._first_ts - self._start_ts  # chunk is independent
+            shift = self._first_ts - self._start_ts
+            if chunk.t.flags.writeable:
+                chunk.t -= shift  # chunk is independent
+            else:
+                chunk.t = chunk.t - shift  # read-only zero-copy view (Parquet / Arrow)
         return chunk
 
     def _dt_trigger_sink(self) -> TriggerSoABuffers:
@@ -570,7 +778,7 @@ class EventReader():
             out.grow(max(out.size + step, int(out.capacity * 1.5) + 1))
         out.c.capacity = out.size + step
 
-    def _read_delta_t_fast(self, delta_t: int) -> "np.ndarray | EventArray":
+    def _read_delta_t_fast(self, delta_t: int, into: EventSoABuffers | None = None) -> "np.ndarray | EventArray":
         """One ``delta_t`` window, fast path: decode into a fresh buffer, hand out
         a zero-copy view of the window, and carry only the small overshoot
         (events past the boundary, at most one decode step) to the next call.
@@ -586,6 +794,10 @@ class EventReader():
         ``n_events`` safety cap (``max_events`` in delta_t mode) is honoured: a
         window larger than the cap is cut at the count boundary, exactly like the
         accumulator path.
+
+        With ``into`` (see :meth:`read_into`) the window is decoded into the
+        caller's buffer, which never grows: once it is full the window is cut
+        there and the next call continues the same time window.
         """
         dec = self._file_decoder
         step = self._dt_step
@@ -598,8 +810,10 @@ class EventReader():
         # Seed it with the previous call's overshoot.
         carry = self._dt_carry
         k = carry.size if carry is not None else 0
-        need = max(self._dt_est * 5 // 4 + step, k + step)
-        out = self._acquire_window_buffer(need)
+        if into is None:
+            out = self._acquire_window_buffer(max(self._dt_est * 5 // 4 + step, k + step))
+        else:
+            out = into
         if k:
             out.t[:k] = carry.t[:k]
             out.x[:k] = carry.x[:k]
@@ -612,7 +826,10 @@ class EventReader():
         # decoded event (only reachable on the first call, when there is no carry).
         if not self._anchored and out.size == 0:
             while out.size == 0 and not dec.is_eof():
-                self._grow_out(out, step)
+                if into is None:
+                    self._grow_out(out, step)
+                else:
+                    out.c.capacity = min(step, into.capacity)
                 tr.reset()
                 dec.parse_step(out, tr)
             if out.size == 0:
@@ -625,16 +842,24 @@ class EventReader():
         end_ts = self._current_ts + delta_t
 
         # Decode until the buffer holds an event at/after the time boundary, the
-        # count cap is exceeded, or the stream ends.
+        # count cap is exceeded, the caller's buffer is full, or the stream ends.
+        full = False
         while not dec.is_eof():
             n = out.size
             if n and (int(out.t[n - 1]) >= end_ts or n > n_cap):
                 break
-            self._grow_out(out, step)
+            if into is None:
+                self._grow_out(out, step)
+            else:
+                out.c.capacity = min(n + step, into.capacity)
             tr.reset()
             added = dec.parse_step(out, tr)
             if added == 0 and dec.is_eof():
                 break
+            if added == 0 and into is not None:
+                # No room left (vector formats stop a few slots short of it).
+                full = True
+                break
 
         size = out.size
         t = out.t[:size].view(np.int64)
@@ -659,7 +884,7 @@ class EventReader():
         self._dt_est = max(self._dt_est, idx)
         if count_cut:
             self._current_ts = int(t[idx])  # count cutoff: resume mid-window
-        else:
+        elif not (full and idx == size):  # a full caller buffer: window goes on
             self._current_ts += delta_t
         self._n_read_events += idx
         # EOF only once the stream is drained *and* no overshoot remains, else the
@@ -719,7 +944,7 @@ class EventReader():
         buf.c.capacity = buf.capacity
         return buf
 
-    def _read_delta_t_c(self, delta_t: int) -> "EventArray":
+    def _read_delta_t_c(self, delta_t: int, into: EventSoABuffers | None = None) -> "EventArray":
         """One delta_t window via the dedicated C parser.
 
         The C parser stops exactly when an event's timestamp reaches ``end_ts``,
@@ -727,6 +952,10 @@ class EventReader():
         output buffer -- no ``searchsorted`` boundary hunt and no overshoot carry
         (every returned event already has ``ts < end_ts``). This is the openeb
         approach: the slicing lives in the decoder, not in Python.
+
+        With ``into`` (see :meth:`read_into`) the window is decoded into the
+        caller's buffer; a full buffer cuts the window like the ``max_events``
+        cap.
         """
         dec = self._file_decoder
         n_cap = self._n_events
@@ -747,8 +976,11 @@ class EventReader():
 
         end_ts = self._current_ts + delta_t
 
-        out = self._acquire_window_buffer(
-            max(self._dt_est * 5 // 4 + self._dt_step, self._dt_step))
+        if into is None:
+            out = self._acquire_window_buffer(
+                max(self._dt_est * 5 // 4 + self._dt_step, self._dt_step))
+        else:
+            out = into
         # The n_events safety cap (max_events in delta_t mode) is enforced by
         # clamping the capacity the C parser sees, so a single C call can never
         # decode past it. The parser stops within its reserved vector headroom
@@ -764,7 +996,7 @@ class EventReader():
             if dec.is_eof():
                 break
             if status == EVUTILS_PARSE_OUTPUT_FULL:
-                if out.c.capacity >= n_cap:
+                if out.c.capacity >= n_cap or into is not None:
                     # Hit the max_events cap: emit what we have and continue
                     # this same time window on the next call.
                     count_cut = True
@@ -830,14 +1062,27 @@ class EventReader():
         return out
 
     def _read(self, delta_t:int|None=None, n_events:int|None=None) -> "EventArray":
-        """Thin wrapper stamping sensor_size onto the decoded window."""
-        return self._attach_sensor_size(self._read_impl(delta_t, n_events))
+        """Thin wrapper stamping sensor_size onto the decoded window (and
+        compacting its timestamps with ``ts_dtype="u4"``)."""
+        out = self._attach_sensor_size(self._read_impl(delta_t, n_events))
+        if self._ts_compact:
+            if isinstance(out, tuple):
+                return out[0].compact(), out[1]
+            return out.compact()
+        return out
 
-    def _read_impl(self, delta_t:int|None=None, n_events:int|None=None) -> "EventArray":
-        """Unguarded body of :meth:`read` (also driven by the prefetch worker)."""
+    def _read_impl(self, delta_t:int|None=None, n_events:int|None=None,
+                   into: EventSoABuffers | None = None) -> "EventArray":
+        """Unguarded body of :meth:`read` (also driven by the prefetch worker).
+
+        With ``into`` (see :meth:`read_into`) the window is written into that
+        caller-owned buffer -- decoded straight into it on the fast paths -- and
+        the returned events are a view of it.
+        """
         # If not initialized, initialize
         if not self._is_initialized:
             self.init()
+        room = into.capacity if into is not None else None
 
         # Fast path: pure n_events streaming with no time window, no triggers,
         # and nothing left buffered from an earlier windowed read. Skips the
@@ -847,28 +1092,39 @@ class EventReader():
                 and (self._buffer is None or len(self._buffer) == 0)):
             dec = self._file_decoder
             n = n_events if n_events is not None else self._n_events
+            if room is not None:
+                n = min(n, room)
             # Exact-capacity native decoders (EVT2/DAT/AER) decode straight into
             # a fresh output buffer via parse_step.
             if self._native_fill and dec._exact_window:
-                return self._read_n_events_fast(n)
+                return self._read_n_events_fast(n, into)
             # Decoders whose read_chunk already returns independent, bounded
-            # chunks (NPZ/CSV) can hand that out directly.
-            if dec._independent_windows:
-                return self._read_n_events_readchunk(n)
+            # chunks (NPZ/CSV) can hand that out directly -- unless the reader
+            # masks them, which would leave short windows.
+            if dec._independent_windows and self._post_filter is None:
+                output = self._read_n_events_readchunk(n)
+                if into is None:
+                    return output
+                self._copy_into(into, output)
+                return events_view(into)
 
         # Fast path: pure delta_t streaming with a native-fill decoder, no
         # triggers, and nothing left in the staging accumulator. Hands out a
         # zero-copy view of the window instead of copying it out (slice_copy).
+        # A caller's buffer must be roomy enough to decode into (the vector
+        # parsers keep some headroom) and to take the pending overshoot.
         if (self._mode == "delta_t" and n_events is None
                 and self._native_fill
                 and not self._read_external_triggers
-                and (self._buffer is None or len(self._buffer) == 0)):
+                and (self._buffer is None or len(self._buffer) == 0)
+                and (room is None or (room >= self._INTO_MIN_DIRECT and (
+                    self._dt_carry is None or self._dt_carry.size < room // 2)))):
             dt = delta_t if delta_t is not None else self._delta_t
             # Prefer the dedicated C delta_t parser (one GIL-free call per window,
             # no boundary search or overshoot carry) when the format has one.
             if self._file_decoder._has_delta_t_parser:
-                return self._read_delta_t_c(dt)
-            return self._read_delta_t_fast(dt)
+                return self._read_delta_t_c(dt, into)
+            return self._read_delta_t_fast(dt, into)
 
         # Allocate the staging accumulator on first use.
         if self._buffer is None:
@@ -891,6 +1147,11 @@ class EventReader():
             delta_t = self._delta_t
         if n_events is None:
             n_events = self._n_events
+        # A caller's buffer caps the window like n_events; unlike n_events, a
+        # window cut there is continued (same time window) by the next call.
+        room_cut = room is not None and (drain or room < n_events)
+        if room_cut:
+            n_events = room
 
         # Establish the first timestamp once, at the very start of the stream.
         if not self._anchored and len(acc) == 0:
@@ -917,7 +1178,7 @@ class EventReader():
         while True:
             t = acc.t_window()
             time_ready = not drain and len(t) > 0 and t[-1] >= end_ts
-            count_ready = not drain and len(acc) > n_events
+            count_ready = (not drain or room_cut) and len(acc) > n_events
 
             if time_ready or count_ready:
                 time_idx = int(np.searchsorted(t, end_ts)) if time_ready else len(acc) + 1
@@ -925,8 +1186,10 @@ class EventReader():
                 if count_ready and time_idx > n_events:
                     # n_events cutoff comes first
                     end_idx = n_events
-                    self._current_ts = int(t[n_events])
-                    tr_end_idx = int(np.searchsorted(tr_t, self._current_ts, side='left'))
+                    cut_ts = int(t[n_events])
+                    if not room_cut:
+                        self._current_ts = cut_ts
+                    tr_end_idx = int(np.searchsorted(tr_t, cut_ts, side='left'))
                 else:
                     # delta_t cutoff comes first (ties go to the time window)
                     end_idx = time_idx
@@ -943,7 +1206,7 @@ class EventReader():
                 break
 
         # Copy out the window (independent) and advance past it.
-        output, output_tr = acc.slice_copy(end_idx, tr_end_idx)
+        output, output_tr = acc.slice_copy(end_idx, tr_end_idx, into)
         self._n_read_events += end_idx
 
         if self._normalize_ts:
@@ -1002,6 +1265,8 @@ class EventReader():
                 out_tr = TriggerArray.empty()
         else:
             out = _out # type: ignore
+        if self._post_filter is not None:
+            out = self._post_filter.apply(out)
 
         # Prepend anything already buffered by prior read() calls (rare: only if
         # read() and read_all() are mixed on the same reader).
@@ -1036,9 +1301,14 @@ class EventReader():
             # Capture the shift before modifying out.t, so triggers get the
             # same normalization.
             shift = int(out.t[0]) - self._start_ts
-            out.t -= shift
+            if out.t.flags.writeable:
+                out.t -= shift
+            else:
+                out.t = out.t - shift  # read-only zero-copy view (Parquet / Arrow)
             if self._read_external_triggers and len(out_tr) > 0:
                 out_tr.t -= shift
+        if self._ts_compact:
+            out = out.compact()
 
         if self._batch_mode:
             from ..types import DataBatch, TriggerArray
@@ -1102,7 +1372,8 @@ class EventReader():
         NotImplementedError
             If the decoder does not support seeking.
         ValueError
-            If neither or both of ``t`` / ``n`` are given.
+            If neither or both of ``t`` / ``n`` are given, or ``n`` is given
+            while the reader filters events (``roi`` / ``polarity`` / ``stride``).
 
         Examples
         --------
@@ -1113,6 +1384,8 @@ class EventReader():
             self.init()
         if (t is None) == (n is None):
             raise ValueError("seek() requires exactly one of t= or n=.")
+        if n is not None and self._event_filter is not None:
+            raise ValueError("seek(n=...) is not supported with roi / polarity / stride filtering; seek by t= instead.")
 
         dec = self._file_decoder
         if not dec.SUPPORTS_SEEK:
@@ -1159,6 +1432,8 @@ class EventReader():
                 res, rem_ev, rem_tr = self._seek_linear(t, n)
         else:
             res, rem_ev, rem_tr = self._seek_linear(t, n)
+        if self._post_filter is not None:
+            rem_ev = self._post_filter.apply(rem_ev)
 
         if len(rem_ev) > 0 or (rem_tr is not None and len(rem_tr) > 0):
             if self._buffer is None:
@@ -1187,9 +1462,15 @@ class EventReader():
         if self._native_fill:
             first = self._peek_first_ts()
         else:
-            chunk = dec.read_chunk()
-            if isinstance(chunk, tuple):
-                chunk = chunk[0]
+            while True:
+                chunk = dec.read_chunk()
+                if isinstance(chunk, tuple):
+                    chunk = chunk[0]
+                if len(chunk) == 0 or self._post_filter is None:
+                    break
+                chunk = self._post_filter.apply(chunk)
+                if len(chunk) > 0:
+                    break
             first = int(chunk.t[0]) if len(chunk) > 0 else None
         dec.reset()
         return first
@@ -1339,6 +1620,41 @@ class EventReader():
             if hasattr(it, "close"):
                 it.close()
 
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        """Arrow PyCapsule interface: stream the remaining windows as record batches.
+
+        Each window of the reader's configured ``delta_t`` / ``n_events`` mode
+        becomes one batch, exported zero-copy via :meth:`EventArray.to_arrow`,
+        so ``polars.DataFrame(reader)`` or ``duckdb`` consume the recording
+        window by window. With ``reuse_buffers=True`` a window's storage is
+        recycled by a later read, so batches are copied out first. Triggers
+        (``ext_trigger=True``) are not part of the stream. Compact windows
+        (``ts_dtype="u4"``) each have their own ``t_base``, which one stream
+        schema cannot carry, so they are exported with absolute ``int64``
+        timestamps. Requires ``pyarrow``.
+        """
+        import pyarrow as pa
+
+        def events(window: Any) -> EventArray:
+            if isinstance(window, tuple):
+                window = window[0]
+            return getattr(window, "events", window).expand()
+
+        windows = iter(self)
+        first = next(windows, None)
+        head = events(first) if first is not None else EventArray.empty()
+        schema = head.to_arrow().schema
+
+        def batches() -> "Iterator[Any]":
+            if first is None:
+                return
+            for ev in itertools.chain((head,), map(events, windows)):
+                if self._reuse_buffers:
+                    ev = ev.copy()
+                yield ev.to_arrow()
+
+        return pa.RecordBatchReader.from_batches(schema, batches()).__arrow_c_stream__(requested_schema)
+
     def _iter_sync(self) -> "Iterator[Any]":
         """The plain synchronous window generator behind :meth:`__iter__`."""
         if not self._is_initialized:
@@ -1353,6 +1669,161 @@ class EventReader():
                     yield DataBatch(events=res, triggers=TriggerArray.empty())
             else:
                 yield res
+
+    def iter_frames(self, delta_t: int | None = None, kind: str = "histogram",
+                    n_bins: int = 1) -> "Iterator[np.ndarray]":
+        """Iterate over per-pixel event-count frames, one per ``delta_t`` window.
+
+        The events are never materialised as windows: the decoder fills a small,
+        cache-resident block that is scatter-accumulated natively into the frame
+        and immediately reused, so a frame costs little more than decoding its
+        events. Windows are anchored on the first event and advance by
+        ``delta_t`` exactly like the reader's ``delta_t`` mode (an empty window
+        yields an all-zero frame), and the reader's ``roi`` / ``polarity`` /
+        ``stride`` filter applies.
+
+        Parameters
+        ----------
+        delta_t : int, optional
+            Frame duration in microseconds, by default the reader's ``delta_t``.
+        kind : {'histogram'}, default 'histogram'
+            Frame representation: per-pixel event counts, split by polarity.
+        n_bins : int, default 1
+            Split each frame into this many equal time bins.
+
+        Yields
+        ------
+        np.ndarray
+            A fresh ``uint32`` array of shape ``(height, width, 2)`` -- the last
+            axis is the polarity -- or ``(n_bins, height, width, 2)`` when
+            ``n_bins > 1``.
+
+        Raises
+        ------
+        ValueError
+            If ``kind`` is unknown, ``delta_t`` / ``n_bins`` is not positive, or
+            the sensor size is unknown (pass ``width`` / ``height``).
+
+        Examples
+        --------
+        >>> reader = EventReader(b"% format EVT3;height=720;width=1280\\n% end\\n")
+        >>> frames = list(reader.iter_frames(delta_t=10000))
+        >>> len(frames)
+        0
+        """
+        if kind != "histogram":
+            raise ValueError(f"Frame kind {kind!r} not supported. Supported kinds are: ['histogram']")
+        dt = self._delta_t if delta_t is None else delta_t
+        if not isinstance(dt, int) or dt <= 0:
+            raise ValueError("delta_t must be a positive integer")
+        if not isinstance(n_bins, int) or n_bins < 1:
+            raise ValueError("n_bins must be a positive integer")
+        self._check_no_active_prefetch()
+        width, height = self.shape()
+        if width is None or height is None:
+            raise ValueError("iter_frames() needs the sensor size: pass width= and height= to the reader")
+        return self._iter_histograms(dt, n_bins, int(width), int(height))
+
+    #: Events decoded per step of :meth:`iter_frames`: small enough that the
+    #: staging block is still cache-resident when it is accumulated.
+    _FRAME_STEP = 1 << 15
+
+    def _iter_histograms(self, delta_t: int, n_bins: int, width: int, height: int) -> "Iterator[np.ndarray]":
+        """Generator body of :meth:`iter_frames` (arguments already validated)."""
+        from ._native_hist import accumulate_histogram
+
+        staging = EventSoABuffers(self._FRAME_STEP)
+        self._stage_pending(staging)
+        pos = 0
+        if staging.size == 0 and not self._fill_staging(staging):
+            self._eof = True
+            return
+        if not self._anchored:
+            self._first_ts = int(staging.t[0])
+            self._current_ts = self._first_ts
+            self._anchored = True
+
+        done = False
+        while not done:
+            counts = np.zeros((n_bins, height, width, 2), dtype=np.uint32)
+            while True:
+                end = accumulate_histogram(staging, pos, counts, self._current_ts, delta_t)
+                self._n_read_events += end - pos
+                pos = end
+                if pos < staging.size:
+                    break  # reached the window end
+                staging.reset()
+                pos = 0
+                if not self._fill_staging(staging):
+                    done = True
+                    break
+            self._current_ts += delta_t
+            yield counts[0] if n_bins == 1 else counts
+        self._eof = True
+
+    def _stage_pending(self, staging: EventSoABuffers) -> None:
+        """Move events already buffered by earlier :meth:`read` calls (staging
+        accumulator, delta_t overshoot) into ``staging``, ahead of the decoder."""
+        self._flush_dt_carry()
+        acc = self._buffer
+        if acc is None or len(acc) == 0:
+            return
+        pending, _ = acc.slice_copy(len(acc), acc._tr.size - acc._tr_start)
+        self._copy_into(staging, pending)
+
+    @staticmethod
+    def _copy_into(staging: EventSoABuffers, events: "EventArray") -> None:
+        """Replace the contents of ``staging`` with ``events`` (growing it)."""
+        k = len(events)
+        staging.grow(k)
+        staging.t[:k] = events.t
+        staging.x[:k] = events.x
+        staging.y[:k] = events.y
+        staging.p[:k] = events.p
+        staging.c.size = k
+
+    def _fill_staging(self, staging: EventSoABuffers) -> bool:
+        """Decode the next events into the empty ``staging`` block. Returns
+        False at the end of the stream."""
+        dec = self._file_decoder
+        if self._native_fill:
+            tr = self._dt_trigger_sink()
+            while staging.size == 0:
+                if dec.is_eof():
+                    return False
+                tr.reset()
+                dec.parse_step(staging, tr)
+            return True
+        while True:
+            chunk = dec.read_chunk()
+            triggers = None
+            if isinstance(chunk, tuple):
+                chunk, triggers = chunk
+            if len(chunk) == 0 and (triggers is None or len(triggers) == 0):
+                return False
+            if self._post_filter is not None:
+                chunk = self._post_filter.apply(chunk)
+            if len(chunk) > 0:
+                self._copy_into(staging, chunk)
+                return True
+
+    def count_events(self) -> int | None:
+        """Get the total number of events in the file, when the format can
+        tell without decoding them (an index, footer, or header count).
+
+        Unlike ``len(reader)``, the number of events read so far, this counts
+        the whole file and ignores ``roi`` / ``polarity`` filtering.
+
+        Returns
+        -------
+        int | None
+            The number of events in the file, or None if it is not known
+
+        """
+        if not self._is_initialized:
+            self.init()
+        return self._file_decoder.count_events()
+
     def shape(self) -> tuple[int|None, int|None]:
         """Get the shape of the frame.
 
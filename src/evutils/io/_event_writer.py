@@ -10,7 +10,7 @@ from pathlib import Path
 import numpy as np
 
 from . import encoders as ev_encoders
-from ._compression import is_compressed_path, open_compressed
+from ._compression import SEEKABLE_ZSTD_FRAME_SIZE, is_compressed_path, open_compressed
 
 class EventWriter():
     """Base class for writing events to different file formats.
@@ -36,6 +36,12 @@ class EventWriter():
         File encoder to use, by default None (chosen from the file extension)
     mode
         File open mode, by default 'w+b'
+    seekable
+        Write a ``.zst`` path in the zstd seekable format: independent frames
+        plus a seek table, so readers can seek and decompress in parallel
+        without inflating the whole file (plain zstd tools still read it).
+        ``True`` uses 1 MiB frames; an int sets the uncompressed bytes per
+        frame. By default False (a single zstd stream).
     **kwargs
         Additional arguments for the file encoder
 
@@ -56,8 +62,11 @@ class EventWriter():
 
     """
 
-    def __init__(self, file: Path | str | io.BufferedIOBase, width:int|None=None, height:int|None=None, dt: datetime|None = None,  file_encoder: ev_encoders.EventEncoder | None = None, mode: str = 'w+b', **kwargs):
+    def __init__(self, file: Path | str | io.BufferedIOBase, width:int|None=None, height:int|None=None, dt: datetime|None = None,  file_encoder: ev_encoders.EventEncoder | None = None, mode: str = 'w+b', seekable: "bool | int" = False, **kwargs):
         self._mode = mode
+        if seekable is True:
+            seekable = SEEKABLE_ZSTD_FRAME_SIZE
+        self._zstd_frame_size: int | None = int(seekable) if seekable else None
         self._file_name: Path | None = None
 
         # Handle paths as input
@@ -133,10 +142,13 @@ class EventWriter():
             The opened file object.
 
         """
-        # Compressed paths (foo.raw.zst) auto-open through a compressing stream;
-        # the inner extension (resolved by get_file_writer) selects the encoder.
+        # Compressed paths (foo.raw.zst) auto-open through a compressing stream
+        # (independent frames + a seek table with seekable=...); the inner
+        # extension (resolved by get_file_writer) selects the encoder.
         if is_compressed_path(file_name):
-            return open_compressed(file_name, "wb")
+            return open_compressed(file_name, "wb", frame_size=self._zstd_frame_size)
+        if self._zstd_frame_size is not None:
+            raise ValueError(f"seekable=... needs a '.zst' path, not {file_name.name!r}")
         # default 'w+b' (not 'wb'): container encoders (HDF5) need the stream to be
         # readable and seekable, and it costs nothing for the append-only ones.
         return open(str(file_name), self._mode)
@@ -179,6 +191,11 @@ class EventWriter():
         >>> writer.close() # doctest: +SKIP
 
         """
+        # Encoders take absolute int64 timestamps: expand compact windows.
+        expand = getattr(events, "expand", None)
+        if expand is not None:
+            events = expand()
+
         # Resolve the encoder lazily so the first batch can supply sensor_size.
         if self._file_encoder is None:
             self._ensure_encoder(events)
@@ -9,9 +9,14 @@ Input strategy:
 * If the source is *mappable* (mmap / in-memory), the whole payload is exposed
   as a single zero-copy ``uint16`` view and the parser walks it in windows --
   no per-chunk copy, no vector-group carry across chunk boundaries.
+* A compressed recording (:class:`~evutils.io._source.DecompressAheadSource`)
+  read serially is decoded block by block while its background thread
+  decompresses the next blocks; the unparsed tail of each block is carried into
+  the headroom in front of the next one. Seeking, indexing and
+  ``decode_workers > 1`` need the whole payload and switch to the slurp below.
 * Otherwise the remaining stream is slurped into memory once and treated the
-  same way. (Truly incremental streaming for live devices is future work; the
-  parser ABI already supports it via ``result.current``.)
+  same way as a mapped one. (Incremental streaming for live devices is future
+  work; the parser ABI already supports it via ``result.current``.)
 
 The Prophesee formats are wired to native parsers, dispatched by the header
 ``format`` field: EVT3 (16-bit words), EVT2 / EVT4 (32-bit words) and EVT2.1
@@ -27,7 +32,6 @@ import re
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict
 
-from ..jit import lazy_njit
 import numpy as np
 
 from ..types import EventArray, TriggerArray
@@ -54,8 +58,12 @@ from ._native_evt import (
     Evt21Parser,
     Evt4Input,
     Evt4Parser,
+    Evt2Encoder,
+    Evt3Encoder,
+    Evt21Encoder,
+    Evt4Encoder,
 )
-from ._source import ByteSource
+from ._source import BLOCK_HEADROOM, ByteSource, DecompressAheadSource
 
 _EMPTY_EVENTS = EventArray.empty()
 
@@ -144,6 +152,10 @@ class EventDecoder_EVT(EventDecoder):
     """
 
     _TAIL_PAD = 8  # >= parser look-ahead padding (EVT3_INPUT_PADDING)
+    #: Streaming mode moves on to the next block once fewer words than this
+    #: remain, so a parser never stalls on a block end mid-stream (must exceed
+    #: the look-ahead and fit BLOCK_HEADROOM at 8 bytes per word).
+    _STREAM_MARGIN = 1024
     SUPPORTS_EXT_TRIGGERS = True
 
     #: EVT is variable-length with an incremental time base, so seeking uses a
@@ -158,6 +170,9 @@ class EventDecoder_EVT(EventDecoder):
     #: even over a non-seekable source (e.g. a compressed stream).
     _buffers_in_memory = True
 
+    #: The C parsers apply the reader's ROI / stride / polarity filter.
+    _native_filter = True
+
     # Per-format TIME_HIGH record descriptor: (type-field right-shift, type code).
     # Used to skip leading records until the first TIME_HIGH establishes a valid
     # time base -- events before it carry an undefined timestamp (a stream sliced
@@ -181,6 +196,25 @@ class EventDecoder_EVT(EventDecoder):
         "evt4": 1 << 34,
     }
 
+    # TIME_HIGH payload field per format: (value mask, left shift into timestamp
+    # bits), as the C parsers compute ``new_ts_high``. The parallel read_all()
+    # replays their wrap test at each segment join with it.
+    _TIME_HIGH_FIELD = {
+        "evt3": (0xFFF, 12),
+        "evt2": (0x0FFFFFFF, 6),
+        "evt21": (0x0FFFFFFF, 6),
+        "evt4": (0x0FFFFFFF, 6),
+    }
+
+    #: Minimum payload words per segment of the parallel read_all(): below this
+    #: the thread hand-off and the final stitch cost more than they save.
+    _PARALLEL_MIN_WORDS = 1 << 20
+
+    #: How many TIME_HIGH candidates past a segment's nominal split point are
+    #: tried for a valid restart point before that split is dropped (the
+    #: neighbouring segments merge).
+    _RESTART_SCAN = 64
+
     def __init__(self, source: ByteSource, chunk_size: int = 1_000_000, read_external_triggers: bool = False):
         # The C parsers reserve headroom for one full vector expansion (up to 64
         # events) below the buffer capacity; a smaller chunk would make the
@@ -212,6 +246,12 @@ class EventDecoder_EVT(EventDecoder):
         self._words: "np.ndarray | None" = None          # uint16 view of the whole payload
         self._offset: int = 0            # current word offset into _words
         self._start_offset: int = 0      # word offset of the first TIME_HIGH
+        # Streaming mode (see _streams()): _words is a window over the current
+        # decompressed block, _stream_base the payload word offset of its start.
+        self._streaming: bool = False
+        self._window: "memoryview | None" = None
+        self._stream_base: int = 0
+        self._stream_done: bool = False
         self._parser: "Callable | None" = None
 
         # Seek support (see seek()).
@@ -224,6 +264,10 @@ class EventDecoder_EVT(EventDecoder):
         self._raw_path: "str | None" = None
         self._use_sidecar: bool = False
 
+        # Ordered decode-ahead over TIME_HIGH-aligned segments, started by the
+        # first parse_step when decode_workers > 1 (see _SegmentPipeline).
+        self._pipeline: "_SegmentPipeline | None" = None
+
     # ------------------------------------------------------------------ #
     # Header
     # ------------------------------------------------------------------ #
@@ -376,41 +420,109 @@ class EventDecoder_EVT(EventDecoder):
 
         if self._source.mappable():
             self._buf = self._source.buffer()          # zero-copy, whole file
+        elif self._streams():
+            first = self._source.read_block()
+            payload_off = self._parse_header(first)
+            if payload_off < len(first):
+                self._finalize_header()
+                self._setup_backend()
+                self._streaming = True
+                self._stream_done = False
+                self._stream_base = 0
+                self._set_window(first[payload_off:])
+                self._payload_off = payload_off
+                self._init_parse_state()
+                return
+            # Header as long as a whole block (or no payload): slurp instead.
+            self._source.reset()
+            self._buf = memoryview(self._source.read(-1))
         else:
             self._buf = memoryview(self._source.read(-1))  # slurp the stream
 
+        self._init_in_memory()
+
+    def _init_in_memory(self) -> None:
+        """Parse the header of the whole-payload ``_buf`` and view its words."""
+        assert self._buf is not None
+        self._streaming = False
         self._payload_off = self._parse_header(self._buf)
         self._finalize_header()
-
-        if self._format not in _BACKENDS:
-            raise NotImplementedError(
-                f"native decoder does not support format {self._format!r}"
-            )
-        parser_cls, input_cls, word_dtype = _BACKENDS[self._format]
-        self._input_cls = input_cls
-        self._word_dtype = word_dtype
+        self._setup_backend()
 
         # View the binary payload as words of the format's native width. The
         # payload can be unaligned relative to the word size (the header length
         # is arbitrary); numpy tolerates this and x86 handles the unaligned
         # loads in the C parser.
-        itemsize = np.dtype(word_dtype).itemsize
+        itemsize = np.dtype(self._word_dtype).itemsize
         n_words = (len(self._buf) - self._payload_off) // itemsize
         if n_words > 0:
             self._words = np.frombuffer(
-                self._buf, dtype=word_dtype, count=n_words, offset=self._payload_off
+                self._buf, dtype=self._word_dtype, count=n_words, offset=self._payload_off
             )
         else:
-            self._words = np.empty(0, dtype=word_dtype)
+            self._words = np.empty(0, dtype=self._word_dtype)
+        self._init_parse_state()
+
+    def _setup_backend(self) -> None:
+        """Pick the native parser / input / word type for the header's format."""
+        if self._format not in _BACKENDS:
+            raise NotImplementedError(
+                f"native decoder does not support format {self._format!r}"
+            )
+        _, self._input_cls, self._word_dtype = _BACKENDS[self._format]
 
+    def _init_parse_state(self) -> None:
+        """Fresh parser and output buffers at the first TIME_HIGH of ``_words``."""
+        assert self._format is not None
         self._start_offset = self._find_first_time_high()
         self._offset = self._start_offset
-        self._parser = parser_cls()
+        self._parser = _BACKENDS[self._format][0]()
+        self._parser.set_filter(self._native_event_filter())
         cap = int(self._chunk_size)
         self._events = EventSoABuffers(cap)
         self._triggers = TriggerSoABuffers(max(cap // 16, 1))
         self._is_initialized = True
 
+    # ------------------------------------------------------------------ #
+    # Streaming mode (compressed input decoded as it is decompressed)
+    # ------------------------------------------------------------------ #
+    def _streams(self) -> bool:
+        """Decode block by block from a decompress-ahead source: serial reads
+        only (decode_workers > 1 splits the whole payload)."""
+        return isinstance(self._source, DecompressAheadSource) and self._decode_workers == 1
+
+    def _set_window(self, window: memoryview) -> None:
+        self._window = window
+        itemsize = np.dtype(self._word_dtype).itemsize
+        self._words = np.frombuffer(window, dtype=self._word_dtype, count=len(window) // itemsize)
+
+    def _drained(self) -> bool:
+        """True when no payload words remain; in streaming mode the window is
+        first moved on to the next block when it runs low."""
+        if self._streaming and not self._stream_done:
+            assert self._words is not None and self._window is not None
+            while not self._stream_done and len(self._words) - self._offset < self._STREAM_MARGIN:
+                itemsize = np.dtype(self._word_dtype).itemsize
+                carry = self._window[self._offset * itemsize:]
+                assert isinstance(self._source, DecompressAheadSource)
+                window = self._source.read_block(carry)
+                self._stream_done = len(window) == len(carry)
+                self._stream_base += self._offset
+                self._offset = 0
+                self._set_window(window)
+        return self._words is None or self._offset >= len(self._words)
+
+    def _materialize(self) -> None:
+        """Leave streaming mode for random access: re-read the whole recording
+        into memory. The read position restarts at the first TIME_HIGH."""
+        if not self._streaming:
+            return
+        self._words = None
+        self._window = None
+        self._source.reset()
+        self._buf = memoryview(self._source.read(-1))
+        self._init_in_memory()
+
     def _find_first_time_high(self) -> int:
         """Word offset of the first TIME_HIGH record in the payload.
 
@@ -459,10 +571,19 @@ class EventDecoder_EVT(EventDecoder):
         input too."""
         return self._format == "evt2"
 
+    @property
+    def _pipelined(self) -> bool:
+        """True when parse_step is served by the ordered decode-ahead pipeline:
+        ``decode_workers > 1`` and no external triggers (the segment decode is
+        events-only, like read_all)."""
+        return self._decode_workers > 1 and not self.read_external_triggers
+
     def parse_step(self, events: EventSoABuffers, triggers: TriggerSoABuffers) -> int:
         """Run the parser once, appending decoded events into ``events``.
 
         Advances the internal word offset and sets EOF when the input is drained.
+        With ``decode_workers > 1`` the events come from the decode-ahead
+        pipeline instead (same stream, decoded on worker threads).
 
         Parameters
         ----------
@@ -479,7 +600,13 @@ class EventDecoder_EVT(EventDecoder):
         """
         if not self._is_initialized:
             self.init()
-        if self._words is None or self._offset >= len(self._words):
+        if self._pipelined:
+            return self._pipeline_step(events)
+        return self._parse_step_serial(events, triggers)
+
+    def _parse_step_serial(self, events: EventSoABuffers, triggers: TriggerSoABuffers) -> int:
+        """parse_step on the decoder's own parser (no pipeline)."""
+        if self._drained():
             self._eof = True
             return 0
         before = events.size
@@ -493,16 +620,38 @@ class EventDecoder_EVT(EventDecoder):
             # parser.reset() (see seek()); applied here so every read path
             # (read_chunk and the reader's accumulator _pull) sees absolute ts.
             events_view(events).t[before:before + appended] += self._seek_correction
-        if self._offset >= len(self._words):
+        if self._drained():
             self._eof = True
         return appended
 
+    def _pipeline_step(self, events: EventSoABuffers) -> int:
+        """parse_step served by the decode-ahead pipeline (started on demand)."""
+        if self._pipeline is None:
+            if self._words is None or self._offset >= len(self._words):
+                self._eof = True
+                return 0
+            self._pipeline = _SegmentPipeline(self, int(self._decode_workers))
+        appended = self._pipeline.step(events)
+        if self._pipeline.exhausted:
+            self._offset = len(self._words)
+            self._eof = True
+        return appended
+
+    def _stop_pipeline(self) -> None:
+        """Shut the decode-ahead pipeline down (waits for in-flight segments,
+        one of which may still be using the decoder's parser)."""
+        if self._pipeline is not None:
+            self._pipeline.close()
+            self._pipeline = None
+
     @property
     def _has_delta_t_parser(self) -> bool:
         """True when a dedicated C delta_t parser exists for this format, so the
         reader can decode a whole time window in one GIL-free C call (no
-        Python-side searchsorted / overshoot carry). EVT3 only, for now."""
-        return self._format == "evt3" and hasattr(self._parser, "parse_delta_t_soa")
+        Python-side searchsorted / overshoot carry). EVT3 only, for now; off
+        while the decode-ahead pipeline serves parse_step."""
+        return (self._format == "evt3" and hasattr(self._parser, "parse_delta_t_soa")
+                and not self._pipelined)
 
     def parse_step_delta_t(self, events: EventSoABuffers, triggers: TriggerSoABuffers,
                            end_ts: int) -> tuple[int, int]:
@@ -518,10 +667,11 @@ class EventDecoder_EVT(EventDecoder):
         """
         if not self._is_initialized:
             self.init()
-        words = self._words
-        if words is None or self._offset >= len(words):
+        if self._drained():
             self._eof = True
             return 0, EVUTILS_PARSE_WINDOW_DONE
+        words = self._words
+        assert words is not None
         before = events.size
         # A post-seek parser.reset() loses the TIME_HIGH wrap accumulation: the
         # C parser decodes in the raw (low) timeline while the caller's end_ts
@@ -561,7 +711,7 @@ class EventDecoder_EVT(EventDecoder):
             self._eof = True
             return self._apply_dt_correction(events, before, corr), status
         self._offset += consumed
-        if self._offset >= len(words):
+        if self._drained():
             self._eof = True
         return self._apply_dt_correction(events, before, corr), status
 
@@ -580,7 +730,7 @@ class EventDecoder_EVT(EventDecoder):
             self.init()
 
         # Nothing left: signal EOF with an empty array (never a stale buffer).
-        if self._words is None or self._offset >= len(self._words):
+        if self._drained():
             self._eof = True
             if self.read_external_triggers:
                 return _EMPTY_EVENTS, TriggerArray.empty()
@@ -594,16 +744,16 @@ class EventDecoder_EVT(EventDecoder):
         # window can consume words yet emit no events (pure timing packets), so
         # we must not treat an empty result as EOF unless the input is drained.
         appended = 0
-        while appended == 0 and self._offset < len(self._words):
+        while appended == 0 and not self._drained():
             if not self.read_external_triggers:
                 # Unrequested triggers are discarded anyway; reset the sink so a
                 # trigger-dense region can never fill it and stall the parser.
                 tr.reset()
             elif tr.size > 0:
                 break  # trigger-only progress: hand the triggers out
-            before_off = self._offset
+            before_off = self._stream_base + self._offset
             appended = self.parse_step(ev, tr)
-            if appended == 0 and self._offset == before_off:
+            if appended == 0 and self._stream_base + self._offset == before_off:
                 break  # zero progress (full buffers); never spin
 
         n = ev.size
@@ -639,12 +789,29 @@ class EventDecoder_EVT(EventDecoder):
         # carries triggers and applies the seek correction via read_chunk).
         if self.read_external_triggers:
             return super().read_all()
+        if self._streaming:
+            return self._read_all_streaming()
 
         if self._words is None or self._offset >= len(self._words):
             self._eof = True
             return _EMPTY_EVENTS
 
         assert self._format is not None  # set by init()
+        if self._pipeline is not None:
+            # Mid-iteration: the pipeline owns the position (and the parser).
+            out = self._pipeline.drain()
+            self._stop_pipeline()
+            self._offset = len(self._words)
+            self._eof = True
+            return out
+
+        bounds = self._parallel_bounds()
+        if len(bounds) > 2:
+            out = self._read_all_parallel(bounds)
+            self._offset = len(self._words)
+            self._eof = True
+            return out
+
         out, self._offset = decode_all_soa(
             self._words, self._offset, self._input_cls, self._parser,
             est_events_per_word=self._READ_ALL_EST.get(self._format, 1.0),
@@ -656,6 +823,183 @@ class EventDecoder_EVT(EventDecoder):
         self._eof = True
         return out
 
+    def _read_all_streaming(self) -> EventArray:
+        """read_all() in streaming mode: parse block after block into one
+        growing buffer (the payload size is not known up front)."""
+        assert self._words is not None and self._format is not None
+        est = self._READ_ALL_EST.get(self._format, 1.0)
+        ev = EventSoABuffers(int(4 * len(self._words) * est) + 1024)
+        tr = TriggerSoABuffers(1 << 12)
+        while not self._drained():
+            if ev.capacity - ev.size < 128:
+                ev.grow(ev.capacity * 2)
+            tr.reset()
+            self._parse_step_serial(ev, tr)
+        self._eof = True
+        return events_view(ev) if ev.size else _EMPTY_EVENTS
+
+    # ------------------------------------------------------------------ #
+    # Parallel read_all
+    # ------------------------------------------------------------------ #
+    def _is_restart_point(self, off: int) -> bool:
+        """True when a fresh parser started at the TIME_HIGH word ``off`` emits
+        exactly what the continuous parser would, up to the wrap accumulation
+        (which :meth:`_read_all_parallel` restores).
+
+        EVT2/2.1 carry no state besides the time base, so every TIME_HIGH
+        qualifies. EVT4 vector masks are raw 32-bit words that can look like a
+        TIME_HIGH; a candidate right after a possible vector base is rejected.
+        EVT3 also carries TIME_LOW, y and the vector base: the TIME_HIGH must be
+        followed by a TIME_LOW, then an ADDR_Y before any event word, and no
+        base-less vector continuation.
+        """
+        words = self._words
+        assert words is not None
+        if self._format == "evt4":
+            return off == 0 or (int(words[off - 1]) >> 28) not in (0xC, 0xD)
+        if self._format != "evt3":
+            return True
+        if off + 1 >= len(words) or (int(words[off + 1]) >> 12) != 0x6:
+            return False
+        seen_y = False
+        for w in words[off + 2:off + 18].tolist():
+            typ = w >> 12
+            if typ == 0x0:             # ADDR_Y
+                seen_y = True
+            elif typ in (0x2, 0x3):    # ADDR_X / VECT_BASE_X
+                return seen_y
+            elif typ in (0x4, 0x5):    # VECT_12 / VECT_8 without a base
+                return False
+        return False
+
+    def _next_restart_point(self, off: int) -> int | None:
+        """Word offset of the first valid restart point at/after ``off``.
+
+        Returns ``n_words`` when no TIME_HIGH follows, and None when
+        ``_RESTART_SCAN`` consecutive candidates were all rejected.
+        """
+        from ._index import next_time_high
+        words = self._words
+        assert words is not None and self._format is not None
+        n = len(words)
+        desc = self._TIME_HIGH_TYPE[self._format]
+        for _ in range(self._RESTART_SCAN):
+            off = next_time_high(words, off, desc)
+            if off >= n or self._is_restart_point(off):
+                return off
+            off += 1
+        return None
+
+    def _parallel_bounds(self) -> list[int]:
+        """Segment boundaries ``[offset, b1, ..., n_words]`` for read_all().
+
+        The remaining payload is cut into ``_decode_workers`` near-equal parts,
+        each split moved forward to the next valid restart point. Returns just
+        ``[offset, n_words]`` (serial) for one worker or a payload too small to
+        be worth splitting.
+        """
+        words = self._words
+        assert words is not None and self._format is not None
+        n = len(words)
+        start = self._offset
+        n_seg = min(int(self._decode_workers), (n - start) // self._PARALLEL_MIN_WORDS)
+        if self._format not in self._TIME_HIGH_TYPE or n_seg < 2:
+            return [start, n]
+        step = (n - start) // n_seg
+        bounds = [start]
+        for k in range(1, n_seg):
+            off = self._next_restart_point(max(start + k * step, bounds[-1] + 1))
+            if off is None:
+                continue  # no restart point nearby: merge with the next segment
+            if off >= n:
+                break
+            bounds.append(off)
+        bounds.append(n)
+        return bounds
+
+    def _new_parser(self):
+        """A fresh parser for a segment decoded on a worker thread, carrying the
+        decoder's event filter."""
+        parser = type(self._parser)()
+        parser.set_filter(self._native_event_filter())
+        return parser
+
+    def _decode_segment(self, lo: int, hi: int, parser) -> tuple[EventArray, tuple[int, int]]:
+        """Decode words ``[lo, hi)`` with ``parser`` into a fresh array.
+
+        Returns the events (raw timeline, no seek correction) and the parser's
+        final time base. An interior segment ends on a TIME_HIGH; the
+        sub-padding residue before it is flushed through the tail pad exactly
+        as at EOF, so the segment decodes to precisely its serial events.
+        """
+        assert self._words is not None and self._format is not None
+        part, _ = decode_all_soa(
+            self._words[:hi], lo, self._input_cls, parser,
+            est_events_per_word=self._READ_ALL_EST.get(self._format, 1.0),
+            tail_pad=self._tail_pad, word_dtype=self._word_dtype,
+            strict=self._strict,
+        )
+        return part, parser.time_base()
+
+    def _join_correction(self, time_base: tuple[int, int], off: int) -> int:
+        """Wrap offset to add to a segment decoded by a fresh parser from the
+        restart point ``off``.
+
+        ``time_base`` is the serial parser's ``(ts_high_high, ts_high)`` just
+        before ``off``. A fresh parser starts both at 0, so replay the C wrap
+        test its first TIME_HIGH would have run against the serial state.
+        """
+        assert self._words is not None and self._format is not None
+        mask, shift = self._TIME_HIGH_FIELD[self._format]
+        ts_high_high, ts_high = time_base
+        first_high = (int(self._words[off]) & mask) << shift
+        return ts_high_high + (self._WRAP_PERIOD[self._format] if first_high < ts_high else 0)
+
+    def _read_all_parallel(self, bounds: list[int]) -> EventArray:
+        """Decode the TIME_HIGH-aligned segments ``bounds`` concurrently and
+        stitch them into one output, bit-identical to the serial decode.
+
+        Segment 0 continues the decoder's own parser; the others start from a
+        fresh state on a thread pool (the native parse releases the GIL). The
+        wrap accumulation a fresh parser misses is chained across the joins
+        (:meth:`_join_correction`) and added while copying into the output.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        parsers = [self._parser] + [self._new_parser() for _ in range(len(bounds) - 2)]
+
+        with ThreadPoolExecutor(max_workers=len(parsers)) as pool:
+            results = list(pool.map(
+                lambda k: self._decode_segment(bounds[k], bounds[k + 1], parsers[k]),
+                range(len(parsers)),
+            ))
+
+            time_base = results[0][1]
+            corrections = [self._seek_correction]
+            for k in range(1, len(results)):
+                corr = self._join_correction(time_base, bounds[k])
+                seg_high_high, seg_high = results[k][1]
+                time_base = (corr + seg_high_high, seg_high)
+                corrections.append(corr + self._seek_correction)
+
+            parts = [part for part, _ in results]
+            starts = np.cumsum([0] + [len(part) for part in parts])
+            total = int(starts[-1])
+            out = EventArray(
+                np.empty(total, dtype=np.int64), np.empty(total, dtype=np.uint16),
+                np.empty(total, dtype=np.uint16), np.empty(total, dtype=np.uint8),
+            )
+
+            def stitch(k: int) -> None:
+                lo, hi = int(starts[k]), int(starts[k + 1])
+                np.add(parts[k].t, corrections[k], out=out.t[lo:hi])
+                out.x[lo:hi] = parts[k].x
+                out.y[lo:hi] = parts[k].y
+                out.p[lo:hi] = parts[k].p
+
+            list(pool.map(stitch, range(len(parts))))
+        return out
+
     def reset(self) -> None:
         """Reset the EVT reader to the beginning.
 
@@ -664,9 +1008,18 @@ class EventDecoder_EVT(EventDecoder):
         None
 
         """
-        self._offset = self._start_offset
+        self._stop_pipeline()
         self._eof = False
         self._seek_correction = 0
+        if self._streaming:
+            # Restart the decompression from the top of the file.
+            self._words = None
+            self._window = None
+            self._source.reset()
+            self._is_initialized = False
+            self.init()
+            return
+        self._offset = self._start_offset
         if self._parser is not None:
             self._parser.reset()
 
@@ -674,15 +1027,19 @@ class EventDecoder_EVT(EventDecoder):
     # Seeking
     # ------------------------------------------------------------------ #
     def _ensure_index(self, need_counts: bool = False):
-        """Obtain a :class:`SeekIndex` (Metavision sidecar or built in memory).
+        """Obtain a :class:`SeekIndex`: a Metavision sidecar, a persisted
+        evutils sidecar, or built in memory (and optionally persisted).
 
         ``need_counts`` forces a built (evutils-counted) index, whose cumulative
         counts match this decoder exactly -- required for event-index seeks.
         """
         from ._index import (
             IncrementalSeekIndex,
+            evutils_index_path,
             metavision_index_path,
+            read_evutils_index,
             read_metavision_index,
+            write_evutils_index,
         )
 
         if self._index is not None and not (need_counts and not self._index_is_ours):
@@ -696,6 +1053,16 @@ class EventDecoder_EVT(EventDecoder):
                 self._payload_off, word_size,
             )
             self._index_is_ours = False
+        sidecar = None
+        if self._raw_path is not None and (self._load_index or self._save_index):
+            sidecar = evutils_index_path(self._raw_path, self._index_dir)
+        if idx is None and sidecar is not None and self._load_index:
+            # A persisted built index: exact counts, mmapped, O(1) to open.
+            idx = read_evutils_index(
+                sidecar, self._raw_path, self._header_digest(),
+                self._payload_off, word_size,
+            )
+            self._index_is_ours = True
         if idx is None:
             idx = IncrementalSeekIndex(
                 words=self._words, start_offset=self._start_offset,
@@ -707,9 +1074,21 @@ class EventDecoder_EVT(EventDecoder):
                 time_high=self._TIME_HIGH_TYPE.get(self._format or ""),
             )
             self._index_is_ours = True
+            if sidecar is not None and self._save_index:
+                idx = idx.to_static()
+                write_evutils_index(
+                    sidecar, self._raw_path, self._header_digest(),
+                    self._payload_off, word_size, idx,
+                )
         self._index = idx
         return idx
 
+    def _header_digest(self) -> bytes:
+        """Digest of the raw ASCII header, binding a persisted index to it."""
+        import hashlib
+        assert self._buf is not None
+        return hashlib.blake2b(bytes(self._buf[:self._payload_off]), digest_size=16).digest()
+
     def _decode_step(self) -> tuple[EventArray, 'TriggerArray']:
         """One decode step from the current offset (no correction).
         Returns a tuple of EventArray and TriggerArray views.
@@ -725,7 +1104,7 @@ class EventDecoder_EVT(EventDecoder):
         while appended == 0 and self._offset < len(self._words):
             tr.reset()
             before_off = self._offset
-            appended = self.parse_step(ev, tr)
+            appended = self._parse_step_serial(ev, tr)
             if appended == 0 and self._offset == before_off:
                 break
                 
@@ -743,6 +1122,10 @@ class EventDecoder_EVT(EventDecoder):
         if not self._is_initialized:
             self.init()
         axis, val = self._seek_axis(t, n)
+        # The forward decode below runs serially; a pipeline restarts from the
+        # landing point on the next parse_step.
+        self._stop_pipeline()
+        self._materialize()
 
         index = self._ensure_index(need_counts=(axis == "n"))
         
@@ -826,6 +1209,8 @@ class EventDecoder_EVT(EventDecoder):
         if not self._is_initialized:
             return 0
         word_size = np.dtype(self._word_dtype).itemsize
+        if self._streaming:
+            return self._payload_off + (self._stream_base + self._offset) * word_size
         return self._payload_off + self._offset * word_size
 
     def close(self) -> None:
@@ -836,238 +1221,127 @@ class EventDecoder_EVT(EventDecoder):
         None
 
         """
+        self._stop_pipeline()
         # Drop numpy views into the (possibly mmap-backed) storage so the source
         # can be closed without BufferError.
         self._words = None
+        self._window = None
         self._buf = None
         self._index = None
 
-# --------------------------------------------------------------------------- #
-# Encoders (EVT3 / EVT2 / EVT2.1 writers)
-#
-# The writers are numba (there is no native encoder yet). They live here with
-# the format module now that _raw.py is gone.
-# --------------------------------------------------------------------------- #
-EVT3_EVT_ADDR_Y = 0x0000
-EVT3_EVT_ADDR_X = 0x2000
-EVT3_VECT_BASE_X = 0x3000
-EVT3_VECT_12 = 0x4000
-EVT3_VECT_8 = 0x5000
-EVT3_EVT_TIME_LOW = 0x6000
-EVT3_CONTINUED_4 = 0x7000
-EVT3_EVT_TIME_HIGH = 0x8000
-EVT3_EXT_TRIGGER = 0xA000
-EVT3_OTHERS = 0xE000
-EVT3_CONTINUED_12 = 0xF000
-
-@lazy_njit
-def get_raw_evt3_buffer(events: np.ndarray, last_lower12_ts: int, last_upper12_ts: int, last_y: int, master: bool = True) -> tuple[np.ndarray, int, int, int]:
-    """Encode events as EVT3.
-
-    Parameters
-    ----------
-    events : np.ndarray
-        Array of events to encode.
-    last_lower12_ts : int
-        Last lower 12-bit timestamp.
-    last_upper12_ts : int
-        Last upper 12-bit timestamp.
-    last_y : int
-        Last y coordinate.
-    master : bool, optional
-        Whether this is the master camera, by default True.
-
-    Returns
-    -------
-    tuple
-        A tuple containing the raw buffer, last lower 12-bit timestamp, last upper 12-bit timestamp, and last y coordinate.
+class _SegmentPipeline:
+    """Ordered decode-ahead for :class:`EventDecoder_EVT` (``decode_workers > 1``).
 
+    The payload past the decoder's offset is cut into TIME_HIGH-aligned segments
+    of about ``_PARALLEL_MIN_WORDS`` words, decoded on a thread pool up to
+    ``2 * workers`` segments ahead. Results are consumed strictly in stream
+    order -- the futures queue is the reorder stage -- wrap-corrected exactly as
+    in the parallel read_all(), and copied out by :meth:`step`. Every reader
+    path built on parse_step (accumulator, delta_t / n_events fast paths)
+    therefore sees the serial event stream and cuts identical windows.
     """
-    # Pre-allocate large buffer
-    buffer = np.zeros(len(events) * 8, dtype=np.uint8)
-
-    # Prepare the master/slave bit
-    if master:
-        master_slave = 0x000
-    else:
-        master_slave = 0x800
-
-    # Current position of the buffer
-    i = 0
-
-    for ev in events:
-        upper12_ts = (int(ev['t']) & 0x0FFF000) >> 12
-        lower12_ts = int(ev['t']) & 0x00000FFF
-
-        # EVT_TIME_HIGH - Updates the higher 12-bit portion of the 24-bit time base
-        if upper12_ts != last_upper12_ts:
-            last_upper12_ts = upper12_ts
-            value = EVT3_EVT_TIME_HIGH | (upper12_ts & 0xFFF)
-
-            buffer[i] = value & 0xFF
-            buffer[i + 1] = (value >> 8) & 0xFF
-            i += 2
-
-        # EVT_TIME_LOW - Updates the lower 12-bit portion of the 24-bit time base
-        if lower12_ts != last_lower12_ts:
-            last_lower12_ts = lower12_ts
-            value = EVT3_EVT_TIME_LOW | (lower12_ts & 0xFFF)
 
-            buffer[i] = value & 0xFF
-            buffer[i + 1] = (value >> 8) & 0xFF
-            i += 2
+    def __init__(self, dec: EventDecoder_EVT, workers: int) -> None:
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._dec = dec
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evutils-decode")
+        self._depth = 2 * workers
+        self._queue: deque = deque()        # (start word, future), in stream order
+        self._next = dec._offset            # start word of the next segment to submit
+        self._started = False               # first segment submitted
+        self._time_base: tuple[int, int] | None = None
+        self._cur: EventArray = _EMPTY_EVENTS
+        self._pos = 0
+        self._submit()
+
+    def _submit(self) -> None:
+        dec = self._dec
+        assert dec._words is not None
+        n = len(dec._words)
+        seg = dec._PARALLEL_MIN_WORDS
+        while len(self._queue) < self._depth and self._next < n:
+            lo = self._next
+            hi = None
+            target = lo + seg
+            while hi is None:
+                hi = dec._next_restart_point(target)
+                target += seg
+            # The first segment continues the decoder's own parser (the offset
+            # may be mid-stream); the rest start fresh at restart points.
+            parser = dec._new_parser() if self._started else dec._parser
+            self._started = True
+            self._queue.append((lo, self._pool.submit(dec._decode_segment, lo, hi, parser)))
+            self._next = hi
+
+    def _advance(self) -> bool:
+        """Make the next non-empty segment current; False at end of stream."""
+        dec = self._dec
+        while self._pos >= len(self._cur):
+            if not self._queue:
+                return False
+            lo, fut = self._queue.popleft()
+            part, (seg_high_high, seg_high) = fut.result()
+            corr = 0 if self._time_base is None else dec._join_correction(self._time_base, lo)
+            self._time_base = (corr + seg_high_high, seg_high)
+            corr += dec._seek_correction
+            if corr and len(part):
+                part.t += corr
+            self._cur, self._pos = part, 0
+            dec._offset = lo
+            self._submit()
+        return True
 
-        # EVT_ADDR_Y - Y coordinate, and system type (master/slave camera)
-        if last_y != ev['y']:
-            last_y = ev['y']
-            value = (EVT3_EVT_ADDR_Y | master_slave | (int(ev['y']) & 0x7FF))
-
-            buffer[i] = value & 0xFF
-            buffer[i + 1] = (value >> 8) & 0xFF
-            i += 2
-
-        # EVT_ADDR_X - Single valid event, X coordinate and polarity
-        value = EVT3_EVT_ADDR_X | (int(ev['x']) & 0x7FF) | ((int(ev['p']) & 0x01) << 11)
-
-        buffer[i] = value & 0xFF
-        buffer[i + 1] = (value >> 8) & 0xFF
-        i += 2
-
-    return buffer[:i], last_lower12_ts, last_upper12_ts, last_y
-
-@lazy_njit
-def get_raw_evt2_buffer(events: np.ndarray, last_ts_high: int) -> tuple[np.ndarray, int]:
-    """Encode events as EVT2 (32-bit words).
-
-    Timestamp is split into a 28-bit high part (EVT_TIME_HIGH word) and a 6-bit
-    low part carried in each CD word. A TIME_HIGH word is emitted only when the
-    high part changes. Layout: type[28:31], ts_low[22:27], x[11:21], y[0:10].
-
-    Parameters
-    ----------
-    events : np.ndarray
-        Array of events to encode.
-    last_ts_high : int
-        Last high timestamp part.
-
-    Returns
-    -------
-    tuple
-        A tuple containing the raw buffer and last high timestamp part.
-
-    """
-    n = len(events)
-    buffer = np.empty(2 * n, dtype=np.uint32)  # <= 1 TIME_HIGH + 1 CD per event
-    i = 0
-    for k in range(n):
-        ts = np.int64(events[k]['t'])
-        x = np.int64(events[k]['x']) & 0x7FF
-        y = np.int64(events[k]['y']) & 0x7FF
-        p = np.int64(events[k]['p']) & 0x1
-
-        ts_high = (ts >> 6) & 0x0FFFFFFF
-        ts_low = ts & 0x3F
-
-        if ts_high != last_ts_high:
-            buffer[i] = np.uint32((8 << 28) | ts_high)  # EVT2_EVT_TIME_HIGH
-            i += 1
-            last_ts_high = int(ts_high)
-
-        buffer[i] = np.uint32((p << 28) | (ts_low << 22) | (x << 11) | y)
-        i += 1
-
-    return buffer[:i], last_ts_high
-
-@lazy_njit
-def get_raw_evt21_buffer(events: np.ndarray, last_ts_high: int) -> tuple[np.ndarray, int]:
-    """Encode events as EVT2.1 (64-bit words, legacy endianness).
-
-    Same descriptor layout as EVT2 in the low 32 bits (type[28:31],
-    ts_low[22:27], x_base[11:21], y[0:10]); the high 32 bits are a validity
-    bitmask for x_base..x_base+31. This writer emits one event per word (mask
-    with a single bit set at x_base = x) -- valid EVT2.1, not yet vectorised.
-
-    Parameters
-    ----------
-    events : np.ndarray
-        Array of events to encode.
-    last_ts_high : int
-        Last high timestamp part.
-
-    Returns
-    -------
-    tuple
-        A tuple containing the raw buffer and last high timestamp part.
-
-    """
-    n = len(events)
-    buffer = np.empty(2 * n, dtype=np.uint64)  # <= 1 TIME_HIGH + 1 CD per event
-    i = 0
-    for k in range(n):
-        ts = np.int64(events[k]['t'])
-        x = np.int64(events[k]['x']) & 0x7FF
-        y = np.int64(events[k]['y']) & 0x7FF
-        p = np.int64(events[k]['p']) & 0x1
-
-        ts_high = (ts >> 6) & 0x0FFFFFFF
-        ts_low = ts & 0x3F
-
-        if ts_high != last_ts_high:
-            buffer[i] = np.uint64((8 << 28) | ts_high)  # EVT21_EVT_TIME_HIGH
-            i += 1
-            last_ts_high = int(ts_high)
-
-        desc = (p << 28) | (ts_low << 22) | (x << 11) | y
-        # High 32 bits: validity mask with bit 0 set (single event at x_base=x).
-        buffer[i] = (np.uint64(1) << np.uint64(32)) | np.uint64(desc)
-        i += 1
-
-    return buffer[:i], last_ts_high
-
-@lazy_njit
-def get_raw_evt4_buffer(events: np.ndarray, last_ts_high: int) -> tuple[np.ndarray, int]:
-    """Encode events as EVT4 (32-bit words).
-
-    Same CD / TIME_HIGH bit layout as EVT2 (type[28:31], ts_low[22:27],
-    x[11:21], y[0:10]) but with EVT4's type codes: CD_OFF=0xA / CD_ON=0xB and
-    TIME_HIGH=0xE. One CD word per event (EVT4's vectorised CD_VEC form is a
-    decode-side optimisation and is not emitted here).
-
-    Parameters
-    ----------
-    events : np.ndarray
-        Array of events to encode.
-    last_ts_high : int
-        Last high timestamp part.
-
-    Returns
-    -------
-    tuple
-        A tuple containing the raw buffer and last high timestamp part.
-
-    """
-    n = len(events)
-    buffer = np.empty(2 * n, dtype=np.uint32)  # <= 1 TIME_HIGH + 1 CD per event
-    i = 0
-    for k in range(n):
-        ts = np.int64(events[k]['t'])
-        x = np.int64(events[k]['x']) & 0x7FF
-        y = np.int64(events[k]['y']) & 0x7FF
-        p = np.int64(events[k]['p']) & 0x1
+    @property
+    def exhausted(self) -> bool:
+        return self._pos >= len(self._cur) and not self._queue
 
-        ts_high = (ts >> 6) & 0x0FFFFFFF
-        ts_low = ts & 0x3F
+    def step(self, events: EventSoABuffers) -> int:
+        """Copy the next decoded events into ``events`` (up to its capacity)."""
+        if not self._advance():
+            return 0
+        size = events.size
+        k = min(int(events.c.capacity) - size, len(self._cur) - self._pos)
+        if k <= 0:
+            return 0
+        src, lo, hi = self._cur, self._pos, self._pos + k
+        events.t[size:size + k] = src.t[lo:hi].view(np.uint64)
+        events.x[size:size + k] = src.x[lo:hi]
+        events.y[size:size + k] = src.y[lo:hi]
+        events.p[size:size + k] = src.p[lo:hi]
+        events.c.size = size + k
+        self._pos = hi
+        return k
+
+    def drain(self) -> EventArray:
+        """Every remaining event as one array."""
+        parts = []
+        while self._advance():
+            parts.append(self._cur[self._pos:])
+            self._pos = len(self._cur)
+        if not parts:
+            return _EMPTY_EVENTS
+        return EventArray(*(np.concatenate([getattr(a, f) for a in parts])
+                            for f in ("t", "x", "y", "p")))
 
-        if ts_high != last_ts_high:
-            buffer[i] = np.uint32((0xE << 28) | ts_high)  # EVT4_EVT_TIME_HIGH
-            i += 1
-            last_ts_high = int(ts_high)
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
 
-        # type = CD_OFF (0xA) for p=0, CD_ON (0xB) for p=1.
-        buffer[i] = np.uint32(((0xA | p) << 28) | (ts_low << 22) | (x << 11) | y)
-        i += 1
 
-    return buffer[:i], last_ts_high
+# --------------------------------------------------------------------------- #
+# Encoders (EVT3 / EVT2 / EVT2.1 / EVT4 writers)
+#
+# All formats are encoded natively from the SoA columns (csrc/evt*_encoder.c)
+# into a word buffer reused across write() calls. EVT3 packs same-row runs into
+# vector groups; the others write one CD word per event.
+# --------------------------------------------------------------------------- #
+_ENCODERS = {
+    "evt3": Evt3Encoder,
+    "evt2": Evt2Encoder,
+    "evt21": Evt21Encoder,
+    "evt4": Evt4Encoder,
+}
 
 class EventEncoder_EVT(EventEncoder):
     """Encoder for Prophesee RAW/EVT files.
@@ -1083,8 +1357,9 @@ class EventEncoder_EVT(EventEncoder):
     serial : str
         Camera serial number written into the header.
     format : {"evt3", "evt21", "evt2", "evt4"}
-        Output format. All are supported; EVT2.1 and EVT4 are written one event
-        per word (valid but not vectorised).
+        Output format. All are supported; EVT3 packs same-row runs into vector
+        groups, EVT2.1 and EVT4 are written one event per word (valid but not
+        vectorised).
 
     References
     ----------
@@ -1104,10 +1379,7 @@ class EventEncoder_EVT(EventEncoder):
 
         self._system_id = 49
 
-        self._last_upper12_ts = -1
-        self._last_lower12_ts = -1
-        self._last_y = -1
-        self._last_ts_high = -1  # EVT2 / EVT2.1 time-high state
+        self._encoder = _ENCODERS[format]()
 
         self._serial_number = serial
 
@@ -1162,29 +1434,17 @@ f"""% camera_integrator_name Prophesee
         if not self._is_initialized:
             self.init()
 
-        # Accept EventArray transparently (SoA -> AoS for the numba encoder).
+        # Native SoA encoder: columns straight from an EventArray, field views
+        # from a structured array.
         if isinstance(events, EventArray):
-            events = events.to_aos()
-
-        if self._format == "evt3":
-            buffer, self._last_lower12_ts, self._last_upper12_ts, self._last_y = get_raw_evt3_buffer(
-                events,
-                self._last_lower12_ts,
-                self._last_upper12_ts,
-                self._last_y)
-        elif self._format == "evt2":
-            buffer, self._last_ts_high = get_raw_evt2_buffer(events, self._last_ts_high)
-        elif self._format == "evt21":
-            buffer, self._last_ts_high = get_raw_evt21_buffer(events, self._last_ts_high)
-        elif self._format == "evt4":
-            buffer, self._last_ts_high = get_raw_evt4_buffer(events, self._last_ts_high)
+            events = events.expand()
+            columns = (events.t, events.x, events.y, events.p)
         else:
-            raise NotImplementedError(
-                f"format {self._format!r} not implemented"
-            )
+            columns = (events['t'], events['x'], events['y'], events['p'])
+        words = self._encoder.encode(*columns)
 
         self._n_written_events += len(events)
 
-        self._fd.write(buffer.tobytes())
+        self._fd.write(words.view(np.uint8))
 
         return len(events)
@@ -0,0 +1,281 @@
+"""EVU: evutils' own chunked columnar container.
+
+Layout (all integers little-endian)::
+
+    header   16 bytes   magic "\\x8bEVU", u16 version, u16 reserved,
+                        u16 width, u16 height, u32 reserved
+    blocks              one per ``block_size`` events, each a block body
+                        (see csrc/include/evutils/evu.h: delta + varint ``t``,
+                        x/y/p bit-packed at the block's own bit widths),
+                        stored raw or as one zstd frame
+    index    40 B/block offset, stored size, body size, events, codec,
+                        min / max ``t``
+    trailer  24 bytes   u64 index offset, u64 block count, "EVUINDEX"
+
+The index at the end makes time and event-index seeks O(log blocks) with no
+scan and no index build: only the block holding the target is decoded.
+Blocks are independent, so ``decode_workers`` threads decompress and decode
+them in parallel (zstd and the native decoder both release the GIL) --
+``read_all`` straight into one output buffer, iteration a few blocks ahead.
+"""
+from __future__ import annotations
+
+import io
+import struct
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Callable
+
+import numpy as np
+
+from ..types import EventArray
+from ._columnar import DEFAULT_GROUP_SIZE, _ColumnarDecoder, _ColumnarEncoder
+from ._compression import _zstd_frame_codec
+from ._native_core import EVUTILS_PARSE_OK, EventSoABuffers, NativeError, events_view
+from ._native_evu import block_events, decode_block, encode_block, encode_max_bytes
+from ._source import ByteSource
+
+MAGIC = b"\x8bEVU"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHHHI")
+_TRAILER = struct.Struct("<QQ8s")
+_TRAILER_MAGIC = b"EVUINDEX"
+
+CODEC_RAW = 0
+CODEC_ZSTD = 1
+_CODECS = {None: CODEC_RAW, "none": CODEC_RAW, "zstd": CODEC_ZSTD}
+
+#: One index entry per block.
+_INDEX_DTYPE = np.dtype([("offset", "<u8"), ("stored", "<u4"), ("raw", "<u4"), ("n", "<u4"),
+                         ("codec", "u1"), ("pad", "V3"), ("t_min", "<i8"), ("t_max", "<i8")])
+
+class EventDecoder_Evu(_ColumnarDecoder):
+    """Decode events from an EVU container.
+
+    Blocks are decoded by the native codec one at a time as the cursor
+    reaches them. With ``decode_workers > 1`` the following blocks are
+    decoded ahead on a thread pool, and :meth:`read_all` decodes every
+    remaining block in parallel straight into a single output buffer.
+
+    Parameters
+    ----------
+    source
+        Byte source to read from.
+    chunk_size
+        Number of events returned per :meth:`read_chunk` call.
+
+    """
+
+    #: A block is decoded whole; cache it rather than decode it twice.
+    _projects_columns = False
+    #: A non-seekable source (pipe, compressed stream) is slurped at init.
+    _buffers_in_memory = True
+
+    def __init__(self, source: ByteSource, chunk_size: int = 1_000_000):
+        super().__init__(source, chunk_size)
+        self._buf: np.ndarray | None = None  # whole file, when mappable / slurped
+        self._index = np.zeros(0, dtype=_INDEX_DTYPE)
+        self._decompress: Callable[[bytes, int], bytes] | None = None
+        self._pool: Any = None
+        self._ahead: dict[int, Future] = {}
+
+    def _read_at(self, offset: int, size: int) -> np.ndarray:
+        if self._buf is not None:
+            return self._buf[offset:offset + size]
+        self._source.seek(offset)
+        data = self._source.read(size)
+        if len(data) != size:
+            raise ValueError(f"EVU file truncated: wanted {size} bytes at offset {offset}, got {len(data)}")
+        return np.frombuffer(data, dtype=np.uint8)
+
+    def init(self) -> None:
+        """Read the header and the block index."""
+        if self._is_initialized:
+            return
+        if self._source.mappable():
+            self._buf = np.frombuffer(self._source.buffer(), dtype=np.uint8)
+            size = len(self._buf)
+        elif self._source.seekable():
+            size = self._source.seek(0, io.SEEK_END)
+        else:
+            self._buf = np.frombuffer(self._source.read(-1), dtype=np.uint8)
+            size = len(self._buf)
+        if size < _HEADER.size + _TRAILER.size:
+            raise ValueError("EVU file too short for its header and trailer")
+
+        magic, version, _, width, height, _ = _HEADER.unpack(self._read_at(0, _HEADER.size).tobytes())
+        if magic != MAGIC:
+            raise ValueError(f"not an EVU file (magic {magic!r})")
+        if version != _VERSION:
+            raise ValueError(f"unsupported EVU version {version}")
+        self._width, self._height = width, height
+
+        index_off, n_blocks, tag = _TRAILER.unpack(self._read_at(size - _TRAILER.size, _TRAILER.size).tobytes())
+        if tag != _TRAILER_MAGIC or index_off + n_blocks * _INDEX_DTYPE.itemsize != size - _TRAILER.size:
+            raise ValueError("EVU file has no valid block index (truncated or still being written?)")
+        self._index = self._read_at(index_off, n_blocks * _INDEX_DTYPE.itemsize).view(_INDEX_DTYPE).copy()
+        if np.any(self._index["codec"] == CODEC_ZSTD):
+            self._decompress = _zstd_frame_codec()[1]
+        self._set_groups(self._index["n"].astype(np.int64), self._index["t_min"], self._index["t_max"])
+        self._pos = 0
+        self._is_initialized = True
+
+    def _body(self, i: int) -> np.ndarray:
+        """Uncompressed body of block ``i``."""
+        entry = self._index[i]
+        stored = self._read_at(int(entry["offset"]), int(entry["stored"]))
+        if entry["codec"] == CODEC_RAW:
+            return stored
+        if entry["codec"] != CODEC_ZSTD:
+            raise ValueError(f"EVU block {i}: unknown codec {int(entry['codec'])}")
+        assert self._decompress is not None
+        body = self._decompress(stored.tobytes(), int(entry["raw"]))
+        return np.frombuffer(body, dtype=np.uint8)
+
+    def _decode_into(self, i: int, out: EventSoABuffers) -> int:
+        """Decode block ``i`` into ``out`` (GIL-free); returns its event count."""
+        body = self._body(i)
+        if block_events(body) != self._index[i]["n"]:
+            raise ValueError(f"EVU block {i}: event count disagrees with the index")
+        res = decode_block(body, out)
+        if res.status != EVUTILS_PARSE_OK:
+            raise NativeError(f"EVU block {i} is corrupt (status {int(res.status)})")
+        return int(self._index[i]["n"])
+
+    def _decode(self, i: int) -> dict[str, np.ndarray]:
+        out = EventSoABuffers(int(self._index[i]["n"]))
+        self._decode_into(i, out)
+        ev = events_view(out)
+        return {"t": ev.t, "x": ev.x, "y": ev.y, "p": ev.p}
+
+    def _executor(self) -> Any:
+        """The decode pool (created on first use)."""
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=int(self._decode_workers),
+                                            thread_name_prefix="evutils-evu")
+        return self._pool
+
+    def _load_group(self, i: int, columns: tuple[str, ...] = ("t", "x", "y", "p")) -> dict[str, np.ndarray]:
+        if self._decode_workers <= 1:
+            return self._decode(i)
+        # Keep the next decode_workers blocks in flight behind the cursor.
+        for stale in [j for j in self._ahead if j < i]:
+            self._ahead.pop(stale).cancel()
+        for j in range(i, min(i + int(self._decode_workers), len(self._index))):
+            if j not in self._ahead:
+                self._ahead[j] = self._executor().submit(self._decode, j)
+        return self._ahead.pop(i).result()
+
+    def read_all(self) -> EventArray:
+        """Return every remaining event at once.
+
+        With ``decode_workers > 1`` the remaining blocks are decoded in
+        parallel, each straight into its slice of one output buffer.
+        """
+        if not self._is_initialized:
+            self.init()
+        first = int(np.searchsorted(self._starts, self._pos, side="right")) - 1
+        if self._decode_workers <= 1 or len(self._index) - first < 2:
+            return super().read_all()
+        base = int(self._starts[first])
+        out = EventSoABuffers(self._n - base)
+
+        def decode(i: int) -> int:
+            lo, hi = int(self._starts[i]) - base, int(self._starts[i + 1]) - base
+            part = EventSoABuffers.wrap(out.t[lo:hi], out.x[lo:hi], out.y[lo:hi], out.p[lo:hi])
+            return self._decode_into(i, part)
+
+        for _ in self._executor().map(decode, range(first, len(self._index))):
+            pass
+        out.c.size = self._n - base
+        skip = self._pos - base
+        self._pos = self._n
+        self._eof = True
+        self._cached = None
+        return events_view(out)[skip:]
+
+    def seek(self, t: int | None = None, n: int | None = None) -> Any:
+        self._drop_ahead()
+        return super().seek(t=t, n=n)
+
+    def reset(self) -> None:
+        self._drop_ahead()
+        super().reset()
+
+    def _drop_ahead(self) -> None:
+        for fut in self._ahead.values():
+            fut.cancel()
+        self._ahead.clear()
+
+    def close(self) -> None:
+        """Stop the decode pool and drop views into the source."""
+        self._drop_ahead()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        super().close()
+        self._buf = None
+
+class EventEncoder_Evu(_ColumnarEncoder):
+    """Encode events into an EVU container, one block per ``block_size`` events.
+
+    Each block is encoded by the native codec and, by default, compressed as
+    one zstd frame. The block index is written on :meth:`close`; the output
+    is written strictly sequentially, so any writable stream works.
+
+    Parameters
+    ----------
+    writable
+        Destination stream to write to.
+    width, height : int
+        Frame geometry stored in the header.
+    dt : datetime, optional
+        Unused; EVU stores no recording timestamp.
+    block_size : int
+        Events per block.
+    compression : str or None
+        ``"zstd"`` (default) or ``None`` for raw blocks.
+    level : int
+        zstd compression level.
+
+    """
+
+    def __init__(self, writable: io.BufferedIOBase, width: int = 1280, height: int = 720,
+                 dt: datetime | None = None, block_size: int = DEFAULT_GROUP_SIZE,
+                 compression: str | None = "zstd", level: int = 3):
+        super().__init__(writable, width, height, dt, group_size=block_size)
+        if compression not in _CODECS:
+            raise ValueError(f"compression must be 'zstd' or None, not {compression!r}")
+        self._codec = _CODECS[compression]
+        self._level = level
+        self._compress: Callable[[bytes, int], bytes] | None = None
+        self._scratch = np.empty(0, dtype=np.uint8)
+        self._entries: list[tuple] = []
+        self._offset = 0
+
+    def init(self) -> None:
+        """Write the file header."""
+        if self._is_initialized:
+            return
+        if self._codec == CODEC_ZSTD:
+            self._compress = _zstd_frame_codec()[0]
+        self._offset = self._fd.write(_HEADER.pack(MAGIC, _VERSION, 0, self._width, self._height, 0))
+        self._is_initialized = True
+
+    def _emit(self, events: EventArray) -> None:
+        n = len(events)
+        if len(self._scratch) < encode_max_bytes(n):
+            self._scratch = np.empty(encode_max_bytes(n), dtype=np.uint8)
+        size = encode_block(events.t, events.x, events.y, events.p, self._scratch)
+        body = self._scratch[:size]
+        stored = body.tobytes() if self._compress is None else self._compress(body.data, self._level)
+        self._fd.write(stored)
+        self._entries.append((self._offset, len(stored), size, n, self._codec, b"",
+                              int(events.t.min()), int(events.t.max())))
+        self._offset += len(stored)
+
+    def _finish(self) -> None:
+        index = np.array(self._entries, dtype=_INDEX_DTYPE)
+        self._fd.write(index.tobytes())
+        self._fd.write(_TRAILER.pack(self._offset, len(index), _TRAILER_MAGIC))
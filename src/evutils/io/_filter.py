@@ -0,0 +1,130 @@
+"""Fused ROI / stride / polarity selection for :class:`~evutils.io.EventReader`.
+
+``EventReader(roi=..., polarity=..., stride=...)`` builds one
+:class:`EventFilterSpec`. The native decoders (EVT2/2.1/3/4, DAT, AER) hand it to
+the C parsers as an ``event_filter_t``: a dropped event is written to the next
+output slot and immediately overwritten, so it never grows the output buffer,
+and the reader's ``delta_t`` / ``n_events`` windows are cut on the filtered
+stream. Every other decoder gets the same selection as a numpy mask applied to
+each decoded chunk.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from ..types import EventArray
+
+#: Most rectangles a single filter can hold (``EVUTILS_MAX_ROIS`` in types.h).
+MAX_ROIS = 8
+
+
+class EventFilterSpec(NamedTuple):
+    """A normalised event filter.
+
+    ``rois`` are half-open ``(x0, y0, x1, y1)`` rectangles; an event is kept if
+    it lies in any of them (no rectangles: the whole sensor). ``x_stride`` /
+    ``y_stride`` keep only every n-th column / row (``x % x_stride == 0``), and
+    ``polarity`` is the kept polarity (``None``: both).
+    """
+    rois: tuple[tuple[int, int, int, int], ...]
+    x_stride: int
+    y_stride: int
+    polarity: int | None
+
+    def mask(self, x: np.ndarray, y: np.ndarray, p: np.ndarray) -> np.ndarray:
+        """Boolean keep-mask over event columns (the numpy twin of the C filter)."""
+        keep = np.ones(len(x), dtype=bool)
+        if self.polarity is not None:
+            keep &= p == self.polarity
+        if self.x_stride > 1:
+            keep &= x % self.x_stride == 0
+        if self.y_stride > 1:
+            keep &= y % self.y_stride == 0
+        if self.rois:
+            inside = np.zeros(len(x), dtype=bool)
+            for x0, y0, x1, y1 in self.rois:
+                inside |= (x >= x0) & (x < x1) & (y >= y0) & (y < y1)
+            keep &= inside
+        return keep
+
+    def apply(self, events: EventArray) -> EventArray:
+        """Return the kept subset of ``events`` (a copy; ``events`` itself when empty)."""
+        if len(events) == 0:
+            return events
+        return events[self.mask(events.x, events.y, events.p)]
+
+    def to_native(self):
+        """The filter as the ctypes mirror of ``event_filter_t``."""
+        from ._native_core import EventFilter
+        flt = EventFilter()
+        flt.n_rois = len(self.rois)
+        for i, rect in enumerate(self.rois):
+            flt.roi[i][:] = rect
+        flt.x_stride = self.x_stride
+        flt.y_stride = self.y_stride
+        flt.polarity = 0x3 if self.polarity is None else 1 << self.polarity
+        return flt
+
+
+def make_event_filter(roi: "Sequence[int] | Sequence[Sequence[int]] | None" = None,
+                      polarity: int | None = None,
+                      stride: "int | tuple[int, int] | None" = None) -> EventFilterSpec | None:
+    """Validate the reader's filter options into an :class:`EventFilterSpec`.
+
+    Parameters
+    ----------
+    roi : (x0, y0, x1, y1) or sequence of them, optional
+        Half-open rectangle(s) to keep; at most :data:`MAX_ROIS`.
+    polarity : {0, 1} or None, optional
+        Keep only this polarity.
+    stride : int or (int, int), optional
+        Keep every ``stride``-th column and row, or ``(x_stride, y_stride)``.
+
+    Returns
+    -------
+    EventFilterSpec or None
+        ``None`` when the options select every event.
+
+    Raises
+    ------
+    ValueError
+        If an option is malformed or out of range.
+    """
+    rois: tuple[tuple[int, int, int, int], ...] = ()
+    if roi is not None:
+        rects = [roi] if len(roi) == 4 and all(isinstance(v, (int, np.integer)) for v in roi) else list(roi)
+        if not rects:
+            raise ValueError("roi must be a rectangle (x0, y0, x1, y1) or a non-empty list of them")
+        if len(rects) > MAX_ROIS:
+            raise ValueError(f"at most {MAX_ROIS} roi rectangles are supported (got {len(rects)})")
+        parsed = []
+        for rect in rects:
+            try:
+                x0, y0, x1, y1 = (int(v) for v in rect)
+            except (TypeError, ValueError):
+                raise ValueError(f"roi rectangles must be (x0, y0, x1, y1) integers (got {rect!r})") from None
+            if not (0 <= x0 < x1 <= 0xFFFF and 0 <= y0 < y1 <= 0xFFFF):
+                raise ValueError(f"roi rectangle {rect!r} must satisfy 0 <= x0 < x1 and 0 <= y0 < y1")
+            parsed.append((x0, y0, x1, y1))
+        rois = tuple(parsed)
+
+    if polarity is not None and polarity not in (0, 1):
+        raise ValueError(f"polarity must be 0, 1 or None (got {polarity!r})")
+
+    if stride is None:
+        x_stride = y_stride = 1
+    elif isinstance(stride, (int, np.integer)):
+        x_stride = y_stride = int(stride)
+    else:
+        try:
+            x_stride, y_stride = (int(v) for v in stride)
+        except (TypeError, ValueError):
+            raise ValueError(f"stride must be an int or an (x_stride, y_stride) pair (got {stride!r})") from None
+    if not (1 <= x_stride <= 0xFFFF and 1 <= y_stride <= 0xFFFF):
+        raise ValueError(f"stride must be positive (got {stride!r})")
+
+    if not rois and polarity is None and x_stride == 1 and y_stride == 1:
+        return None
+    return EventFilterSpec(rois, x_stride, y_stride, None if polarity is None else int(polarity))
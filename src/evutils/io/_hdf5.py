@@ -22,6 +22,11 @@ from ._source import ByteSource
 
 _EMPTY_EVENTS = EventArray.empty()
 
+#: Bisection granularity for time seeks when ``t`` is not chunked (contiguous).
+_DEFAULT_T_BLOCK = 1 << 16
+#: Bound on the sparse probe index (it is simply reset when full).
+_MAX_T_PROBES = 4096
+
 @lazy_njit
 def _fill_ms_to_idx(t: np.ndarray, ms_to_idx: np.ndarray, start_ms: int,
                     end_ms: int, base_idx: int, base_ms: int) -> None:
@@ -96,7 +101,10 @@ class EventDecoder_HDF5(EventDecoder):
         self._t_offset: int = 0
         self._n: int = 0
         self._pos = 0
-        self._t_cache: np.ndarray | None = None  # lazily-loaded t column for time seek
+        # Sparse time-seek index: chunk-aligned event index -> timestamp, filled
+        # by the bisection probes (never the whole t column).
+        self._t_probes: dict[int, int] = {}
+        self._t_block = _DEFAULT_T_BLOCK
 
     def init(self) -> None:
         """Open the HDF5 file and locate the event datasets."""
@@ -137,6 +145,9 @@ class EventDecoder_HDF5(EventDecoder):
             self._ms_idx_offset = int(np.asarray(self._h5["ms_to_idx_offset"]).item())
         if "t_offset" in self._h5:
             self._t_offset = int(np.asarray(self._h5["t_offset"]).item())
+        t_ds = self._aos if self._aos is not None else self._h5["events"]["t"]
+        if t_ds.chunks:
+            self._t_block = int(t_ds.chunks[0])
         if "width" in self._h5.attrs:
             self._width = int(self._h5.attrs["width"])
         if "height" in self._h5.attrs:
@@ -233,25 +244,69 @@ class EventDecoder_HDF5(EventDecoder):
 
         return self._slice(int(self._ms_to_idx[rel_start]), int(self._ms_to_idx[rel_end]))
 
-    def _all_t(self) -> np.ndarray:
-        """Lazily load the whole timestamp column (user timeline, +t_offset)."""
-        if self._t_cache is None:
-            assert self._h5 is not None
-            if self._aos is not None:
-                t = self._aos["t"][:].astype(np.int64)
+    def _t_range(self, start: int, end: int) -> np.ndarray:
+        """Timestamps ``[start, end)`` on the user timeline (``+ t_offset``)."""
+        assert self._h5 is not None
+        if self._aos is not None:
+            t = self._aos.fields("t")[start:end].astype(np.int64)
+        else:
+            t = self._h5["events"]["t"][start:end].astype(np.int64)
+        if self._t_offset:
+            t += self._t_offset
+        return t
+
+    def _t_at(self, idx: int) -> int:
+        """Timestamp of event ``idx``; chunk-aligned probes are remembered."""
+        ts = self._t_probes.get(idx)
+        if ts is None:
+            ts = int(self._t_range(idx, idx + 1)[0])
+            if idx % self._t_block == 0:
+                if len(self._t_probes) >= _MAX_T_PROBES:
+                    self._t_probes.clear()
+                self._t_probes[idx] = ts
+        return ts
+
+    def _index_of_time(self, t: int) -> int:
+        """Index of the first event with timestamp ``>= t``.
+
+        ``ms_to_idx`` narrows the search to one millisecond bucket (verified
+        against its neighbours, so a foreign or mis-anchored index cannot
+        make the result inexact). The remaining range is bisected on chunk
+        boundaries, one ``t`` chunk per probe, until a single chunk is left
+        to ``searchsorted``: O(log n) chunks read, never the whole column.
+        """
+        lo, hi = 0, self._n
+        if self._ms_to_idx is not None and len(self._ms_to_idx):
+            last = len(self._ms_to_idx) - 1
+            rel = (t - self._t_offset) // 1000 - self._ms_idx_offset
+            if rel < 0:
+                b_lo, b_hi = 0, int(self._ms_to_idx[0])
+            elif rel >= last:
+                b_lo, b_hi = int(self._ms_to_idx[last]), self._n
             else:
-                t = self._h5["events"]["t"][:].astype(np.int64)
-            if self._t_offset:
-                t = t + self._t_offset
-            self._t_cache = t
-        return self._t_cache
+                b_lo, b_hi = int(self._ms_to_idx[rel]), int(self._ms_to_idx[rel + 1])
+            b_lo, b_hi = min(b_lo, self._n), min(b_hi, self._n)
+            if b_lo <= b_hi and (b_lo == 0 or self._t_at(b_lo - 1) < t) \
+                    and (b_hi == self._n or self._t_at(b_hi) >= t):
+                lo, hi = b_lo, b_hi
+        # Invariant: the answer lies in [lo, hi].
+        block = self._t_block
+        while hi - lo > block:
+            mid = (lo + hi) // 2 // block * block
+            if mid <= lo:
+                mid = (lo // block + 1) * block
+            if self._t_at(mid) < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo + int(np.searchsorted(self._t_range(lo, hi), t, side="left"))
 
     def seek(self, t: int | None = None, n: int | None = None) -> tuple["SeekResult", "EventArray", "TriggerArray | None"]:
         """Seek to an absolute timestamp (µs) or event index. See base class.
 
-        Index seek sets the event position directly; time seek does a
-        ``searchsorted`` over the (lazily cached) timestamp column, so it is
-        exact regardless of ``t_offset`` / ``ms_to_idx`` anchoring.
+        Index seek sets the event position directly; time seek narrows the
+        range with ``ms_to_idx`` and a chunk-wise bisection of the timestamp
+        column (see :meth:`_index_of_time`), reading O(log n) chunks.
         """
         from .common import SeekResult
         if not self._is_initialized:
@@ -259,7 +314,7 @@ class EventDecoder_HDF5(EventDecoder):
         axis, val = self._seek_axis(t, n)
 
         if axis == "t":
-            idx = int(np.searchsorted(self._all_t(), val, side="left"))
+            idx = self._index_of_time(val)
         else:
             idx = val
 
@@ -267,7 +322,7 @@ class EventDecoder_HDF5(EventDecoder):
         self._pos = idx
         self._eof = idx >= self._n
         
-        landed_ts = int(self._all_t()[idx]) if idx < self._n else val
+        landed_ts = self._t_at(idx) if idx < self._n else val
         return SeekResult(ts=landed_ts, index=idx, eof=self._eof), _EMPTY_EVENTS, None
 
     def reset(self) -> None:
@@ -5,7 +5,7 @@ A :class:`SeekIndex` is a coarse, monotonic map from *absolute timestamp* and
 seekable decoder jump close to a target (the nearest bookmark at or before it)
 and then decode forward the small remainder to the exact position.
 
-Two ways to obtain one:
+Three ways to obtain one:
 
 * **Build it** from a fresh sequential decode pass (:func:`build_seek_index`),
   recording one bookmark per parse step. The timestamps recorded this way are
@@ -17,6 +17,10 @@ Two ways to obtain one:
   Metavision timestamps are shifted by ``ts_shift_us`` relative to the raw
   stream; we add it back so bookmarks live in the same (raw-absolute) timeline
   the evutils EVT decoder produces.
+* **Reload a persisted built index** from an evutils ``<file>.raw.evidx``
+  sidecar (:func:`read_evutils_index`, written by
+  :func:`write_evutils_index`). It is memory-mapped and validated against the
+  raw file's size, mtime and header digest, so a stale sidecar is ignored.
 
 The wrap accumulator that a fresh ``parser.reset()`` cannot recover is restored
 at seek time from a bookmark's absolute timestamp: ``W = bookmark_ts -
@@ -35,6 +39,27 @@ from typing import Protocol, TYPE_CHECKING
 if TYPE_CHECKING:
     import numpy as np
 
+def next_time_high(words: np.ndarray, start: int, time_high: tuple[int, int]) -> int:
+    """Word offset of the first TIME_HIGH at/after ``start`` (or ``len(words)``).
+
+    ``time_high`` is the decoder's ``(type-field shift, type code)`` descriptor.
+    Vectorized block scan, same shape as the decoder's ``_find_first_time_high``.
+    """
+    n = len(words)
+    shift, code = time_high
+    start = min(max(start, 0), n)
+    block = 1 << 16
+    while start < n:
+        stop = min(start + block, n)
+        seg = words[start:stop]
+        hits = ((seg >> shift) & 0xF) == code
+        i = int(np.argmax(hits))
+        if hits[i]:
+            return start + i
+        start = stop
+        block = min(block * 4, 1 << 24)
+    return n
+
 class SeekIndex(Protocol):
     """Monotonic (timestamp, cumulative-count) -> word-offset bookmarks."""
 
@@ -135,35 +160,29 @@ class IncrementalSeekIndex:
             self._cum_arr = np.asarray(self._cum_list, dtype=np.int64)
             self._arrs_stale = False
 
-    def _next_time_high(self, start: int) -> int:
-        """Word offset of the first TIME_HIGH at/after ``start`` (or n_words).
+    def to_static(self) -> StaticSeekIndex:
+        """Finish the index (decode to EOF) and freeze it into a
+        :class:`StaticSeekIndex`, e.g. for :func:`write_evutils_index`."""
+        self._build_until()
+        self._update_arrs()
+        return StaticSeekIndex(
+            ts=self._ts_arr, word_offset=self._off_arr,
+            cum_count=self._cum_arr, n_events=self._cum,
+        )
 
-        Vectorized block scan, same shape as the decoder's
-        ``_find_first_time_high``.
-        """
-        n = len(self._words)
+    def _next_time_high(self, start: int) -> int:
+        """Word offset of the first TIME_HIGH at/after ``start`` (or n_words)."""
         if self._time_high is None:
-            return n
-        shift, code = self._time_high
-        start = min(max(start, 0), n)
-        block = 1 << 16
-        while start < n:
-            stop = min(start + block, n)
-            seg = self._words[start:stop]
-            hits = ((seg >> shift) & 0xF) == code
-            i = int(np.argmax(hits))
-            if hits[i]:
-                return start + i
-            start = stop
-            block = min(block * 4, 1 << 24)
-        return n
+            return len(self._words)
+        return next_time_high(self._words, start, self._time_high)
 
     def _build_until(self, target_t: int | None = None, target_n: int | None = None) -> None:
         if self._is_eof:
             return
         if target_t is not None and len(self._ts_list) > 0 and self._ts_list[-1] >= target_t:
             return
-        if target_n is not None and self._cum >= target_n:
+        # The bookmark found must hold a real time base: even n = 0 needs one.
+        if target_n is not None and len(self._ts_list) > 0 and self._cum >= target_n:
             return
 
         from ._native_core import events_view, parse_step
@@ -231,7 +250,7 @@ class IncrementalSeekIndex:
                 break
             if target_t is not None and first_ts is not None and first_ts >= target_t:
                 break
-            if target_n is not None and self._cum >= target_n:
+            if target_n is not None and len(self._ts_list) > 0 and self._cum >= target_n:
                 break
 
     def bookmark_for_time(self, t: int) -> tuple[int, int, int]:
@@ -343,3 +362,118 @@ def read_metavision_index(index_path: "str | Path", raw_path: "str | Path",
         cum_count=cum_count,
         n_events=int(cum_count[-1] + recs["count"][-1]),
     )
+
+
+# --------------------------------------------------------------------------- #
+# evutils `<file>.raw.evidx` sidecar (persisted built index)
+# --------------------------------------------------------------------------- #
+
+_EVU_MAGIC = b"EVUIDX1\0"
+
+#: Fixed header after the magic: raw file size and mtime (ns), a digest of the
+#: raw ASCII header, the payload byte offset and word size, total event count
+#: and bookmark count.
+_EVU_HEADER = np.dtype([
+    ("size", "<u8"), ("mtime_ns", "<i8"), ("header_digest", "V16"),
+    ("payload_off", "<u8"), ("word_size", "<u8"),
+    ("n_events", "<u8"), ("n_bookmarks", "<u8"),
+])
+_EVU_DATA_OFF = len(_EVU_MAGIC) + _EVU_HEADER.itemsize
+
+#: One bookmark: absolute timestamp, payload word offset, cumulative count.
+_EVU_RECORD = np.dtype([("ts", "<i8"), ("word_offset", "<i8"), ("cum_count", "<i8")])
+
+
+def evutils_index_path(raw_path: "str | Path", cache_dir: "str | Path | None" = None) -> Path:
+    """Sidecar path for a raw file: ``<file>.raw.evidx`` next to it, or
+    ``<cache_dir>/<file>.raw.<path hash>.evidx`` (the hash of the resolved path
+    keeps equally named recordings from different directories apart)."""
+    p = Path(raw_path)
+    if cache_dir is None:
+        return p.with_name(p.name + ".evidx")
+    import hashlib
+    key = hashlib.blake2b(str(p.resolve()).encode(), digest_size=8).hexdigest()
+    return Path(cache_dir) / f"{p.name}.{key}.evidx"
+
+
+def read_evutils_index(index_path: "str | Path", raw_path: "str | Path", header_digest: bytes,
+                       payload_off: int, word_size: int) -> "StaticSeekIndex | None":
+    """Memory-map an evutils ``.evidx`` sidecar as a :class:`StaticSeekIndex`.
+
+    Returns ``None`` if the sidecar is missing, malformed or stale: the raw
+    file's size or mtime changed, or its header / payload layout differs from
+    what the sidecar was built for.
+    """
+    index_path = Path(index_path)
+    try:
+        st = Path(raw_path).stat()
+        if index_path.stat().st_size < _EVU_DATA_OFF:
+            return None
+        with open(index_path, "rb") as f:
+            if f.read(len(_EVU_MAGIC)) != _EVU_MAGIC:
+                return None
+            hdr = np.frombuffer(f.read(_EVU_HEADER.itemsize), dtype=_EVU_HEADER)[0]
+    except OSError:
+        return None
+    if (int(hdr["size"]) != st.st_size or int(hdr["mtime_ns"]) != st.st_mtime_ns
+            or bytes(hdr["header_digest"]) != header_digest
+            or int(hdr["payload_off"]) != payload_off
+            or int(hdr["word_size"]) != word_size):
+        return None
+    n = int(hdr["n_bookmarks"])
+    if index_path.stat().st_size != _EVU_DATA_OFF + n * _EVU_RECORD.itemsize:
+        return None
+    if n == 0:
+        recs = np.zeros(0, dtype=_EVU_RECORD)
+    else:
+        recs = np.memmap(index_path, dtype=_EVU_RECORD, mode="r",
+                         offset=_EVU_DATA_OFF, shape=(n,))
+    return StaticSeekIndex(
+        ts=recs["ts"], word_offset=recs["word_offset"],
+        cum_count=recs["cum_count"], n_events=int(hdr["n_events"]),
+    )
+
+
+def write_evutils_index(index_path: "str | Path", raw_path: "str | Path", header_digest: bytes,
+                        payload_off: int, word_size: int, index: StaticSeekIndex) -> bool:
+    """Persist ``index`` as an evutils ``.evidx`` sidecar for ``raw_path``.
+
+    Written to a temporary file and renamed into place, so concurrent readers
+    of the same recording never see a partial sidecar. Returns False (and
+    leaves nothing behind) when the location is not writable.
+    """
+    import os
+    import tempfile
+
+    index_path = Path(index_path)
+    st = Path(raw_path).stat()
+    hdr = np.zeros(1, dtype=_EVU_HEADER)
+    hdr["size"] = st.st_size
+    hdr["mtime_ns"] = st.st_mtime_ns
+    hdr["header_digest"] = np.void(bytes(header_digest))
+    hdr["payload_off"] = payload_off
+    hdr["word_size"] = word_size
+    hdr["n_events"] = index.n_events
+    hdr["n_bookmarks"] = len(index.ts)
+    recs = np.empty(len(index.ts), dtype=_EVU_RECORD)
+    recs["ts"] = index.ts
+    recs["word_offset"] = index.word_offset
+    recs["cum_count"] = index.cum_count
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=index_path.parent, prefix=index_path.name, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_EVU_MAGIC)
+            f.write(hdr.tobytes())
+            f.write(recs.tobytes())
+        os.replace(tmp, index_path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    return True
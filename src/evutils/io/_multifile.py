@@ -0,0 +1,437 @@
+"""Read an ordered list of recording files as one continuous stream.
+
+Cameras and recorders often roll a long recording into fixed-length
+segments (``rec_000.raw``, ``rec_001.raw``, ...). :class:`EventDecoder_MultiFile`
+chains one ordinary decoder per segment behind the normal decoder contract,
+so the EventReader windows across file boundaries exactly as it would over
+one concatenated file: a ``delta_t`` / ``n_events`` window straddling a
+boundary is filled from both files, with no event dropped or repeated.
+
+Only the current segment is open. While it is being read, the next one is
+opened and initialised (header parsed, file mapped, page cache warmed) on a
+background thread, so crossing a boundary costs a dictionary swap.
+
+Global ``seek(t=)`` / ``seek(n=)`` go through a per-file bounds table (first
+timestamp and event count of each segment), filled lazily by the segments'
+own seeks and cached: a seek opens the files it needs to locate the target,
+then only the landing segment stays open.
+"""
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from ..types import EventArray, TriggerArray
+from ._native_core import EVUTILS_PARSE_OK, EVUTILS_PARSE_OUTPUT_FULL
+from ._source import ByteSource, make_source
+from .common import EventDecoder, SeekResult
+
+#: Past any real timestamp: ``seek(t=_END_OF_TIME)`` lands on a segment's end,
+#: and its index is then the segment's event count.
+_END_OF_TIME = 1 << 62
+
+#: Settings the EventReader injects into its decoder after construction;
+#: copied onto every segment decoder when it is opened.
+_INJECTED = ("read_external_triggers", "_strict", "_decode_workers", "_event_filter",
+             "_use_sidecar", "_load_index", "_save_index", "_index_dir")
+
+
+class FileListSource(ByteSource):
+    """An ordered list of recording files, read as one stream.
+
+    Holds only the paths: :class:`EventDecoder_MultiFile` opens each file as
+    its own source when it reaches it. ``name`` is the first file's name.
+
+    Parameters
+    ----------
+    paths : sequence of str or Path
+        The segment files, in playback order.
+
+    """
+
+    def __init__(self, paths: "Sequence[str | Path]") -> None:
+        self.paths = [Path(p) for p in paths]
+        if not self.paths:
+            raise ValueError("the file list is empty")
+        for p in self.paths:
+            if not p.is_file():
+                raise FileNotFoundError(f"File {p} does not exist")
+        self.name = self.paths[0].name
+
+    def read(self, size: int = -1) -> bytes:
+        raise io.UnsupportedOperation("a file list is read through EventDecoder_MultiFile")
+
+    def peek(self, size: int) -> bytes:
+        raise io.UnsupportedOperation("a file list is read through EventDecoder_MultiFile")
+
+    def seekable(self) -> bool:
+        # Every segment is reopened from its path, so the list can always rewind.
+        return True
+
+
+def _release(dec: EventDecoder) -> None:
+    """Close a segment decoder and its source."""
+    dec.close()
+    try:
+        dec._source.close()
+    except BufferError:
+        pass  # a caller still holds a view of the mapping; it closes with the last view
+
+
+def _release_when_done(fut: Future) -> None:
+    if fut.exception() is None:
+        _release(fut.result())
+
+
+def _first_ts(dec: EventDecoder) -> "int | None":
+    """Timestamp of a decoder's first event, read from its start (decoded,
+    not taken from a seek landing)."""
+    dec.reset()
+    while True:
+        chunk = dec.read_chunk(n_events_hint=1)
+        if isinstance(chunk, tuple):
+            chunk = chunk[0]
+        if len(chunk):
+            return int(chunk.t[0])
+        if dec.is_eof():
+            return None
+
+
+def _join(parts: "list[tuple[EventArray, TriggerArray | None]]",
+          with_triggers: bool) -> 'EventArray | tuple[EventArray, TriggerArray]':
+    events = [ev for ev, _ in parts if len(ev)]
+    if not events:
+        ev = EventArray.empty()
+    elif len(events) == 1:
+        ev = events[0]
+    else:
+        ev = EventArray(*(np.concatenate([getattr(a, f) for a in events]) for f in "txyp"))
+    if not with_triggers:
+        return ev
+    triggers = [tr for _, tr in parts if tr is not None and len(tr)]
+    if not triggers:
+        tr = TriggerArray.empty()
+    elif len(triggers) == 1:
+        tr = triggers[0]
+    else:
+        tr = TriggerArray(*(np.concatenate([getattr(a, f) for a in triggers]) for f in ("t", "p", "id")))
+    return ev, tr
+
+
+class EventDecoder_MultiFile(EventDecoder):
+    """Decode an ordered list of files as one continuous stream.
+
+    Each file is decoded by its own format decoder (all files must share one
+    format). The capabilities -- native ``parse_step``, exact / independent
+    windows, seeking, triggers -- are those of the segment decoder, so the
+    EventReader keeps every fast path it would use on a single file.
+
+    Parameters
+    ----------
+    source : FileListSource
+        The files to read, in order.
+    file_decoder : type[EventDecoder], optional
+        Decoder class for the segments; by default resolved from the first
+        file (extension, then content).
+    **kwargs
+        Passed to every segment decoder's constructor.
+
+    """
+
+    def __init__(self, source: FileListSource, file_decoder: "type[EventDecoder] | None" = None,
+                 **kwargs: Any) -> None:
+        from . import decoders as ev_decoders
+        self._paths = source.paths
+        self._kwargs = kwargs
+        first = make_source(self._paths[0])
+        self._explicit_cls = file_decoder is not None
+        self._cls = file_decoder or ev_decoders.resolve_decoder_cls(first)
+        # The first segment is built up front: its class attributes and
+        # properties are the capabilities the EventReader selects paths from.
+        self._sub: EventDecoder = self._cls(first, **kwargs)
+        self._i = 0
+        super().__init__(source)
+        self._bounds: "list[tuple[int | None, int] | None]" = [None] * len(self._paths)
+        self._pool: Any = None
+        self._ahead: "tuple[int, Future] | None" = None
+        if hasattr(self._sub, "parse_step"):
+            self.parse_step = self._parse_step
+        if hasattr(self._sub, "parse_step_delta_t"):
+            self.parse_step_delta_t = self._parse_step_delta_t
+
+    # -- capabilities of the segment decoder ---------------------------------- #
+    @property
+    def SUPPORTS_SEEK(self) -> bool:  # type: ignore[override]
+        return self._sub.SUPPORTS_SEEK
+
+    @property
+    def SUPPORTS_EXT_TRIGGERS(self) -> bool:  # type: ignore[override]
+        return self._sub.SUPPORTS_EXT_TRIGGERS
+
+    @property
+    def _exact_window(self) -> bool:  # type: ignore[override]
+        return self._sub._exact_window
+
+    @property
+    def _independent_windows(self) -> bool:  # type: ignore[override]
+        return self._sub._independent_windows
+
+    @property
+    def _buffers_in_memory(self) -> bool:  # type: ignore[override]
+        return self._sub._buffers_in_memory
+
+    @property
+    def _has_delta_t_parser(self) -> bool:  # type: ignore[override]
+        return self._sub._has_delta_t_parser
+
+    @property
+    def _native_filter(self) -> bool:
+        return self._sub._native_filter
+
+    # -- opening segments ----------------------------------------------------- #
+    def _configure(self, dec: EventDecoder, i: int) -> None:
+        for name in _INJECTED:
+            setattr(dec, name, getattr(self, name))
+        dec._raw_path = str(self._paths[i])
+
+    def _load(self, i: int) -> EventDecoder:
+        """Open, configure and initialise the decoder for file ``i``."""
+        from . import decoders as ev_decoders
+        path = self._paths[i]
+        if hasattr(os, "posix_fadvise"):
+            # Start the read-in now, while the previous file is still decoding.
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        source = make_source(path, workers=self._decode_workers)
+        if not self._explicit_cls and ev_decoders.resolve_decoder_cls(source) is not self._cls:
+            source.close()
+            raise ValueError(f"{path.name} is not in the same format as {self._paths[0].name}; "
+                             "all files of a recording must share one format")
+        dec = self._cls(source, **self._kwargs)
+        self._configure(dec, i)
+        dec.init()
+        return dec
+
+    def _prefetch(self, i: int) -> None:
+        """Open file ``i`` on the background thread."""
+        if i >= len(self._paths):
+            return
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evutils-multifile")
+        self._ahead = (i, self._pool.submit(self._load, i))
+
+    def _drop_ahead(self) -> None:
+        if self._ahead is not None:
+            fut = self._ahead[1]
+            self._ahead = None
+            # Still opening in the background: close it once it is ready.
+            fut.add_done_callback(_release_when_done)
+
+    def _open(self, i: int) -> EventDecoder:
+        if self._ahead is not None and self._ahead[0] == i:
+            fut = self._ahead[1]
+            self._ahead = None
+            return fut.result()
+        return self._load(i)
+
+    def _switch(self, i: int) -> None:
+        """Make file ``i`` (opened fresh, at its start) the current one."""
+        if self._ahead is not None and self._ahead[0] != i:
+            self._drop_ahead()
+        dec = self._open(i)
+        _release(self._sub)
+        self._sub, self._i = dec, i
+        self._prefetch(i + 1)
+
+    def _advance(self) -> bool:
+        """Move on to the next file; False after the last one."""
+        if self._i + 1 >= len(self._paths):
+            return False
+        self._switch(self._i + 1)
+        return True
+
+    # -- decoder contract ----------------------------------------------------- #
+    def init(self) -> None:
+        """Initialise the first file and start opening the second."""
+        if self._is_initialized:
+            return
+        self._configure(self._sub, 0)
+        self._sub.init()
+        self._width, self._height = self._sub.shape()
+        self._prefetch(1)
+        self._is_initialized = True
+
+    def _parse_step(self, events: Any, triggers: Any) -> int:
+        """Native fill across files: the current file's ``parse_step``, moving
+        on to the next file once it is drained."""
+        while True:
+            added = self._sub.parse_step(events, triggers)  # type: ignore[attr-defined]
+            if added or not self._sub.is_eof() or not self._advance():
+                return int(added)
+
+    def _parse_step_delta_t(self, events: Any, triggers: Any, end_ts: int) -> tuple[int, int]:
+        """Dedicated delta_t parser across files. A drained file reports
+        ``EVUTILS_PARSE_OK`` so the reader calls again, now on the next file."""
+        added, status = self._sub.parse_step_delta_t(events, triggers, end_ts)  # type: ignore[attr-defined]
+        if status != EVUTILS_PARSE_OUTPUT_FULL and self._sub.is_eof() and self._advance():
+            status = EVUTILS_PARSE_OK
+        return added, status
+
+    def read_chunk(self, delta_t_hint: int | None = None,
+                   n_events_hint: int | None = None) -> 'EventArray | tuple[EventArray, TriggerArray]':
+        """Read the next chunk, continuing into the next file at a boundary.
+
+        With ``n_events_hint`` the chunk is filled to exactly that many events
+        unless the last file ends, stitching across files if needed.
+        """
+        if not self._is_initialized:
+            self.init()
+        parts: "list[tuple[EventArray, TriggerArray | None]]" = []
+        with_triggers = False
+        n = 0
+        while True:
+            want = n_events_hint - n if n_events_hint else None
+            out = self._sub.read_chunk(delta_t_hint, want)
+            if isinstance(out, tuple):
+                ev, tr = out
+                with_triggers = True
+            else:
+                ev, tr = out, None
+            if len(ev) == 0 and (tr is None or len(tr) == 0):
+                # An empty chunk ends a file (as it ends a single-file read).
+                if not self._advance():
+                    self._eof = True
+                    break
+                continue
+            if not n_events_hint or n + len(ev) >= n_events_hint:
+                parts.append((ev, tr))
+                break
+            # Short of the window: keep a copy, the next call may reuse the buffer.
+            parts.append((ev.copy(), tr.copy() if tr is not None else None))
+            n += len(ev)
+        return _join(parts, with_triggers)
+
+    def read_all(self) -> 'EventArray | tuple[EventArray, TriggerArray]':
+        """Decode every remaining event of every remaining file at once."""
+        if not self._is_initialized:
+            self.init()
+        outs = [self._sub.read_all()]
+        while self._advance():
+            outs.append(self._sub.read_all())
+        self._eof = True
+        parts = [out if isinstance(out, tuple) else (out, None) for out in outs]
+        return _join(parts, any(isinstance(out, tuple) for out in outs))
+
+    def is_eof(self) -> bool:
+        return self._i == len(self._paths) - 1 and self._sub.is_eof()
+
+    def _bounds_of(self, i: int, opened: "dict[int, EventDecoder]") -> "tuple[int | None, int]":
+        """First timestamp (``None`` if empty) and event count of file ``i``."""
+        bounds = self._bounds[i]
+        if bounds is None:
+            if i not in opened:
+                opened[i] = self._load(i)
+            dec = opened[i]
+            count = dec.seek(t=_END_OF_TIME)[0].index
+            first = _first_ts(dec) if count else None
+            bounds = self._bounds[i] = (first, count)
+        return bounds
+
+    def seek(self, t: int | None = None, n: int | None = None) -> tuple[SeekResult, EventArray, "TriggerArray | None"]:
+        """Seek to an absolute timestamp (µs) or global event index. See base class.
+
+        The target file is found from the per-file bounds table, then the
+        seek is delegated to that file's decoder. A time past the end of one
+        file but before the next lands on the next file's first event.
+        """
+        if not self._is_initialized:
+            self.init()
+        axis, val = self._seek_axis(t, n)
+        self._drop_ahead()
+        opened = {self._i: self._sub}
+        try:
+            land, base, res, rem_ev, rem_tr = self._locate(axis, val, opened)
+            self._sub, self._i = opened.pop(land), land
+        finally:
+            for dec in opened.values():
+                if dec is not self._sub:
+                    _release(dec)
+        self._prefetch(land + 1)
+        self._eof = res.eof
+        return SeekResult(ts=res.ts, index=base + res.index, eof=res.eof), rem_ev, rem_tr
+
+    def _locate(self, axis: str, val: int, opened: "dict[int, EventDecoder]") -> tuple:
+        """Seek the file holding the target: ``(file, events before it, *its seek result)``."""
+        def sub(i: int) -> EventDecoder:
+            if i not in opened:
+                opened[i] = self._load(i)
+            return opened[i]
+
+        last = len(self._paths) - 1
+        base = land_base = 0
+        land = None
+        for i in range(len(self._paths)):
+            first, count = self._bounds_of(i, opened)
+            if axis == "n":
+                if val < base + count:
+                    land = i
+                    break
+            elif count:
+                if first > val and land is not None:  # type: ignore[operator]
+                    break
+                land, land_base = i, base
+                if first > val:  # type: ignore[operator]
+                    break  # before the first event: land on it
+            base += count
+        if axis == "t":
+            if land is None:  # no events at all
+                land, land_base = last, base
+            base = land_base
+        elif land is None:  # past the end
+            land = last
+            base -= self._bounds[last][1]  # type: ignore[index]
+
+        res, rem_ev, rem_tr = sub(land).seek(t=val) if axis == "t" else sub(land).seek(n=val - base)
+        if res.eof and axis == "t":
+            # Past this file's last event: continue at the next non-empty file.
+            for i in range(land + 1, len(self._paths)):
+                first, count = self._bounds_of(i, opened)
+                if count:
+                    base += sum(self._bounds[j][1] for j in range(land, i))  # type: ignore[index]
+                    land = i
+                    res, rem_ev, rem_tr = sub(i).seek(t=first)
+                    break
+        return land, base, res, rem_ev, rem_tr
+
+    def reset(self) -> None:
+        """Go back to the start of the first file."""
+        if self._i == 0:
+            self._sub.reset()
+        else:
+            self._switch(0)
+        self._eof = False
+
+    def tell(self) -> int:
+        """Position within the current file (see its decoder's ``tell``)."""
+        return self._sub.tell()
+
+    def current_file(self) -> Path:
+        """Path of the file under the cursor."""
+        return self._paths[self._i]
+
+    def close(self) -> None:
+        """Close the open files and stop the prefetch thread."""
+        self._drop_ahead()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        _release(self._sub)
@@ -0,0 +1,58 @@
+"""ctypes bindings for the native AEDAT 4.0 packet parser.
+
+:class:`Aedat4Input` views one decompressed packet body zero-copy;
+:class:`Aedat4Parser` owns the opaque C state (the resume position inside a
+body whose elements did not fit the output buffer). The container walk and
+decompression stay in :mod:`evutils.io._aedat`; shared SoA buffers live in
+:mod:`evutils.io._native_core`.
+"""
+from __future__ import annotations
+import ctypes
+from ctypes import POINTER, pointer, c_uint8, cast as c_cast, c_char, c_void_p, byref
+from typing import TYPE_CHECKING, cast
+import numpy as np
+from ._native_core import register_bindings, NativeError, EventFilter, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+
+if TYPE_CHECKING:
+    from ctypes import _Pointer
+
+class Aedat4InputBuffer(ctypes.Structure):
+    _fields_ = [("begin", POINTER(c_uint8)), ("end", POINTER(c_uint8))]
+
+class Aedat4Input:
+    __slots__ = ("arr", "c")
+    def __init__(self, body: np.ndarray):
+        if body.dtype != np.uint8 or not body.flags["C_CONTIGUOUS"]: raise NativeError("Aedat4Input needs a C-contiguous uint8 array")
+        self.arr = body
+        base = body.ctypes.data
+        self.c = Aedat4InputBuffer()
+        self.c.begin = c_cast(base, POINTER(c_uint8))
+        self.c.end = c_cast(base + body.nbytes, POINTER(c_uint8))
+
+def _bind_aedat(handle: ctypes.CDLL) -> None:
+    from ._native_core import EventBufferSOA, TriggerBufferSOA, ParserResult
+    if hasattr(handle, "AEDAT4_state_size"):
+        handle.AEDAT4_state_size.argtypes = []
+        handle.AEDAT4_state_size.restype = ctypes.c_size_t
+    if hasattr(handle, "AEDAT4_parse_packet_soa"):
+        handle.AEDAT4_parse_packet_soa.argtypes = [c_void_p, POINTER(Aedat4InputBuffer), POINTER(EventBufferSOA), POINTER(TriggerBufferSOA)]
+        handle.AEDAT4_parse_packet_soa.restype = ParserResult
+
+register_bindings(_bind_aedat)
+
+class Aedat4Parser:
+    __slots__ = ("_state", "_buf", "_filter")
+    def __init__(self) -> None:
+        self._buf = (c_char * int(lib().AEDAT4_state_size()))()
+        self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
+    def reset(self, element: int = 0) -> None:
+        ctypes.memset(self._buf, 0, len(self._buf))
+        if element > 0:
+            import struct
+            struct.pack_into("=I", self._buf, 0, element)
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
+    def parse_packet_soa(self, inp: Aedat4Input, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
+        return cast(ParserResult, lib().AEDAT4_parse_packet_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
+    def __enter__(self) -> "Aedat4Parser": return self
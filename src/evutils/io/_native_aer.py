@@ -6,10 +6,13 @@ Shared SoA buffers and parse helpers live in :mod:`evutils.io._native_core`.
 """
 from __future__ import annotations
 import ctypes
-from ctypes import POINTER, c_uint32, cast as c_cast, c_char, c_void_p, c_uint64, byref
-from typing import cast
+from ctypes import POINTER, pointer, c_uint32, cast as c_cast, c_char, c_void_p, c_uint64, byref
+from typing import TYPE_CHECKING, cast
 import numpy as np
-from ._native_core import register_bindings, NativeError, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+from ._native_core import register_bindings, NativeError, EventFilter, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+
+if TYPE_CHECKING:
+    from ctypes import _Pointer
 
 class AerInputBuffer(ctypes.Structure):
     _fields_ = [("begin", POINTER(c_uint32)), ("end", POINTER(c_uint32))]
@@ -45,16 +48,19 @@ def _bind_aer(handle: ctypes.CDLL) -> None:
 register_bindings(_bind_aer)
 
 class AerParser:
-    __slots__ = ("_state", "_buf", "_mode", "_t_start", "_t_step")
+    __slots__ = ("_state", "_buf", "_filter", "_mode", "_t_start", "_t_step")
     def __init__(self, mode: int = AER_TS_ZERO, t_start: int = 0, t_step: int = 1):
         self._buf = (c_char * int(lib().AER_state_size()))()
         self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
         self._mode = mode
         self._t_start = t_start
         self._t_step = t_step
         lib().AER_state_configure(self._state, mode, t_start, t_step)
-    def reset(self) -> None:
-        lib().AER_state_configure(self._state, self._mode, self._t_start, self._t_step)
+    def reset(self, t_next: int | None = None) -> None:
+        lib().AER_state_configure(self._state, self._mode, self._t_start if t_next is None else t_next, self._t_step)
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
     def parse_chunk_soa(self, inp: AerInput, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().AER_parse_chunk_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
     def __enter__(self) -> "AerParser": return self
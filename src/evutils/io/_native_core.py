@@ -7,7 +7,7 @@ import os
 import sys
 from ctypes import (
     POINTER, Structure, byref, cast as c_cast, c_char_p, c_char,
-    c_int, c_size_t, c_uint8, c_uint16, c_uint64, c_void_p,
+    c_int, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p,
 )
 from pathlib import Path
 from typing import cast, Callable
@@ -17,11 +17,11 @@ from ..types import EventArray, TriggerArray
 
 __all__ = [
     "NativeError", "lib", "register_bindings",
-    "EventBufferSOA", "TriggerBufferSOA",
+    "EventBufferSOA", "TriggerBufferSOA", "EventFilter", "EVUTILS_MAX_ROIS",
     "ParserResult", "EventSoABuffers", "TriggerSoABuffers",
     "EVENT_DTYPE", "TRIGGER_DTYPE",
     "events_view", "triggers_view",
-    "parse_step", "decode_all_soa",
+    "parse_step", "decode_all_soa", "simd_level", "set_simd_level", "SIMD_LEVELS",
     "EVUTILS_PARSE_OK", "EVUTILS_PARSE_INPUT_EMPTY", "EVUTILS_PARSE_OUTPUT_FULL",
     "EVUTILS_PARSE_ERROR", "EVUTILS_PARSE_INCOMPLETE", "EVUTILS_PARSE_WINDOW_DONE", "EVUTILS_PARSE_WARNING",
     "_T_DTYPE", "_X_DTYPE", "_Y_DTYPE", "_P_DTYPE", "_ID_DTYPE"
@@ -39,11 +39,20 @@ _Y_DTYPE = np.uint16
 _P_DTYPE = np.uint8
 _ID_DTYPE = np.uint8
 
+EVUTILS_MAX_ROIS = 8
+
+class EventFilter(Structure):
+    _fields_ = [
+        ("n_rois", c_uint32), ("roi", (c_uint16 * 4) * EVUTILS_MAX_ROIS),
+        ("x_stride", c_uint16), ("y_stride", c_uint16), ("polarity", c_uint8),
+    ]
+
 class EventBufferSOA(Structure):
     _fields_ = [
         ("t", POINTER(c_uint64)), ("x", POINTER(c_uint16)),
         ("y", POINTER(c_uint16)), ("p", POINTER(c_uint8)),
         ("capacity", c_size_t), ("size", c_size_t),
+        ("filter", POINTER(EventFilter)),
     ]
 
 class TriggerBufferSOA(Structure):
@@ -103,6 +112,11 @@ def register_bindings(binder: Callable[[ctypes.CDLL], None]) -> None:
 def _bind(handle: ctypes.CDLL) -> ctypes.CDLL:
     handle.evutils_version.argtypes = []
     handle.evutils_version.restype = c_char_p
+    if hasattr(handle, "evutils_simd_level"):
+        handle.evutils_simd_level.argtypes = []
+        handle.evutils_simd_level.restype = c_int
+        handle.evutils_set_simd_level.argtypes = [c_int]
+        handle.evutils_set_simd_level.restype = c_int
     for binder in _BINDINGS:
         binder(handle)
     return handle
@@ -134,6 +148,23 @@ class EventSoABuffers:
         self.c.p = self.p.ctypes.data_as(POINTER(c_uint8))
         self.c.capacity = self.capacity
         self.c.size = 0
+    @classmethod
+    def wrap(cls, t: np.ndarray, x: np.ndarray, y: np.ndarray, p: np.ndarray) -> "EventSoABuffers":
+        """Buffers over caller-owned, equally long contiguous columns (no copy).
+        ``t`` may be int64 or uint64. Never :meth:`grow` a wrapped buffer: that
+        would silently detach it from the caller's arrays."""
+        self = cls.__new__(cls)
+        self.capacity = len(t)
+        self.t = t.view(_T_DTYPE)
+        self.x, self.y, self.p = x, y, p
+        self.c = EventBufferSOA()
+        self.c.t = self.t.ctypes.data_as(POINTER(c_uint64))
+        self.c.x = x.ctypes.data_as(POINTER(c_uint16))
+        self.c.y = y.ctypes.data_as(POINTER(c_uint16))
+        self.c.p = p.ctypes.data_as(POINTER(c_uint8))
+        self.c.capacity = self.capacity
+        self.c.size = 0
+        return self
     @property
     def size(self) -> int: return int(self.c.size)
     def reset(self) -> None: self.c.size = 0
@@ -188,6 +219,20 @@ class TriggerSoABuffers:
         n = self.size
         return self.t[:n], self.id[:n], self.p[:n]
 
+# Kernel levels of the runtime-dispatched EVT2 / EVT4 CD decode (csrc/simd.c).
+SIMD_LEVELS = ("scalar", "avx2", "avx512")
+
+def simd_level() -> str:
+    """Name of the CD-word kernel the EVT2 / EVT4 parsers use on this CPU."""
+    return SIMD_LEVELS[lib().evutils_simd_level()]
+
+def set_simd_level(level: "str | None") -> str:
+    """Force a kernel level (``None`` = widest supported; a level the CPU lacks
+    falls back to the widest it has). Returns the level now in effect."""
+    if level is not None and level not in SIMD_LEVELS:
+        raise ValueError(f"level must be one of {SIMD_LEVELS} or None, got {level!r}")
+    return SIMD_LEVELS[lib().evutils_set_simd_level(-1 if level is None else SIMD_LEVELS.index(level))]
+
 def events_view(ev: EventSoABuffers) -> EventArray:
     n = ev.size
     return EventArray(ev.t[:n].view(np.int64), ev.x[:n], ev.y[:n], ev.p[:n])
@@ -6,10 +6,13 @@ buffers and parse helpers live in :mod:`evutils.io._native_core`.
 """
 from __future__ import annotations
 import ctypes
-from ctypes import POINTER, c_uint32, cast as c_cast, c_char, c_void_p, byref
-from typing import cast
+from ctypes import POINTER, pointer, c_uint32, cast as c_cast, c_char, c_void_p, byref
+from typing import TYPE_CHECKING, cast
 import numpy as np
-from ._native_core import register_bindings, NativeError, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+from ._native_core import register_bindings, NativeError, EventFilter, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+
+if TYPE_CHECKING:
+    from ctypes import _Pointer
 
 class DatInputBuffer(ctypes.Structure):
     _fields_ = [("begin", POINTER(c_uint32)), ("end", POINTER(c_uint32))]
@@ -39,15 +42,18 @@ def _bind_dat(handle: ctypes.CDLL) -> None:
 register_bindings(_bind_dat)
 
 class DatParser:
-    __slots__ = ("_state", "_buf")
+    __slots__ = ("_state", "_buf", "_filter")
     def __init__(self) -> None:
         self._buf = (c_char * int(lib().DAT_state_size()))()
         self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
     def reset(self, wrap_offset: int = 0) -> None:
         ctypes.memset(self._buf, 0, len(self._buf))
         if wrap_offset > 0:
             import struct
             struct.pack_into("=Q", self._buf, 0, wrap_offset)
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
     def parse_chunk_soa(self, inp: DatInput, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().DAT_parse_chunk_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
     def __enter__(self) -> "DatParser": return self
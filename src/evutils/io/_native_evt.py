@@ -1,16 +1,20 @@
-"""ctypes bindings for the native EVT2 / EVT2.1 / EVT3 / EVT4 parsers.
+"""ctypes bindings for the native EVT2 / EVT2.1 / EVT3 / EVT4 parsers and encoders.
 
 Input wrappers (:class:`Evt2Input`, :class:`Evt21Input`, :class:`Evt3Input`,
 :class:`Evt4Input`) view the payload words zero-copy; the ``Evt*Parser`` classes
-own the opaque C parser state. Shared SoA output buffers and the parse loop
-helpers live in :mod:`evutils.io._native_core`.
+own the opaque C parser state. The ``Evt*Encoder`` classes are the writers'
+side: they encode SoA columns into a reused word buffer. Shared SoA output buffers and
+the parse loop helpers live in :mod:`evutils.io._native_core`.
 """
 from __future__ import annotations
 import ctypes
-from ctypes import POINTER, c_uint16, c_uint32, c_uint64, cast as c_cast, c_char, c_void_p, byref
-from typing import cast
+from ctypes import POINTER, pointer, c_int32, c_int64, c_uint16, c_uint32, c_uint64, cast as c_cast, c_char, c_void_p, byref
+from typing import TYPE_CHECKING, cast
 import numpy as np
-from ._native_core import register_bindings, NativeError, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+from ._native_core import register_bindings, NativeError, EventFilter, EventSoABuffers, TriggerSoABuffers, ParserResult, lib
+
+if TYPE_CHECKING:
+    from ctypes import _Pointer
 
 class Evt3InputBuffer(ctypes.Structure):
     _fields_ = [("begin", POINTER(c_uint16)), ("end", POINTER(c_uint16))]
@@ -21,6 +25,9 @@ class Evt21InputBuffer(ctypes.Structure):
 class Evt4InputBuffer(ctypes.Structure):
     _fields_ = [("begin", POINTER(c_uint32)), ("end", POINTER(c_uint32))]
 
+class EvtEncoderState(ctypes.Structure):
+    _fields_ = [("ts_high", c_int64), ("ts_low", c_int64), ("y", c_int32)]
+
 class Evt3Input:
     __slots__ = ("arr", "c")
     def __init__(self, words: np.ndarray):
@@ -78,6 +85,9 @@ def _bind_evt(handle: ctypes.CDLL) -> None:
     if hasattr(handle, "EVT3_state_size"):
         handle.EVT3_state_size.argtypes = []
         handle.EVT3_state_size.restype = ctypes.c_size_t
+    if hasattr(handle, "EVT3_state_time_base"):
+        handle.EVT3_state_time_base.argtypes = [c_void_p, POINTER(c_uint64), POINTER(c_uint64)]
+        handle.EVT3_state_time_base.restype = None
     if hasattr(handle, "EVT3_parse_chunk_soa"):
         handle.EVT3_parse_chunk_soa.argtypes = [c_void_p, POINTER(Evt3InputBuffer), POINTER(EventBufferSOA), POINTER(TriggerBufferSOA)]
         handle.EVT3_parse_chunk_soa.restype = ParserResult
@@ -87,62 +97,145 @@ def _bind_evt(handle: ctypes.CDLL) -> None:
     if hasattr(handle, "EVT2_state_size"):
         handle.EVT2_state_size.argtypes = []
         handle.EVT2_state_size.restype = ctypes.c_size_t
+    if hasattr(handle, "EVT2_state_time_base"):
+        handle.EVT2_state_time_base.argtypes = [c_void_p, POINTER(c_uint64), POINTER(c_uint64)]
+        handle.EVT2_state_time_base.restype = None
     if hasattr(handle, "EVT2_parse_chunk_soa"):
         handle.EVT2_parse_chunk_soa.argtypes = [c_void_p, POINTER(Evt2InputBuffer), POINTER(EventBufferSOA), POINTER(TriggerBufferSOA)]
         handle.EVT2_parse_chunk_soa.restype = ParserResult
     if hasattr(handle, "EVT21_state_size"):
         handle.EVT21_state_size.argtypes = []
         handle.EVT21_state_size.restype = ctypes.c_size_t
+    if hasattr(handle, "EVT21_state_time_base"):
+        handle.EVT21_state_time_base.argtypes = [c_void_p, POINTER(c_uint64), POINTER(c_uint64)]
+        handle.EVT21_state_time_base.restype = None
     if hasattr(handle, "EVT21_parse_chunk_soa"):
         handle.EVT21_parse_chunk_soa.argtypes = [c_void_p, POINTER(Evt21InputBuffer), POINTER(EventBufferSOA), POINTER(TriggerBufferSOA)]
         handle.EVT21_parse_chunk_soa.restype = ParserResult
     if hasattr(handle, "EVT4_state_size"):
         handle.EVT4_state_size.argtypes = []
         handle.EVT4_state_size.restype = ctypes.c_size_t
+    if hasattr(handle, "EVT4_state_time_base"):
+        handle.EVT4_state_time_base.argtypes = [c_void_p, POINTER(c_uint64), POINTER(c_uint64)]
+        handle.EVT4_state_time_base.restype = None
     if hasattr(handle, "EVT4_parse_chunk_soa"):
         handle.EVT4_parse_chunk_soa.argtypes = [c_void_p, POINTER(Evt4InputBuffer), POINTER(EventBufferSOA), POINTER(TriggerBufferSOA)]
         handle.EVT4_parse_chunk_soa.restype = ParserResult
+    if hasattr(handle, "EVT3_encode_soa"):
+        handle.EVT3_encode_soa.argtypes = [POINTER(EvtEncoderState), POINTER(EventBufferSOA), POINTER(c_uint16)]
+        handle.EVT3_encode_soa.restype = ctypes.c_size_t
+    for name, word in (("EVT2_encode_soa", c_uint32), ("EVT21_encode_soa", c_uint64), ("EVT4_encode_soa", c_uint32)):
+        if hasattr(handle, name):
+            getattr(handle, name).argtypes = [POINTER(EvtEncoderState), POINTER(EventBufferSOA), POINTER(word)]
+            getattr(handle, name).restype = ctypes.c_size_t
 
 register_bindings(_bind_evt)
 
 class Evt3Parser:
-    __slots__ = ("_state", "_buf")
+    __slots__ = ("_state", "_buf", "_filter")
     def __init__(self) -> None:
         self._buf = (c_char * int(lib().EVT3_state_size()))()
         self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
     def reset(self) -> None: ctypes.memset(self._buf, 0, len(self._buf))
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
     def parse_chunk_soa(self, inp: Evt3Input, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().EVT3_parse_chunk_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
     def parse_delta_t_soa(self, inp: Evt3Input, events: EventSoABuffers, triggers: TriggerSoABuffers, end_ts: int) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().EVT3_parse_delta_t_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c), c_uint64(end_ts)))
+    def time_base(self) -> tuple[int, int]:
+        hh, high = c_uint64(), c_uint64()
+        lib().EVT3_state_time_base(self._state, byref(hh), byref(high))
+        return int(hh.value), int(high.value)
     def __enter__(self) -> "Evt3Parser": return self
 
 class Evt2Parser:
-    __slots__ = ("_state", "_buf")
+    __slots__ = ("_state", "_buf", "_filter")
     def __init__(self) -> None:
         self._buf = (c_char * int(lib().EVT2_state_size()))()
         self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
     def reset(self) -> None: ctypes.memset(self._buf, 0, len(self._buf))
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
     def parse_chunk_soa(self, inp: Evt2Input, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().EVT2_parse_chunk_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
+    def time_base(self) -> tuple[int, int]:
+        hh, high = c_uint64(), c_uint64()
+        lib().EVT2_state_time_base(self._state, byref(hh), byref(high))
+        return int(hh.value), int(high.value)
     def __enter__(self) -> "Evt2Parser": return self
 
 class Evt21Parser:
-    __slots__ = ("_state", "_buf")
+    __slots__ = ("_state", "_buf", "_filter")
     def __init__(self) -> None:
         self._buf = (c_char * int(lib().EVT21_state_size()))()
         self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
     def reset(self) -> None: ctypes.memset(self._buf, 0, len(self._buf))
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
     def parse_chunk_soa(self, inp: Evt21Input, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().EVT21_parse_chunk_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
+    def time_base(self) -> tuple[int, int]:
+        hh, high = c_uint64(), c_uint64()
+        lib().EVT21_state_time_base(self._state, byref(hh), byref(high))
+        return int(hh.value), int(high.value)
     def __enter__(self) -> "Evt21Parser": return self
 
 class Evt4Parser:
-    __slots__ = ("_state", "_buf")
+    __slots__ = ("_state", "_buf", "_filter")
     def __init__(self) -> None:
         self._buf = (c_char * int(lib().EVT4_state_size()))()
         self._state = c_cast(self._buf, c_void_p)
+        self._filter: "_Pointer[EventFilter] | None" = None
     def reset(self) -> None: ctypes.memset(self._buf, 0, len(self._buf))
+    def set_filter(self, flt: "EventFilter | None") -> None: self._filter = pointer(flt) if flt is not None else None
     def parse_chunk_soa(self, inp: Evt4Input, events: EventSoABuffers, triggers: TriggerSoABuffers) -> ParserResult:
+        events.c.filter = self._filter
         return cast(ParserResult, lib().EVT4_parse_chunk_soa(self._state, byref(inp.c), byref(events.c), byref(triggers.c)))
+    def time_base(self) -> tuple[int, int]:
+        hh, high = c_uint64(), c_uint64()
+        lib().EVT4_state_time_base(self._state, byref(hh), byref(high))
+        return int(hh.value), int(high.value)
     def __enter__(self) -> "Evt4Parser": return self
+
+class _EvtEncoder:
+    """Stateful encoder base. The time base (and for EVT3 the row) carries over
+    between :meth:`encode` calls, so a stream can be written in any number of
+    batches. The returned words are a view of a buffer reused by the next call."""
+    __slots__ = ("_state", "_out")
+    _symbol = ""
+    _word: type = np.uint16
+    _ctype: type = c_uint16
+    _max_words = 1  # worst case words per event (*_ENCODE_MAX_WORDS)
+    def __init__(self) -> None:
+        self._state = EvtEncoderState(-1, -1, -1)
+        self._out = np.empty(0, dtype=self._word)
+    def reset(self) -> None: self._state = EvtEncoderState(-1, -1, -1)
+    def encode(self, t: np.ndarray, x: np.ndarray, y: np.ndarray, p: np.ndarray) -> np.ndarray:
+        n = len(t)
+        if len(self._out) < self._max_words * n: self._out = np.empty(self._max_words * n, dtype=self._word)
+        events = EventSoABuffers.wrap(np.ascontiguousarray(t, dtype=np.int64), np.ascontiguousarray(x, dtype=np.uint16),
+                                      np.ascontiguousarray(y, dtype=np.uint16), np.ascontiguousarray(p, dtype=np.uint8))
+        events.c.size = n
+        w = getattr(lib(), self._symbol)(byref(self._state), byref(events.c), self._out.ctypes.data_as(POINTER(self._ctype)))
+        return self._out[:int(w)]
+
+class Evt3Encoder(_EvtEncoder):
+    __slots__ = ()
+    _symbol, _word, _ctype, _max_words = "EVT3_encode_soa", np.uint16, c_uint16, 4
+
+class Evt2Encoder(_EvtEncoder):
+    __slots__ = ()
+    _symbol, _word, _ctype, _max_words = "EVT2_encode_soa", np.uint32, c_uint32, 2
+
+class Evt21Encoder(_EvtEncoder):
+    __slots__ = ()
+    _symbol, _word, _ctype, _max_words = "EVT21_encode_soa", np.uint64, c_uint64, 2
+
+class Evt4Encoder(_EvtEncoder):
+    __slots__ = ()
+    _symbol, _word, _ctype, _max_words = "EVT4_encode_soa", np.uint32, c_uint32, 2
@@ -0,0 +1,64 @@
+"""ctypes bindings for the native EVU block codec.
+
+:func:`encode_block` packs SoA columns into one uncompressed block body;
+:func:`decode_block` appends a body's events to :class:`EventSoABuffers`.
+The container (compression, footer index) is walked in
+:mod:`evutils.io._evu`; shared SoA buffers live in
+:mod:`evutils.io._native_core`.
+"""
+from __future__ import annotations
+import ctypes
+from ctypes import POINTER, c_uint8, cast as c_cast, byref
+from typing import cast
+import numpy as np
+from ._native_core import register_bindings, NativeError, EventSoABuffers, ParserResult, lib
+
+#: Bytes of the fixed block header and trailing load padding (csrc evu.h).
+EVU_BLOCK_HEADER = 24
+EVU_PAD = 8
+
+class EvuInputBuffer(ctypes.Structure):
+    _fields_ = [("begin", POINTER(c_uint8)), ("end", POINTER(c_uint8))]
+
+class EvuInput:
+    __slots__ = ("arr", "c")
+    def __init__(self, body: np.ndarray):
+        if body.dtype != np.uint8 or not body.flags["C_CONTIGUOUS"]: raise NativeError("EvuInput needs a C-contiguous uint8 array")
+        self.arr = body
+        base = body.ctypes.data
+        self.c = EvuInputBuffer()
+        self.c.begin = c_cast(base, POINTER(c_uint8))
+        self.c.end = c_cast(base + body.nbytes, POINTER(c_uint8))
+
+def _bind_evu(handle: ctypes.CDLL) -> None:
+    from ._native_core import EventBufferSOA
+    if hasattr(handle, "EVU_encode_block_soa"):
+        handle.EVU_encode_block_soa.argtypes = [POINTER(EventBufferSOA), POINTER(c_uint8)]
+        handle.EVU_encode_block_soa.restype = ctypes.c_size_t
+    if hasattr(handle, "EVU_decode_block_soa"):
+        handle.EVU_decode_block_soa.argtypes = [POINTER(EvuInputBuffer), POINTER(EventBufferSOA)]
+        handle.EVU_decode_block_soa.restype = ParserResult
+
+register_bindings(_bind_evu)
+
+def encode_max_bytes(n: int) -> int:
+    """Worst-case body size for ``n`` events (``EVU_ENCODE_MAX_BYTES``)."""
+    return EVU_BLOCK_HEADER + 15 * n + EVU_PAD
+
+def encode_block(t: np.ndarray, x: np.ndarray, y: np.ndarray, p: np.ndarray, out: np.ndarray) -> int:
+    """Encode the columns as one block body into ``out`` (uint8, at least
+    :func:`encode_max_bytes` long). Returns the body size."""
+    n = len(t)
+    if len(out) < encode_max_bytes(n): raise NativeError("EVU encode buffer too small")
+    events = EventSoABuffers.wrap(np.ascontiguousarray(t, dtype=np.int64), np.ascontiguousarray(x, dtype=np.uint16),
+                                  np.ascontiguousarray(y, dtype=np.uint16), np.ascontiguousarray(p, dtype=np.uint8))
+    events.c.size = n
+    return int(lib().EVU_encode_block_soa(byref(events.c), out.ctypes.data_as(POINTER(c_uint8))))
+
+def block_events(body: "np.ndarray | bytes") -> int:
+    """Event count stored in a block body's header."""
+    return int.from_bytes(bytes(body[:4]), "little")
+
+def decode_block(body: np.ndarray, events: EventSoABuffers) -> ParserResult:
+    """Append the events of one uncompressed block body to ``events`` (GIL-free)."""
+    return cast(ParserResult, lib().EVU_decode_block_soa(byref(EvuInput(body).c), byref(events.c)))
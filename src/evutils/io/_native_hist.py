@@ -0,0 +1,41 @@
+"""ctypes bindings for the native event-count accumulator.
+
+:func:`accumulate_histogram` scatters a decoded SoA block into a
+``(n_bins, height, width, 2)`` uint32 counter array (csrc/histogram.c); the
+frame iteration built on it lives in :meth:`evutils.io.EventReader.iter_frames`.
+"""
+from __future__ import annotations
+import ctypes
+from ctypes import POINTER, byref, c_size_t, c_uint32, c_uint64
+import numpy as np
+from ._native_core import register_bindings, NativeError, EventBufferSOA, EventSoABuffers, lib
+
+def _bind_hist(handle: ctypes.CDLL) -> None:
+    if hasattr(handle, "evutils_histogram_accumulate_soa"):
+        handle.evutils_histogram_accumulate_soa.argtypes = [
+            POINTER(EventBufferSOA), # const event_buffer_soa_t *events
+            c_size_t,                # size_t start
+            POINTER(c_uint32),       # uint32_t *counts
+            c_uint32,                # uint32_t n_bins
+            c_uint32,                # uint32_t height
+            c_uint32,                # uint32_t width
+            c_uint64,                # timestamp_t t0
+            c_uint64,                # uint64_t delta_t
+        ]
+        handle.evutils_histogram_accumulate_soa.restype = c_size_t
+
+register_bindings(_bind_hist)
+
+def accumulate_histogram(events: EventSoABuffers, start: int, counts: np.ndarray, t0: int, delta_t: int) -> int:
+    """Accumulate ``events[start:]`` into ``counts`` up to ``t0 + delta_t``.
+
+    Returns the index of the first event at/after the window end (``events.size``
+    when the whole block was consumed).
+    """
+    if counts.dtype != np.uint32 or counts.ndim != 4 or counts.shape[3] != 2 or not counts.flags["C_CONTIGUOUS"]:
+        raise NativeError("counts must be a C-contiguous (n_bins, height, width, 2) uint32 array")
+    n_bins, height, width, _ = counts.shape
+    return int(lib().evutils_histogram_accumulate_soa(
+        byref(events.c), start, counts.ctypes.data_as(POINTER(c_uint32)),
+        n_bins, height, width, c_uint64(t0), c_uint64(delta_t),
+    ))
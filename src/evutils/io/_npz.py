@@ -10,7 +10,11 @@ reading. The layout is fully compatible with plain
 Both directions stream and never materialise the whole recording:
 
 * The decoder reads the ``.npy`` members through zip streams chunk by chunk
-  (works for stored and deflated members alike).
+  (works for stored and deflated members alike). Stored members -- the
+  default of both :class:`EventEncoder_Npz` and ``np.savez`` -- are
+  contiguous byte ranges of the file, so when the file can be memory-mapped
+  they are read as zero-copy views instead: chunks cost nothing, ``seek(n=)``
+  is O(1) and ``seek(t=)`` a ``searchsorted`` over the mapped ``t`` column.
 * The encoder cannot write four zip members simultaneously (the zip format is
   strictly sequential), so :meth:`~EventEncoder_Npz.write` spools each column
   to an unlinked temporary file as raw bytes; :meth:`~EventEncoder_Npz.close`
@@ -19,6 +23,7 @@ Both directions stream and never materialise the whole recording:
 from __future__ import annotations
 
 import io
+import struct
 import tempfile
 import zipfile
 from datetime import datetime
@@ -29,10 +34,14 @@ from numpy.lib import format as npy_format
 
 from ..types import EventArray, TriggerArray
 from .common import EventDecoder, EventEncoder
-from ._source import ByteSource
+from ._compression import is_compressed_path
+from ._source import BufferSource, ByteSource
 
 _EMPTY_EVENTS = EventArray.empty()
 
+#: Zip local file header: signature ... name length, extra length (30 bytes).
+_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
 #: Column name -> on-disk dtype (matches EventArray's column dtypes).
 _COLUMNS = (("t", np.dtype(np.int64)), ("x", np.dtype(np.uint16)),
             ("y", np.dtype(np.uint16)), ("p", np.dtype(np.uint8)))
@@ -78,6 +87,10 @@ class EventDecoder_Npz(EventDecoder):
     be iterated. Accepts either the four column members ``t/x/y/p`` or a
     single structured ``events`` member.
 
+    If every event member is stored (not deflated) and the archive is a plain
+    file or an in-memory buffer, the members are memory-mapped instead and
+    chunks are read-only views of the file.
+
     Parameters
     ----------
     source
@@ -88,7 +101,7 @@ class EventDecoder_Npz(EventDecoder):
 
     """
 
-    #: read_chunk returns fresh, independent arrays bounded by n_events_hint, so
+    #: read_chunk returns fresh (or read-only mapped) arrays bounded by n_events_hint, so
     #: EventReader can hand them out directly (skipping the staging accumulator).
     _independent_windows = True
 
@@ -103,6 +116,10 @@ class EventDecoder_Npz(EventDecoder):
         self._aos_dtype: np.dtype | None = None  # set when reading an 'events' member
         self._n = 0
         self._pos = 0
+        # Member name -> (dtype, data offset within the member), from the npy headers.
+        self._layout: dict[str, tuple[np.dtype, int]] = {}
+        # Member name -> zero-copy view of all its data, when every member is stored.
+        self._mapped: dict[str, np.ndarray] = {}
 
     def _open_streams(self) -> None:
         """(Re)open the member streams and position them past the npy headers."""
@@ -110,6 +127,7 @@ class EventDecoder_Npz(EventDecoder):
         for fp in self._streams.values():
             fp.close()
         self._streams = {}
+        self._layout = {}
 
         names = set(self._zf.namelist())
         if {"t.npy", "x.npy", "y.npy", "p.npy"} <= names:
@@ -124,6 +142,7 @@ class EventDecoder_Npz(EventDecoder):
                 elif shape[0] != n:
                     raise ValueError("event columns have mismatched lengths")
                 self._streams[name] = fp
+                self._layout[name] = (dtype, fp.tell())
             self._n = n or 0
             self._aos_dtype = None
         elif "events.npy" in names:
@@ -132,6 +151,7 @@ class EventDecoder_Npz(EventDecoder):
             if dtype.names is None or not {"t", "x", "y", "p"} <= set(dtype.names):
                 raise ValueError("'events' member must be a structured array with t/x/y/p fields")
             self._streams["events"] = fp
+            self._layout["events"] = (dtype, fp.tell())
             self._aos_dtype = dtype
             self._n = shape[0]
         else:
@@ -155,11 +175,53 @@ class EventDecoder_Npz(EventDecoder):
                     setattr(self, attr, int(npy_format.read_array(fp).item()))
 
         self._open_streams()
+        self._mapped = self._map_members()
+        if self._mapped:
+            for fp in self._streams.values():
+                fp.close()
+            self._streams = {}
         self._pos = 0
         self._is_initialized = True
 
+    def _map_members(self) -> dict[str, np.ndarray]:
+        """Zero-copy views of the event members, or ``{}`` to stream them.
+
+        Plain files get numpy's own map, so views outlive the reader and never
+        pin the source's mmap; in-memory sources are viewed directly.
+        """
+        assert self._zf is not None
+        path = self._raw_path
+        if path is not None and not is_compressed_path(path):
+            buf = np.memmap(path, dtype=np.uint8, mode="r")
+        elif isinstance(self._source, BufferSource):
+            buf = np.frombuffer(self._source.buffer(), dtype=np.uint8)
+        else:
+            return {}
+        mapped = {}
+        for name, (dtype, data_offset) in self._layout.items():
+            info = self._zf.getinfo(f"{name}.npy")
+            if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1 or dtype.hasobject:
+                return {}  # deflated / encrypted: stream the archive
+            local = buf[info.header_offset:info.header_offset + _LOCAL_HEADER.size].tobytes()
+            if len(local) < _LOCAL_HEADER.size:
+                return {}
+            magic, name_len, extra_len = _LOCAL_HEADER.unpack(local)
+            if magic != b"PK\x03\x04":
+                return {}
+            start = info.header_offset + _LOCAL_HEADER.size + name_len + extra_len + data_offset
+            nbytes = self._n * dtype.itemsize
+            if start + nbytes > len(buf):
+                return {}
+            mapped[name] = buf[start:start + nbytes].view(dtype)
+        return mapped
+
     def _read_n(self, n: int) -> EventArray:
-        """Stream the next ``n`` events out of the member streams."""
+        """Read the next ``n`` events: views of the mapped members, else streamed."""
+        if self._mapped:
+            lo, hi = self._pos, self._pos + n
+            if self._aos_dtype is not None:
+                return EventArray.from_aos(self._mapped["events"][lo:hi])
+            return EventArray(*(self._mapped[name][lo:hi] for name, _ in _COLUMNS))
         if self._aos_dtype is not None:
             fp = self._streams["events"]
             buf = _read_exact(fp, n * self._aos_dtype.itemsize)
@@ -197,6 +259,8 @@ class EventDecoder_Npz(EventDecoder):
     def _load_all_t(self) -> np.ndarray:
         """Read the full timestamp column once (for a time->index search)."""
         assert self._zf is not None
+        if self._mapped:
+            return self._mapped["events"]["t"] if self._aos_dtype is not None else self._mapped["t"]
         if self._aos_dtype is not None:
             with self._zf.open("events.npy") as fp:
                 return npy_format.read_array(fp)["t"]
@@ -208,6 +272,8 @@ class EventDecoder_Npz(EventDecoder):
         assert self._zf is not None
         if idx >= self._n:
             return None
+        if self._mapped:
+            return int(self._load_all_t()[idx])
         if self._aos_dtype is not None:
             with self._zf.open("events.npy") as fp:
                 _read_npy_header(fp)
@@ -232,6 +298,10 @@ class EventDecoder_Npz(EventDecoder):
 
     def _seek_to_index(self, idx: int) -> None:
         """Reposition every member stream so the next read starts at ``idx``."""
+        self._pos = idx
+        self._eof = idx >= self._n
+        if self._mapped:
+            return
         self._open_streams()  # streams sit at their first data byte (headers consumed)
         for name, fp in self._streams.items():
             skip_bytes = idx * self._itemsize(name)
@@ -240,8 +310,6 @@ class EventDecoder_Npz(EventDecoder):
                 if not chunk:
                     break
                 skip_bytes -= len(chunk)
-        self._pos = idx
-        self._eof = idx >= self._n
 
     def seek(self, t: int | None = None, n: int | None = None) -> tuple["SeekResult", "EventArray", "TriggerArray | None"]:
         from .common import SeekResult
@@ -266,7 +334,7 @@ class EventDecoder_Npz(EventDecoder):
 
     def reset(self) -> None:
         """Reset the reader to the beginning of the archive."""
-        if self._is_initialized:
+        if self._is_initialized and not self._mapped:
             self._open_streams()
         self._pos = 0
         self._eof = False
@@ -280,6 +348,7 @@ class EventDecoder_Npz(EventDecoder):
         for fp in self._streams.values():
             fp.close()
         self._streams = {}
+        self._mapped = {}
         if self._zf is not None:
             self._zf.close()
             self._zf = None
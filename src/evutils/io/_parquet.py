@@ -0,0 +1,350 @@
+"""Parquet and Arrow IPC (Feather v2) decoders and encoders.
+
+Both formats store the four event columns ``t`` (int64), ``x`` / ``y``
+(uint16) and ``p`` (uint8) under those names, with ``width`` / ``height`` in
+the schema metadata. Events are written in timestamp order and in *groups* --
+Parquet row groups, IPC record batches -- of ``group_size`` rows, and every
+group knows the time range it covers:
+
+* Parquet keeps per-row-group min/max column statistics in its footer, so a
+  time seek or a time-range :meth:`~_ColumnarDecoder.read` decodes only the
+  row groups that overlap (predicate pushdown).
+* Arrow IPC files are read through the (memory-mapped) source buffer without
+  decoding at all. The writer records ``group_size`` in the schema metadata,
+  so opening a file reads only its last record batch (IPC batches may be
+  compressed); a group's last timestamp is looked up when a time seek first
+  bisects over it.
+
+Columns are handed to :class:`~evutils.types.EventArray` zero-copy wherever the
+Arrow buffers allow it (a single chunk without nulls of the canonical dtype).
+Chunks are read-only views of the decoded group (for IPC, of the file).
+
+``pyarrow`` is imported lazily on first use; :mod:`evutils.io.decoders` only
+registers these backends when it is installed.
+"""
+from __future__ import annotations
+
+import io
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from ..types import EventArray
+from ._columnar import _COLUMNS, DEFAULT_GROUP_SIZE, _ColumnarDecoder, _ColumnarEncoder
+from ._compression import is_compressed_path
+from ._source import ByteSource
+
+def _pa() -> Any:
+    """Import ``pyarrow`` (deferred so ``import evutils.io`` does not pay for it)."""
+    import pyarrow
+    return pyarrow
+
+def _schema(width: int, height: int, group_size: int | None = None) -> Any:
+    pa = _pa()
+    metadata = {"width": str(width), "height": str(height)}
+    if group_size is not None:
+        metadata["group_size"] = str(group_size)
+    return pa.schema([(name, pa.from_numpy_dtype(dtype)) for name, dtype in _COLUMNS],
+                     metadata=metadata)
+
+def _to_numpy(col: Any) -> np.ndarray:
+    """An Arrow (chunked) array as numpy, zero-copy when the buffers allow it."""
+    if hasattr(col, "num_chunks"):
+        col = col.chunk(0) if col.num_chunks == 1 else col.combine_chunks()
+    return col.to_numpy(zero_copy_only=False)
+
+class _SourceFile(io.RawIOBase):
+    """A seekable :class:`ByteSource` as the raw file object pyarrow expects."""
+
+    def __init__(self, source: ByteSource) -> None:
+        self._src = source
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._src.read(size)
+
+    def readinto(self, b: Any) -> int:
+        data = self._src.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        return self._src.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self._src.tell()
+
+class _ArrowEmitter(ABC):
+    """Write each group of a :class:`_ColumnarEncoder` as one record batch."""
+
+    _width: int
+    _height: int
+
+    def _emit(self, events: EventArray) -> None:
+        pa = _pa()
+        batch = pa.record_batch(
+            [pa.array(np.ascontiguousarray(getattr(events, name), dtype=dtype))
+             for name, dtype in _COLUMNS],
+            schema=_schema(self._width, self._height))
+        self._write_batch(batch)
+
+    @abstractmethod
+    def _write_batch(self, batch: Any) -> None:
+        """Append one record batch to the output."""
+        raise NotImplementedError
+
+def _arrow_input(source: ByteSource, path: str | None) -> Any:
+    """A pyarrow random-access file over ``source``.
+
+    A plain file is memory-mapped by pyarrow itself: its buffers are
+    reference-counted, so zero-copy columns may outlive the reader without
+    pinning the source's own mmap (which would then fail to close). Other
+    mappable sources are wrapped zero-copy, other seekable ones go through
+    Python file calls, and a stream is slurped into memory.
+    """
+    pa = _pa()
+    if path is not None and source.mappable() and not is_compressed_path(path):
+        return pa.memory_map(path)
+    if source.mappable():
+        return pa.BufferReader(pa.py_buffer(source.buffer()))
+    if source.seekable():
+        return pa.PythonFile(_SourceFile(source), mode="r")
+    return pa.BufferReader(pa.py_buffer(source.read(-1)))
+
+class EventDecoder_Parquet(_ColumnarDecoder):
+    """Decode events from a Parquet file.
+
+    Row groups are decoded one at a time as the cursor reaches them. Time
+    seeks and :meth:`read` use the footer's per-row-group ``t`` min/max
+    statistics to skip every row group outside the requested range; files
+    written without statistics fall back to reading each group's ``t`` column
+    once at open.
+
+    Parameters
+    ----------
+    source
+        Byte source to read from.
+    chunk_size
+        Number of events returned per :meth:`read_chunk` call.
+
+    """
+
+    def __init__(self, source: ByteSource, chunk_size: int = 1_000_000):
+        super().__init__(source, chunk_size)
+        self._pf: Any = None
+
+    def init(self) -> None:
+        """Open the file and collect the row-group time statistics."""
+        if self._is_initialized:
+            return
+        import pyarrow.parquet as pq
+
+        self._pf = pq.ParquetFile(_arrow_input(self._source, self._raw_path))
+        names = self._pf.schema_arrow.names
+        missing = [name for name, _ in _COLUMNS if name not in names]
+        if missing:
+            raise ValueError(f"Parquet file lacks event column(s) {missing}; found {names}")
+        meta = self._pf.metadata
+        t_col = names.index("t")
+        rows, t_min, t_max = [], [], []
+        for i in range(meta.num_row_groups):
+            rg = meta.row_group(i)
+            rows.append(rg.num_rows)
+            stats = rg.column(t_col).statistics
+            if stats is not None and stats.has_min_max:
+                t_min.append(int(stats.min))
+                t_max.append(int(stats.max))
+            elif rg.num_rows:
+                ts = self._load_group(i, ("t",))["t"]
+                t_min.append(int(ts.min()))
+                t_max.append(int(ts.max()))
+            else:
+                t_min.append(0)
+                t_max.append(0)
+        self._set_groups(rows, t_min, t_max)
+        self._read_geometry(self._pf.schema_arrow.metadata)
+        self._pos = 0
+        self._is_initialized = True
+
+    def _load_group(self, i: int, columns: tuple[str, ...] = ("t", "x", "y", "p")) -> dict[str, np.ndarray]:
+        table = self._pf.read_row_group(i, columns=list(columns))
+        return {name: _to_numpy(table.column(name)) for name in columns}
+
+    def close(self) -> None:
+        super().close()
+        if self._pf is not None:
+            self._pf.close()
+            self._pf = None
+
+class EventDecoder_Arrow(_ColumnarDecoder):
+    """Decode events from an Arrow IPC file (Feather v2).
+
+    Record batches are read straight out of the source buffer -- for a file
+    path, the memory map -- so no event data is copied or decoded. Time seeks
+    bisect over the batches, looking up the last timestamp of each batch they
+    probe. Compressed IPC files decompress batch by batch instead.
+
+    Parameters
+    ----------
+    source
+        Byte source to read from.
+    chunk_size
+        Number of events returned per :meth:`read_chunk` call.
+
+    """
+
+    def __init__(self, source: ByteSource, chunk_size: int = 1_000_000):
+        super().__init__(source, chunk_size)
+        self._ipc: Any = None
+        self._last_t: dict[int, int] = {}
+
+    def init(self) -> None:
+        """Open the IPC file and index its record batches."""
+        if self._is_initialized:
+            return
+        import pyarrow.ipc
+
+        self._ipc = pyarrow.ipc.open_file(_arrow_input(self._source, self._raw_path))
+        names = self._ipc.schema.names
+        missing = [name for name, _ in _COLUMNS if name not in names]
+        if missing:
+            raise ValueError(f"Arrow file lacks event column(s) {missing}; found {names}")
+        n_batches = self._ipc.num_record_batches
+        metadata = self._ipc.schema.metadata or {}
+        rows: list[int] = []
+        if n_batches and b"group_size" in metadata:
+            # Every batch but the last holds group_size rows; the footer's row
+            # count confirms it without touching (decompressing) the batches.
+            group_size = int(metadata[b"group_size"])
+            rows = [group_size] * (n_batches - 1) + [self._ipc.get_batch(n_batches - 1).num_rows]
+            if sum(rows) != self._ipc.count_rows():
+                rows = []
+        if not rows:
+            # Foreign file with irregular batches: size each one.
+            rows = [self._ipc.get_batch(i).num_rows for i in range(n_batches)]
+        self._set_groups(rows, [], [])
+        self._last_t = {}
+        self._read_geometry(self._ipc.schema.metadata)
+        self._pos = 0
+        self._is_initialized = True
+
+    def _load_group(self, i: int, columns: tuple[str, ...] = ("t", "x", "y", "p")) -> dict[str, np.ndarray]:
+        batch = self._ipc.get_batch(i)
+        return {name: _to_numpy(batch.column(name)) for name in columns}
+
+    def _group_for_time(self, t: int) -> int:
+        # Bisect over the batches' last timestamps, remembering each probe; only
+        # the probed batches are read (for compressed files, decompressed).
+        lo, hi = 0, len(self._starts) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if mid not in self._last_t:
+                batch = self._ipc.get_batch(mid)
+                last = batch.column("t")[-1].as_py() if batch.num_rows else np.iinfo(np.int64).min
+                self._last_t[mid] = int(last)
+            if self._last_t[mid] < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def close(self) -> None:
+        super().close()
+        self._ipc = None
+
+class EventEncoder_Parquet(_ArrowEmitter, _ColumnarEncoder):
+    """Encode events into a Parquet file, one row group per ``group_size`` events.
+
+    Column statistics are written for every row group, which is what lets
+    :class:`EventDecoder_Parquet` skip row groups on time seeks and reads.
+
+    Parameters
+    ----------
+    writable
+        Destination stream to write to.
+    width, height : int
+        Frame geometry stored in the schema metadata.
+    dt : datetime, optional
+        Unused; Parquet stores no recording timestamp.
+    group_size : int
+        Events per row group.
+    compression : str
+        Parquet column codec (``"zstd"``, ``"snappy"``, ``"none"``, ...).
+
+    """
+
+    def __init__(self, writable: io.BufferedIOBase, width: int = 1280, height: int = 720,
+                 dt: datetime | None = None, group_size: int = DEFAULT_GROUP_SIZE,
+                 compression: str = "zstd"):
+        super().__init__(writable, width, height, dt, group_size)
+        self._compression = compression
+        self._writer: Any = None
+
+    def init(self) -> None:
+        """Open the Parquet writer (the header is written with the first group)."""
+        if self._is_initialized:
+            return
+        import pyarrow.parquet as pq
+        self._writer = pq.ParquetWriter(self._fd, _schema(self._width, self._height),
+                                        compression=self._compression, write_statistics=["t"])
+        self._is_initialized = True
+
+    def _write_batch(self, batch: Any) -> None:
+        self._writer.write_batch(batch, row_group_size=batch.num_rows)
+
+    def _finish(self) -> None:
+        self._writer.close()
+        self._writer = None
+
+class EventEncoder_Arrow(_ArrowEmitter, _ColumnarEncoder):
+    """Encode events into an Arrow IPC file (Feather v2), one record batch per
+    ``group_size`` events.
+
+    Uncompressed by default so :class:`EventDecoder_Arrow` can read the
+    batches zero-copy from a memory map.
+
+    Parameters
+    ----------
+    writable
+        Destination stream to write to.
+    width, height : int
+        Frame geometry stored in the schema metadata.
+    dt : datetime, optional
+        Unused; Arrow IPC stores no recording timestamp.
+    group_size : int
+        Events per record batch.
+    compression : str, optional
+        IPC buffer codec (``"zstd"`` or ``"lz4"``); disables zero-copy reads.
+
+    """
+
+    def __init__(self, writable: io.BufferedIOBase, width: int = 1280, height: int = 720,
+                 dt: datetime | None = None, group_size: int = DEFAULT_GROUP_SIZE,
+                 compression: str | None = None):
+        super().__init__(writable, width, height, dt, group_size)
+        self._compression = compression
+        self._writer: Any = None
+
+    def init(self) -> None:
+        """Write the IPC file header and schema."""
+        if self._is_initialized:
+            return
+        import pyarrow.ipc
+        options = pyarrow.ipc.IpcWriteOptions(compression=self._compression)
+        self._writer = pyarrow.ipc.new_file(
+            self._fd, _schema(self._width, self._height, self._group_size), options=options)
+        self._is_initialized = True
+
+    def _write_batch(self, batch: Any) -> None:
+        self._writer.write_batch(batch)
+
+    def _finish(self) -> None:
+        self._writer.close()
+        self._writer = None
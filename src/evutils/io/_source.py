@@ -25,7 +25,9 @@ import mmap
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from ._compression import is_compressed_path, open_compressed
+import numpy as np
+
+from ._compression import _zstd_frame_codec, is_compressed_path, open_compressed, read_zstd_seek_table
 
 class ByteSource(ABC):
     """Abstract raw-byte input. Knows nothing about events."""
@@ -202,6 +204,210 @@ class StreamSource(ByteSource):
         if self._owns:
             self._s.close()
 
+#: Decompress-ahead ring of :class:`DecompressAheadSource`: ``_AHEAD_DEPTH``
+#: reusable blocks of ``_AHEAD_BLOCK`` bytes, each preceded by
+#: ``BLOCK_HEADROOM`` bytes a consumer can carry an unparsed tail into.
+_AHEAD_BLOCK = 4 << 20
+_AHEAD_DEPTH = 4
+BLOCK_HEADROOM = 1 << 16
+#: Reads at least this large (or read_block) start the background thread;
+#: smaller random-access reads (zip / HDF5 metadata) go straight through.
+_AHEAD_MIN_READ = 1 << 20
+
+class DecompressAheadSource(StreamSource):
+    """A compressed file (``.gz`` / ``.zst`` / ``.xz`` / ``.bz2``) whose
+    decompression runs ahead on a background thread.
+
+    Sequential reads are served from a ring of reusable blocks the thread
+    fills while the caller parses the previous ones, so decoding a compressed
+    recording costs max(decompress, parse) rather than their sum (the stdlib
+    and zstd codecs release the GIL). :meth:`read_block` hands out a block
+    zero-copy. Seeks stop the thread and go to the underlying stream;
+    :meth:`reset` reopens the file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        path = Path(path)
+        super().__init__(open_compressed(path, "rb"), name=path.name, owns=True)
+        self._path = path
+        self._slots: list[bytearray] = []
+        self._thread = None
+        self._stop_event = None
+        self._free = None
+        self._filled = None
+        self._cur: tuple[bytearray, int] | None = None  # (slot, data bytes)
+        self._cur_pos = 0      # bytes of the current block already handed out
+        self._ahead_eof = False
+        self._pos = 0          # logical position (bytes handed out)
+
+    # -- background thread ------------------------------------------------- #
+    @staticmethod
+    def _run(stream, free, filled, stop) -> None:
+        try:
+            while True:
+                slot = free.get()
+                if slot is None or stop.is_set():
+                    return
+                view = memoryview(slot)[BLOCK_HEADROOM:]
+                n = 0
+                while n < len(view):
+                    k = stream.readinto(view[n:])
+                    if not k:
+                        break
+                    n += k
+                short = n < len(view)
+                view.release()
+                filled.put((slot, n))
+                if short:
+                    filled.put(None)  # end of stream
+                    return
+        except BaseException as exc:  # re-raised in the consumer
+            filled.put(exc)
+
+    def _start(self) -> None:
+        if self._thread is not None or self._ahead_eof:
+            return
+        import queue
+        import threading
+        if not self._slots:
+            self._slots = [bytearray(BLOCK_HEADROOM + _AHEAD_BLOCK) for _ in range(_AHEAD_DEPTH)]
+        self._free, self._filled = queue.Queue(), queue.Queue()
+        for slot in self._slots:
+            self._free.put(slot)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._s, self._free, self._filled, self._stop_event),
+            name="evutils-decompress", daemon=True)
+        self._thread.start()
+
+    def _stop(self) -> None:
+        """Stop the thread and drop the ring contents (the underlying stream
+        is left wherever the thread got to)."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._free.put(None)
+            self._thread.join()
+            self._thread = None
+        self._cur = None
+        self._cur_pos = 0
+        self._ahead_eof = False
+
+    def _advance(self) -> bool:
+        """Make the next filled block current (recycling the current one);
+        False at the end of the stream."""
+        if self._cur is not None:
+            self._free.put(self._cur[0])
+            self._cur = None
+        if self._ahead_eof:
+            return False
+        item = self._filled.get()
+        if isinstance(item, BaseException):
+            self._ahead_eof = True
+            raise item
+        if item is None:
+            self._ahead_eof = True
+            return False
+        self._cur = item
+        self._cur_pos = 0
+        return True
+
+    def _available(self) -> int:
+        return self._cur[1] - self._cur_pos if self._cur is not None else 0
+
+    # -- ByteSource --------------------------------------------------------- #
+    def read_block(self, prefix: "bytes | memoryview" = b"") -> memoryview:
+        """The next decompressed block as a zero-copy view into the ring, valid
+        until the next read / seek on this source.
+
+        ``prefix`` (at most ``BLOCK_HEADROOM`` bytes, typically the unparsed
+        tail of the previous block) is copied into the headroom right in front
+        of the block, so the view covers ``prefix + block`` contiguously.
+        Returns just a copy of ``prefix`` at the end of the stream.
+        """
+        if len(prefix) > BLOCK_HEADROOM:
+            raise ValueError(f"prefix longer than BLOCK_HEADROOM ({BLOCK_HEADROOM} bytes)")
+        carry = bytes(prefix)  # may alias the block recycled below
+        self._start()
+        if self._thread is None or (not self._available() and not self._advance()):
+            return memoryview(carry)
+        assert self._cur is not None
+        slot, n = self._cur
+        lo = BLOCK_HEADROOM + self._cur_pos
+        slot[lo - len(carry):lo] = carry
+        self._pos += n - self._cur_pos
+        self._cur_pos = n
+        return memoryview(slot)[lo - len(carry):BLOCK_HEADROOM + n]
+
+    def read(self, size: int = -1) -> bytes:
+        if self._thread is None and (size < 0 or size < _AHEAD_MIN_READ):
+            out = bytes(self._s.read(size))
+            self._pos += len(out)
+            return out
+        self._start()
+        buf = bytearray()
+        while size < 0 or len(buf) < size:
+            if not self._available() and not self._advance():
+                break
+            assert self._cur is not None
+            take = self._available() if size < 0 else min(self._available(), size - len(buf))
+            lo = BLOCK_HEADROOM + self._cur_pos
+            buf += memoryview(self._cur[0])[lo:lo + take]
+            self._cur_pos += take
+        self._pos += len(buf)
+        return bytes(buf) if size >= 0 else buf  # type: ignore[return-value]
+
+    def readline(self) -> bytes:
+        if self._thread is None:
+            line = super().readline()
+            self._pos += len(line)
+            return line
+        out = bytearray()
+        while self._available() or self._advance():
+            assert self._cur is not None
+            slot, lo = self._cur[0], BLOCK_HEADROOM + self._cur_pos
+            hi = lo + self._available()
+            nl = slot.find(b"\n", lo, hi)
+            take = (nl + 1 if nl >= 0 else hi) - lo
+            out += memoryview(slot)[lo:lo + take]
+            self._cur_pos += take
+            if nl >= 0:
+                break
+        self._pos += len(out)
+        return bytes(out)
+
+    def peek(self, size: int) -> bytes:
+        if self._thread is None:
+            return super().peek(size)
+        if not self._available() and not self._advance():
+            return b""
+        assert self._cur is not None
+        lo = BLOCK_HEADROOM + self._cur_pos
+        return bytes(self._cur[0][lo:lo + min(size, self._available())])
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos, whence = self._pos + pos, io.SEEK_SET
+        if whence == io.SEEK_SET and pos == self._pos:
+            return self._pos
+        self._stop()
+        self._pos = int(self._s.seek(pos, whence))
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def reset(self) -> None:
+        """Restart from the beginning by reopening the file (no backwards
+        seek through the compressed stream)."""
+        self._stop()
+        self._s.close()
+        self._s = open_compressed(self._path, "rb")
+        self._pos = 0
+
+    def close(self) -> None:
+        self._stop()
+        super().close()
+
 class BufferSource(ByteSource):
     """Zero-copy source over an in-memory buffer (bytes / bytearray / memoryview
     / ``BytesIO.getbuffer()``).
@@ -287,7 +493,113 @@ class MmapSource(ByteSource):
         self._mm.close()
         self._f.close()
 
-def make_source(inp: "Path | str | bytes | io.BufferedIOBase", *, mmap_files: bool = True) -> ByteSource:
+class SeekableZstdSource(ByteSource):
+    """Random-access source over a seekable ``.zst`` file (independent frames
+    plus a seek table, see :mod:`evutils.io._compression`).
+
+    A read decompresses only the frames it covers; the last frame is cached
+    for sequential small reads. Reads spanning several frames decompress them
+    on up to ``workers`` threads (the zstd backends release the GIL). Not
+    mappable: a decoder that needs the whole payload gets it from ``read(-1)``.
+    """
+
+    def __init__(self, path: str | Path, table: "tuple[np.ndarray, np.ndarray]", workers: int = 1) -> None:
+        self._decompress = _zstd_frame_codec()[1]
+        path = Path(path)
+        self._f = open(path, "rb")
+        self.name = path.name
+        comp, decomp = table
+        self._comp_size = comp
+        self._decomp_size = decomp
+        self._comp_start = np.concatenate(([0], np.cumsum(comp)))
+        self._start = np.concatenate(([0], np.cumsum(decomp)))  # decompressed offsets
+        self._length = int(self._start[-1])
+        self._workers = max(1, int(workers))
+        self._pool = None
+        self._cached: tuple[int, bytes] | None = None  # (frame, decompressed bytes)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _frame(self, i: int) -> bytes:
+        if self._cached is None or self._cached[0] != i:
+            self._f.seek(int(self._comp_start[i]))
+            self._cached = (i, self._decompress(self._f.read(int(self._comp_size[i])), int(self._decomp_size[i])))
+        return self._cached[1]
+
+    def _frames(self, first: int, last: int) -> list[bytes]:
+        """Decompressed frames ``first..last`` (inclusive); the compressed
+        bytes are read in one call, the frames decompressed in parallel."""
+        if first == last or self._workers == 1:
+            return [self._frame(i) for i in range(first, last + 1)]
+        lo = int(self._comp_start[first])
+        self._f.seek(lo)
+        raw = memoryview(self._f.read(int(self._comp_start[last + 1]) - lo))
+        bounds = self._comp_start[first:last + 2] - lo
+        jobs = [(raw[int(bounds[k]):int(bounds[k + 1])], int(self._decomp_size[first + k]))
+                for k in range(last - first + 1)]
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="evutils-zstd")
+        out = list(self._pool.map(lambda job: self._decompress(*job), jobs))
+        self._cached = (last, out[-1])
+        return out
+
+    def _read_at(self, pos: int, size: int) -> bytes:
+        end = min(pos + size, self._length)
+        if end <= pos:
+            return b""
+        first = int(np.searchsorted(self._start, pos, side="right")) - 1
+        last = int(np.searchsorted(self._start, end, side="left")) - 1
+        frames = self._frames(first, last)
+        if first == last:
+            lo = pos - int(self._start[first])
+            return frames[0][lo:lo + end - pos]
+        head = memoryview(frames[0])[pos - int(self._start[first]):]
+        tail = memoryview(frames[-1])[:end - int(self._start[last])]
+        return b"".join([head, *frames[1:-1], tail])
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = self._length - self._pos
+        out = self._read_at(self._pos, size)
+        self._pos += len(out)
+        return out
+
+    def readline(self) -> bytes:
+        out = bytearray()
+        while self._pos < self._length:
+            chunk = self._read_at(self._pos, 65536)
+            nl = chunk.find(b"\n")
+            take = nl + 1 if nl >= 0 else len(chunk)
+            out += chunk[:take]
+            self._pos += take
+            if nl >= 0:
+                break
+        return bytes(out)
+
+    def peek(self, size: int) -> bytes:
+        return self._read_at(self._pos, size)
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        self._pos = _clamp_seek(pos, whence, self._pos, self._length)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._cached = None
+        self._f.close()
+
+def make_source(inp: "Path | str | bytes | io.BufferedIOBase", *, mmap_files: bool = True, workers: int = 1) -> ByteSource:
     """Normalise ``inp`` into a :class:`ByteSource`.
 
     Accepts a path (str/Path), an in-memory buffer (bytes/bytearray/memoryview),
@@ -296,6 +608,8 @@ def make_source(inp: "Path | str | bytes | io.BufferedIOBase", *, mmap_files: bo
 
     Regular files are memory-mapped by default (zero-copy); set
     ``mmap_files=False`` or fall back automatically for empty/unmappable files.
+    A ``.zst`` file in the zstd seekable format opens as a random-access
+    :class:`SeekableZstdSource` that decompresses on up to ``workers`` threads.
     """
     if isinstance(inp, ByteSource):
         return inp
@@ -303,11 +617,17 @@ def make_source(inp: "Path | str | bytes | io.BufferedIOBase", *, mmap_files: bo
         p = Path(inp)
         if not p.is_file():
             raise FileNotFoundError(f"File {p} does not exist")
+        if p.suffix.lower() == ".zst":
+            with open(p, "rb") as f:
+                table = read_zstd_seek_table(f)
+            if table is not None:
+                return SeekableZstdSource(p, table, workers=workers)
         if is_compressed_path(p):
-            # A compressed file cannot be mmap'd; wrap the decompressing stream.
-            # Keep the full name (incl. the compression suffix) so format
-            # detection can strip it back to the inner extension.
-            return StreamSource(open_compressed(p, "rb"), name=p.name, owns=True)
+            # A compressed file cannot be mmap'd; wrap the decompressing stream
+            # (decompressed ahead on a background thread). It keeps the full
+            # name (incl. the compression suffix) so format detection can strip
+            # it back to the inner extension.
+            return DecompressAheadSource(p)
         if mmap_files and p.stat().st_size > 0:
             try:
                 return MmapSource(p)
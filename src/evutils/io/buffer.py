@@ -174,16 +174,20 @@ class EventAccumulator():
             t.p[e_tr:e_tr + n_tr] = triggers.p
             t.c.size = e_tr + n_tr
 
-    def slice_copy(self, k: int, tr_k: int = 0) -> tuple[EventArray, TriggerArray]:
+    def slice_copy(self, k: int, tr_k: int = 0,
+                   into: EventSoABuffers | None = None) -> tuple[EventArray, TriggerArray]:
         """Return an independent copy of the first ``k`` unconsumed events and
         advance past them.
-        
+
         Parameters
         ----------
         k : int
             The number of unconsumed events to slice and copy.
         tr_k : int, optional
             The number of unconsumed triggers to slice and copy.
+        into : EventSoABuffers, optional
+            Copy the events into the front of this (caller-owned) buffer instead
+            of a fresh array; it must hold at least ``k`` events.
 
         Returns
         -------
@@ -193,9 +197,17 @@ class EventAccumulator():
         """
         s = self._buf
         i = self._start
-        out = EventArray(
-            s.t[i:i + k].view(np.int64), s.x[i:i + k], s.y[i:i + k], s.p[i:i + k]
-        ).copy()
+        if into is None:
+            out = EventArray(
+                s.t[i:i + k].view(np.int64), s.x[i:i + k], s.y[i:i + k], s.p[i:i + k]
+            ).copy()
+        else:
+            into.t[:k] = s.t[i:i + k]
+            into.x[:k] = s.x[i:i + k]
+            into.y[:k] = s.y[i:i + k]
+            into.p[:k] = s.p[i:i + k]
+            into.c.size = k
+            out = EventArray(into.t[:k].view(np.int64), into.x[:k], into.y[:k], into.p[:k])
         self._start += k
 
         t = self._tr
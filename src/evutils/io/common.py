@@ -81,9 +81,32 @@ class EventDecoder(ABC):
     _has_delta_t_parser = False
 
     #: Seek-index wiring, injected by EventReader from its ``index=`` option.
-    #: Only EVT consults them; harmless defaults for every other decoder.
+    #: Only EVT (and CSV, for its line index) consult them; harmless defaults
+    #: for every other decoder.
     _use_sidecar = False
     _raw_path: "str | None" = None
+    #: evutils' own persisted index sidecar: load a valid one when present,
+    #: write one after a full build, and an optional cache directory for it.
+    _load_index = False
+    _save_index = False
+    _index_dir: "str | None" = None
+
+    #: Thread count for read_all(), injected by EventReader from its
+    #: ``decode_workers=`` option. EVT and (memory-mapped) CSV split their
+    #: payload across threads and AEDAT 4.0 decompresses packets ahead on them;
+    #: every other decoder decodes serially.
+    _decode_workers = 1
+
+    #: ROI / stride / polarity selection (an ``EventFilterSpec``), injected by
+    #: EventReader from its ``roi=`` / ``polarity=`` / ``stride=`` options.
+    _event_filter: "Any" = None
+
+    @property
+    def _native_filter(self) -> bool:
+        """The decoder applies ``_event_filter`` inside its native parser, so
+        dropped events never reach the output. Otherwise the EventReader masks
+        each decoded chunk itself."""
+        return False
 
     def __init__(self, source: "io.BufferedIOBase | str | bytes", chunk_size: int = 10000, read_external_triggers: bool = False):
         """Initialize the decoder.
@@ -214,6 +237,11 @@ class EventDecoder(ABC):
             
         return res_ev
 
+    def _native_event_filter(self) -> "Any":
+        """``_event_filter`` as a ctypes ``event_filter_t`` for a native parser,
+        or ``None`` (keep every event)."""
+        return self._event_filter.to_native() if self._event_filter is not None else None
+
     def close(self) -> None:
         """Release any resources held by the decoder (e.g. buffer views).
 
@@ -277,6 +305,18 @@ class EventDecoder(ABC):
         """
         self._chunk_size = chunk_size
 
+    def count_events(self) -> int | None:
+        """Get the total number of events in the file, if the decoder can tell
+        without reading them out.
+
+        Returns
+        -------
+        int | None
+            The number of events in the file, or None if it is not known
+
+        """
+        return None
+
     def shape(self) -> tuple[int|None, int|None]:
         """Get the shape of the frame (width, height).
 
@@ -6,6 +6,7 @@ CSV, h5py for HDF5) are not registered; asking for them raises an
 ``ImportError`` that names the extra to install.
 """
 
+import importlib.util
 from pathlib import Path
 from typing import Type, cast
 
@@ -47,9 +48,24 @@ except ImportError:
         "reading HDF5 event files requires h5py/hdf5plugin: install `evutils[hdf5]`"
     )
 
+# pyarrow is imported by the backend on first use, not here: it is heavy.
+if importlib.util.find_spec("pyarrow") is not None:
+    from ._parquet import EventDecoder_Arrow, EventDecoder_Parquet
+    _READER_MAPPING[".parquet"] = EventDecoder_Parquet
+    _READER_MAPPING[".arrow"] = EventDecoder_Arrow
+    _READER_MAPPING[".feather"] = EventDecoder_Arrow
+    _READER_MAPPING[".ipc"] = EventDecoder_Arrow
+else:
+    _UNAVAILABLE[".parquet"] = _UNAVAILABLE[".arrow"] = _UNAVAILABLE[".feather"] = _UNAVAILABLE[".ipc"] = (
+        "reading Parquet / Arrow IPC event files requires pyarrow: install `evutils[arrow]`"
+    )
+
 from ._npz import EventDecoder_Npz
 _READER_MAPPING[".npz"] = EventDecoder_Npz
 
+from ._evu import EventDecoder_Evu
+_READER_MAPPING[".evu"] = EventDecoder_Evu
+
 from ._evt import EventDecoder_EVT
 _READER_MAPPING[".raw"] = EventDecoder_EVT
 _READER_MAPPING[".evt"] = EventDecoder_EVT
@@ -140,12 +156,32 @@ def _sniff_aedat(head: bytes) -> bool:
     """
     return head.startswith(b"#!AER-DAT")
 
+def _sniff_evu(head: bytes) -> bool:
+    """EVU: the file opens with the ``\\x8bEVU`` magic."""
+    return head.startswith(b"\x8bEVU")
+
+def _sniff_bin(head: bytes) -> bool:
+    """BIN columnar dump: the file opens with the ``\\x8bEVB`` magic."""
+    return head.startswith(b"\x8bEVB")
+
+def _sniff_parquet(head: bytes) -> bool:
+    """Parquet: the file opens with the ``PAR1`` magic."""
+    return head.startswith(b"PAR1")
+
+def _sniff_arrow(head: bytes) -> bool:
+    """Arrow IPC file (Feather v2): the file opens with the ``ARROW1`` magic."""
+    return head.startswith(b"ARROW1")
+
 _SNIFFERS = [
     (_sniff_dat, "EventDecoder_Dat"),
     (_sniff_evt, "EventDecoder_EVT"),
     (_sniff_aedat, "EventDecoder_Aedat"),
+    (_sniff_evu, "EventDecoder_Evu"),
+    (_sniff_bin, "EventDecoder_Bin"),
     (_sniff_prophesee, "EventDecoder_EVT"),  # generic "% "-headed fallback
 ]
+if ".parquet" in _READER_MAPPING:
+    _SNIFFERS += [(_sniff_parquet, "EventDecoder_Parquet"), (_sniff_arrow, "EventDecoder_Arrow")]
 
 def resolve_decoder_cls(source: "io.BufferedIOBase | str | bytes") -> Type[EventDecoder]:
     """Determine the decoder class for a :class:`ByteSource`.
@@ -188,4 +224,4 @@ def resolve_decoder_cls(source: "io.BufferedIOBase | str | bytes") -> Type[Event
         f"({name!r}) and no known magic bytes. Pass an explicit decoder."
     )
 
-__all__ = ["EventDecoder", 'EventDecoder_Aedat', 'EventDecoder_Bin', 'EventDecoder_Csv', 'EventDecoder_Dat', 'EventDecoder_HDF5', 'EventDecoder_Npz', 'EventDecoder_EVT', 'EventDecoder_AER', 'get_reader_from_filename', 'resolve_decoder_cls']
+__all__ = ["EventDecoder", 'EventDecoder_Aedat', 'EventDecoder_Bin', 'EventDecoder_Csv', 'EventDecoder_Dat', 'EventDecoder_HDF5', 'EventDecoder_Npz', 'EventDecoder_Evu', 'EventDecoder_Parquet', 'EventDecoder_Arrow', 'EventDecoder_EVT', 'EventDecoder_AER', 'get_reader_from_filename', 'resolve_decoder_cls']
@@ -6,6 +6,7 @@ for HDF5) are not registered; asking for them raises an ``ImportError`` that
 names the extra to install.
 """
 
+import importlib.util
 from pathlib import Path
 from typing import Type
 
@@ -47,9 +48,24 @@ except ImportError:
         "writing HDF5 event files requires h5py/hdf5plugin: install `evutils[hdf5]`"
     )
 
+# pyarrow is imported by the backend on first use, not here: it is heavy.
+if importlib.util.find_spec("pyarrow") is not None:
+    from ._parquet import EventEncoder_Arrow, EventEncoder_Parquet
+    _WRITER_MAPPING[".parquet"] = EventEncoder_Parquet
+    _WRITER_MAPPING[".arrow"] = EventEncoder_Arrow
+    _WRITER_MAPPING[".feather"] = EventEncoder_Arrow
+    _WRITER_MAPPING[".ipc"] = EventEncoder_Arrow
+else:
+    _UNAVAILABLE[".parquet"] = _UNAVAILABLE[".arrow"] = _UNAVAILABLE[".feather"] = _UNAVAILABLE[".ipc"] = (
+        "writing Parquet / Arrow IPC event files requires pyarrow: install `evutils[arrow]`"
+    )
+
 from ._npz import EventEncoder_Npz
 _WRITER_MAPPING[".npz"] = EventEncoder_Npz
 
+from ._evu import EventEncoder_Evu
+_WRITER_MAPPING[".evu"] = EventEncoder_Evu
+
 from ._evt import EventEncoder_EVT
 
 def _evt_encoder_for(fmt: str) -> Type[EventEncoder]:
@@ -98,4 +114,4 @@ def get_file_writer(file: Path) -> Type[EventEncoder]:
         f"{sorted(_WRITER_MAPPING.keys() | _UNAVAILABLE.keys())}"
     )
 
-__all__ = ["EventEncoder", "EventEncoder_Aedat", "EventEncoder_Bin", "EventEncoder_Csv", "EventEncoder_Dat", "EventEncoder_HDF5", "EventEncoder_Npz", "EventEncoder_EVT", "EventEncoder_AER", "get_file_writer"]
+__all__ = ["EventEncoder", "EventEncoder_Aedat", "EventEncoder_Bin", "EventEncoder_Csv", "EventEncoder_Dat", "EventEncoder_HDF5", "EventEncoder_Npz", "EventEncoder_Evu", "EventEncoder_Parquet", "EventEncoder_Arrow", "EventEncoder_EVT", "EventEncoder_AER", "get_file_writer"]
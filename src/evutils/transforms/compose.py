@@ -1,6 +1,7 @@
 import numpy as np
 from typing import Iterable, Callable, Union
 from evutils.types import SoaArray
+from .functional._common import absolute_time
 
 def unwrap_events(events: Union[np.ndarray, SoaArray]):
     """Unwraps events into a tuple of (t, x, y, p) arrays."""
@@ -68,6 +69,8 @@ class Compose:
                 break
                 
             if step_type == "jit":
+                if any(getattr(transform, "_absolute_time", False) for transform in block):
+                    events = absolute_time(events)
                 t, x, y, p = unwrap_events(events)
                 for transform in block:
                     # Let the transform fall back to the container's sensor_size.
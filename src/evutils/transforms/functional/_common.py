@@ -27,6 +27,15 @@ def apply_kernel(events: "EventArray", kernel: Callable[..., "EventArray"], *arg
     t, x, y, p = kernel(t, x, y, p, *args)
     return repack_events(events, t, x, y, p)
 
+def absolute_time(events: "EventArray") -> "EventArray":
+    """Expand compact (``uint32`` offset) timestamps to absolute ``int64``.
+
+    For kernels that rewrite ``t`` itself (skew, jitter, normalize), whose
+    result depends on the timestamp origin; other containers pass through.
+    """
+    expand = getattr(events, "expand", None)
+    return expand() if expand is not None else events
+
 def sample_range(value: "tuple[float, float] | list[float] | float") -> float:
     """Return ``value``, or a uniform sample in ``[lo, hi)`` if it is a 2-tuple.
 
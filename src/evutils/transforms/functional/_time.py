@@ -2,7 +2,7 @@
 import numpy as np
 from evutils.jit import lazy_njit
 
-from ._common import apply_kernel
+from ._common import absolute_time, apply_kernel
 
 @lazy_njit
 def _time_skew_jit(t, x, y, p, coefficient: float, offset: float):
@@ -27,7 +27,7 @@ def time_skew(events, coefficient, offset=0.0):
     np.ndarray or EventArray
         Events with rewritten timestamps, in their original container type.
     """
-    return apply_kernel(events, _time_skew_jit, float(coefficient), float(offset))
+    return apply_kernel(absolute_time(events), _time_skew_jit, float(coefficient), float(offset))
 
 @lazy_njit
 def _time_jitter_jit(t, x, y, p, std: float, clip_negative: bool,
@@ -65,7 +65,7 @@ def time_jitter(events, std=1.0, clip_negative=True, sort_timestamps=False):
     np.ndarray or EventArray
         Jittered events, in their original container type.
     """
-    return apply_kernel(events, _time_jitter_jit, float(std),
+    return apply_kernel(absolute_time(events), _time_jitter_jit, float(std),
                         bool(clip_negative), bool(sort_timestamps))
 
 @lazy_njit
@@ -106,4 +106,4 @@ def normalize_ts(events, start_ts=0):
     >>> normalize_ts(events)['t']
     array([  0, 100, 200])
     """
-    return apply_kernel(events, _normalize_ts_jit, int(start_ts))
+    return apply_kernel(absolute_time(events), _normalize_ts_jit, int(start_ts))
@@ -5,7 +5,7 @@ import numpy as np
 
 from evutils.types import SoaArray
 
-from .functional._common import sample_range
+from .functional._common import absolute_time, sample_range
 
 class Transform:
     """Base class for all evutils transforms.
@@ -17,6 +17,9 @@ class Transform:
     #: as a fallback when a transform was constructed without an explicit one.
     #: See :meth:`bind_context`.
     _ctx_sensor_size = None
+    #: True for transforms that rewrite timestamps: compact (``uint32`` offset)
+    #: events are expanded to absolute ``int64`` time before ``_forward_jit``.
+    _absolute_time = False
 
     def bind_context(self, events):
         """Capture per-call context (currently ``sensor_size``) from ``events``.
@@ -49,6 +52,8 @@ class Transform:
                 return events, target
             return events
 
+        if self._absolute_time:
+            events = absolute_time(events)
         self.bind_context(events)
         t, x, y, p = unwrap_events(events)
         t, x, y, p = self._forward_jit(t, x, y, p)
@@ -204,6 +209,8 @@ class TimeSkew(Transform):
     offset : float or tuple of float, optional
         Added after multiplication. Default ``0``.
     """
+    _absolute_time = True
+
     def __init__(self, coefficient: Union[float, tuple],
                  offset: Union[float, tuple] = 0):
         self.coefficient = coefficient
@@ -232,6 +239,8 @@ class TimeNormalize(Transform):
     start_ts : int, optional
         Timestamp assigned to the earliest event. Default ``0``.
     """
+    _absolute_time = True
+
     def __init__(self, start_ts: int = 0):
         self.start_ts = start_ts
 
@@ -254,6 +263,8 @@ class TimeJitter(Transform):
     sort_timestamps : bool, optional
         Re-sort by timestamp after jittering. Default ``False``.
     """
+    _absolute_time = True
+
     def __init__(self, std: float, clip_negative: bool = True,
                  sort_timestamps: bool = False):
         self.std = std
@@ -5,10 +5,13 @@ Defines the structured NumPy dtypes used throughout evutils — ``Events``
 together with small helpers for checking event arrays.
 """
 
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 import numpy as np
 
+if TYPE_CHECKING:
+    import pyarrow
+
 __all__ = ['Event_dtype', 'Trigger_dtype', 'EventArray', 'TriggerArray', 'DataBatch', 'is_monotonically_increasing', 'EventsChecker']
 
 from dataclasses import dataclass
@@ -69,6 +72,12 @@ class SoaArray:
     _aos_dtype: np.dtype
     _fields: tuple[str, ...]
 
+    def __init__(self, metadata: 'dict | None' = None, **columns: np.ndarray) -> None:
+        """Store ``columns`` as-is; subclasses validate and convert them."""
+        for f, col in columns.items():
+            setattr(self, f, col)
+        self._metadata = metadata
+
     @property
     def metadata(self) -> 'dict | None':
         """Optional lightweight, per-array metadata (e.g. ``sensor_size``).
@@ -115,13 +124,9 @@ class SoaArray:
                 __slots__ = fields
                 _aos_dtype = np.dtype([(f, self._aos_dtype[f]) for f in fields])
                 _fields = fields
-                def __init__(self, **kwargs):
-                    for k, v in kwargs.items():
-                        setattr(self, k, v)
-            subset = DynamicSoaArray(**{f: getattr(self, f) for f in fields})
             # x/y are preserved, so a sensor size stays valid on the subset.
-            subset.metadata = self.metadata.copy() if self.metadata is not None else None
-            return subset
+            return DynamicSoaArray(**{f: getattr(self, f) for f in fields},
+                                   metadata=self.metadata.copy() if self.metadata is not None else None)
 
         # When indexing a single element, return a NumPy void record to match AoS behaviour exactly.
         if isinstance(key, (int, np.integer)):
@@ -132,8 +137,7 @@ class SoaArray:
 
         # Otherwise, slice all columns and return a new SoA array
         sliced_args = {f: getattr(self, f)[key] for f in self._fields}
-        sliced = self.__class__(**sliced_args)
-        sliced.metadata = self.metadata.copy() if self.metadata is not None else None
+        sliced = self.__class__(**sliced_args, metadata=self.metadata.copy() if self.metadata is not None else None)
         return sliced
 
     def __len__(self) -> int:
@@ -157,27 +161,21 @@ class SoaArray:
     def copy(self: _S) -> _S:
         """Return a deep copy with independent column arrays."""
         copied_args = {f: getattr(self, f).copy() for f in self._fields}
-        new = self.__class__(**copied_args)
         # Shallow-copy the metadata dict so mutating one array's metadata does
         # not leak into the copy.
-        new.metadata = None if self.metadata is None else dict(self.metadata)
-        return new
+        return self.__class__(**copied_args, metadata=None if self.metadata is None else dict(self.metadata))
 
     @classmethod
     def empty(cls: 'type[_S]', metadata: 'dict | None' = None) -> _S:
         """Return an empty SoA array with correctly-typed (zero-length) columns."""
         args = {f: np.empty(0, dtype=cls._aos_dtype[f]) for f in cls._fields}
-        new = cls(**args)
-        new.metadata = metadata
-        return new
+        return cls(**args, metadata=metadata)
 
     @classmethod
     def from_aos(cls: 'type[_S]', aos_array: np.ndarray, metadata: 'dict | None' = None) -> _S:
         """Constructs a SoA array from an array of structures (AoS) numpy array."""
         args = {f: np.ascontiguousarray(aos_array[f]) for f in cls._fields}
-        new = cls(**args)
-        new.metadata = metadata
-        return new
+        return cls(**args, metadata=metadata)
 
     def to_aos(self) -> np.ndarray:
         """Converts the SoA array to an array of structures (AoS) numpy array."""
@@ -197,6 +195,77 @@ class SoaArray:
             return aos.astype(dtype)
         return aos
 
+    def to_arrow(self) -> "pyarrow.RecordBatch":
+        """Return the columns as a ``pyarrow.RecordBatch`` without copying.
+
+        Each contiguous column becomes the buffer of one Arrow field. The
+        batch's schema metadata holds ``width`` / ``height`` from
+        :attr:`sensor_size` and ``t_base`` for compact arrays when they are
+        set. Requires ``pyarrow``.
+        """
+        import pyarrow as pa
+        meta = {}
+        if self.sensor_size is not None:
+            meta["width"], meta["height"] = (str(int(v)) for v in self.sensor_size)
+        m = self.metadata
+        if m and 't_base' in m:
+            meta["t_base"] = str(int(m['t_base']))
+        return pa.RecordBatch.from_arrays([pa.array(getattr(self, f)) for f in self._fields],
+                                          names=list(self._fields), metadata=meta or None)
+
+    def __arrow_c_schema__(self) -> object:
+        """Arrow PyCapsule interface: the schema of :meth:`to_arrow`."""
+        return self.to_arrow().schema.__arrow_c_schema__()
+
+    def __arrow_c_array__(self, requested_schema: object | None = None) -> tuple[object, object]:
+        """Arrow PyCapsule interface: export as one struct array, zero-copy.
+
+        Lets Arrow consumers (``pyarrow``, ``polars``, ``duckdb``, ...) take the
+        array directly, e.g. ``pyarrow.record_batch(events)``.
+        """
+        return self.to_arrow().__arrow_c_array__(requested_schema)
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        """Arrow PyCapsule interface: export as a one-batch stream, zero-copy.
+
+        E.g. ``polars.DataFrame(events)`` or ``duckdb.sql("... FROM events")``.
+        """
+        import pyarrow as pa
+        batch = self.to_arrow()
+        return pa.RecordBatchReader.from_batches(batch.schema, [batch]).__arrow_c_stream__(requested_schema)
+
+    def to_dlpack(self, max_version: "tuple[int, int] | None" = None) -> "dict[str, object]":
+        """Export every column as a DLPack capsule, keyed by field name.
+
+        The capsules share memory with the columns, so e.g.
+        ``torch.from_dlpack(events.to_dlpack()['x'])`` copies nothing.
+        Strided columns are made contiguous first, which copies them.
+        Read-only columns are copied too, unless ``max_version >= (1, 0)``:
+        only DLPack 1.0 can flag a tensor as read-only. Each column array also
+        has its own ``__dlpack__``, so a writable column can go straight to
+        ``from_dlpack``.
+
+        Parameters
+        ----------
+        max_version : tuple of int, optional
+            Highest DLPack version the consumer understands (numpy >= 2.1).
+
+        Returns
+        -------
+        dict of str to PyCapsule
+            One capsule per column.
+
+        """
+        legacy = max_version is None or tuple(max_version) < (1, 0)
+        kwargs = {} if max_version is None else {"max_version": tuple(max_version)}
+        out = {}
+        for f in self._fields:
+            col = getattr(self, f)
+            if not col.flags.c_contiguous or (legacy and not col.flags.writeable):
+                col = col.copy()
+            out[f] = col.__dlpack__(**kwargs)
+        return out
+
 class EventArray(SoaArray):
     """A container for storing event data in a struct-of-arrays (SoA) layout.
 
@@ -227,6 +296,20 @@ class EventArray(SoaArray):
     [(100, 10, 30, 1) (150, 20, 40, 0)]
     >>> events[0]  # doctest: +SKIP
     np.void((100, 10, 30, 1), dtype=[('t', '<i8'), ('x', '<u2'), ('y', '<u2'), ('p', 'u1')])
+
+    **Compact timestamps.** ``t`` may instead be ``uint32`` offsets from
+    ``metadata['t_base']`` (see :meth:`compact`), which cuts a window's memory
+    by a third. Everything that only compares or subtracts timestamps (slicing,
+    masking, the dense representations, the spatial transforms) works on the
+    offsets directly; :meth:`expand` restores absolute ``int64`` timestamps.
+    The compact form is opt-in: a ``uint32`` ``t`` passed without a
+    ``t_base`` in ``metadata`` is taken as absolute and stored as ``int64``.
+
+    >>> small = EventArray(t=[1_000_000_100, 1_000_000_150], x=[10, 20], y=[30, 40], p=[1, 0]).compact()
+    >>> small.t, small.t_base
+    (array([ 0, 50], dtype=uint32), 1000000100)
+    >>> small.expand().t
+    array([1000000100, 1000000150])
     """
 
     __slots__ = ['t', 'x', 'y', 'p']
@@ -234,7 +317,12 @@ class EventArray(SoaArray):
     _fields = ('t', 'x', 'y', 'p')
 
     def __init__(self, t: "np.typing.ArrayLike", x: "np.typing.ArrayLike", y: "np.typing.ArrayLike", p: "np.typing.ArrayLike", metadata: 'dict | None' = None) -> None:
-        t_arr = np.atleast_1d(np.asarray(t, dtype=np.int64))
+        t_arr = np.asarray(t)
+        # The compact (uint32 offset) form is opt-in: it is kept only together
+        # with its ``metadata['t_base']``. Anything else -- a plain uint32
+        # column included -- becomes absolute int64.
+        compact = t_arr.dtype == np.uint32 and metadata is not None and 't_base' in metadata
+        t_arr = np.atleast_1d(t_arr if compact else np.asarray(t_arr, dtype=np.int64))
         x_arr = np.atleast_1d(np.asarray(x, dtype=np.uint16))
         y_arr = np.atleast_1d(np.asarray(y, dtype=np.uint16))
         p_arr = np.atleast_1d(np.asarray(p, dtype=np.uint8))
@@ -251,6 +339,66 @@ class EventArray(SoaArray):
         self.p = p_arr
         self.metadata = metadata
 
+    @property
+    def t_base(self) -> int:
+        """Origin of the timestamps: ``metadata['t_base']``, or 0 when unset.
+        Absolute timestamps are ``t_base + t``."""
+        m = self.metadata
+        return int(m.get('t_base', 0)) if m else 0
+
+    @property
+    def is_compact(self) -> bool:
+        """True when ``t`` holds ``uint32`` offsets from :attr:`t_base`."""
+        return self.t.dtype == np.uint32
+
+    def compact(self, t_base: 'int | None' = None) -> 'EventArray':
+        """Return the events with ``uint32`` timestamps relative to ``t_base``.
+
+        Parameters
+        ----------
+        t_base : int, optional
+            Timestamp origin, by default the earliest timestamp.
+
+        Raises
+        ------
+        ValueError
+            If a timestamp lies before ``t_base`` or more than ``2**32 - 1`` us
+            (~71 minutes) after it.
+        """
+        if self.is_compact and t_base is None:
+            return self
+        t = self.t if not self.is_compact else self.t.astype(np.int64)
+        base_now = self.t_base
+        if t_base is None:
+            t_base = base_now + (int(t.min()) if len(t) else 0)
+        shift = int(t_base) - base_now
+        if len(t) and (int(t.min()) < shift or int(t.max()) - shift > 0xFFFFFFFF):
+            raise ValueError("Timestamps do not fit into uint32 offsets from t_base "
+                             "(a compact array spans at most 2**32 - 1 us)")
+        t_rel = np.empty(len(t), dtype=np.uint32)
+        np.subtract(t, shift, out=t_rel, casting='unsafe')
+        metadata = dict(self.metadata) if self.metadata else {}
+        metadata['t_base'] = int(t_base)
+        return EventArray(t_rel, self.x, self.y, self.p, metadata=metadata)
+
+    def expand(self) -> 'EventArray':
+        """Return the events with absolute ``int64`` timestamps (the inverse of
+        :meth:`compact`); returns ``self`` when there is nothing to expand."""
+        base = self.t_base
+        if not self.is_compact and base == 0:
+            return self
+        t = self.t.astype(np.int64)
+        if base:
+            t += base
+        metadata = dict(self.metadata) if self.metadata else {}
+        metadata.pop('t_base', None)
+        return EventArray(t, self.x, self.y, self.p, metadata=metadata or None)
+
+    def to_aos(self) -> np.ndarray:
+        """Converts the SoA array to an array of structures (AoS) numpy array,
+        with absolute timestamps."""
+        return SoaArray.to_aos(self.expand())
+
 class TriggerArray(SoaArray):
     """A container for storing trigger data in a struct-of-arrays (SoA) layout.
 
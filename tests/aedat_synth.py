@@ -132,19 +132,68 @@ _V4_INFO_XML = (
 )
 
 
-def make_aedat4(t: Any, x: Any, y: Any, p: Any, events_per_packet: int=5, compression: int=0, info: bytes=_V4_INFO_XML) -> bytes:
+def _fb_data_table(entries: list) -> bytes:
+    """Hand-built size-prefixed FileDataTable FlatBuffer (identifier FTAB).
+
+    ``entries`` are ``(byte_offset, stream_id, size, n_elements, ts_start,
+    ts_end)`` tuples; every FileDataDefinition table shares one vtable.
+    """
+    n = len(entries)
+    # Layout:
+    #  0: u32 size prefix   12: root vtable [6, 8, 4]   20: root table
+    #  4: u32 root offset   18: padding                 28: vector (n offsets)
+    #  8: 'FTAB'
+    vec = 28
+    vtable = vec + 4 + 4 * n
+    first = vtable + 16                            # 14-byte vtable + 2 pad
+    buf = bytearray()
+    buf += struct.pack("<I", 0)                    # size prefix (patched below)
+    buf += struct.pack("<I", 16)                   # root table offset, relative to pos 4
+    buf += b"FTAB"
+    buf += struct.pack("<HHH", 6, 8, 4)            # root vtable: field0 @4
+    buf += b"\x00\x00"
+    buf += struct.pack("<i", 8)                    # soffset: table(20) - vtable(12)
+    buf += struct.pack("<I", vec - 24)             # field0: vector offset rel to pos 24
+    buf += struct.pack("<I", n)
+    for i in range(n):
+        slot = vec + 4 + 4 * i
+        buf += struct.pack("<I", first + 48 * i - slot)
+    # FileDataDefinition: soffset, pad, ByteOffset @8, PacketInfo @16,
+    # NumElements @24, TimestampStart @32, TimestampEnd @40.
+    buf += struct.pack("<HHHHHHH", 14, 48, 8, 16, 24, 32, 40) + b"\x00\x00"
+    for i, (offset, stream_id, size, count, ts0, ts1) in enumerate(entries):
+        table = first + 48 * i
+        buf += struct.pack("<iI", table - vtable, 0)
+        buf += struct.pack("<qiiqqq", offset, stream_id, size, count, ts0, ts1)
+    struct.pack_into("<I", buf, 0, len(buf) - 4)
+    return bytes(buf)
+
+
+def make_aedat4(t: Any, x: Any, y: Any, p: Any, events_per_packet: int=5, compression: int=0, info: bytes=_V4_INFO_XML,
+                data_table: bool=False) -> bytes:
     """AEDAT 4.0: version line + IOHeader FlatBuffer + (StreamID, Size)-framed
-    EventPacket FlatBuffers."""
-    io_header = _fb_io_header(compression, -1, info)
+    EventPacket FlatBuffers [+ a trailing FileDataTable whose ByteOffsets
+    point at the packet bodies, as dv-processing writes them]."""
+    def compress(body: bytes) -> bytes:
+        if compression in (1, 2):
+            import lz4.frame
+            return lz4.frame.compress(body)
+        return body
+
+    header_size = len(_fb_io_header(compression, -1, info))
     out = bytearray(b"#!AER-DAT4.0\r\n")
-    out += struct.pack("<I", len(io_header)) + io_header
+    out += struct.pack("<I", header_size) + bytes(header_size)
+    entries = []
     for i in range(0, len(t), events_per_packet):
         s = slice(i, i + events_per_packet)
-        body = _fb_event_packet(t[s], x[s], y[s], p[s])
-        if compression in (1, 2):
-            import lz4.frame
-            body = lz4.frame.compress(body)
+        body = compress(_fb_event_packet(t[s], x[s], y[s], p[s]))
+        entries.append((len(out) + 8, 0, len(body), len(t[s]), int(t[s][0]), int(t[s][-1])))
         out += struct.pack("<ii", 0, len(body)) + body
+    table_pos = -1
+    if data_table:
+        table_pos = len(out)
+        out += compress(_fb_data_table(entries))
+    out[18:18 + header_size] = _fb_io_header(compression, table_pos, info)
     return bytes(out)
 
 
@@ -184,3 +184,227 @@ def test_aedat4_encoder_roundtrip(tmp_path: Any) -> None:
         assert np.array_equal(out.y, events.y)
         assert np.array_equal(out.p, events.p)
 
+
+
+@pytest.mark.parametrize("compression", [0, 1, 3])
+def test_aedat4_native_chunks_split_packets(tmp_path: Any, compression: int) -> None:
+    """Packets larger than the decoder's chunk resume mid-packet; compressed
+    bodies come from the decompression pool in stream order."""
+    if compression == 1:
+        pytest.importorskip("lz4")
+    if compression == 3:
+        pytest.importorskip("zstandard")
+    from evutils.io import EventWriter
+    from evutils.types import EventArray
+    t, x, y, p = random_events(20_000, 640, 480, seed=10)
+    f = tmp_path / "v4_big.aedat4"
+    with EventWriter(f, format="aedat", compression=compression) as w:
+        for s in range(0, len(t), 3_000):
+            w.write(EventArray(t[s:s + 3_000], x[s:s + 3_000].astype(np.uint16),
+                               y[s:s + 3_000].astype(np.uint16), p[s:s + 3_000].astype(np.uint8)))
+    with EventReader(f, chunk_size=1_000, decode_workers=3) as r:
+        check(r.read_all(), t, x, y, p)
+    with EventReader(f, n_events=777, chunk_size=1_000) as r:
+        chunks = list(r)
+        assert np.array_equal(np.concatenate([c.t for c in chunks]), t)
+        r.reset()
+        check(r.read_all(), t, x, y, p)
+
+
+def test_aedat4_native_filter_and_triggers(tmp_path: Any) -> None:
+    from evutils.io import EventWriter
+    from evutils.types import EventArray, TriggerArray
+    t, x, y, p = random_events(2_000, 640, 480, seed=11)
+    events = EventArray(t, x.astype(np.uint16), y.astype(np.uint16), p.astype(np.uint8))
+    triggers = TriggerArray(np.array([5, 50_000], dtype=np.int64), np.array([1, 0], dtype=np.uint8),
+                            np.zeros(2, dtype=np.uint8))
+    f = tmp_path / "v4_trig.aedat4"
+    with EventWriter(f, format="aedat") as w:
+        w.write(events[:1_000], triggers)
+        w.write(events[1_000:])
+    with EventReader(f, polarity=1) as r:
+        out = r.read_all()
+        assert np.array_equal(out.x, x[p == 1])
+    with EventReader(f, ext_trigger=True) as r:
+        ev, tr = r.read_all()
+        assert len(ev) == 2_000
+        assert np.array_equal(tr.t, triggers.t) and np.array_equal(tr.p, triggers.p)
+
+
+def test_aedat4_truncated_packet_raises(tmp_path: Any) -> None:
+    import struct
+    t, x, y, p = random_events(100, 640, 480, seed=12)
+    data = bytearray(make_aedat4(t, x, y, p, events_per_packet=100))
+    # Cut the single packet short: its event vector no longer fits the body.
+    hdr = 18 + struct.unpack_from("<I", data, 14)[0]
+    size = struct.unpack_from("<i", data, hdr + 4)[0]
+    struct.pack_into("<i", data, hdr + 4, size - 32)
+    f = tmp_path / "v4_truncated.aedat4"
+    f.write_bytes(bytes(data[:-32]))
+    with pytest.raises(ValueError):
+        with EventReader(f) as r:
+            r.read_all()
+
+
+def test_aedat4_skips_unrequested_streams(tmp_path: Any) -> None:
+    """Packets of streams the reader does not return are dropped by their
+    header: a corrupt frame packet is never decompressed."""
+    import struct
+    pytest.importorskip("lz4")
+    t, x, y, p = random_events(300, 640, 480, seed=13)
+    info = (b'<dv version="2.0"><node name="outInfo" path="/outInfo/">'
+            b'<node name="0" path="/outInfo/0/"><attr key="typeIdentifier" type="string">EVTS</attr>'
+            b'<node name="info" path="/outInfo/0/info/"><attr key="sizeX" type="int">640</attr>'
+            b'<attr key="sizeY" type="int">480</attr></node></node>'
+            b'<node name="2" path="/outInfo/2/"><attr key="typeIdentifier" type="string">FRME</attr>'
+            b'</node></node></dv>')
+    data = make_aedat4(t, x, y, p, events_per_packet=100, compression=1, info=info)
+    hdr = 18 + struct.unpack_from("<I", data, 14)[0]
+    junk = b"\xff" * 64
+    data = data[:hdr] + struct.pack("<ii", 2, len(junk)) + junk + data[hdr:] + struct.pack("<ii", 2, len(junk)) + junk
+    f = tmp_path / "v4_frames.aedat4"
+    f.write_bytes(data)
+    with EventReader(f) as r:
+        check(r.read_all(), t, x, y, p)
+
+
+def test_aedat4_skips_triggers_unless_requested(tmp_path: Any) -> None:
+    import struct
+    pytest.importorskip("lz4")
+    from evutils.io import EventWriter
+    from evutils.types import EventArray, TriggerArray
+    t, x, y, p = random_events(500, 640, 480, seed=14)
+    events = EventArray(t, x.astype(np.uint16), y.astype(np.uint16), p.astype(np.uint8))
+    triggers = TriggerArray(np.array([7], dtype=np.int64), np.array([1], dtype=np.uint8), np.zeros(1, dtype=np.uint8))
+    f = tmp_path / "v4_trig_lz4.aedat4"
+    with EventWriter(f, format="aedat", compression=1) as w:
+        w.write(events, triggers)
+    data = bytearray(f.read_bytes())
+    # Corrupt the trigger packet (stream 1, after the event packet).
+    off = 18 + struct.unpack_from("<I", data, 14)[0]
+    off += 8 + struct.unpack_from("<i", data, off + 4)[0]
+    assert struct.unpack_from("<i", data, off)[0] == 1
+    size = struct.unpack_from("<i", data, off + 4)[0]
+    data[off + 8:off + 8 + size] = b"\xff" * size
+    f.write_bytes(bytes(data))
+    with EventReader(f) as r:
+        check(r.read_all(), t, x, y, p)
+    with pytest.raises(Exception):
+        with EventReader(f, ext_trigger=True) as r:
+            r.read_all()
+
+
+@pytest.mark.parametrize("compression", [0, 1])
+@pytest.mark.parametrize("data_table", [False, True])
+def test_aedat4_seek(tmp_path: Any, compression: int, data_table: bool) -> None:
+    if compression:
+        pytest.importorskip("lz4")
+    t, x, y, p = random_events(5_000, 640, 480, seed=15)
+    f = tmp_path / "v4_seek.aedat4"
+    f.write_bytes(make_aedat4(t, x, y, p, events_per_packet=300, compression=compression, data_table=data_table))
+    with EventReader(f) as r:
+        for target in (int(t[2_345]) + 1, int(t[0]) - 10, int(t[299]), int(t[-1])):
+            k = int(np.searchsorted(t, target))
+            assert r.seek(t=target) == t[k]
+            out = r.read_all()
+            check(out, t[k:], x[k:], y[k:], p[k:])
+        for n in (0, 299, 300, 4_321, 4_999):
+            assert r.seek(n=n) == t[n]
+            check(r.read_all(), t[n:], x[n:], y[n:], p[n:])
+        r.seek(t=int(t[-1]) + 1)
+        assert len(r.read_all()) == 0
+    with EventReader(f, n_events=1_000) as r:
+        r.seek(n=1_500)
+        first = next(iter(r))
+        check(first, t[1_500:2_500], x[1_500:2_500], y[1_500:2_500], p[1_500:2_500])
+    with EventReader(f, polarity=1) as r:
+        k = 3_210
+        r.seek(t=int(t[k]))
+        m = p[k:] == 1
+        check(r.read_all(), t[k:][m], x[k:][m], y[k:][m], p[k:][m])
+
+
+@pytest.mark.parametrize("data_table", [False, True])
+def test_aedat4_seek_tie_across_packets(tmp_path: Any, data_table: bool) -> None:
+    """A timestamp shared by the end of one packet and the start of the next:
+    the seek lands on its first occurrence."""
+    t = np.array([90, 100, 100, 100, 100, 110, 120, 130, 140, 150])
+    x, y, p = np.arange(10), np.arange(10), np.arange(10) % 2
+    f = tmp_path / "v4_tie.aedat4"
+    f.write_bytes(make_aedat4(t, x, y, p, events_per_packet=3, data_table=data_table))
+    with EventReader(f) as r:
+        assert r.seek(t=100) == 100
+        check(r.read_all(), t[1:], x[1:], y[1:], p[1:])
+
+
+@pytest.mark.parametrize("compression", [0, 1])
+def test_aedat4_data_table_index_matches_scan(tmp_path: Any, compression: int) -> None:
+    from evutils.io._aedat import EventDecoder_Aedat
+    from evutils.io._source import make_source
+    if compression:
+        pytest.importorskip("lz4")
+    t, x, y, p = random_events(2_000, 640, 480, seed=16)
+    f = tmp_path / "v4_table.aedat4"
+    f.write_bytes(make_aedat4(t, x, y, p, events_per_packet=250, compression=compression, data_table=True))
+    with make_source(f) as src:
+        dec = EventDecoder_Aedat(src)
+        dec.init()
+        table = dec._v4_table_packets()
+        assert table is not None and table == dec._v4_scan_packets()
+        dec.close()
+
+
+@pytest.mark.parametrize("version", [1, 2, 3])
+def test_aedat_legacy_seek(tmp_path: Any, version: int) -> None:
+    """Exact seek on 1.0/2.0 (checkpointed records, across 32-bit timestamp
+    wraps and skipped APS words) and 3.1 (packet index)."""
+    n = 150_000 if version < 3 else 5_000
+    rng = np.random.default_rng(17)
+    t = np.cumsum(rng.integers(0, 200_000, n)).astype(np.int64)
+    x, y, p = rng.integers(0, 128, n), rng.integers(0, 128, n), rng.integers(0, 2, n)
+    f = tmp_path / f"v{version}_seek.aedat"
+    if version == 1:
+        f.write_bytes(make_aedat1(t & 0xFFFFFFFF, x, y, p))
+    elif version == 2:
+        f.write_bytes(make_aedat2(t & 0xFFFFFFFF, x, y, p, aps_every=7))
+    else:
+        t = t & 0x7FFFFFFF
+        t.sort()
+        f.write_bytes(make_aedat3(t, x, y, p, events_per_packet=64))
+    with EventReader(f) as r:
+        expected = r.read_all()
+        if version < 3:
+            assert int(expected.t[-1]) > 2 * (1 << 32)
+        for target in (int(expected.t[n // 3]) + 1, int(expected.t[0]) - 1, int(expected.t[-1]), int(expected.t[9 * n // 10])):
+            k = int(np.searchsorted(expected.t, target))
+            assert r.seek(t=target) == expected.t[k]
+            check(r.read_all(), expected.t[k:], expected.x[k:], expected.y[k:], expected.p[k:])
+        for m in (0, 65_535 % n, n - 1, n // 2 + 3):
+            assert r.seek(n=m) == expected.t[m]
+            check(r.read_all(), expected.t[m:], expected.x[m:], expected.y[m:], expected.p[m:])
+        r.seek(n=n)
+        assert len(r.read_all()) == 0
+
+
+@pytest.mark.parametrize("version", [1, 2, 3])
+def test_aedat_legacy_seek_tie_at_boundary(tmp_path: Any, version: int) -> None:
+    """Tied timestamps straddling a 1.0/2.0 checkpoint or a 3.1 packet
+    boundary: the seek lands on the first of them."""
+    if version < 3:
+        n, lo, hi = 70_000, 65_530, 65_540  # checkpoints every 65536 records
+    else:
+        n, lo, hi = 10, 1, 5  # 3-event packets
+    t = np.arange(n, dtype=np.int64)
+    t[lo:hi] = lo
+    rng = np.random.default_rng(18)
+    x, y, p = rng.integers(0, 128, n), rng.integers(0, 128, n), rng.integers(0, 2, n)
+    f = tmp_path / f"v{version}_tie.aedat"
+    if version == 1:
+        f.write_bytes(make_aedat1(t, x, y, p))
+    elif version == 2:
+        f.write_bytes(make_aedat2(t, x, y, p))
+    else:
+        f.write_bytes(make_aedat3(t, x, y, p, events_per_packet=3))
+    with EventReader(f) as r:
+        assert r.seek(t=lo) == lo
+        check(r.read_all(), t[lo:], x[lo:], y[lo:], p[lo:])
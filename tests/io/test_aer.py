@@ -110,3 +110,33 @@ def test_AER_truncated_payload(tmp_path: Any) -> None:
     p.write_bytes(b"\x01\x02\x03") # 3 bytes, AER is 4 bytes
     with EventReader(p) as r:
         assert len(r.read()) == 0
+
+
+def test_AER_seek(tmp_path: Any) -> None:
+    """Index seek is record arithmetic; time seek inverts the timestamp
+    generator (or bisects a custom array)."""
+    from evutils.io import EventReader
+
+    p, ev = _write_aer(tmp_path)
+    with EventReader(p, timestamps="sequential", t_start=100, t_step=5) as r:
+        assert r.seek(n=400) == 100 + 5 * 400
+        out = r.read_all()
+        assert np.array_equal(out["x"], ev["x"][400:])
+        assert np.array_equal(out["t"], 100 + 5 * np.arange(400, 1000))
+        assert r.seek(t=1_003) == 1_005
+        assert np.array_equal(r.read_all()["t"], 100 + 5 * np.arange(181, 1000))
+
+    custom = np.sort(np.random.randint(0, 10**9, 1000))
+    with EventReader(p, timestamps=custom, n_events=100) as r:
+        target = int(custom[567]) - 1 if custom[566] < custom[567] - 1 else int(custom[567])
+        k = int(np.searchsorted(custom, target))
+        assert r.seek(t=target) == custom[k]
+        window = r.read()
+        assert np.array_equal(window["t"], custom[k:k + 100])
+        assert np.array_equal(window["y"], ev["y"][k:k + 100])
+
+    with EventReader(p) as r:
+        r.seek(n=990)
+        assert len(r.read_all()) == 10
+        r.seek(t=1)
+        assert len(r.read_all()) == 0
@@ -1,22 +1,111 @@
-"""The ``.bin`` format is a reserved stub: reading and writing must fail with
-an explicit :class:`NotImplementedError` (never a silent no-op or an obscure
-downstream crash)."""
+"""BIN columnar dump tests: round trips, the implied block layout, zero-copy
+memory-mapped windows and pointer-math / ``searchsorted`` seeks."""
+import io
+from typing import Any
+
 import numpy as np
 import pytest
 
 from evutils.io import EventReader, EventWriter
+from evutils.io._bin import EVENT_BYTES, HEADER_SIZE, EventEncoder_Bin
+from evutils.io._source import make_source
 from evutils.types import Event_dtype
 
 
-def test_bin_read_raises_not_implemented(tmp_path):
-    p = tmp_path / "events.bin"
-    p.write_bytes(b"\x00" * 64)
-    with pytest.raises(NotImplementedError, match="not implemented"):
-        EventReader(str(p))
+def make_events(n: int = 50_000, seed: int = 8) -> Any:
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = np.cumsum(rng.integers(0, 9, n))
+    ev["x"] = rng.integers(0, 1280, n)
+    ev["y"] = rng.integers(0, 720, n)
+    ev["p"] = rng.integers(0, 2, n)
+    return ev
+
+
+def _write(path: Any, ev: Any, block_size: int = 4096) -> None:
+    with EventWriter(path, width=640, height=480, block_size=block_size) as w:
+        for part in np.array_split(ev, 13):  # blocks must not follow the write slicing
+            w.write(part)
+
+
+def test_roundtrip(tmp_path: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "events.bin"
+    _write(path, ev)
+    assert path.stat().st_size == HEADER_SIZE + len(ev) * EVENT_BYTES
+    with EventReader(path) as r:
+        got = r.read_all()
+        assert r.shape() == (640, 480)
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(got, f), ev[f])
+
+    windows = list(EventReader(path, n_events=1000))
+    assert all(len(w) == 1000 for w in windows[:-1])
+    np.testing.assert_array_equal(np.concatenate([w.x for w in windows]), ev["x"])
+    windows = list(EventReader(path, delta_t=2000))
+    np.testing.assert_array_equal(np.concatenate([w.t for w in windows]), ev["t"])
+    np.testing.assert_array_equal(EventReader(path, normalize_ts=True).read_all().t, ev["t"] - ev["t"][0])
+
+    # Seekable-but-not-mapped and in-memory (sniffed by magic) sources.
+    got = EventReader(make_source(path, mmap_files=False)).read_all()
+    np.testing.assert_array_equal(got.t, ev["t"])
+    got = EventReader(io.BytesIO(path.read_bytes())).read_all()
+    np.testing.assert_array_equal(got.p, ev["p"])
+
+
+def test_windows_are_memmap_views(tmp_path: Any) -> None:
+    ev = make_events(10_000)
+    path = tmp_path / "events.bin"
+    _write(path, ev)
+    with EventReader(path, n_events=500) as r:
+        w = next(iter(r))
+    # A read-only view of the mapped file that outlives the reader.
+    assert not w.t.flags.writeable and not w.t.flags.owndata
+    assert isinstance(w.t.base, np.memmap) or isinstance(w.t.base.base, np.memmap)
+    np.testing.assert_array_equal(w.t, ev["t"][:500])
+
+
+def test_seek(tmp_path: Any, monkeypatch: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "events.bin"
+    _write(path, ev)
+    r = EventReader(path, n_events=100)
+    r.init()
+    dec = r._file_decoder
+    loads: list[int] = []
+    orig = dec._load_group
+    monkeypatch.setattr(dec, "_load_group", lambda i, *a: loads.append(i) or orig(i, *a))
+
+    assert r.seek(n=12_345) == ev["t"][12_345]
+    np.testing.assert_array_equal(r.read().x, ev["x"][12_345:12_445])
+    target = int(ev["t"][30_001])
+    want = int(np.searchsorted(ev["t"], target))
+    assert r.seek(t=target) == ev["t"][want]
+    np.testing.assert_array_equal(r.read().t, ev["t"][want:want + 100])
+    assert set(loads) == {12_345 // 4096, want // 4096}
+    r.seek(t=int(ev["t"][-1]) + 1)
+    assert len(r.read()) == 0
+
+
+def test_stream_writer_and_truncation(tmp_path: Any) -> None:
+    ev = make_events(5000)
+    buf = io.BytesIO()
+    w = EventEncoder_Bin(buf, block_size=1024)  # a stream: no seeking back
+    w.write(ev)
+    w.close()
+    data = buf.getvalue()
+    np.testing.assert_array_equal(EventReader(io.BytesIO(data)).read_all().y, ev["y"])
+
+    path = tmp_path / "cut.bin"
+    path.write_bytes(data[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        EventReader(path).init()
+    with pytest.raises(ValueError, match="multiple of 8"):
+        EventWriter(tmp_path / "bad.bin", block_size=1001).write(ev)
 
 
-def test_bin_write_raises_not_implemented(tmp_path):
-    ev = np.zeros(10, dtype=Event_dtype)
-    with pytest.raises(NotImplementedError, match="not implemented"):
-        with EventWriter(str(tmp_path / "events.bin")) as w:
-            w.write(ev)
+def test_empty_file(tmp_path: Any) -> None:
+    path = tmp_path / "empty.bin"
+    with EventWriter(path):
+        pass
+    assert len(EventReader(path).read_all()) == 0
@@ -0,0 +1,89 @@
+"""Tests for ``EventReader(ts_dtype="u4")`` (compact uint32 timestamps).
+
+Compact windows must expand back to exactly the default reader's windows, and
+the dense representations and transforms must give the same result on either
+form.
+"""
+import numpy as np
+import pytest
+
+from evutils.dense import histogram, timesurface, voxel_histogram
+from evutils.io import EventReader, EventWriter
+from evutils.transforms import Compose, DropEventByTime, RefractoryPeriod, TimeSkew
+from evutils.transforms.functional import normalize_ts
+from evutils.types import Event_dtype
+
+
+def _events(n: int = 30_000, seed: int = 2):
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = 7_000_000_000 + np.sort(rng.integers(0, 3_000_000, n))
+    ev["x"] = rng.integers(0, 320, n)
+    ev["y"] = rng.integers(0, 240, n)
+    ev["p"] = rng.integers(0, 2, n)
+    return ev
+
+
+@pytest.fixture(params=["evt3", "evt2", "npz"])
+def recording(request, tmp_path):
+    fmt = request.param
+    p = tmp_path / (f"rec_{fmt}.raw" if fmt.startswith("evt") else f"rec.{fmt}")
+    with EventWriter(p, **({"format": fmt} if fmt.startswith("evt") else {})) as w:
+        w.write(_events())
+    return p
+
+
+@pytest.mark.parametrize("opts", [{"delta_t": 250_000}, {"n_events": 4_000}, {"mode": "all"}])
+def test_compact_windows_expand_to_default(recording, opts):
+    expected = list(EventReader(recording, **opts))
+    got = list(EventReader(recording, ts_dtype="u4", **opts))
+    assert len(got) == len(expected)
+    for c, e in zip(got, expected):
+        assert c.t.dtype == np.uint32
+        if len(e):
+            assert c.t_base == e.t[0] and c.t[0] == 0
+        np.testing.assert_array_equal(c.expand().t, e.t)
+        np.testing.assert_array_equal(c.x, e.x)
+        assert c.sensor_size == e.sensor_size
+
+
+def test_compact_read_all_and_write_back(tmp_path):
+    src = tmp_path / "rec.raw"
+    with EventWriter(src, format="evt3") as w:
+        w.write(_events())
+    full = EventReader(src).read_all()
+    compact = EventReader(src, ts_dtype="u4").read_all()
+    assert compact.t.dtype == np.uint32 and compact.t_base == full.t[0]
+
+    dst = tmp_path / "copy.raw"
+    with EventWriter(dst, format="evt3") as w:
+        w.write(compact)  # written with absolute timestamps
+    np.testing.assert_array_equal(EventReader(dst).read_all().t, full.t)
+
+
+def test_dense_and_transforms_accept_compact(tmp_path):
+    src = tmp_path / "rec.raw"
+    with EventWriter(src, format="evt2") as w:
+        w.write(_events())
+    full = EventReader(src, delta_t=10_000).read()
+    compact = EventReader(src, delta_t=10_000, ts_dtype="u4").read()
+    kw = {"width": 320, "height": 240}
+
+    np.testing.assert_array_equal(histogram(compact, **kw), histogram(full, **kw))
+    np.testing.assert_array_equal(timesurface(compact, **kw), timesurface(full, **kw))
+    np.testing.assert_array_equal(voxel_histogram(compact, n_bins=4, **kw),
+                                  voxel_histogram(full, n_bins=4, **kw))
+
+    refractory = RefractoryPeriod(500)(compact)
+    assert refractory.t.dtype == np.uint32
+    np.testing.assert_array_equal(refractory.expand().t, RefractoryPeriod(500)(full).t)
+    skewed = Compose([RefractoryPeriod(500), TimeSkew(2.0)])(compact)
+    np.testing.assert_array_equal(skewed.t, Compose([RefractoryPeriod(500), TimeSkew(2.0)])(full).t)
+    np.testing.assert_array_equal(normalize_ts(compact, start_ts=5).t, normalize_ts(full, start_ts=5).t)
+    assert len(DropEventByTime(0.5)(compact)) < len(compact)
+
+
+@pytest.mark.parametrize("bad", ["f4", "u2", "nonsense"])
+def test_ts_dtype_validated(bad):
+    with pytest.raises(ValueError):
+        EventReader(b"% format EVT3;height=720;width=1280\n% end\n", ts_dtype=bad)
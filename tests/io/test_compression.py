@@ -202,3 +202,117 @@ def test_chunked_write_compressed(tmp_path: Any) -> None:
     with EventReader(p) as r:
         out = np.asarray(r.read_all())
     assert_events_equal(out, ev, "chunked.bz2")
+
+
+# --------------------------------------------------------------------------- #
+# zstd seekable format
+# --------------------------------------------------------------------------- #
+@pytest.mark.skipif(not _has_zstd(), reason="no zstd backend")
+@pytest.mark.parametrize("ext, fmt", [("raw", "evt3"), ("csv", None), ("npz", None)])
+def test_seekable_zstd_roundtrip(tmp_path: Any, ext: str, fmt: Any) -> None:
+    """seekable= writes independent frames + a seek table: plain zstd readers
+    still decode it, and the reader opens it as a random-access source."""
+    from evutils.io._compression import read_zstd_seek_table
+    from evutils.io._source import SeekableZstdSource
+    ev = make_events(20_000)
+    p = tmp_path / f"out.{ext}.zst"
+    kw = {"format": fmt} if fmt else {}
+    with EventWriter(p, seekable=4096, **kw) as w:
+        for part in np.array_split(ev, 7):
+            w.write(part)
+    with open(p, "rb") as f:
+        comp, decomp = read_zstd_seek_table(f)
+    assert len(comp) > 1 and (decomp[:-1] == 4096).all()
+    with open_compressed(p, "rb") as f:  # a plain zstd stream reader
+        plain = f.read()
+    assert len(plain) == int(decomp.sum())
+
+    for workers in (1, 3):
+        with EventReader(p, n_events=1000, decode_workers=workers) as r:
+            assert isinstance(r._source, SeekableZstdSource)
+            assert_events_equal(r.read_all(), ev, f"{ext} workers={workers}")
+            r.seek(n=12_345)
+            assert_events_equal(r.read(), ev[12_345:13_345], f"{ext} seek")
+
+
+@pytest.mark.skipif(not _has_zstd(), reason="no zstd backend")
+def test_seekable_zstd_source_random_reads(tmp_path: Any) -> None:
+    from evutils.io._source import make_source
+    data = np.random.default_rng(1).integers(0, 7, 50_000, dtype=np.uint8).tobytes()
+    p = tmp_path / "blob.zst"
+    with open_compressed(p, "wb", frame_size=1000) as f:
+        f.write(data[:123])
+        f.write(data[123:])
+    for workers in (1, 4):
+        src = make_source(p, workers=workers)
+        assert src.seekable() and not src.mappable()
+        for pos, size in ((0, 10), (999, 2), (1500, 7_000), (49_990, 100), (0, -1)):
+            src.seek(pos)
+            want = data[pos:] if size < 0 else data[pos:pos + size]
+            assert src.peek(5) == data[pos:pos + 5]
+            assert src.read(size) == want
+        src.close()
+
+
+def test_seekable_requires_zst(tmp_path: Any) -> None:
+    with pytest.raises(ValueError, match="zst"):
+        EventWriter(tmp_path / "out.raw.gz", format="evt3", seekable=True)
+    with pytest.raises(ValueError, match="zst"):
+        EventWriter(tmp_path / "out.raw", format="evt3", seekable=True)
+
+
+# --------------------------------------------------------------------------- #
+# Background decompression (DecompressAheadSource)
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("fmt", ["evt3", "evt2", "evt21", "evt4"])
+def test_evt_streams_compressed_blocks(tmp_path: Any, monkeypatch: Any, fmt: str) -> None:
+    """Compressed EVT is decoded block by block off the decompression ring:
+    tiny, word-misaligned blocks force a window switch every few hundred words
+    (with the unparsed tail carried across), and must decode exactly."""
+    from evutils.io import _source
+    from evutils.io._source import DecompressAheadSource
+    monkeypatch.setattr(_source, "_AHEAD_BLOCK", 4099)
+    ev = make_events(30_000, t_max=3_000_000)
+    p = tmp_path / "out.raw.gz"
+    with EventWriter(p, format=fmt) as w:
+        w.write(ev)
+
+    with EventReader(p, n_events=1_000) as r:
+        assert isinstance(r._source, DecompressAheadSource)
+        chunks = list(r)
+        assert r._file_decoder._streaming
+    assert_events_equal(np.concatenate(chunks), ev, f"{fmt} windows")
+    with EventReader(p, mode="all") as r:
+        assert_events_equal(r.read(), ev, f"{fmt} read_all")
+    with EventReader(p, delta_t=50_000) as r:
+        assert_events_equal(np.concatenate(list(r)), ev, f"{fmt} delta_t")
+
+    # A seek leaves streaming mode (the payload is re-read into memory).
+    with EventReader(p, n_events=100) as r:
+        r.read()
+        r.seek(n=20_000)
+        assert_events_equal(r.read(), ev[20_000:20_100], f"{fmt} seek")
+        assert not r._file_decoder._streaming
+
+
+def test_decompress_ahead_source_reads(tmp_path: Any, monkeypatch: Any) -> None:
+    from evutils.io import _source
+    monkeypatch.setattr(_source, "_AHEAD_BLOCK", 1000)
+    monkeypatch.setattr(_source, "_AHEAD_MIN_READ", 1)
+    data = b"".join(b"line %d\n" % i for i in range(5_000))
+    p = tmp_path / "lines.txt.gz"
+    with gzip.open(p, "wb") as f:
+        f.write(data)
+    src = _source.make_source(p)
+    assert isinstance(src, _source.DecompressAheadSource)
+    assert src.peek(4) == b"line"
+    assert src.readline() == b"line 0\n"
+    assert src.read(3_000) == data[7:3_007]
+    assert src.readline() == data[3_007:data.index(b"\n", 3_007) + 1]
+    block = src.read_block(prefix=b"xy")
+    assert bytes(block[:2]) == b"xy" and len(block) > 2
+    src.seek(10)
+    assert src.tell() == 10 and src.read(5) == data[10:15]
+    src.reset()
+    assert bytes(src.read(-1)) == data
+    src.close()
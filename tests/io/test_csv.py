@@ -309,3 +309,97 @@ def test_CSV_chunked_reads_across_refills(tmp_path: Any) -> None:
             total += len(chunk)
     assert total == n
 
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_CSV_parallel_matches_serial(tmp_path: Any, monkeypatch: Any, trailing_newline: bool) -> None:
+    """decode_workers > 1 parses line-aligned byte ranges concurrently; read_all,
+    windows, seeks and a missing final newline match the serial decoder."""
+    from evutils.io import EventReader, EventWriter
+    from evutils.io import _csv
+    from evutils.types import Event_dtype
+    monkeypatch.setattr(_csv, "_PARALLEL_RANGE_BYTES", 4096)  # many ranges
+    n = 20_000
+    rng = np.random.default_rng(3)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev['t'] = np.cumsum(rng.integers(0, 50, n))
+    ev['x'] = rng.integers(0, 1280, n)
+    ev['y'] = rng.integers(0, 720, n)
+    ev['p'] = rng.integers(0, 2, n)
+    p = tmp_path / "par.csv"
+    with EventWriter(p) as w:
+        w.write(ev)
+    if not trailing_newline:
+        p.write_bytes(p.read_bytes().rstrip(b"\n"))
+
+    with EventReader(p, mode="all", decode_workers=4) as r:
+        assert np.array_equal(r.read(), ev)
+    with EventReader(p, n_events=3_333, decode_workers=3) as r:
+        chunks = list(r)
+        assert [len(c) for c in chunks[:-1]] == [3_333] * (len(chunks) - 1)
+        assert np.array_equal(np.concatenate(chunks), ev)
+    with EventReader(p, n_events=1_000, decode_workers=2) as r:
+        first = r.read()
+        assert np.array_equal(first, ev[:1_000])
+        r.seek(n=12_345)
+        assert np.array_equal(r.read(), ev[12_345:13_345])
+        r.seek(n=0)
+        assert np.array_equal(r.read(), ev[:1_000])
+
+
+def test_CSV_line_index_seek(tmp_path: Any, monkeypatch: Any) -> None:
+    """Seeks go through the sparse line index: exact on both axes across block
+    boundaries, blank lines and duplicate timestamps, with a real event index."""
+    from evutils.io import EventReader
+    from evutils.io import _csv
+    monkeypatch.setattr(_csv, "_LINE_INDEX_STRIDE", 64)
+    n = 5_000
+    rng = np.random.default_rng(4)
+    t = np.cumsum(rng.choice([0, 0, 0, 1, 7], n)).astype(np.int64)
+    lines = [f"{t[i]},{i % 640},{i % 480},{i % 2}" for i in range(n)]
+    for at in (10, 64, 700, 4_000):
+        lines.insert(at, "")  # blank lines are skipped by the parser
+    p = tmp_path / "idx.csv"
+    p.write_text("t,x,y,p\n" + "\n".join(lines))  # no final newline
+
+    with EventReader(p, n_events=100) as r:
+        # The index counts the file without disturbing the read position.
+        assert np.array_equal(r.read().t, t[:100])
+        assert r.count_events() == n
+        assert np.array_equal(r.read().t, t[100:200])
+        for k in (0, 63, 64, 65, 3_000, n - 1):
+            r.seek(n=k)
+            assert len(r) == k
+            assert np.array_equal(r.read().t, t[k:k + 100])
+        for T in (0, int(t[64]), int(t[1_234]) + 1, int(t[-1])):
+            k = int(np.searchsorted(t, T))
+            assert r.seek(t=T) == t[k]
+            assert len(r) == k
+            assert np.array_equal(r.read().t, t[k:k + 100])
+        r.seek(t=int(t[-1]) + 1)
+        assert len(r) == n and len(r.read()) == 0
+        r.seek(n=n + 10)
+        assert len(r.read()) == 0
+        assert r._file_decoder._index.n_events == n
+
+
+def test_CSV_line_index_persisted(tmp_path: Any, monkeypatch: Any) -> None:
+    """index="persist" writes the line index as a sidecar; later opens map it."""
+    from evutils.io import EventReader, EventWriter
+    from evutils.io import _csv
+    from evutils.io._index import evutils_index_path
+    from evutils.types import Event_dtype
+    ev = np.zeros(20_000, dtype=Event_dtype)
+    ev['t'] = np.arange(len(ev)) * 3
+    p = tmp_path / "persist.csv"
+    with EventWriter(p) as w:
+        w.write(ev)
+    with EventReader(p, n_events=10, index="persist") as r:
+        assert r.seek(t=30_001) == 30_003
+    assert evutils_index_path(p).is_file()
+
+    monkeypatch.setattr(_csv.EventDecoder_Csv, "_build_line_index", None)
+    with EventReader(p, n_events=10) as r:
+        assert r.count_events() == len(ev)
+        r.seek(n=12_345)
+        assert np.array_equal(r.read().t, ev['t'][12_345:12_355])
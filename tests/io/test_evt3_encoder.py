@@ -0,0 +1,84 @@
+"""Tests for the native EVT3 encoder (vector-group packing).
+
+Same-row, same-timestamp, same-polarity runs must come back from the decoder
+exactly as written, in the written order, and pack into fewer words than one
+``ADDR_X`` per event.
+"""
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.io._native_evt import Evt3Encoder
+from evutils.types import Event_dtype, EventArray
+
+
+def _bursts(n_bursts: int = 2_000, seed: int = 4):
+    """Sensor-like bursts: runs of increasing x on one row, one timestamp."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    t = 0
+    for _ in range(n_bursts):
+        t += int(rng.integers(1, 300))
+        k = int(rng.integers(1, 40))
+        x = int(rng.integers(0, 1100)) + np.sort(rng.choice(np.arange(96), size=k, replace=False))
+        ev = np.zeros(k, dtype=Event_dtype)
+        ev["t"], ev["x"] = t, x
+        ev["y"] = rng.integers(0, 720)
+        ev["p"] = rng.integers(0, 2, k) if rng.random() < 0.3 else rng.integers(0, 2)
+        parts.append(ev)
+    return np.concatenate(parts)
+
+
+def _roundtrip(tmp_path, batches):
+    p = tmp_path / "rec.raw"
+    with EventWriter(p, format="evt3") as w:
+        for b in batches:
+            w.write(b)
+    return p, EventReader(p).read_all()
+
+
+def _assert_same(got, ev):
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(got, f), ev[f])
+
+
+def test_vector_groups_roundtrip_and_shrink(tmp_path):
+    ev = _bursts()
+    p, got = _roundtrip(tmp_path, [ev])
+    _assert_same(got, ev)
+    payload = Evt3Encoder().encode(ev["t"], ev["x"], ev["y"], ev["p"])
+    assert p.read_bytes().endswith(payload.tobytes())
+    assert len(payload) < 0.8 * len(ev)
+    vect = (payload >> 12)
+    assert (vect == 0x3).any() and (vect == 0x4).any() and (vect == 0x5).any()
+
+
+@pytest.mark.parametrize("split", [1, 7, 333])
+def test_batches_and_soa_input(tmp_path, split):
+    ev = _bursts(500)
+    cuts = np.arange(split, len(ev), max(1, len(ev) // split))
+    batches = [EventArray.from_aos(b) if i % 2 else b for i, b in enumerate(np.split(ev, cuts))]
+    _, got = _roundtrip(tmp_path, batches)
+    _assert_same(got, ev)
+
+
+def test_unordered_and_mixed_runs_keep_order(tmp_path):
+    ev = np.zeros(12, dtype=Event_dtype)
+    ev["t"] = 100
+    ev["y"] = 3
+    ev["x"] = [10, 9, 8, 20, 21, 22, 23, 60, 61, 61, 62, 100]
+    ev["p"] = [1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0]
+    _, got = _roundtrip(tmp_path, [ev])
+    _assert_same(got, ev)
+
+
+def test_full_span_and_time_wrap(tmp_path):
+    row = np.zeros(32, dtype=Event_dtype)
+    row["x"] = 1000 + np.arange(32)
+    row["y"], row["p"] = 719, 1
+    ev = np.concatenate([row.copy() for _ in range(40)])
+    ev["t"] = np.repeat(np.arange(40) * 3_000_000, 32)  # crosses the 24-bit wrap
+    _, got = _roundtrip(tmp_path, [ev])
+    _assert_same(got, ev)
+    words = Evt3Encoder().encode(ev["t"], ev["x"], ev["y"], ev["p"])
+    assert len(words) <= 40 * 7  # TIME_HIGH/LOW + ADDR_Y + 4-word group per row
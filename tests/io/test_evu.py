@@ -0,0 +1,137 @@
+"""EVU container tests: round trips, block layout, index-driven seeks, the
+parallel block decode and corrupt-block detection."""
+import io
+from typing import Any
+
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.io._source import make_source
+from evutils.types import Event_dtype
+
+
+def make_events(n: int = 50_000, seed: int = 6) -> Any:
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = 1_700_000_000 + np.cumsum(rng.integers(0, 300, n))
+    ev["x"] = rng.integers(0, 1280, n)
+    ev["y"] = rng.integers(0, 720, n)
+    ev["p"] = rng.integers(0, 2, n)
+    return ev
+
+
+def _write(path: Any, ev: Any, block_size: int = 4096, **kw: Any) -> None:
+    with EventWriter(path, width=640, height=480, block_size=block_size, **kw) as w:
+        for part in np.array_split(ev, 13):  # blocks must not follow the write slicing
+            w.write(part)
+
+
+@pytest.mark.parametrize("compression", ["zstd", None])
+def test_roundtrip(tmp_path: Any, compression: Any) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    ev = make_events()
+    path = tmp_path / "rec.evu"
+    _write(path, ev, compression=compression)
+    with EventReader(path) as r:
+        got = r.read_all()
+        assert r.shape() == (640, 480)
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(got, f), ev[f])
+
+    windows = list(EventReader(path, n_events=1000))
+    assert all(len(w) == 1000 for w in windows[:-1])
+    np.testing.assert_array_equal(np.concatenate([w.x for w in windows]), ev["x"])
+    windows = list(EventReader(path, delta_t=20_000))
+    np.testing.assert_array_equal(np.concatenate([w.t for w in windows]), ev["t"])
+    np.testing.assert_array_equal(EventReader(path, normalize_ts=True).read_all().t, ev["t"] - ev["t"][0])
+
+    # Seekable-but-not-mappable and in-memory (sniffed by magic) sources.
+    got = EventReader(make_source(path, mmap_files=False)).read_all()
+    np.testing.assert_array_equal(got.t, ev["t"])
+    got = EventReader(io.BytesIO(path.read_bytes())).read_all()
+    np.testing.assert_array_equal(got.y, ev["y"])
+
+
+def test_blocks_are_compact(tmp_path: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "rec.evu"
+    _write(path, ev, compression=None)
+    # 1-2 varint bytes of t plus 11 + 10 + 1 bits of x/y/p per event.
+    assert path.stat().st_size < len(ev) * 5
+
+
+def test_unusual_values(tmp_path: Any) -> None:
+    ev = np.zeros(9, dtype=Event_dtype)
+    ev["t"] = [0, 0, 5, 3, 2**40, 2**40, 7, 7, 2**62]  # ties, steps back and large gaps
+    ev["x"] = [65535, 0, 1, 2, 3, 4, 5, 6, 7]
+    ev["y"] = 9  # a constant column packs to zero bits
+    ev["p"] = [0, 1, 255, 0, 1, 0, 1, 0, 1]
+    path = tmp_path / "odd.evu"
+    _write(path, ev, block_size=4, compression=None)
+    got = EventReader(path).read_all()
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(got, f), ev[f])
+
+
+def test_seek_decodes_one_block(tmp_path: Any, monkeypatch: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "rec.evu"
+    _write(path, ev)
+    r = EventReader(path, n_events=100)
+    r.init()
+    dec = r._file_decoder
+    loads: list[int] = []
+    orig = dec._load_group
+    monkeypatch.setattr(dec, "_load_group", lambda i, *a: loads.append(i) or orig(i, *a))
+
+    target = int(ev["t"][30_001])
+    want = int(np.searchsorted(ev["t"], target))
+    assert r.seek(t=target) == ev["t"][want]
+    np.testing.assert_array_equal(r.read().t, ev["t"][want:want + 100])
+    assert loads == [want // 4096]
+
+    assert r.seek(n=12_345) == ev["t"][12_345]
+    np.testing.assert_array_equal(r.read().x, ev["x"][12_345:12_445])
+    r.seek(t=int(ev["t"][-1]) + 1)
+    assert len(r.read()) == 0
+
+
+def test_parallel_decode(tmp_path: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "rec.evu"
+    _write(path, ev)
+    with EventReader(path, decode_workers=4) as r:
+        got = r.read_all()
+    np.testing.assert_array_equal(got.t, ev["t"])
+    np.testing.assert_array_equal(got.p, ev["p"])
+
+    # Read-ahead while iterating, then a parallel read_all from mid-block.
+    with EventReader(path, n_events=5000, decode_workers=3) as r:
+        it = iter(r)
+        first = [next(it) for _ in range(3)]
+        rest = r._file_decoder.read_all()
+    np.testing.assert_array_equal(np.concatenate([w.t for w in first] + [rest.t]), ev["t"])
+
+
+def test_corrupt_block_is_reported(tmp_path: Any) -> None:
+    ev = make_events(10_000)
+    path = tmp_path / "rec.evu"
+    _write(path, ev, compression=None)
+    data = bytearray(path.read_bytes())
+    data[16 + 20] ^= 0x40  # the first block's delta-stream length
+    path.write_bytes(bytes(data))
+    with pytest.raises(Exception, match="block 0"):
+        EventReader(path).read_all()
+
+    path.write_bytes(bytes(data[:-10]))  # lost trailer: refuse rather than guess
+    with pytest.raises(ValueError, match="index"):
+        EventReader(path).read_all()
+
+
+def test_empty_file(tmp_path: Any) -> None:
+    path = tmp_path / "empty.evu"
+    with EventWriter(path):
+        pass
+    assert len(EventReader(path).read_all()) == 0
@@ -166,3 +166,38 @@ def test_HDF5_empty_dataset(tmp_path: Any) -> None:
     with EventReader(p) as r:
         out = r.read_all()
         assert len(out) == 0
+
+
+@pytest.mark.parametrize("layout", ["indexed", "no_index", "t_offset", "prophesee"])
+def test_time_seek_reads_few_chunks(tmp_path: Any, monkeypatch: Any, layout: str) -> None:
+    """seek(t=) is exact and reads O(log n) chunks of t, never the whole column."""
+    ev = make_events(200_000, t_max=2_000_000)
+    p = tmp_path / "seek.h5"
+    offset = 0
+    if layout == "prophesee":
+        _write_prophesee_layout(p, ev)
+    else:
+        with EventWriter(p, chunksize=4096) as w:
+            w.write(ev)
+        with h5py.File(p, "r+") as f:
+            if layout == "no_index":
+                del f["ms_to_idx"]
+            if layout == "t_offset":
+                offset = 5_000_000
+                f.create_dataset("t_offset", data=np.int64(offset))
+
+    with EventReader(p, n_events=10) as r:
+        r.init()
+        dec: Any = r._file_decoder
+        read: list[int] = []
+        orig = dec._t_range
+        monkeypatch.setattr(dec, "_t_range", lambda a, b: read.append(b - a) or orig(a, b))
+        for target in [0, 1, 999_999, 1_234_567, int(ev["t"][-1]), int(ev["t"][-1]) + 1]:
+            read.clear()
+            landed = r.seek(t=target + offset)
+            want = int(np.searchsorted(ev["t"], target))
+            if want < len(ev):
+                assert landed == ev["t"][want] + offset
+                np.testing.assert_array_equal(r.read().t, ev["t"][want:want + 10] + offset)
+            assert sum(read) <= 2 * dec._t_block + 64, (target, read)
+        assert len(dec._t_probes) < 100
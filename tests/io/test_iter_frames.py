@@ -0,0 +1,92 @@
+"""Tests for ``EventReader.iter_frames`` (native histogram accumulation).
+
+Every frame must equal the per-pixel, per-polarity counts of the events the
+reader's own ``delta_t`` windowing yields for the same window.
+"""
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.types import Event_dtype
+
+W, H = 320, 240
+
+
+def _events(n: int = 60_000, seed: int = 5):
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = np.sort(rng.integers(0, 3_000_000, n))
+    ev["x"] = rng.integers(0, W, n)
+    ev["y"] = rng.integers(0, H, n)
+    ev["p"] = rng.integers(0, 2, n)
+    ev["t"][n // 10:n // 10 + n // 60] = ev["t"][n // 10]  # a dense burst at one timestamp
+    return ev
+
+
+def _counts(ev, n_bins=1, t0=0, delta_t=1):
+    out = np.zeros((n_bins, H, W, 2), dtype=np.uint32)
+    b = (ev.t - t0) * n_bins // delta_t if n_bins > 1 else np.zeros(len(ev), dtype=np.int64)
+    np.add.at(out, (b, ev.y, ev.x, ev.p), 1)
+    return out if n_bins > 1 else out[0]
+
+
+@pytest.fixture(params=["evt3", "evt2", "evt21", "evt4", "dat", "npz"])
+def recording(request, tmp_path):
+    fmt = request.param
+    p = tmp_path / (f"rec_{fmt}.raw" if fmt.startswith("evt") else f"rec.{fmt}")
+    with EventWriter(p, **({"format": fmt} if fmt.startswith("evt") else {})) as w:
+        w.write(_events())
+    return p
+
+
+def test_frames_match_windowed_counts(recording):
+    windows = list(EventReader(recording, delta_t=200_000))
+    frames = list(EventReader(recording, width=W, height=H).iter_frames(delta_t=200_000))
+    assert len(frames) == len(windows)
+    for f, w in zip(frames, windows):
+        assert f.shape == (H, W, 2) and f.dtype == np.uint32
+        np.testing.assert_array_equal(f, _counts(w))
+
+
+def test_frames_time_bins(recording):
+    t0 = int(EventReader(recording).read_all().t[0])
+    windows = list(EventReader(recording, delta_t=300_000))
+    frames = list(EventReader(recording, width=W, height=H).iter_frames(delta_t=300_000, n_bins=3))
+    assert len(frames) == len(windows)
+    for k, (f, w) in enumerate(zip(frames, windows)):
+        assert f.shape == (3, H, W, 2)
+        np.testing.assert_array_equal(f, _counts(w, 3, t0 + k * 300_000, 300_000))
+
+
+def test_frames_with_filter_and_prior_read(tmp_path):
+    p = tmp_path / "rec.raw"
+    with EventWriter(p, format="evt3") as w:
+        w.write(_events())
+    opts = {"width": W, "height": H, "roi": (50, 40, 200, 160), "polarity": 1}
+    windows = list(EventReader(p, delta_t=100_000, **opts))
+
+    reader = EventReader(p, delta_t=100_000, **opts)
+    first = reader.read()
+    frames = list(reader.iter_frames())  # continues after the window read()
+    np.testing.assert_array_equal(first.t, windows[0].t)
+    assert len(frames) == len(windows) - 1
+    for f, w in zip(frames, windows[1:]):
+        np.testing.assert_array_equal(f, _counts(w))
+    assert reader.is_eof()
+
+
+def test_iter_frames_validated(tmp_path):
+    raw = b"% format EVT3;height=240;width=320\n% end\n"
+    with pytest.raises(ValueError):
+        EventReader(raw).iter_frames(kind="voxel")
+    with pytest.raises(ValueError):
+        EventReader(raw).iter_frames(delta_t=0)
+    with pytest.raises(ValueError):
+        EventReader(raw).iter_frames(n_bins=0)
+    assert list(EventReader(raw).iter_frames(delta_t=1_000)) == []
+
+    p = tmp_path / "rec.aer"  # no sensor geometry in the file
+    with EventWriter(p) as w:
+        w.write(_events(100))
+    with pytest.raises(ValueError):
+        EventReader(p).iter_frames()
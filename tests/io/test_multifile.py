@@ -0,0 +1,121 @@
+"""Multi-file recordings: an ordered list of files read as one stream, with
+windows spanning file boundaries and global seeks."""
+from typing import Any
+
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.types import Event_dtype
+
+#: Segment boundaries, including an empty middle segment.
+CUTS = (0, 17_001, 17_001, 41_234, 60_000)
+
+
+def make_events(n: int = 60_000, seed: int = 9) -> Any:
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = 1000 + np.cumsum(rng.integers(0, 40, n))
+    ev["x"] = rng.integers(0, 640, n)
+    ev["y"] = rng.integers(0, 480, n)
+    ev["p"] = rng.integers(0, 2, n)
+    return ev
+
+
+def _write(tmp_path: Any, ev: Any, ext: str, **kw: Any) -> "tuple[list[Any], Any]":
+    """Write ``ev`` as segments split at CUTS, and as one whole file."""
+    paths = []
+    for k in range(len(CUTS) - 1):
+        path = tmp_path / f"rec_{k:03d}{ext}"
+        with EventWriter(path, width=640, height=480, **kw) as w:
+            w.write(ev[CUTS[k]:CUTS[k + 1]])
+        paths.append(path)
+    whole = tmp_path / f"whole{ext}"
+    with EventWriter(whole, width=640, height=480, **kw) as w:
+        w.write(ev)
+    return paths, whole
+
+
+FORMATS = [(".raw", {"format": "evt2"}), (".raw", {"format": "evt3"}), (".dat", {}),
+           (".npz", {}), (".bin", {"block_size": 1024})]
+
+
+@pytest.mark.parametrize("ext, kw", FORMATS, ids=["evt2", "evt3", "dat", "npz", "bin"])
+@pytest.mark.parametrize("window", [{"delta_t": 5000}, {"n_events": 7000}, {"delta_t": 5000, "n_events": 3000}])
+def test_windows_match_one_file(tmp_path: Any, ext: str, kw: Any, window: Any) -> None:
+    ev = make_events()
+    paths, whole = _write(tmp_path, ev, ext, **kw)
+    want = [w.t.copy() for w in EventReader(whole, **window)]
+    with EventReader(paths, **window) as r:
+        got = [w.t.copy() for w in r]
+        assert r.shape() == (640, 480)
+    assert len(got) == len(want)
+    for a, b in zip(got, want):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_read_all_and_options(tmp_path: Any) -> None:
+    ev = make_events()
+    paths, _ = _write(tmp_path, ev, ".raw", format="evt3")
+    got = EventReader([str(p) for p in paths]).read_all()
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(got, f), ev[f])
+
+    # Reader options reach every segment decoder.
+    got = np.concatenate([w.x for w in EventReader(paths, delta_t=3000, roi=(0, 0, 320, 240))])
+    np.testing.assert_array_equal(got, ev["x"][(ev["x"] < 320) & (ev["y"] < 240)])
+    got = np.concatenate([w.t for w in EventReader(paths, delta_t=3000, decode_workers=3, async_read=True)])
+    np.testing.assert_array_equal(got, ev["t"])
+
+
+@pytest.mark.parametrize("ext, kw", [(".raw", {"format": "evt3"}), (".npz", {})], ids=["evt3", "npz"])
+def test_global_seek(tmp_path: Any, ext: str, kw: Any) -> None:
+    ev = make_events()
+    paths, _ = _write(tmp_path, ev, ext, **kw)
+    with EventReader(paths, n_events=100) as r:
+        for k in (30_000, 17_000, 41_234, 5):  # mid-file, last of a file, first of a file, backwards
+            assert r.seek(n=k) == ev["t"][k]
+            np.testing.assert_array_equal(r.read().t, ev["t"][k:k + 100])
+            assert len(r) == k + 100
+
+        # Between two files' time ranges: lands on the next file's first event.
+        target = int(ev["t"][17_000]) + 1
+        want = int(np.searchsorted(ev["t"], target))
+        assert r.seek(t=target) == ev["t"][want]
+        np.testing.assert_array_equal(r.read().x, ev["x"][want:want + 100])
+        assert r._file_decoder.current_file() == paths[2]  # rec_001 is empty
+
+        r.seek(t=int(ev["t"][-1]) + 1)
+        assert len(r.read()) == 0
+
+
+def test_seek_into_gap_past_time_wrap(tmp_path: Any) -> None:
+    # Late segments start more than half an EVT3 time wrap (2**24 us) in, where
+    # a landing taken from seek(n=0) used to come back one wrap early.
+    ev = make_events()
+    ev["t"] = 1000 + np.cumsum(np.random.default_rng(3).integers(0, 600, len(ev)))
+    paths, _ = _write(tmp_path, ev, ".raw", format="evt3")
+    assert ev["t"][CUTS[3]] > 1 << 23
+    with EventReader(paths, n_events=100) as r:
+        for k in (30_000, 16_999, CUTS[3], 5):
+            r.seek(n=k)
+            np.testing.assert_array_equal(r.read().t, ev["t"][k:k + 100])
+        target = int(ev["t"][CUTS[3] - 1]) + 1
+        assert r.seek(t=target) == ev["t"][CUTS[3]]
+        np.testing.assert_array_equal(r.read().t, ev["t"][CUTS[3]:CUTS[3] + 100])
+        assert r._file_decoder._bounds[3] == (ev["t"][CUTS[3]], CUTS[4] - CUTS[3])
+    with EventReader(paths[3], n_events=10) as r:
+        assert r.seek(n=0) == ev["t"][CUTS[3]]
+        np.testing.assert_array_equal(r.read().t, ev["t"][CUTS[3]:CUTS[3] + 10])
+
+
+def test_mixed_formats_rejected(tmp_path: Any) -> None:
+    ev = make_events(1000)
+    raw, dat = tmp_path / "a.raw", tmp_path / "b.dat"
+    for path in (raw, dat):
+        with EventWriter(path) as w:
+            w.write(ev)
+    with pytest.raises(ValueError, match="same format"):
+        EventReader([raw, dat]).read_all()
+    with pytest.raises(ValueError, match="empty"):
+        EventReader([])
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 from evutils.io import EventReader, EventWriter
+from evutils.io.decoders import EventDecoder_Npz
 from evutils.types import Event_dtype
 
 from typing import Any
@@ -41,6 +42,19 @@ def test_we_read_np_savez_soa(tmp_path: Any) -> None:
         assert np.array_equal(np.asarray(r.read_all()), ev)
 
 
+def test_uint32_timestamps_read_as_int64(tmp_path: Any) -> None:
+    """A plain uint32 ``t`` column is not the compact form: every read mode
+    returns absolute int64 timestamps."""
+    ev = make_events()
+    p = tmp_path / "u32.npz"
+    np.savez(p, t=ev["t"].astype(np.uint32), x=ev["x"], y=ev["y"], p=ev["p"])
+    windows = [EventReader(p).read_all()]
+    windows += list(EventReader(p, n_events=3000)) + list(EventReader(p, delta_t=100_000))
+    for w in windows:
+        assert w.t.dtype == np.int64 and not w.is_compact
+    np.testing.assert_array_equal(windows[0].t, ev["t"])
+
+
 def test_we_read_np_savez_structured(tmp_path: Any) -> None:
     """A single structured 'events' member (compressed) is accepted too."""
     ev = make_events()
@@ -113,3 +127,41 @@ def test_NPZ_empty_file(tmp_path: Any) -> None:
     with pytest.raises(zipfile.BadZipFile):
         with EventReader(p) as r:
             r.read_all()
+
+
+def test_stored_members_are_mapped(tmp_path: Any) -> None:
+    ev = make_events(50_000)
+    p = tmp_path / "stored.npz"
+    with EventWriter(p) as w:
+        w.write(ev)
+    with EventReader(p, n_events=1000) as r:
+        dec = r._file_decoder
+        w = next(iter(r))
+        assert dec._mapped and not dec._streams
+        # A read-only view of the file, not a streamed copy.
+        assert not w.t.flags.writeable and not w.t.flags.owndata
+        target = int(ev["t"][31_234])
+        want = int(np.searchsorted(ev["t"], target))
+        assert r.seek(t=target) == ev["t"][want]
+        np.testing.assert_array_equal(r.read().x, ev["x"][want:want + 1000])
+        assert r.seek(n=40_000) == ev["t"][40_000]
+        np.testing.assert_array_equal(r.read().p, ev["p"][40_000:41_000])
+    np.testing.assert_array_equal(w.t, ev["t"][:1000])  # outlives the reader
+
+    # np.savez's structured layout and an in-memory buffer are mapped too.
+    np.savez(p, events=ev)
+    with EventReader(p.read_bytes(), file_decoder=EventDecoder_Npz) as r:
+        r.init()
+        assert r._file_decoder._mapped
+        np.testing.assert_array_equal(r.read_all().y, ev["y"])
+
+
+def test_deflated_members_are_streamed(tmp_path: Any) -> None:
+    ev = make_events()
+    p = tmp_path / "deflated.npz"
+    np.savez_compressed(p, t=ev["t"], x=ev["x"], y=ev["y"], p=ev["p"])
+    with EventReader(p, n_events=1000) as r:
+        r.init()
+        assert not r._file_decoder._mapped
+        assert r.seek(n=5000) == ev["t"][5000]
+        np.testing.assert_array_equal(r.read().t, ev["t"][5000:6000])
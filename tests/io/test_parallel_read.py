@@ -0,0 +1,144 @@
+"""Tests for the segment-parallel EVT ``read_all`` (``EventReader(decode_workers=N)``).
+
+The parallel decode must be bit-identical to the serial one: timestamps (across
+TIME_HIGH wraps), coordinates, polarities and event order. The split threshold
+is lowered so small synthetic recordings are cut into several segments.
+"""
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.io._evt import EventDecoder_EVT
+from evutils.types import Event_dtype
+
+FORMATS = ["evt3", "evt2", "evt21", "evt4"]
+
+
+def _recording(n: int = 200_000, t_max: int = 40_000_000, seed: int = 0):
+    """Sorted random events plus bursts of same-row neighbours (vector groups).
+
+    ``t_max`` > 2**24 wraps the EVT3 time base more than once.
+    """
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = np.sort(rng.integers(0, t_max, n))
+    ev["x"] = rng.integers(0, 1280, n)
+    ev["y"] = rng.integers(0, 720, n)
+    ev["p"] = rng.integers(0, 2, n)
+    for i in range(0, n - 32, 997):
+        ev["t"][i:i + 32] = ev["t"][i]
+        ev["y"][i:i + 32] = ev["y"][i]
+        ev["p"][i:i + 32] = ev["p"][i]
+        ev["x"][i:i + 32] = (int(ev["x"][i]) % 1200) + np.arange(32)
+    return ev
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(EventDecoder_EVT, "_PARALLEL_MIN_WORDS", 1 << 12)
+
+
+def _assert_identical(a, b):
+    assert len(a) == len(b)
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(a, f), getattr(b, f))
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_parallel_read_all_matches_serial(tmp_path, small_segments, fmt):
+    p = tmp_path / f"rec_{fmt}.raw"
+    with EventWriter(p, format=fmt) as w:
+        w.write(_recording())
+
+    serial = EventReader(p).read_all()
+    reader = EventReader(p, decode_workers=4)
+    reader.init()
+    assert len(reader._file_decoder._parallel_bounds()) > 2  # really split
+    _assert_identical(reader.read_all(), serial)
+
+
+def test_parallel_read_all_evt2_wrap(tmp_path, small_segments):
+    # The 28-bit EVT2 TIME_HIGH field wraps at 2**34 µs (~4.8 h).
+    ev = _recording(t_max=3 * (1 << 34))
+    p = tmp_path / "wrap.raw"
+    with EventWriter(p, format="evt2") as w:
+        w.write(ev)
+
+    out = EventReader(p, decode_workers=4).read_all()
+    np.testing.assert_array_equal(out.t, ev["t"])
+    _assert_identical(out, EventReader(p).read_all())
+
+
+@pytest.mark.parametrize("fmt", ["evt3", "evt4"])
+def test_parallel_read_all_after_seek(tmp_path, small_segments, fmt):
+    ev = _recording()
+    p = tmp_path / f"seek_{fmt}.raw"
+    with EventWriter(p, format=fmt) as w:
+        w.write(ev)
+
+    t0 = 25_000_000  # past the first EVT3 wrap
+    serial = EventReader(p)
+    serial.seek(t=t0)
+    parallel = EventReader(p, decode_workers=3)
+    parallel.seek(t=t0)
+    _assert_identical(parallel.read_all(), serial.read_all())
+
+
+def test_decode_workers_validated(tmp_path):
+    with pytest.raises(ValueError):
+        EventReader(b"% format EVT3;height=720;width=1280\n% end\n", decode_workers=0)
+
+
+def _windows(p, **kw):
+    return list(EventReader(p, **kw))
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+@pytest.mark.parametrize("mode", [
+    {"delta_t": 250_000},
+    {"n_events": 7_777},
+    {"mode": "mixed", "delta_t": 500_000, "n_events": 5_000},
+])
+def test_decode_ahead_windows_match_serial(tmp_path, small_segments, fmt, mode):
+    p = tmp_path / f"iter_{fmt}.raw"
+    with EventWriter(p, format=fmt) as w:
+        w.write(_recording())
+
+    serial = _windows(p, **mode)
+    parallel = _windows(p, decode_workers=4, **mode)
+    assert len(parallel) == len(serial)
+    for a, b in zip(parallel, serial):
+        _assert_identical(a, b)
+
+
+def test_decode_ahead_async_and_normalized(tmp_path, small_segments):
+    p = tmp_path / "async.raw"
+    with EventWriter(p, format="evt3") as w:
+        w.write(_recording())
+
+    kw = {"delta_t": 100_000, "normalize_ts": True}
+    serial = _windows(p, **kw)
+    parallel = _windows(p, decode_workers=3, async_read=True, **kw)
+    assert len(parallel) == len(serial)
+    for a, b in zip(parallel, serial):
+        _assert_identical(a, b)
+
+
+@pytest.mark.parametrize("fmt", ["evt3", "evt21"])
+def test_decode_ahead_seek_and_read_all(tmp_path, small_segments, fmt):
+    ev = _recording()
+    p = tmp_path / f"mixed_{fmt}.raw"
+    with EventWriter(p, format=fmt) as w:
+        w.write(ev)
+
+    reader = EventReader(p, delta_t=200_000, decode_workers=4)
+    for _ in range(5):
+        reader.read()
+    reader.seek(t=30_000_000)  # stops the pipeline; it restarts after the jump
+    win = reader.read()
+    assert win.t[0] >= 30_000_000
+    rest = reader.read_all()  # drains the restarted pipeline
+    tail = ev[ev["t"] >= 30_000_000]
+    np.testing.assert_array_equal(np.concatenate([win.t, rest.t]), tail["t"])
+    np.testing.assert_array_equal(np.concatenate([win.x, rest.x]), tail["x"])
+    reader.close()
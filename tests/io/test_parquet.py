@@ -0,0 +1,195 @@
+"""Parquet / Arrow IPC decoder and encoder tests: round trips, fixed-size row
+groups, statistics-driven seeks and range reads, zero-copy IPC columns."""
+import io
+from typing import Any
+
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.io._source import make_source
+from evutils.types import Event_dtype
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq  # noqa: E402
+
+
+def make_events(n: int = 50_000, seed: int = 4) -> Any:
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = np.cumsum(rng.integers(0, 9, n))
+    ev["x"] = rng.integers(0, 1280, n)
+    ev["y"] = rng.integers(0, 720, n)
+    ev["p"] = rng.integers(0, 2, n)
+    return ev
+
+
+def _write(path: Any, ev: Any, group_size: int = 4096) -> None:
+    with EventWriter(path, width=640, height=480, group_size=group_size) as w:
+        for part in np.array_split(ev, 13):  # groups must not follow the write slicing
+            w.write(part)
+
+
+@pytest.mark.parametrize("ext", ["parquet", "arrow", "feather"])
+def test_roundtrip(tmp_path: Any, ext: str) -> None:
+    ev = make_events()
+    path = tmp_path / f"rec.{ext}"
+    _write(path, ev)
+    with EventReader(path) as r:
+        got = r.read_all()
+        assert r.shape() == (640, 480)
+        assert r.count_events() == len(ev)
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(got, f), ev[f])
+
+    windows = list(EventReader(path, n_events=1000))
+    assert all(len(w) == 1000 for w in windows[:-1])
+    np.testing.assert_array_equal(np.concatenate([w.x for w in windows]), ev["x"])
+    windows = list(EventReader(path, delta_t=2000))
+    np.testing.assert_array_equal(np.concatenate([w.t for w in windows]), ev["t"])
+    # Normalising must not write through the (read-only, cached) group views.
+    shifted = EventReader(path, n_events=1000, normalize_ts=True, start_ts=5)
+    np.testing.assert_array_equal(next(iter(shifted)).t, ev["t"][:1000] - ev["t"][0] + 5)
+    np.testing.assert_array_equal(EventReader(path, normalize_ts=True).read_all().t, ev["t"] - ev["t"][0])
+
+    # Non-mappable and in-memory (sniffed by magic) sources.
+    got = EventReader(make_source(path, mmap_files=False)).read_all()
+    np.testing.assert_array_equal(got.t, ev["t"])
+    got = EventReader(io.BytesIO(path.read_bytes())).read_all()
+    np.testing.assert_array_equal(got.y, ev["y"])
+
+
+def test_parquet_fixed_row_groups_with_stats(tmp_path: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "rec.parquet"
+    _write(path, ev)
+    meta = pq.ParquetFile(path).metadata
+    sizes = [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+    assert sizes[:-1] == [4096] * (len(sizes) - 1) and sum(sizes) == len(ev)
+    stats = meta.row_group(3).column(0).statistics
+    assert (stats.min, stats.max) == (ev["t"][3 * 4096], ev["t"][4 * 4096 - 1])
+
+
+@pytest.mark.parametrize("ext", ["parquet", "arrow"])
+def test_seek_and_range_read_touch_overlapping_groups(tmp_path: Any, ext: str, monkeypatch: Any) -> None:
+    ev = make_events()
+    path = tmp_path / f"rec.{ext}"
+    _write(path, ev)
+    r = EventReader(path, n_events=100)
+    r.init()
+    dec = r._file_decoder
+    loads: list[int] = []
+    orig = dec._load_group
+    monkeypatch.setattr(dec, "_load_group", lambda i, *a: loads.append(i) or orig(i, *a))
+
+    target = int(ev["t"][30_001])
+    want = int(np.searchsorted(ev["t"], target))
+    assert r.seek(t=target) == ev["t"][want]
+    np.testing.assert_array_equal(r.read().t, ev["t"][want:want + 100])
+    assert set(loads) == {want // 4096}
+
+    loads.clear()
+    got = dec.read(start_ms=100, end_ms=130)
+    mask = (ev["t"] >= 100_000) & (ev["t"] < 130_000)
+    np.testing.assert_array_equal(got.t, ev["t"][mask])
+    first, last = np.flatnonzero(mask)[[0, -1]] // 4096
+    assert set(loads) <= set(range(first, last + 2))
+
+    r.seek(t=int(ev["t"][-1]) + 1)
+    assert len(r.read()) == 0
+    assert r.seek(n=12_345) == ev["t"][12_345]
+    np.testing.assert_array_equal(r.read().x, ev["x"][12_345:12_445])
+
+
+def test_arrow_columns_are_zero_copy(tmp_path: Any) -> None:
+    ev = make_events(10_000)
+    path = tmp_path / "rec.arrow"
+    _write(path, ev)
+    with EventReader(path, n_events=500) as r:
+        w = next(iter(r))
+        # A read-only view of the memory-mapped file, not a decoded copy.
+        assert not w.t.flags.writeable and not w.t.flags.owndata
+        np.testing.assert_array_equal(w.t, ev["t"][:500])
+
+
+def test_empty_file(tmp_path: Any) -> None:
+    path = tmp_path / "empty.parquet"
+    with EventWriter(path):
+        pass
+    assert len(EventReader(path).read_all()) == 0
+
+
+def test_reader_arrow_stream(tmp_path: Any) -> None:
+    ev = make_events(10_000)
+    path = tmp_path / "rec.arrow"
+    _write(path, ev)
+    table = pa.table(EventReader(path, n_events=3000))
+    assert [b.num_rows for b in table.to_batches()] == [3000, 3000, 3000, 1000]
+    np.testing.assert_array_equal(table.column("t").to_numpy(), ev["t"])
+    assert table.schema.metadata[b"width"] == b"640"
+    # Recycled window buffers are copied out before the next window overwrites them.
+    table = pa.table(EventReader(path, delta_t=5000, reuse_buffers=True))
+    np.testing.assert_array_equal(table.column("x").to_numpy(), ev["x"])
+
+
+def test_reader_arrow_stream_compact(tmp_path: Any) -> None:
+    # Every compact window has its own t_base (0, ~1.8e9, ~3.6e9, ...): the
+    # stream must carry absolute timestamps, not the first window's base.
+    ev = make_events(10_000)
+    ev["t"] = np.arange(len(ev), dtype=np.int64) * 600_000
+    path = tmp_path / "rec.arrow"
+    _write(path, ev)
+    table = pa.table(EventReader(path, n_events=3000, ts_dtype="u4"))
+    assert table.schema.field("t").type == pa.int64()
+    assert b"t_base" not in (table.schema.metadata or {})
+    np.testing.assert_array_equal(table.column("t").to_numpy(), ev["t"])
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_arrow_open_reads_only_last_batch(tmp_path: Any, compression: Any, monkeypatch: Any) -> None:
+    ev = make_events()
+    path = tmp_path / "rec.arrow"
+    with EventWriter(path, group_size=4096, compression=compression) as w:
+        w.write(ev)
+    batches: list[int] = []
+    orig = pa.ipc.open_file
+
+    class Counting:
+        def __init__(self, source: Any) -> None:
+            self._r = orig(source)
+
+        def __getattr__(self, name: str) -> Any:
+            return getattr(self._r, name)
+
+        def get_batch(self, i: int) -> Any:
+            batches.append(i)
+            return self._r.get_batch(i)
+
+    monkeypatch.setattr(pa.ipc, "open_file", Counting)
+    r = EventReader(path, n_events=100)
+    r.init()
+    n_batches = -(-len(ev) // 4096)
+    assert batches == [n_batches - 1]
+
+    # A time seek bisects over the batches instead of scanning them.
+    target = int(ev["t"][30_001])
+    want = int(np.searchsorted(ev["t"], target))
+    assert r.seek(t=target) == ev["t"][want]
+    np.testing.assert_array_equal(r.read().t, ev["t"][want:want + 100])
+    assert len(set(batches)) <= n_batches.bit_length() + 2
+
+
+def test_arrow_irregular_batches(tmp_path: Any) -> None:
+    # A file from another writer: no group_size metadata, uneven batches.
+    ev = make_events(10_000)
+    path = tmp_path / "rec.arrow"
+    table = pa.table({name: ev[name] for name in ("t", "x", "y", "p")})
+    with pa.ipc.new_file(path, table.schema) as w:
+        for start, stop in ((0, 10), (10, 10), (10, 7_000), (7_000, 10_000)):
+            w.write_table(table.slice(start, stop - start))
+    with EventReader(path, n_events=100) as r:
+        for k in (0, 9, 10, 6_999, 9_950):
+            assert r.seek(t=int(ev["t"][k])) == ev["t"][np.searchsorted(ev["t"], ev["t"][k])]
+        np.testing.assert_array_equal(EventReader(path).read_all().t, ev["t"])
+        r.seek(t=int(ev["t"][-1]) + 1)
+        assert len(r.read()) == 0
@@ -0,0 +1,124 @@
+"""Tests for ``EventReader.read_into`` / ``iter_into`` (caller-owned buffers).
+
+Windows written into the caller's arrays must match ``read()``'s windows, and
+a buffer too small for a window must split it without losing or reordering
+events.
+"""
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.types import Event_dtype, EventArray
+
+
+def _events(n: int = 40_000, seed: int = 9):
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = np.sort(rng.integers(1_000, 4_000_000, n))
+    ev["x"] = rng.integers(0, 640, n)
+    ev["y"] = rng.integers(0, 480, n)
+    ev["p"] = rng.integers(0, 2, n)
+    return ev
+
+
+def _buffer(n: int) -> EventArray:
+    return EventArray(np.zeros(n, np.int64), np.zeros(n, np.uint16),
+                      np.zeros(n, np.uint16), np.zeros(n, np.uint8))
+
+
+def _window(buf, offset, n):
+    return EventArray(buf.t[offset:offset + n], buf.x[offset:offset + n],
+                      buf.y[offset:offset + n], buf.p[offset:offset + n])
+
+
+def _assert_identical(a, b):
+    assert len(a) == len(b)
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(a, f), getattr(b, f))
+
+
+@pytest.fixture(params=["evt3", "evt2", "evt4", "dat", "npz", "csv"])
+def recording(request, tmp_path):
+    fmt = request.param
+    p = tmp_path / (f"rec_{fmt}.raw" if fmt.startswith("evt") else f"rec.{fmt}")
+    with EventWriter(p, **({"format": fmt} if fmt.startswith("evt") else {})) as w:
+        w.write(_events())
+    return p
+
+
+@pytest.mark.parametrize("opts", [{"delta_t": 150_000}, {"n_events": 3_000},
+                                  {"delta_t": 100_000, "n_events": 2_500}])
+def test_read_into_matches_read(recording, opts):
+    expected = list(EventReader(recording, **opts))
+    buf = _buffer(60_000)
+    buf.t[:7] = -1  # sentinel ahead of the offset
+    reader = EventReader(recording, **opts)
+    got = []
+    while not reader.is_eof():
+        n = reader.read_into(buf, offset=7)
+        got.append(_window(buf, 7, n).copy())
+    assert len(got) == len(expected)
+    for a, b in zip(got, expected):
+        _assert_identical(a, b)
+    assert (buf.t[:7] == -1).all()
+    assert len(reader) == sum(len(w) for w in expected)
+
+
+@pytest.mark.parametrize("opts", [{"delta_t": 500_000}, {"n_events": 9_000}, {"mode": "all"}])
+def test_small_buffer_splits_windows(recording, opts):
+    full = EventReader(recording).read_all()
+    buf = _buffer(5_000)
+    reader = EventReader(recording, **opts)
+    parts = [_window(buf, 0, n).copy() for n in reader.iter_into(buf)]
+    assert all(len(w) <= 5_000 for w in parts)
+    joined = EventArray(*(np.concatenate([getattr(w, f) for w in parts]) for f in ("t", "x", "y", "p")))
+    _assert_identical(joined, full)
+
+
+def test_read_into_decodes_in_place(tmp_path):
+    p = tmp_path / "rec.raw"
+    with EventWriter(p, format="evt2") as w:
+        w.write(_events())
+    buf = _buffer(10_000)
+    reader = EventReader(p, n_events=10_000, normalize_ts=True)
+    assert reader.read_into(buf) == 10_000
+    ref = EventReader(p, n_events=10_000, normalize_ts=True).read()
+    _assert_identical(buf, ref)
+    assert buf.sensor_size == reader.shape()
+
+
+def test_read_into_after_read(tmp_path):
+    p = tmp_path / "rec.raw"
+    with EventWriter(p, format="evt3") as w:
+        w.write(_events())
+    expected = list(EventReader(p, delta_t=200_000))
+    reader = EventReader(p, delta_t=200_000)
+    first = reader.read(n_events=500)  # leaves events staged in the accumulator
+    buf = _buffer(50_000)
+    rest = [_window(buf, 0, n).copy() for n in reader.iter_into(buf)]
+    _assert_identical(first, expected[0][:500])
+    joined = np.concatenate([w.t for w in rest])
+    np.testing.assert_array_equal(np.concatenate([first.t, joined]),
+                                  np.concatenate([w.t for w in expected]))
+
+
+@pytest.mark.parametrize("bad, offset", [
+    (np.zeros(10, dtype=Event_dtype), 0),
+    (None, 10),
+    (None, -1),
+    ("t", 0),
+    ("x", 0),
+])
+def test_read_into_validated(bad, offset):
+    reader = EventReader(b"% format EVT3;height=720;width=1280\n% end\n", n_events=10)
+    buf = _buffer(10)
+    if isinstance(bad, np.ndarray):
+        with pytest.raises(TypeError):
+            reader.read_into(bad)
+        return
+    if bad == "t":
+        buf.t = buf.t.astype(np.float64)
+    elif bad == "x":
+        buf.x = np.zeros(20, np.uint16)[::2]
+    with pytest.raises(ValueError):
+        reader.read_into(buf, offset=offset)
@@ -0,0 +1,147 @@
+"""Tests for ``EventReader(roi=..., polarity=..., stride=...)``.
+
+The native decoders (EVT2/2.1/3/4, DAT, AER) filter inside the C parser; the
+others are masked after decoding. Either way the result must equal a numpy mask
+over the unfiltered stream, and windows must be cut on the filtered stream.
+"""
+import numpy as np
+import pytest
+
+from evutils.io import EventReader, EventWriter
+from evutils.io._evt import EventDecoder_EVT
+from evutils.types import Event_dtype, EventArray
+
+ROIS = [(100, 50, 300, 200), (400, 0, 450, 480)]
+
+
+def _events(n: int = 50_000, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    ev = np.zeros(n, dtype=Event_dtype)
+    ev["t"] = np.sort(rng.integers(0, 5_000_000, n))
+    ev["x"] = rng.integers(0, 512, n)
+    ev["y"] = rng.integers(0, 480, n)
+    ev["p"] = rng.integers(0, 2, n)
+    # Same-row neighbour bursts, so vector formats emit (and filter) groups.
+    for i in range(0, n - 32, 301):
+        ev["t"][i:i + 32] = ev["t"][i]
+        ev["y"][i:i + 32] = ev["y"][i]
+        ev["p"][i:i + 32] = ev["p"][i]
+        ev["x"][i:i + 32] = (int(ev["x"][i]) % 470) + np.arange(32)
+    return ev
+
+
+def _mask(ev, rois=(), polarity=None, stride=(1, 1)):
+    keep = np.ones(len(ev), dtype=bool)
+    if polarity is not None:
+        keep &= ev.p == polarity
+    keep &= (ev.x % stride[0] == 0) & (ev.y % stride[1] == 0)
+    if rois:
+        inside = np.zeros(len(ev), dtype=bool)
+        for x0, y0, x1, y1 in rois:
+            inside |= (ev.x >= x0) & (ev.x < x1) & (ev.y >= y0) & (ev.y < y1)
+        keep &= inside
+    return ev[keep]
+
+
+def _assert_identical(a, b):
+    assert len(a) == len(b)
+    for f in ("t", "x", "y", "p"):
+        np.testing.assert_array_equal(getattr(a, f), getattr(b, f))
+
+
+@pytest.fixture(params=["evt3", "evt2", "evt21", "evt4", "dat", "aer", "npz", "csv"])
+def recording(request, tmp_path):
+    fmt = request.param
+    if fmt.startswith("evt"):
+        p = tmp_path / f"rec_{fmt}.raw"
+        kw = {"format": fmt}
+    else:
+        p = tmp_path / f"rec.{fmt}"
+        kw = {}
+    with EventWriter(p, **kw) as w:
+        w.write(_events())
+    return p
+
+
+@pytest.mark.parametrize("opts, ref", [
+    ({"roi": ROIS[0]}, {"rois": ROIS[:1]}),
+    ({"roi": ROIS, "polarity": 1}, {"rois": ROIS, "polarity": 1}),
+    ({"polarity": 0, "stride": 2}, {"polarity": 0, "stride": (2, 2)}),
+    ({"roi": ROIS, "stride": (3, 1)}, {"rois": ROIS, "stride": (3, 1)}),
+])
+def test_filtered_read_all_matches_mask(recording, opts, ref):
+    expected = _mask(EventReader(recording).read_all(), **ref)
+    assert 0 < len(expected)
+    _assert_identical(EventReader(recording, **opts).read_all(), expected)
+
+
+def test_filtered_n_events_windows(recording):
+    expected = _mask(EventReader(recording).read_all(), rois=ROIS, polarity=1)
+    windows = list(EventReader(recording, n_events=1_000, roi=ROIS, polarity=1))
+    assert all(len(w) == 1_000 for w in windows[:-1])
+    joined = EventArray(*(np.concatenate([getattr(w, f) for w in windows]) for f in ("t", "x", "y", "p")))
+    _assert_identical(joined, expected)
+
+
+@pytest.mark.parametrize("fmt", ["evt3", "evt2", "dat"])
+def test_filtered_delta_t_windows(tmp_path, fmt):
+    p = tmp_path / (f"rec_{fmt}.raw" if fmt.startswith("evt") else f"rec.{fmt}")
+    with EventWriter(p, **({"format": fmt} if fmt.startswith("evt") else {})) as w:
+        w.write(_events())
+    expected = _mask(EventReader(p).read_all(), rois=ROIS[:1], polarity=0)
+
+    windows = list(EventReader(p, delta_t=100_000, roi=ROIS[:1], polarity=0))
+    t0 = int(expected.t[0])  # windows anchor on the first *kept* event
+    for k, w in enumerate(windows):
+        lo, hi = t0 + k * 100_000, t0 + (k + 1) * 100_000
+        _assert_identical(w, expected[(expected.t >= lo) & (expected.t < hi)])
+    assert sum(len(w) for w in windows) == len(expected)
+
+
+@pytest.mark.parametrize("fmt", ["evt3", "evt21"])
+def test_filtered_parallel_decode(tmp_path, monkeypatch, fmt):
+    monkeypatch.setattr(EventDecoder_EVT, "_PARALLEL_MIN_WORDS", 1 << 10)
+    p = tmp_path / f"rec_{fmt}.raw"
+    with EventWriter(p, format=fmt) as w:
+        w.write(_events())
+    opts = {"roi": ROIS, "stride": 2}
+    serial = EventReader(p, **opts).read_all()
+    _assert_identical(EventReader(p, decode_workers=4, **opts).read_all(), serial)
+    windows = list(EventReader(p, n_events=777, decode_workers=4, **opts))
+    assert sum(len(w) for w in windows) == len(serial)
+
+
+def test_filtered_seek_by_time(recording):
+    if recording.suffix == ".aer":
+        pytest.skip("AER has no timestamps to seek on")
+    full = _mask(EventReader(recording).read_all(), rois=ROIS)
+    reader = EventReader(recording, roi=ROIS)
+    reader.seek(t=2_500_000)
+    _assert_identical(reader.read_all(), full[full.t >= 2_500_000])
+    with pytest.raises(ValueError):
+        reader.seek(n=10)
+
+
+def test_filtered_aer_custom_timestamps(tmp_path):
+    ev = _events(5_000)
+    p = tmp_path / "rec.aer"
+    with EventWriter(p) as w:
+        w.write(ev)
+    ts = np.arange(len(ev), dtype=np.int64) * 10
+    out = EventReader(p, timestamps=ts, polarity=1).read_all()
+    np.testing.assert_array_equal(out.t, ts[ev["p"] == 1])
+    np.testing.assert_array_equal(out.x, ev["x"][ev["p"] == 1])
+
+
+@pytest.mark.parametrize("opts", [
+    {"roi": (10, 10, 5, 20)},
+    {"roi": (0, 0, 10)},
+    {"roi": [(0, 0, 1, 1)] * 9},
+    {"roi": []},
+    {"polarity": 2},
+    {"stride": 0},
+    {"stride": (1, 2, 3)},
+])
+def test_filter_options_validated(opts):
+    with pytest.raises(ValueError):
+        EventReader(b"% format EVT3;height=720;width=1280\n% end\n", **opts)
@@ -206,6 +206,77 @@ def test_seek_linear_fallback_non_seekable(tmp_path):
     assert int(c.t[0]) == int(ev["t"][exp])
 
 
+# --------------------------------------------------------------------------- #
+# Persisted evutils index sidecar (index="persist")
+# --------------------------------------------------------------------------- #
+
+def _evt3_ramp(tmp_path):
+    ev = _ramp()
+    p = tmp_path / "ramp.raw"
+    _write(p, "evt3", ev)
+    return p, ev
+
+
+def test_persisted_index_roundtrip(tmp_path, monkeypatch):
+    from evutils.io import _index
+
+    p, ev = _evt3_ramp(tmp_path)
+    T = 17_500_000  # past the EVT3 wrap
+    exp = int(ev["t"][int(np.searchsorted(ev["t"], T))])
+    with EventReader(p, n_events=3000, index="persist") as r:
+        assert r.seek(t=T) == exp
+    sidecar = _index.evutils_index_path(p)
+    assert sidecar.is_file()
+
+    # A second open maps the sidecar: no index is built, counts are exact.
+    monkeypatch.setattr(_index, "IncrementalSeekIndex", None)
+    with EventReader(p, n_events=3000) as r:
+        assert r.seek(n=7000) == int(ev["t"][7000])
+        assert r._file_decoder._index.n_events == N
+        assert r.seek(t=T) == exp
+        assert int(r.read().t[0]) == exp
+
+
+def test_persisted_index_stale_is_rebuilt(tmp_path):
+    import os
+    from evutils.io._index import StaticSeekIndex, evutils_index_path
+
+    p, ev = _evt3_ramp(tmp_path)
+    with EventReader(p, n_events=3000, index="persist") as r:
+        r.seek(t=1_000_000)
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # "modified"
+    with EventReader(p, n_events=3000) as r:
+        r.seek(t=1_000_000)
+        assert not isinstance(r._file_decoder._index, StaticSeekIndex)
+    with EventReader(p, n_events=3000, index="persist") as r:  # rewrites it
+        r.seek(t=1_000_000)
+    with EventReader(p, n_events=3000) as r:
+        r.seek(t=1_000_000)
+        assert isinstance(r._file_decoder._index, StaticSeekIndex)
+    assert evutils_index_path(p).is_file()
+
+
+def test_persisted_index_cache_dir(tmp_path):
+    from evutils.io._index import evutils_index_path
+
+    p, ev = _evt3_ramp(tmp_path)
+    cache = tmp_path / "cache"
+    with EventReader(p, n_events=3000, index="persist", index_dir=cache) as r:
+        r.seek(n=5000)
+    assert not evutils_index_path(p).exists()
+    assert evutils_index_path(p, cache).is_file()
+    with EventReader(p, n_events=3000, index=False) as r:
+        r.seek(n=5000)  # index=False neither reads nor writes a sidecar
+    assert not evutils_index_path(p).exists()
+
+
+def test_index_policy_validated(tmp_path):
+    p, _ = _evt3_ramp(tmp_path)
+    with pytest.raises(ValueError, match="index"):
+        EventReader(p, index="sidecar")
+
+
 # --------------------------------------------------------------------------- #
 # Metavision .tmp_index interop (gated on the local data/ fixtures)
 # --------------------------------------------------------------------------- #
@@ -1,3 +1,4 @@
+import pytest
 import numpy as np
 
 from evutils.types import Event_dtype
@@ -149,4 +150,79 @@ def test_soa_array_multi_field_indexing() -> None:
     assert np.array_equal(sub.y, [30, 40])
     assert not hasattr(sub, 't')
 
-    
\ No newline at end of file
+    
+
+def test_event_array_compact_roundtrip() -> None:
+    from evutils.types import EventArray
+    t = np.array([5_000_000_000, 5_000_000_010, 5_000_400_000], dtype=np.int64)
+    ev = EventArray(t, [1, 2, 3], [4, 5, 6], [0, 1, 0], metadata={'sensor_size': (8, 8)})
+    c = ev.compact()
+    assert c.is_compact and c.t.dtype == np.uint32
+    assert c.t_base == 5_000_000_000
+    assert np.array_equal(c.t, [0, 10, 400_000])
+    assert c.sensor_size == (8, 8)
+    # Slices and copies stay compact and keep their origin.
+    assert c[1:].t.dtype == np.uint32 and c[1:].t_base == c.t_base
+    assert np.array_equal(c.copy().expand().t, t)
+    assert np.array_equal(c.to_aos()['t'], t)
+    assert ev.expand() is ev and c.compact() is c
+    rebased = c.compact(t_base=4_999_999_000)
+    assert np.array_equal(rebased.t, [1_000, 1_010, 401_000])
+    assert np.array_equal(rebased.expand().t, t)
+
+
+def test_event_array_compact_is_opt_in() -> None:
+    from evutils.types import EventArray
+    t = np.array([7, 9], dtype=np.uint32)
+    ev = EventArray(t, [0, 0], [0, 0], [0, 0])
+    assert ev.t.dtype == np.int64 and not ev.is_compact
+    c = EventArray(t, [0, 0], [0, 0], [0, 0], metadata={'t_base': 100})
+    assert c.is_compact and np.array_equal(c.expand().t, [107, 109])
+
+
+def test_event_array_compact_span_checked() -> None:
+    from evutils.types import EventArray
+    ev = EventArray([0, 2**32], [0, 0], [0, 0], [0, 0])
+    with pytest.raises(ValueError):
+        ev.compact()
+    with pytest.raises(ValueError):
+        EventArray([10, 20], [0, 0], [0, 0], [0, 0]).compact(t_base=15)
+
+
+def test_event_array_arrow_interchange_is_zero_copy() -> None:
+    from evutils.types import EventArray, TriggerArray
+    pa = pytest.importorskip("pyarrow")
+    ev = EventArray(t=np.arange(6) * 10, x=np.arange(6), y=np.arange(6) + 1, p=[0, 1] * 3)
+    ev.sensor_size = (64, 32)
+    batch = pa.record_batch(ev)
+    assert batch.schema.names == ["t", "x", "y", "p"]
+    assert batch.schema.metadata == {b"width": b"64", b"height": b"32"}
+    assert np.shares_memory(batch.column("x").to_numpy(), ev.x)
+    assert pa.table(ev).column("t").to_pylist() == list(ev.t)
+    trig = TriggerArray(t=[1, 2], p=[0, 1], id=[3, 3])
+    assert pa.record_batch(trig).schema.names == ["t", "p", "id"]
+
+
+def test_event_array_to_dlpack() -> None:
+    from evutils.types import EventArray
+    ev = EventArray(t=np.arange(8), x=np.arange(8), y=np.arange(8), p=np.ones(8))
+
+    class _Capsule:
+        def __init__(self, capsule: object) -> None:
+            self._c = capsule
+        def __dlpack__(self, **kwargs: object) -> object:
+            return self._c
+        def __dlpack_device__(self) -> tuple[int, int]:
+            return (1, 0)  # CPU
+
+    cols = ev.to_dlpack()
+    x = np.from_dlpack(_Capsule(cols["x"]))
+    assert x.dtype == np.uint16 and np.shares_memory(x, ev.x)
+    # Read-only and strided columns cannot be flagged for a legacy consumer,
+    # so they are exported as copies.
+    ev.t.flags.writeable = False
+    strided = ev[::2]
+    t = np.from_dlpack(_Capsule(ev.to_dlpack()["t"]))
+    np.testing.assert_array_equal(t, ev.t)
+    assert not np.shares_memory(t, ev.t)
+    np.testing.assert_array_equal(np.from_dlpack(_Capsule(strided.to_dlpack()["y"])), strided.y)